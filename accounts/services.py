@@ -13,6 +13,7 @@ from django.conf import settings
 from django.utils import timezone
 from .models import Character, MapleStoryAPIKey
 from .exceptions import ErrorType
+from util.nexon_client import get_nexon_client
 
 logger = logging.getLogger(__name__)
 
@@ -58,11 +59,7 @@ class CharacterService:
 
         try:
             # Get character list from Nexon API
-            response = requests.get(
-                CHARACTER_LIST_URL,
-                headers=headers,
-                timeout=10
-            )
+            response = get_nexon_client().get(CHARACTER_LIST_URL, headers=headers)
 
             if response.status_code == 404:
                 raise ValueError("계정 정보를 찾을 수 없습니다. API 키를 확인해주세요.")
@@ -122,7 +119,7 @@ class CharacterService:
         params = {"character_name": character_name}
 
         try:
-            response = requests.get(CHARACTER_ID_URL, headers=headers, params=params, timeout=10)
+            response = get_nexon_client().get(CHARACTER_ID_URL, headers=headers, params=params)
 
             if response.status_code == 404:
                 # Story 1.7: AC #7 - 공개 설정 안 된 캐릭터
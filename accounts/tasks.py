@@ -5,7 +5,6 @@ from celery import shared_task
 from typing import List
 import logging
 import time
-import asyncio
 import pytz
 from django.utils import timezone
 from .services import TaskStatusService, MonitoringService
@@ -16,9 +15,13 @@ from .exceptions import (
     ErrorType, classify_exception
 )
 from characters.services import MapleAPIService
-from characters.models import CharacterBasic, CharacterBasicHistory, CharacterPopularity, CharacterStat, Inventory, Storage
+from characters.models import (
+    CharacterBasic, CharacterBasicHistory, CharacterPopularity, CharacterStat, CrawlContentState, CrawlSnapshot,
+    Inventory, Storage,
+)
 from characters.crawler_services import CrawlerService, CrawlingError, ParsingError, StorageParsingError, ItemDetailCrawler
-from characters.schemas import InventoryItemSchema, StorageItemSchema
+from characters.browser_pool import run_in_worker_loop
+from characters.crawl_persistence import save_crawled_items
 from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
@@ -112,6 +115,34 @@ def check_crawl_success_rate():
     }
 
 
+def _get_bundle_result(bundle: dict, crawl_type: str) -> dict:
+    """
+    crawl_bundle 결과에서 크롤링 타입별 결과 반환
+
+    해당 타입이 실패했으면 crawl_bundle이 잡아둔 원래 예외를 다시 발생시켜
+    타입별 except 블록에서 기존과 동일하게 처리되도록 합니다.
+    """
+    if crawl_type in bundle['errors']:
+        raise bundle['errors'][crawl_type]
+    return bundle['results'][crawl_type]
+
+
+def _snapshot_counts(character_basic, crawl_type: str, unchanged: bool = False) -> dict:
+    """
+    현재 스냅샷의 아이템 수와 이번 저장에서 쓴 행 수
+
+    delta 모드에서는 변경된 슬롯만 새 행으로 저장하므로 두 값이 다릅니다.
+    내용이 그대로여서 저장을 생략했으면(unchanged) 쓴 행은 0입니다.
+    """
+    snapshot = CrawlSnapshot.current(character_basic, crawl_type)
+    if snapshot is None:
+        return {'item_count': 0, 'rows_written': 0}
+    return {
+        'item_count': snapshot.item_count,
+        'rows_written': 0 if unchanged else snapshot.rows_written,
+    }
+
+
 @shared_task(bind=True, max_retries=3)
 def crawl_character_data(self, ocid: str, crawl_types: List[str]):
     """
@@ -143,24 +174,27 @@ def crawl_character_data(self, ocid: str, crawl_types: List[str]):
         except CharacterBasic.DoesNotExist:
             raise ValueError(f'CharacterBasic with ocid {ocid} not found')
 
-        # 3. character_info_url 새로 가져오기 (만료시간이 있으므로 항상 갱신)
-        character_info_url = None
-        crawl_types_needing_url = {'inventory', 'storage', 'meso'}
-        if crawl_types_needing_url.intersection(crawl_types):
+        # 3. 웹 페이지 크롤링 (인벤토리/창고/메소)을 하나의 브라우저 세션에서 실행
+        # character_info_url은 유효 시간 내 캐시된 토큰을 재사용하고, 없거나 만료되면 새로 가져옴
+        bundle = None
+        if set(CrawlerService.BUNDLE_CRAWL_TYPES).intersection(crawl_types):
             TaskStatusService.update_task_status(
                 task_id,
                 'STARTED',
                 progress=0,
-                message='캐릭터 URL 조회 중...'
+                message='캐릭터 웹 페이지 수집 중...'
             )
             crawler = CrawlerService()
-            character_info_url = asyncio.run(
-                crawler.fetch_character_info_url(character_basic.character_name)
+            # 인벤토리/창고 아이템은 저장 단계에서 청크 단위로 파싱 (stream_items)
+            bundle = run_in_worker_loop(
+                crawler.crawl_bundle(character_basic.character_name, crawl_types, stream_items=True)
             )
-            # URL 저장
-            character_basic.character_info_url = character_info_url
-            character_basic.save(update_fields=['character_info_url'])
-            logger.info(f'Fetched and saved character_info_url: {character_info_url}')
+            # URL 저장 (캐시된 토큰을 재사용했으면 변경 없음)
+            character_info_url = bundle['character_info_url']
+            if character_basic.character_info_url != character_info_url:
+                character_basic.character_info_url = character_info_url
+                character_basic.save(update_fields=['character_info_url'])
+                logger.info(f'Fetched and saved character_info_url: {character_info_url}')
 
         # 4. 크롤링 실행
         results = {}
@@ -243,48 +277,40 @@ def crawl_character_data(self, ocid: str, crawl_types: List[str]):
                         message=f'인벤토리 수집 중... ({base_progress}%)'  # Story 2.7: AC #2
                     )
 
-                    # AC 2.3.1: Playwright로 크롤링 실행
-                    # character_info_url은 task 시작 시 미리 가져옴 (재사용)
-                    crawler = CrawlerService()
-                    crawled_data = asyncio.run(
-                        crawler.crawl_inventory(character_info_url, character_basic.character_name)
-                    )
+                    # AC 2.3.1: Playwright 크롤링은 task 시작 시 crawl_bundle로 실행됨
+                    crawled_data = _get_bundle_result(bundle, 'inventory')
+
+                    # 지난 스냅샷과 같은 페이지면 검증/저장 생략 (확인 시간만 갱신)
+                    unchanged_state = CrawlContentState.confirm_unchanged(
+                        character_basic, 'inventory', crawled_data.get('content_hash'), Inventory)
+                    if unchanged_state:
+                        logger.info(f'Inventory unchanged since {unchanged_state.crawled_at}, skipping save')
+                        results['inventory'] = {
+                            'status': 'success',
+                            **_snapshot_counts(character_basic, 'inventory', unchanged=True),
+                            'unchanged': True,
+                            'confirmed_at': unchanged_state.confirmed_at.isoformat(),
+                            'crawled_at': crawled_data['crawled_at']
+                        }
+                        continue
 
-                    # AC 2.3.3 - 2.3.5: 데이터 검증 및 저장
+                    # AC 2.3.3 - 2.3.5: 데이터 검증 및 저장 (파싱 → 검증 → bulk_create 청크 단위)
                     # AC 2.3.6: 이전 데이터는 히스토리로 보관 (덮어쓰지 않음)
-                    saved_items = []
                     # 모든 아이템에 동일한 crawled_at 적용
                     crawl_timestamp = timezone.now()
-                    for item_data in crawled_data['items']:
-                        try:
-                            # Pydantic 검증
-                            validated_item = InventoryItemSchema(**item_data)
-
-                            # DB 저장 (AC 2.3.8: detail_url 포함)
-                            inventory_item = Inventory.objects.create(
-                                character_basic=character_basic,
-                                item_type=validated_item.item_type,
-                                item_name=validated_item.item_name,
-                                item_icon=validated_item.item_icon,
-                                quantity=validated_item.quantity,
-                                item_options=validated_item.item_options,
-                                slot_position=validated_item.slot_position,
-                                expiry_date=validated_item.expiry_date,
-                                detail_url=validated_item.detail_url,
-                                has_detail=False,  # 상세 정보는 아직 크롤링 안됨
-                                crawled_at=crawl_timestamp  # 동일한 타임스탬프
-                            )
-                            saved_items.append(inventory_item.id)
+                    save_crawled_items(
+                        'inventory', character_basic, crawled_data['items'], crawl_timestamp,
+                        content_hash=crawled_data.get('content_hash'))
 
-                        except ValidationError as ve:
-                            # AC 2.3.7: 검증 실패 로깅
-                            logger.warning(f'Item validation failed for slot {item_data.get("slot_position")}: {ve}')
-                            continue
+                    CrawlContentState.record(
+                        character_basic, 'inventory', crawled_data.get('content_hash'), crawl_timestamp)
 
-                    logger.info(f'Inventory crawling completed: {len(saved_items)} items saved')
+                    counts = _snapshot_counts(character_basic, 'inventory')
+                    logger.info(
+                        f'Inventory crawling completed: {counts["item_count"]} items, {counts["rows_written"]} rows written')
                     results['inventory'] = {
                         'status': 'success',
-                        'items_saved': len(saved_items),
+                        **counts,
                         'crawled_at': crawled_data['crawled_at']
                     }
 
@@ -312,12 +338,13 @@ def crawl_character_data(self, ocid: str, crawl_types: List[str]):
                         message='아이템 상세 정보 수집 중...'
                     )
 
-                    # 캐릭터의 Inventory 아이템 조회 (detail_url이 있는 것만)
+                    # 현재 스냅샷의 Inventory 아이템 조회 (detail_url이 있는 것만)
+                    # delta 모드에서는 변경되지 않은 슬롯이 이전 행 그대로이므로 저장된 id가 아니라 스냅샷 기준으로 조회
                     # Story 1.8: character_basic은 이미 조회됨
-                    inventory_items = Inventory.objects.filter(
+                    inventory_items = CrawlSnapshot.current_items('inventory').filter(
                         character_basic=character_basic,
                         detail_url__isnull=False,
-                        has_detail=False  # 아직 상세 정보가 없는 것만
+                        has_detail=False,  # 아직 상세 정보가 없는 것만 (이전 크롤링에서 실패한 슬롯 포함)
                     ).order_by('id')
 
                     total_items = inventory_items.count()
@@ -342,7 +369,7 @@ def crawl_character_data(self, ocid: str, crawl_types: List[str]):
 
                         # ItemDetailCrawler로 크롤링
                         crawler = ItemDetailCrawler()
-                        crawl_result = asyncio.run(
+                        crawl_result = run_in_worker_loop(
                             crawler.crawl_item_details(
                                 list(inventory_items),
                                 progress_callback=update_progress
@@ -374,44 +401,39 @@ def crawl_character_data(self, ocid: str, crawl_types: List[str]):
                         message=f'창고 수집 중... ({base_progress}%)'  # Story 2.7: AC #2
                     )
 
-                    # character_info_url은 task 시작 시 미리 가져옴 (재사용)
-                    crawler = CrawlerService()
-                    crawled_data = asyncio.run(
-                        crawler.crawl_storage(character_info_url, character_basic.character_name)
-                    )
-
-                    # AC 2.4.6, 2.4.7: Pydantic 검증 및 DB 저장
-                    saved_count = 0
+                    # 창고 크롤링은 task 시작 시 crawl_bundle로 실행됨
+                    crawled_data = _get_bundle_result(bundle, 'storage')
 
-                    # 크롤링 데이터 안전하게 가져오기 (storage는 shared/personal 구분 없음)
-                    storage_items = crawled_data.get('items', [])
+                    # 지난 스냅샷과 같은 페이지면 검증/저장 생략 (확인 시간만 갱신)
+                    unchanged_state = CrawlContentState.confirm_unchanged(
+                        character_basic, 'storage', crawled_data.get('content_hash'), Storage)
+                    if unchanged_state:
+                        logger.info(f'Storage unchanged since {unchanged_state.crawled_at}, skipping save')
+                        results['storage'] = {
+                            'status': 'success',
+                            **_snapshot_counts(character_basic, 'storage', unchanged=True),
+                            'unchanged': True,
+                            'confirmed_at': unchanged_state.confirmed_at.isoformat(),
+                            'crawled_at': crawled_data.get('crawled_at')
+                        }
+                        continue
 
+                    # AC 2.4.6, 2.4.7: Pydantic 검증 및 DB 저장 (청크 단위, storage는 shared/personal 구분 없음)
                     # 모든 아이템에 동일한 crawled_at 적용
                     crawl_timestamp = timezone.now()
+                    save_crawled_items(
+                        'storage', character_basic, crawled_data.get('items', []), crawl_timestamp,
+                        content_hash=crawled_data.get('content_hash'))
 
-                    for item_data in storage_items:
-                        try:
-                            validated_item = StorageItemSchema(**item_data)
-                            Storage.objects.create(
-                                character_basic=character_basic,
-                                storage_type='storage',  # 단일 창고 타입
-                                item_name=validated_item.item_name,
-                                item_icon=validated_item.item_icon,
-                                quantity=validated_item.quantity,
-                                item_options=validated_item.item_options,
-                                slot_position=validated_item.slot_position,
-                                expiry_date=validated_item.expiry_date,
-                                crawled_at=crawl_timestamp,  # 동일한 타임스탬프
-                            )
-                            saved_count += 1
-                        except ValidationError as ve:
-                            logger.warning(f'Storage item validation failed: {ve}')
-                            continue
+                    CrawlContentState.record(
+                        character_basic, 'storage', crawled_data.get('content_hash'), crawl_timestamp)
 
-                    logger.info(f'Storage crawling completed: {saved_count} items saved')
+                    counts = _snapshot_counts(character_basic, 'storage')
+                    logger.info(
+                        f'Storage crawling completed: {counts["item_count"]} items, {counts["rows_written"]} rows written')
                     results['storage'] = {
                         'status': 'success',
-                        'items_saved': saved_count,
+                        **counts,
                         'crawled_at': crawled_data.get('crawled_at')
                     }
 
@@ -439,12 +461,8 @@ def crawl_character_data(self, ocid: str, crawl_types: List[str]):
                         message=f'메소 수집 중... ({base_progress}%)'  # Story 2.7: AC #2
                     )
 
-                    # character_info_url은 task 시작 시 미리 가져옴 (재사용)
-                    # AC 2.5.1: 캐릭터 메소 크롤링
-                    crawler = CrawlerService()
-                    crawled_data = asyncio.run(
-                        crawler.crawl_character_meso(character_info_url, character_basic.character_name)
-                    )
+                    # AC 2.5.1: 캐릭터 메소 크롤링은 task 시작 시 crawl_bundle로 실행됨
+                    crawled_data = _get_bundle_result(bundle, 'meso')
 
                     meso_amount = crawled_data.get('meso')
 
@@ -831,7 +831,7 @@ class CrawlAPIDataIntegrationTests(TestCase):
             world_name='스카니아'
         )
 
-    @patch('characters.services.requests.get')
+    @patch('util.nexon_client.NexonAPIClient.get')
     def test_crawl_api_data_full_flow(self, mock_requests_get):
         """
         Integration: Celery task에서 'api_data' 타입 호출, 전체 API 호출 플로우 및 DB 저장 확인
@@ -932,15 +932,15 @@ class CrawlAPIDataIntegrationTests(TestCase):
         self.assertIn('CharacterBasic', str(context.exception))
         self.assertIn('not found', str(context.exception))
 
-    @patch('util.rate_limiter.check_rate_limit')
-    @patch('characters.services.requests.get')
+    @patch('util.rate_limiter.RateLimiter.acquire_sync')
+    @patch('requests.Session.get')
     def test_rate_limit_applied_during_crawl(self, mock_requests_get, mock_rate_limit):
         """
         AC 2.2.5: Celery task 실행 시 Rate Limit이 적용되는지 확인
         Story 1.8: ocid 기반으로 변경
         """
-        # Mock 설정
-        mock_rate_limit.return_value = True
+        # Mock 설정 (리미터는 Nexon 클라이언트가 요청마다 호출)
+        mock_rate_limit.return_value = None
 
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
@@ -1390,7 +1390,7 @@ class LinkedCharactersViewTest(APITestCase):
         refresh = RefreshToken.for_user(self.user)
         self.access_token = str(refresh.access_token)
 
-    @patch('accounts.services.requests.get')
+    @patch('util.nexon_client.NexonAPIClient.get')
     def test_get_linked_characters_success(self, mock_get):
         """
         AC 3.10.1: 전체 캐릭터 목록 조회 성공
@@ -13,6 +13,7 @@ from django_ratelimit.decorators import ratelimit
 from django.utils.decorators import method_decorator
 
 from define.define import BASE_URL
+from util.nexon_client import get_nexon_client
 
 from .models import MapleStoryAPIKey, Account, Character, UserProfile
 from .serializers import (
@@ -91,7 +92,7 @@ class AccountListView(APIView):
         }
 
         try:
-            response = requests.get(
+            response = get_nexon_client().get(
                 f"{BASE_URL}/character/list", headers=headers)
             response.raise_for_status()
             data = response.json()
@@ -690,7 +691,7 @@ class CrawlStatusView(APIView):
 
     def _get_crawl_result_data(self, crawl_task):
         """크롤링 결과 데이터 조회 (inventory, storage, meso)"""
-        from characters.models import Inventory, Storage, CharacterBasic
+        from characters.models import CrawlSnapshot
         from characters.serializers import InventoryItemSerializer, StorageItemSerializer
 
         character_basic = crawl_task.character_basic
@@ -699,29 +700,17 @@ class CrawlStatusView(APIView):
 
         result = {}
 
-        # 최근 인벤토리 데이터
-        latest_inventory = character_basic.inventory_items.order_by('-crawled_at').first()
-        if latest_inventory:
-            items = character_basic.inventory_items.filter(
-                crawled_at=latest_inventory.crawled_at
-            ).order_by('slot_position')
-            result['inventory'] = {
-                'crawled_at': latest_inventory.crawled_at.isoformat(),
-                'items': InventoryItemSerializer(items, many=True).data,
-                'total_count': items.count()
-            }
-
-        # 최근 창고 데이터
-        latest_storage = character_basic.storage_items.order_by('-crawled_at').first()
-        if latest_storage:
-            items = character_basic.storage_items.filter(
-                crawled_at=latest_storage.crawled_at
-            ).order_by('slot_position')
-            result['storage'] = {
-                'crawled_at': latest_storage.crawled_at.isoformat(),
-                'items': StorageItemSerializer(items, many=True).data,
-                'total_count': items.count()
-            }
+        # 현재 인벤토리/창고 스냅샷 (CrawlSnapshot join, 유형별 쿼리 1회)
+        for kind, serializer_class in (('inventory', InventoryItemSerializer), ('storage', StorageItemSerializer)):
+            items = list(
+                CrawlSnapshot.current_items(kind).filter(character_basic=character_basic).order_by('slot_position')
+            )
+            if items:
+                result[kind] = {
+                    'crawled_at': items[0].crawled_at.isoformat(),
+                    'items': serializer_class(items, many=True).data,
+                    'total_count': len(items)
+                }
 
         # 메소 데이터
         result['meso'] = character_basic.meso
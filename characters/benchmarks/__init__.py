@@ -0,0 +1,12 @@
+"""
+크롤링 파서 벤치마크 (characters/crawler_services.py)
+
+- corpus: 페이지 종류(inventory/storage/character_info/item_detail)별 small/full/pathological HTML
+- suites: 파서별 벤치마크 정의
+- runner: 실행 시간(중앙값)/최대 메모리 측정 및 기준값 대비 회귀 검사
+
+실행:
+    python -m characters.benchmarks                      # 결과 출력
+    python -m characters.benchmarks --save base.json     # 기준값 저장
+    python -m characters.benchmarks --baseline base.json # 회귀 검사 (악화 시 종료 코드 1)
+"""
@@ -0,0 +1,11 @@
+import os
+import sys
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'maplestorage_backend.settings')
+django.setup()
+
+from characters.benchmarks.runner import main  # noqa: E402
+
+sys.exit(main())
@@ -0,0 +1,27 @@
+"""
+pytest-benchmark 스위트 (선택, pytest-benchmark 설치 시)
+
+자동 수집되지 않도록 파일명이 test_로 시작하지 않습니다. 경로를 지정해 실행:
+    DJANGO_SETTINGS_MODULE=maplestorage_backend.settings \
+        pytest characters/benchmarks/bench_parsers.py --benchmark-autosave
+    pytest characters/benchmarks/bench_parsers.py --benchmark-compare --benchmark-compare-fail=median:25%
+"""
+import os
+
+import django
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'maplestorage_backend.settings')
+django.setup()
+
+from characters.benchmarks.suites import build_benchmarks  # noqa: E402
+
+BENCHMARKS = build_benchmarks()
+
+
+@pytest.mark.parametrize('name', sorted(BENCHMARKS))
+def test_parser(benchmark, name):
+    benchmark.group = name.split('[')[0]
+    assert benchmark(BENCHMARKS[name]) is not None
@@ -0,0 +1,255 @@
+"""
+파서 벤치마크용 HTML 코퍼스
+
+corpus/v{CORPUS_VERSION}/{kind}_{size}.html 파일이 있으면(익명화한 실제 페이지) 그대로 쓰고,
+없으면 같은 마크업 구조로 페이지를 결정적으로 생성합니다 (시드 고정, 실행마다 동일).
+생성 규칙이나 저장된 페이지를 바꾸면 CORPUS_VERSION을 올려 이전 기준값과 섞이지 않게 합니다.
+
+실제 페이지 추가:
+    python -m characters.benchmarks.corpus record inventory full page.html --name 캐릭터명
+
+- small: 아이템/항목 몇 개
+- full: 실제 최대치에 가까운 페이지 (인벤토리 5탭 가득, 창고 가득, 장비 상세 전체 항목)
+- pathological: 최대치를 크게 넘는 페이지 (긴 툴팁, 뒤쪽에 있는 메소 영역 등 최악 경로)
+"""
+import argparse
+import random
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List
+
+CORPUS_VERSION = 1
+CORPUS_DIR = Path(__file__).resolve().parent / 'corpus' / f'v{CORPUS_VERSION}'
+
+KINDS = ('inventory', 'storage', 'character_info', 'item_detail')
+SIZES = ('small', 'full', 'pathological')
+
+_ITEM_NAMES = (
+    '엘릭서', '파워 엘릭서', '순록의 우유', '경험치 2배 쿠폰 (15분)', '주문의 흔적',
+    '아케인셰이드 스태프', '앱솔랩스 숄더', '블랙 큐브', '에디셔널 큐브', "메이플 용사의 망토",
+)
+_RARITIES = ('레어', '에픽', '유니크', '레전드리')
+
+# 익명화 대상: p 파라미터(캐릭터 정보 토큰), 스크립트, 아바타 이미지 경로
+_TOKEN_RE = re.compile(r'([?&](?:amp;)?p=)[^"&\s]+')
+_SCRIPT_RE = re.compile(r'<script\b.*?</script>', re.S | re.I)
+_AVATAR_RE = re.compile(r'(avatar\.maplestory\.nexon\.com/Character/)[^"\s]+')
+
+
+def anonymize_html(html: str, names: Iterable[str] = ()) -> str:
+    """실제 페이지 익명화 (캐릭터 이름/정보 토큰/스크립트/아바타 경로 제거)"""
+    html = _SCRIPT_RE.sub('', html)
+    html = _TOKEN_RE.sub(r'\1TOKEN', html)
+    html = _AVATAR_RE.sub(r'\1anonymous.png', html)
+    for index, name in enumerate(names):
+        html = html.replace(name, f'캐릭터{index + 1}')
+    return html
+
+
+def _page(body: str, chrome: int = 1) -> str:
+    """공통 페이지 틀 (chrome: 메뉴/푸터 반복 횟수, 파서와 무관한 마크업 양)"""
+    menu = ''.join(
+        f'<li><a href="/Common/Menu/{i}">메뉴 {i}</a><span class="new">{i * 37}</span></li>' for i in range(40))
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>메이플스토리</title>'
+        '<script>var token = "anonymous";</script></head><body>'
+        f'<div id="gnb"><ul>{menu * chrome}</ul></div>'
+        f'<div id="container"><div class="con_wrap"><div class="contents_wrap">{body}</div></div></div>'
+        f'<div id="footer">{"<p>Copyright NEXON Korea Corporation All Rights Reserved.</p>" * chrome}</div>'
+        '</body></html>'
+    )
+
+
+def _expiry_text(rng: random.Random) -> str:
+    year, month, day = rng.randint(2025, 2027), rng.randint(1, 12), rng.randint(1, 28)
+    return rng.choice((
+        f'{year}년 {month}월 {day}일 {rng.randint(0, 23)}시 {rng.randint(0, 59)}분까지 사용가능',
+        f'{year}.{month:02d}.{day:02d} 까지',
+        f'{year}년 {month}월 {day}일',
+    ))
+
+
+def _inventory_item(rng: random.Random, index: int, tooltip_lines: int) -> str:
+    name = rng.choice(_ITEM_NAMES)
+    quantity = f'&nbsp;({rng.randint(2, 9999)}개)' if rng.random() < 0.5 else ''
+    spell = f' +{rng.randint(1, 10)}' if rng.random() < 0.2 else ''
+    star = f'<em>{rng.randint(0, 25)}성 강화</em>' if rng.random() < 0.3 else ''
+    expiry = f'<p class="date">{_expiry_text(rng)}</p>' if rng.random() < 0.2 else ''
+    tooltip = ''.join(f'<p>아이템 설명 {line}: 효과가 적용됩니다.</p>' for line in range(tooltip_lines))
+    return (
+        f'<div class="inven_item_img"><img src="//avatar.maplestory.nexon.com/ItemIcon/{index:08X}.png" alt=""/></div>'
+        '<div class="inven_item_memo">'
+        f'<div class="inven_item_memo_title"><h1><a href="/MyMaple/Item/Detail?itemId={index}">'
+        f'{name}{spell}{quantity}</a></h1>{star}</div>'
+        f'<div class="item_memo_sel">{rng.choice(_RARITIES)}</div>{expiry}{tooltip}</div>'
+    )
+
+
+def build_inventory(size: str) -> str:
+    """인벤토리 페이지 (.inven_list 5탭 > .inven_item_img + .inven_item_memo)"""
+    rng = random.Random(f'inventory-{size}')
+    per_tab, tooltip_lines, chrome = {'small': (4, 0, 1), 'full': (96, 2, 3), 'pathological': (1024, 12, 20)}[size]
+
+    tabs = []
+    for tab in range(5):
+        items = ''.join(_inventory_item(rng, tab * 10000 + i, tooltip_lines) for i in range(per_tab))
+        if tab == 4 and size == 'small':
+            items = '<p>아이템이 없습니다.</p>'
+        tabs.append(f'<div class="inven_list">{items}</div>')
+    return _page(''.join(tabs), chrome)
+
+
+def _storage_item(rng: random.Random, index: int, tooltip_lines: int) -> str:
+    name = rng.choice(_ITEM_NAMES)
+    if rng.random() < 0.3:
+        name = f'<font color="#{rng.choice(("FFFFFF", "E3D04D", "9966FF"))}">{name}</font>'
+    quantity = f'<br>({rng.randint(2, 500)}개)' if rng.random() < 0.4 else ''
+    star = f'[{rng.randint(1, 25)}성 강화]<br />' if rng.random() < 0.2 else ''
+    expiry = f'<span class="date">{_expiry_text(rng)}</span>' if rng.random() < 0.2 else ''
+    tooltip = ''.join(f'<p>설명 {line}</p>' for line in range(tooltip_lines))
+    return (
+        f'<li><div class="inven_item_img"><img src="//avatar.maplestory.nexon.com/ItemIcon/{index:08X}.png"/>'
+        f'<h1><a href="/MyMaple/Item/Detail?itemId={index}">{star}{name}{quantity}</a></h1>'
+        f'{expiry}{tooltip}</div></li>'
+    )
+
+
+def build_storage(size: str) -> str:
+    """창고 페이지 (<li> > .inven_item_img, 상단 메소 영역)"""
+    rng = random.Random(f'storage-{size}')
+    count, tooltip_lines, chrome = {'small': (8, 0, 1), 'full': (160, 2, 3), 'pathological': (2400, 10, 20)}[size]
+
+    items = ''.join(_storage_item(rng, i, tooltip_lines) for i in range(count))
+    meso = f'<div><div><div><div class="meso_area">보유 메소: {rng.randint(0, 99_999_999_999):,}</div></div></div></div>'
+    if size == 'pathological':
+        # 메소 영역이 목록 뒤에 있는 최악 경로 (정규식이 페이지 끝까지 스캔)
+        return _page(f'<ul class="storage_list">{items}</ul>{meso}', chrome)
+    return _page(f'{meso}<ul class="storage_list">{items}</ul>', chrome)
+
+
+def build_character_info(size: str) -> str:
+    """캐릭터 기본정보 페이지 (.tab01_con_wrap > table > 메소 행)"""
+    rng = random.Random(f'character_info-{size}')
+    extra_rows, chrome = {'small': (0, 1), 'full': (30, 3), 'pathological': (3000, 40)}[size]
+
+    rows = ''.join(
+        f'<tr><th><span>항목 {i}</span></th><td><span>{rng.randint(0, 99999):,}</span></td></tr>'
+        for i in range(extra_rows))
+    body = (
+        '<div><div class="tab01_con_wrap">'
+        '<table><tbody><tr><th><span>레벨</span></th><td><span>275</span></td></tr>'
+        '<tr><th><span>직업</span></th><td><span>아크메이지(불,독)</span></td></tr></tbody></table>'
+        f'<table><tbody>{rows}<tr><th><span>경험치</span></th><td><span>45.678%</span></td></tr>'
+        f'<tr><th><span>인기도</span></th><td><span>{rng.randint(0, 9999):,}</span></td></tr>'
+        f'<tr><th><span>메소</span></th><td><span>{rng.randint(0, 99_999_999_999):,}</span></td></tr>'
+        '</tbody></table></div></div>'
+    )
+    return _page(body, chrome)
+
+
+def _stet_row(label: str, value: str, color: str = '') -> str:
+    th = f'<font color="{color}">{label}</font>' if color else label
+    return f'<li><div class="stet_th"><span>{th}</span></div><div class="point_td">{value}</div></li>'
+
+
+def build_item_detail(size: str) -> str:
+    """아이템 상세 (JSON view HTML: .item_title, .ablilty01/02, .stet_info)"""
+    rng = random.Random(f'item_detail-{size}')
+
+    rows: List[str] = []
+    if size == 'small':
+        rows.append(_stet_row('기타', '교환 불가'))
+    else:
+        for label in ('STR', 'DEX', 'INT', 'LUK', 'MaxHP', 'MaxMP', '공격력', '마력', '물리방어력'):
+            base, bonus, scroll = rng.randint(0, 300), rng.randint(0, 100), rng.randint(0, 200)
+            rows.append(_stet_row(label, f'+{base + bonus + scroll} <span>({base} + {bonus} + {scroll})</span>'))
+        rows += [
+            _stet_row('보스 몬스터 공격 시 데미지', '+30%'),
+            _stet_row('몬스터 방어율 무시', '+20%'),
+            _stet_row('올스탯', '+6%'),
+            _stet_row('잠재옵션', 'INT : +12%<br/>INT : +9%<br/>마력 : +9%', '#00FF00'),
+            _stet_row('에디셔널 잠재옵션', '마력 : +14<br/>INT : +4%', '#9966FF'),
+            _stet_row('매그너스의 소울', '마력 : +3%'),
+            _stet_row('가위 사용 가능 횟수', '5회'),
+            _stet_row('기타', '22성 강화<br/>25성까지 강화 가능<br/>고유장착<br/>교환 불가'),
+        ]
+        if size == 'pathological':
+            rows += [_stet_row(f'알 수 없는 옵션 {i}', f'+{i}') for i in range(400)]
+            rows.append(_stet_row('기타', '<br/>'.join(f'설명 {i}' for i in range(500))))
+
+    return (
+        '<div class="item_memo">'
+        f'<div class="item_title"><h1>{rng.choice(_ITEM_NAMES)}</h1></div>'
+        '<div class="ablilty02"><span>장비분류</span><em>스태프</em></div>'
+        '<div class="ablilty02"><span>착용 가능한 직업</span><em>마법사</em></div>'
+        '<div class="ablilty01"><ul><li><span>REQ LEV</span><em>200</em></li>'
+        '<li><span>REQ INT</span><em>600</em></li></ul></div>'
+        f'<div class="stet_info"><ul>{"".join(rows)}</ul></div></div>'
+    )
+
+
+_BUILDERS = {
+    'inventory': build_inventory,
+    'storage': build_storage,
+    'character_info': build_character_info,
+    'item_detail': build_item_detail,
+}
+
+
+def corpus_path(kind: str, size: str) -> Path:
+    return CORPUS_DIR / f'{kind}_{size}.html'
+
+
+@lru_cache(maxsize=None)
+def load_page(kind: str, size: str) -> str:
+    """코퍼스 페이지 (저장된 실제 페이지 우선, 없으면 생성)"""
+    if kind not in _BUILDERS or size not in SIZES:
+        raise ValueError(f'Unknown corpus page: {kind}/{size}')
+
+    path = corpus_path(kind, size)
+    if path.exists():
+        return path.read_text(encoding='utf-8')
+    return _BUILDERS[kind](size)
+
+
+def record_page(kind: str, size: str, html: str, names: Iterable[str] = ()) -> Path:
+    """실제 페이지를 익명화해 코퍼스에 저장"""
+    if kind not in _BUILDERS or size not in SIZES:
+        raise ValueError(f'Unknown corpus page: {kind}/{size}')
+
+    path = corpus_path(kind, size)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(anonymize_html(html, names), encoding='utf-8')
+    load_page.cache_clear()
+    return path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='파서 벤치마크 코퍼스 관리')
+    subcommands = parser.add_subparsers(dest='command', required=True)
+
+    record = subcommands.add_parser('record', help='실제 페이지를 익명화해 코퍼스에 저장')
+    record.add_argument('kind', choices=KINDS)
+    record.add_argument('size', choices=SIZES)
+    record.add_argument('html_file')
+    record.add_argument('--name', action='append', default=[], help='익명화할 캐릭터 이름 (여러 번 지정 가능)')
+
+    subcommands.add_parser('list', help='코퍼스 페이지 목록 (크기, 저장/생성 여부)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'record':
+        html = Path(args.html_file).read_text(encoding='utf-8')
+        print(record_page(args.kind, args.size, html, args.name))
+        return 0
+
+    for kind in KINDS:
+        for size in SIZES:
+            source = 'recorded' if corpus_path(kind, size).exists() else 'generated'
+            print(f'{kind:15} {size:13} {len(load_page(kind, size).encode("utf-8")):>10,} bytes  {source}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
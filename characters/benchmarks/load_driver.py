@@ -0,0 +1,283 @@
+"""
+크롤링 부하 드라이버 (replay 서버 대상 오프라인 end-to-end 벤치마크)
+
+crawl_character_data 작업을 N개 동시에 실행하고 처리량, 작업 지연 p50/p99, 워커 RSS를 보고합니다.
+실제 사이트 대신 replay 서버로 요청하므로 같은 조건으로 반복 측정할 수 있습니다
+(워커 수 산정, 크롤링 엔진 변경 전후 비교).
+
+- inline 모드 (기본): 이 프로세스에서 스레드 N개로 태스크를 동기 실행 (concurrency=N인 threads 워커와 같음)
+  replay 서버도 이 프로세스에서 띄우며 (--base-url 지정 시 외부 서버 사용), RSS는 이 프로세스 기준
+  (Playwright 폴백 시 Chromium 프로세스는 제외)
+- celery 모드: 브로커로 태스크를 보내고 완료까지 대기 (지연 = 큐 대기 포함)
+  워커는 CRAWLER_BASE_URL=<replay 서버 주소>로 미리 띄워야 하며, RSS는 측정하지 않음
+
+측정용 CharacterBasic(ocid loadtest-*)을 만들고 끝나면 삭제합니다 (--keep이면 유지).
+운영 DB가 아닌 벤치마크용 DB에서 실행하세요.
+
+실행:
+    python -m characters.benchmarks.load_driver --jobs 40 --concurrency 8 --latency 0.15 --jitter 0.05
+    python -m characters.benchmarks.load_driver --mode celery --base-url http://127.0.0.1:8765 --jobs 200
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import resource
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .replay_server import add_server_arguments, build_server
+
+LOADTEST_OCID_PREFIX = 'loadtest-'
+DEFAULT_CRAWL_TYPES = ('inventory', 'storage', 'meso')
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """최근접 순위 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def current_rss() -> Optional[int]:
+    """현재 프로세스 RSS (바이트, /proc 없으면 None)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_rss() -> int:
+    """프로세스 최대 RSS (바이트, ru_maxrss는 Linux KiB / macOS 바이트)"""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+class RssSampler:
+    """백그라운드 스레드에서 RSS를 주기적으로 기록"""
+
+    def __init__(self, interval: float = 0.2):
+        self.interval = interval
+        self.samples: List[int] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            rss = current_rss()
+            if rss is not None:
+                self.samples.append(rss)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+class BackgroundReplayServer:
+    """별도 스레드의 이벤트 루프에서 replay 서버 실행 (태스크는 각자 워커 루프 사용)"""
+
+    def __init__(self, server):
+        self.server = server
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def __enter__(self) -> str:
+        self._thread.start()
+        return asyncio.run_coroutine_threadsafe(self.server.start(), self.loop).result()
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+def _job_failed(result) -> bool:
+    """태스크 결과에 실패한 크롤링 타입이 있는지"""
+    return not isinstance(result, dict) or any(
+        isinstance(value, dict) and value.get('status') not in ('success', None)
+        for value in result.values()
+    )
+
+
+def create_characters(count: int) -> List[str]:
+    """측정용 CharacterBasic 생성 (ocid 목록)"""
+    from characters.models import CharacterBasic
+
+    ocids = []
+    for index in range(count):
+        ocid = f'{LOADTEST_OCID_PREFIX}{index:05d}'
+        CharacterBasic.objects.update_or_create(
+            ocid=ocid,
+            defaults={
+                'character_name': f'부하테스트{index}',
+                'world_name': '스카니아',
+                'character_gender': '남',
+                'character_class': '아크메이지(불,독)',
+            }
+        )
+        ocids.append(ocid)
+    return ocids
+
+
+def delete_characters():
+    from characters.models import CharacterBasic
+
+    CharacterBasic.objects.filter(ocid__startswith=LOADTEST_OCID_PREFIX).delete()
+
+
+def run_inline(ocids: List[str], crawl_types: List[str], concurrency: int) -> Dict[str, object]:
+    """스레드 concurrency개로 태스크 동기 실행"""
+    from django.db import connection
+
+    from accounts.tasks import crawl_character_data
+    from maplestorage_backend.celery import shutdown_crawler_browsers
+
+    def run_job(ocid: str):
+        start = time.perf_counter()
+        try:
+            result = crawl_character_data.apply(args=[ocid, crawl_types])
+            failed = result.failed() or _job_failed(result.result)
+        except Exception:
+            failed = True
+        finally:
+            connection.close()
+        return time.perf_counter() - start, failed
+
+    with RssSampler() as sampler:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = list(executor.map(run_job, ocids))
+            elapsed = time.perf_counter() - start
+            # 스레드별 워커 루프가 사라지기 전에 HTTP 세션/브라우저/파싱 워커 정리 (워커 종료와 동일)
+            shutdown_crawler_browsers()
+
+    return {
+        'elapsed': elapsed,
+        'latencies': [latency for latency, _ in outcomes],
+        'failures': sum(1 for _, failed in outcomes if failed),
+        'rss_peak': max(sampler.samples + [peak_rss()]),
+        'rss_mean': statistics.mean(sampler.samples) if sampler.samples else None,
+    }
+
+
+def run_celery(ocids: List[str], crawl_types: List[str], timeout: float) -> Dict[str, object]:
+    """브로커로 태스크를 보내고 완료 시점 기록"""
+    from accounts.tasks import crawl_character_data
+
+    start = time.perf_counter()
+    pending = {
+        crawl_character_data.delay(ocid, crawl_types): time.perf_counter()
+        for ocid in ocids
+    }
+
+    latencies, failures = [], 0
+    while pending and time.perf_counter() - start < timeout:
+        for async_result, submitted_at in list(pending.items()):
+            if not async_result.ready():
+                continue
+            latencies.append(time.perf_counter() - submitted_at)
+            if not async_result.successful() or _job_failed(async_result.result):
+                failures += 1
+            del pending[async_result]
+        time.sleep(0.05)
+
+    return {
+        'elapsed': time.perf_counter() - start,
+        'latencies': latencies,
+        'failures': failures + len(pending),  # 제한 시간 안에 끝나지 않은 작업은 실패로 집계
+        'rss_peak': None,
+        'rss_mean': None,
+    }
+
+
+def summarize(run: Dict[str, object], jobs: int) -> Dict[str, object]:
+    latencies = run['latencies']
+    return {
+        'jobs': jobs,
+        'failures': run['failures'],
+        'elapsed_s': round(run['elapsed'], 3),
+        'throughput_jobs_per_s': round(jobs / run['elapsed'], 3) if run['elapsed'] else None,
+        'latency_p50_s': round(percentile(latencies, 50), 3) if latencies else None,
+        'latency_p99_s': round(percentile(latencies, 99), 3) if latencies else None,
+        'rss_peak_mb': round(run['rss_peak'] / 1024 / 1024, 1) if run['rss_peak'] else None,
+        'rss_mean_mb': round(run['rss_mean'] / 1024 / 1024, 1) if run['rss_mean'] else None,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='replay 서버 대상 crawl_character_data 부하 드라이버')
+    add_server_arguments(parser)
+    parser.add_argument('--mode', choices=('inline', 'celery'), default='inline')
+    parser.add_argument('--base-url', help='외부 replay 서버 주소 (없으면 이 프로세스에서 실행, inline 모드)')
+    parser.add_argument('--jobs', type=int, default=20, help='실행할 작업 수 (캐릭터 수)')
+    parser.add_argument('--concurrency', type=int, default=4, help='동시 작업 수 (inline 모드)')
+    parser.add_argument('--crawl-types', default=','.join(DEFAULT_CRAWL_TYPES),
+                        help='크롤링 타입 (쉼표 구분, item_details 포함 시 상세 요청률 설정 적용)')
+    parser.add_argument('--fetch-backend', choices=('http', 'playwright'), default='http')
+    parser.add_argument('--request-delay', type=float, default=0.0,
+                        help='인벤토리 요청 전 대기 (초, 실제 사이트 기본값 2)')
+    parser.add_argument('--timeout', type=float, default=600, help='celery 모드 전체 대기 한도 (초)')
+    parser.add_argument('--keep', action='store_true', help='측정용 캐릭터 데이터 유지')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'maplestorage_backend.settings')
+    import django
+    django.setup()
+    from django.conf import settings
+
+    crawl_types = [t.strip() for t in args.crawl_types.split(',') if t.strip()]
+    settings.CRAWLER_FETCH_BACKEND = args.fetch_backend
+    settings.CRAWLER_REQUEST_DELAY = args.request_delay
+
+    server = None if args.base_url or args.mode == 'celery' else build_server(args)
+    if server is None and not args.base_url:
+        parser.error('--mode celery requires --base-url (the replay server the workers point at)')
+
+    ocids = create_characters(args.jobs)
+    try:
+        if server is not None:
+            with BackgroundReplayServer(server) as base_url:
+                settings.CRAWLER_BASE_URL = base_url
+                run = run_inline(ocids, crawl_types, args.concurrency)
+        else:
+            settings.CRAWLER_BASE_URL = args.base_url
+            if args.mode == 'celery':
+                run = run_celery(ocids, crawl_types, args.timeout)
+            else:
+                run = run_inline(ocids, crawl_types, args.concurrency)
+    finally:
+        if not args.keep:
+            delete_characters()
+
+    report = summarize(run, len(ocids))
+    report.update({
+        'mode': args.mode,
+        'concurrency': args.concurrency if args.mode == 'inline' else None,
+        'crawl_types': crawl_types,
+        'served': dict(server.stats) if server is not None else None,
+    })
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    return 0 if not report['failures'] else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
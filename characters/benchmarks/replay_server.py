@@ -0,0 +1,273 @@
+"""
+메이플스토리 사이트 replay 서버 (오프라인 크롤링 벤치마크용)
+
+캡처한 랭킹/기본정보/인벤토리/창고/아이템 상세 응답을 로컬에서 다시 보내줍니다.
+CrawlerService/ItemDetailCrawler의 base_url(settings.CRAWLER_BASE_URL)을 이 서버 주소로
+바꾸면 실제 사이트 대신 이 서버로 요청합니다.
+
+응답 소스 (여러 개 지정 가능, 앞에 지정한 것 우선):
+- HAR 파일: 브라우저 개발자 도구에서 저장한 .har
+  (같은 경로+쿼리 요청은 그 응답, 나머지는 같은 페이지 종류의 응답을 재사용)
+- fixture 디렉터리: {kind}*.html / {kind}*.json (kind: ranking, character_info, inventory, storage, item_detail)
+- 둘 다 없는 페이지 종류는 벤치마크 코퍼스(full)를 사용
+
+랭킹 페이지는 같은 URL의 캡처가 없으면 요청한 캐릭터 이름(c 파라미터)의 링크를 만들어 보내므로
+임의의 캐릭터 이름으로 크롤링할 수 있습니다.
+
+실행:
+    python -m characters.benchmarks.replay_server --har capture.har --latency 0.2 --jitter 0.05 --error-rate 0.01
+"""
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import random
+import zlib
+from collections import Counter
+from html import escape
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from aiohttp import web
+
+from .corpus import load_page
+
+logger = logging.getLogger(__name__)
+
+PAGE_KINDS = ('ranking', 'character_info', 'inventory', 'storage', 'item_detail')
+
+# 캡처가 없을 때 사용할 코퍼스 페이지
+_CORPUS_FALLBACK = {
+    'character_info': ('character_info', 'full'),
+    'inventory': ('inventory', 'full'),
+    'storage': ('storage', 'full'),
+    'item_detail': ('item_detail', 'full'),
+}
+
+
+def classify_path(path: str) -> Optional[str]:
+    """요청 경로의 페이지 종류 (replay 대상이 아니면 None)"""
+    path = path.rstrip('/').lower()
+
+    if 'ranking/' in path:
+        return 'ranking'
+    if '/character/detail/' in path:
+        if path.endswith('/inventory'):
+            return 'inventory'
+        if path.endswith('/storage'):
+            return 'storage'
+        return 'character_info'
+    if '/resource/item' in path or '/item/detail' in path:
+        return 'item_detail'
+    return None
+
+
+def _request_key(url: str) -> str:
+    parts = urlsplit(url)
+    return parts.path + (f'?{parts.query}' if parts.query else '')
+
+
+def _response(body: str, status: int = 200, content_type: str = 'text/html') -> Dict[str, object]:
+    return {'status': status, 'body': body, 'content_type': content_type}
+
+
+def _ranking_page(character_name: str) -> str:
+    """요청한 캐릭터의 링크 하나가 있는 랭킹 페이지"""
+    name = escape(character_name)
+    return (
+        '<html><body><div class="rank_table_wrap"><table><tbody><tr>'
+        f'<td class="left"><dl><dt><a href="/Common/Character/Detail/{name}?p=REPLAY">{name}</a></dt>'
+        '<dd>아크메이지(불,독)</dd></dl></td></tr></tbody></table></div></body></html>'
+    )
+
+
+class ReplayServer:
+    """
+    캡처 응답 replay 서버
+
+    Args:
+        latency: 응답 지연 (초)
+        jitter: 지연 편차 (초, latency ± jitter 균등 분포)
+        error_rate: 오류 응답 비율 (0~1)
+        error_status: 주입할 오류 상태 코드 (503/429는 크롤러의 페이싱 감속 경로를 탐)
+        seed: 지연/오류 난수 시드 (재현용)
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+
+        self.exact: Dict[str, Dict[str, object]] = {}
+        self.by_kind: Dict[str, List[Dict[str, object]]] = {kind: [] for kind in PAGE_KINDS}
+        self.stats: Counter = Counter()
+
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url: Optional[str] = None
+
+    def add_response(self, url: str, response: Dict[str, object]) -> Optional[str]:
+        """캡처 응답 등록 (replay 대상이 아닌 URL이면 무시하고 None)"""
+        kind = classify_path(urlsplit(url).path)
+        if kind is None:
+            return None
+
+        self.exact.setdefault(_request_key(url), response)
+        self.by_kind[kind].append(response)
+        return kind
+
+    def load_har(self, path) -> int:
+        """HAR 파일의 HTML/JSON 응답 등록 (등록한 응답 수)"""
+        with open(path, encoding='utf-8') as f:
+            har = json.load(f)
+
+        count = 0
+        for entry in har.get('log', {}).get('entries', []):
+            request, response = entry.get('request', {}), entry.get('response', {})
+            content = response.get('content', {})
+            body = content.get('text')
+            if request.get('method', 'GET') != 'GET' or body is None or response.get('status') != 200:
+                continue
+            if content.get('encoding') == 'base64':
+                body = base64.b64decode(body).decode('utf-8', errors='replace')
+
+            content_type = (content.get('mimeType') or 'text/html').split(';')[0]
+            if self.add_response(request.get('url', ''), _response(body, 200, content_type)):
+                count += 1
+
+        logger.info(f'Loaded {count} responses from {path}')
+        return count
+
+    def load_fixture_dir(self, path) -> int:
+        """fixture 디렉터리의 {kind}*.html / {kind}*.json 등록 (등록한 응답 수)"""
+        count = 0
+        for file in sorted(Path(path).iterdir()):
+            kind = next((k for k in PAGE_KINDS if file.name.startswith(k)), None)
+            if kind is None or file.suffix not in ('.html', '.json'):
+                continue
+
+            content_type = 'application/json' if file.suffix == '.json' else 'text/html'
+            self.by_kind[kind].append(_response(file.read_text(encoding='utf-8'), 200, content_type))
+            count += 1
+
+        logger.info(f'Loaded {count} fixtures from {path}')
+        return count
+
+    def resolve(self, path_qs: str, query: Dict[str, str]) -> Optional[Dict[str, object]]:
+        """요청에 보낼 응답 (캡처 > 같은 종류의 캡처 > 코퍼스, 없으면 None)"""
+        response = self.exact.get(path_qs)
+        if response is not None:
+            return response
+
+        kind = classify_path(urlsplit(path_qs).path)
+        if kind is None:
+            return None
+
+        # 다른 캐릭터의 랭킹 캡처에는 요청한 이름의 링크가 없으므로 항상 생성
+        if kind == 'ranking':
+            return _response(_ranking_page(query.get('c', '')))
+
+        candidates = self.by_kind[kind]
+        if candidates:
+            # 같은 URL은 항상 같은 응답 (파싱 캐시/변경 감지가 실제와 같게 동작)
+            return candidates[zlib.crc32(path_qs.encode('utf-8')) % len(candidates)]
+
+        return _response(load_page(*_CORPUS_FALLBACK[kind]))
+
+    async def handle(self, request: web.Request) -> web.Response:
+        delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.stats['error'] += 1
+            return web.Response(status=self.error_status, text='injected error')
+
+        response = self.resolve(request.path_qs, request.query)
+        if response is None:
+            self.stats['not_found'] += 1
+            return web.Response(status=404, text='no recorded response')
+
+        self.stats[classify_path(request.path) or 'exact'] += 1
+        return web.Response(
+            status=response['status'], text=response['body'], content_type=response['content_type'])
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """서버 시작 (port=0이면 빈 포트 사용), 서버 주소 반환"""
+        app = web.Application()
+        app.router.add_route('GET', '/{tail:.*}', self.handle)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f'http://{host}:{bound_port}'
+        logger.info(f'Replay server listening on {self.base_url}')
+        return self.base_url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def build_server(args) -> ReplayServer:
+    """CLI 인자로 서버 구성 (load_driver와 공용)"""
+    server = ReplayServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    for har in args.har or []:
+        server.load_har(har)
+    for fixture_dir in args.fixtures or []:
+        server.load_fixture_dir(fixture_dir)
+    return server
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--har', action='append', help='캡처한 HAR 파일 (여러 번 지정 가능)')
+    parser.add_argument('--fixtures', action='append', help='fixture 디렉터리 (여러 번 지정 가능)')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='지연 편차 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    parser.add_argument('--error-status', type=int, default=503, help='주입할 오류 상태 코드')
+    parser.add_argument('--seed', type=int, help='지연/오류 난수 시드')
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='메이플스토리 사이트 replay 서버')
+    add_server_arguments(parser)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server = build_server(args)
+
+    async def serve():
+        base_url = await server.start(args.host, args.port)
+        print(f'Replay server: {base_url} (CRAWLER_BASE_URL={base_url})')
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+            print(f'Served: {dict(server.stats)}')
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+"""
+벤치마크 실행기 및 회귀 검사
+
+- 시간: time.perf_counter로 rounds회 측정한 중앙값/최솟값 (첫 1회는 워밍업으로 제외)
+- 메모리: tracemalloc으로 별도 1회 실행한 최대 할당량 (Python 할당만 집계, lxml C 메모리 제외)
+
+기준값(JSON)과 비교해 최솟값 시간(다른 프로세스 간섭에 가장 덜 흔들림) 또는 최대 메모리가
+임계치(기본 25%)를 넘게 늘면 회귀로 봅니다.
+시간 기준값은 같은 머신에서 기록한 것만 의미가 있습니다.
+"""
+import argparse
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from .corpus import CORPUS_VERSION
+
+DEFAULT_ROUNDS = 5
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.25
+
+# 너무 짧은 측정값은 잡음이 커서 회귀 판단에서 제외 (초 / 바이트)
+MIN_COMPARABLE_TIME = 0.0005
+MIN_COMPARABLE_MEMORY = 64 * 1024
+
+
+def measure(func: Callable[[], object], rounds: int = DEFAULT_ROUNDS) -> Dict[str, float]:
+    """단일 벤치마크 측정 (median/min 초, peak_memory 바이트)"""
+    func()
+
+    timings = []
+    for _ in range(max(rounds, 1)):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'median': statistics.median(timings),
+        'min': min(timings),
+        'peak_memory': peak,
+        'rounds': len(timings),
+    }
+
+
+def run_benchmarks(benchmarks: Dict[str, Callable[[], object]], rounds: int = DEFAULT_ROUNDS,
+                   name_filter: Optional[str] = None) -> Dict[str, object]:
+    """벤치마크 실행 결과 (기준값 파일 형식)"""
+    results = {
+        name: measure(func, rounds)
+        for name, func in benchmarks.items()
+        if not name_filter or name_filter in name
+    }
+    return {
+        'corpus_version': CORPUS_VERSION,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object],
+            time_threshold: float = DEFAULT_TIME_THRESHOLD,
+            memory_threshold: float = DEFAULT_MEMORY_THRESHOLD) -> List[str]:
+    """기준값 대비 회귀 목록 (없으면 빈 리스트)"""
+    if baseline.get('corpus_version') != current.get('corpus_version'):
+        return [
+            f"corpus version mismatch: baseline v{baseline.get('corpus_version')}, "
+            f"current v{current.get('corpus_version')} (re-record the baseline)"
+        ]
+
+    regressions = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+
+        if max(result['min'], base['min']) >= MIN_COMPARABLE_TIME:
+            ratio = result['min'] / base['min'] if base['min'] else float('inf')
+            if ratio > 1 + time_threshold:
+                regressions.append(
+                    f"{name}: time {base['min'] * 1000:.2f}ms -> {result['min'] * 1000:.2f}ms "
+                    f"(+{(ratio - 1) * 100:.0f}%)")
+
+        if max(result['peak_memory'], base['peak_memory']) >= MIN_COMPARABLE_MEMORY:
+            ratio = result['peak_memory'] / base['peak_memory'] if base['peak_memory'] else float('inf')
+            if ratio > 1 + memory_threshold:
+                regressions.append(
+                    f"{name}: peak memory {base['peak_memory'] / 1024:.0f}KiB -> "
+                    f"{result['peak_memory'] / 1024:.0f}KiB (+{(ratio - 1) * 100:.0f}%)")
+
+    return regressions
+
+
+def format_results(report: Dict[str, object]) -> str:
+    lines = [f"{'benchmark':55} {'median':>11} {'min':>11} {'peak mem':>11}"]
+    for name, result in report['results'].items():
+        lines.append(
+            f"{name:55} {result['median'] * 1000:>9.3f}ms {result['min'] * 1000:>9.3f}ms "
+            f"{result['peak_memory'] / 1024:>8.0f}KiB")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='크롤링 파서 벤치마크')
+    parser.add_argument('--filter', help='이름에 이 문자열이 들어간 벤치마크만 실행')
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS, help='시간 측정 횟수')
+    parser.add_argument('--save', help='결과를 기준값 JSON으로 저장')
+    parser.add_argument('--baseline', help='기준값 JSON과 비교 (회귀 시 종료 코드 1)')
+    parser.add_argument('--time-threshold', type=float, default=DEFAULT_TIME_THRESHOLD)
+    parser.add_argument('--memory-threshold', type=float, default=DEFAULT_MEMORY_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    from .suites import build_benchmarks
+
+    report = run_benchmarks(build_benchmarks(), args.rounds, args.filter)
+    print(format_results(report))
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f'\nSaved baseline: {args.save}')
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.time_threshold, args.memory_threshold)
+        if regressions:
+            print('\nRegressions:')
+            for line in regressions:
+                print(f'  {line}')
+            return 1
+        print('\nNo regressions.')
+
+    return 0
@@ -0,0 +1,57 @@
+"""
+파서별 벤치마크 정의
+
+BENCHMARKS: 이름('{파서}.{메서드}[{size}]') → 인자 없는 호출 함수
+코퍼스 페이지는 build_benchmarks() 시점에 읽어 두므로 측정에는 파싱 시간만 들어갑니다.
+"""
+import re
+from typing import Callable, Dict
+
+from characters.crawler_services import (
+    ExpiryDateParser,
+    InventoryParser,
+    ItemDetailParser,
+    MesoParser,
+    StorageParser,
+)
+
+from .corpus import SIZES, load_page
+
+# ExpiryDateParser 입력: 인벤토리 페이지에 실제로 나오는 만료일 문구
+_EXPIRY_TEXT_RE = re.compile(r'<p class="date">([^<]*)</p>')
+
+
+def _expiry_texts(size: str):
+    return _EXPIRY_TEXT_RE.findall(load_page('inventory', size))
+
+
+def build_benchmarks() -> Dict[str, Callable[[], object]]:
+    """벤치마크 목록 생성 (파서 5종 × small/full/pathological)"""
+    benchmarks: Dict[str, Callable[[], object]] = {}
+
+    for size in SIZES:
+        inventory = load_page('inventory', size)
+        storage = load_page('storage', size)
+        character_info = load_page('character_info', size)
+        item_detail = load_page('item_detail', size)
+        expiry_texts = _expiry_texts(size)
+        detail_pages = [(item_detail, f'아이템{i}') for i in range(20)]
+
+        benchmarks.update({
+            f'InventoryParser.parse_inventory[{size}]':
+                lambda html=inventory: InventoryParser.parse_inventory(html),
+            f'StorageParser.parse_storage[{size}]':
+                lambda html=storage: StorageParser.parse_storage(html, 'storage'),
+            f'MesoParser.parse_storage_meso[{size}]':
+                lambda html=storage: MesoParser.parse_storage_meso(html),
+            f'MesoParser.parse_character_meso[{size}]':
+                lambda html=character_info: MesoParser.parse_character_meso(html),
+            f'ExpiryDateParser.parse_many[{size}]':
+                lambda texts=expiry_texts: ExpiryDateParser.parse_many(texts),
+            f'ItemDetailParser.parse_detail_page[{size}]':
+                lambda html=item_detail: ItemDetailParser.parse_detail_page(html, '아이템'),
+            f'ItemDetailParser.parse_many[{size}]':
+                lambda pages=detail_pages: ItemDetailParser.parse_many(pages),
+        })
+
+    return benchmarks
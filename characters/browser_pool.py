@@ -0,0 +1,325 @@
+"""
+Playwright 브라우저 풀 (Celery 워커 프로세스 단위)
+
+크롤링 페이지마다 Chromium을 새로 띄우지 않고, 이미 실행 중인 브라우저에서
+새 BrowserContext만 발급합니다.
+
+- 브라우저는 일정 페이지 수를 처리했거나 Chromium 프로세스 메모리가
+  한도를 넘으면 교체(recycle)됩니다.
+- Playwright 객체는 생성된 이벤트 루프에 묶이므로 풀은 루프별로 관리하며,
+  Celery 태스크는 run_in_worker_loop()로 프로세스 수명 동안 같은 루프를 재사용합니다.
+- 워커 종료 시 shutdown_browser_pools()로 브라우저를 정리합니다.
+"""
+import asyncio
+import logging
+import os
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',  # Docker 환경 대응
+]
+
+
+class _PooledBrowser:
+    """풀에서 관리하는 브라우저 1개와 사용량 카운터"""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.pages_served = 0
+        self.active_contexts = 0
+        self.retired = False
+
+    def on_page(self, page):
+        """context에서 새 페이지(탭)가 열릴 때마다 호출"""
+        self.pages_served += 1
+
+
+class BrowserPool:
+    """
+    장시간 실행되는 Chromium 브라우저 풀
+
+    사용 예:
+        async with get_browser_pool().new_context(user_agent=...) as context:
+            page = await context.new_page()
+            ...
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_pages_per_browser: int = 100,
+        max_memory_mb: Optional[int] = 1024,
+        launch_args: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            size: 동시에 유지할 최대 브라우저 수
+            max_pages_per_browser: 브라우저 교체 전 최대 처리 페이지 수
+            max_memory_mb: Chromium 프로세스 RSS 합계 한도 (None이면 검사 안 함)
+            launch_args: chromium.launch() 인자
+        """
+        self.size = max(1, size)
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_memory_mb = max_memory_mb
+        self.launch_args = launch_args or DEFAULT_LAUNCH_ARGS
+
+        self._playwright_manager = None
+        self._playwright = None
+        self._browsers: List[_PooledBrowser] = []
+        self._lock = asyncio.Lock()
+        self._closed = False
+
+    @asynccontextmanager
+    async def new_context(self, **context_kwargs):
+        """
+        실행 중인 브라우저에서 새 BrowserContext 발급
+
+        블록을 벗어나면 context는 닫히고, 교체 조건을 만족한 브라우저는 종료됩니다.
+
+        Args:
+            **context_kwargs: browser.new_context() 인자 (user_agent, viewport 등)
+
+        Yields:
+            BrowserContext
+        """
+        pooled = await self._acquire_browser()
+
+        try:
+            context = await pooled.browser.new_context(**context_kwargs)
+        except Exception:
+            # 브라우저 크래시 등: 다음 요청부터 새 브라우저 사용
+            pooled.active_contexts -= 1
+            pooled.retired = True
+            await self._close_if_idle(pooled)
+            raise
+
+        context.on('page', pooled.on_page)
+
+        try:
+            yield context
+        finally:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f'Failed to close browser context: {e}')
+
+            pooled.active_contexts -= 1
+            await self._release_browser(pooled)
+
+    async def close(self):
+        """풀의 모든 브라우저와 Playwright 드라이버 종료"""
+        async with self._lock:
+            self._closed = True
+            browsers, self._browsers = self._browsers, []
+
+        for pooled in browsers:
+            await self._close_browser(pooled)
+
+        if self._playwright_manager is not None:
+            try:
+                await self._playwright_manager.__aexit__(None, None, None)
+            except Exception as e:
+                logger.warning(f'Failed to stop playwright: {e}')
+            self._playwright_manager = None
+            self._playwright = None
+
+        logger.info(f'Browser pool closed ({len(browsers)} browsers)')
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태 (모니터링/디버깅용)"""
+        return {
+            'browsers': len(self._browsers),
+            'active_contexts': sum(b.active_contexts for b in self._browsers),
+            'pages_served': [b.pages_served for b in self._browsers],
+            'closed': self._closed,
+        }
+
+    async def _acquire_browser(self) -> _PooledBrowser:
+        """가장 한가한 브라우저 선택 (여유가 있으면 새로 실행)"""
+        async with self._lock:
+            if self._closed:
+                raise RuntimeError('Browser pool is closed')
+
+            available = [b for b in self._browsers if not b.retired]
+
+            if len(available) < self.size:
+                pooled = await self._launch_browser()
+            else:
+                pooled = min(available, key=lambda b: b.active_contexts)
+
+            pooled.active_contexts += 1
+            return pooled
+
+    async def _launch_browser(self) -> _PooledBrowser:
+        """새 Chromium 브라우저 실행 (self._lock 보유 상태에서 호출)"""
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright_manager = async_playwright()
+            self._playwright = await self._playwright_manager.__aenter__()
+
+        browser = await self._playwright.chromium.launch(
+            headless=True,
+            args=self.launch_args
+        )
+        pooled = _PooledBrowser(browser)
+        self._browsers.append(pooled)
+
+        logger.info(f'Launched pooled browser ({len(self._browsers)}/{self.size})')
+        return pooled
+
+    async def _release_browser(self, pooled: _PooledBrowser):
+        """context 반환 후 교체 조건 확인"""
+        if not pooled.retired:
+            if pooled.pages_served >= self.max_pages_per_browser:
+                logger.info(
+                    f'Recycling browser after {pooled.pages_served} pages')
+                pooled.retired = True
+            elif self.max_memory_mb:
+                rss_mb = chromium_rss_mb()
+                if rss_mb is not None and rss_mb > self.max_memory_mb:
+                    logger.info(
+                        f'Recycling browser: chromium RSS {rss_mb:.0f}MB > {self.max_memory_mb}MB')
+                    pooled.retired = True
+
+        await self._close_if_idle(pooled)
+
+    async def _close_if_idle(self, pooled: _PooledBrowser):
+        """교체 대상이고 사용 중인 context가 없으면 브라우저 종료"""
+        if not pooled.retired or pooled.active_contexts > 0:
+            return
+
+        async with self._lock:
+            if pooled not in self._browsers:
+                return
+            self._browsers.remove(pooled)
+
+        await self._close_browser(pooled)
+
+    @staticmethod
+    async def _close_browser(pooled: _PooledBrowser):
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.warning(f'Failed to close pooled browser: {e}')
+
+
+def chromium_rss_mb() -> Optional[float]:
+    """
+    현재 프로세스 하위(Playwright 드라이버 + Chromium) 프로세스 RSS 합계 (MB)
+
+    Linux /proc 기반이며, 그 외 환경에서는 None을 반환합니다.
+    """
+    if not os.path.isdir('/proc'):
+        return None
+
+    children: Dict[int, List[int]] = {}
+    rss_pages: Dict[int, int] = {}
+
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                stat = f.read()
+        except OSError:
+            continue
+
+        # comm 필드에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후를 분리
+        fields = stat.rsplit(')', 1)[-1].split()
+        try:
+            pid = int(entry)
+            ppid = int(fields[1])
+            rss_pages[pid] = int(fields[21])
+        except (IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(pid)
+
+    total_pages = 0
+    stack = list(children.get(os.getpid(), []))
+    while stack:
+        pid = stack.pop()
+        total_pages += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+
+    return total_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+# 이벤트 루프별 브라우저 풀
+_pools: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]' = weakref.WeakKeyDictionary()
+
+# 스레드별 워커 이벤트 루프 (Celery prefork 자식 프로세스에서는 프로세스당 1개)
+_worker_loops = threading.local()
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    현재 실행 중인 이벤트 루프의 브라우저 풀 반환 (없으면 settings 기반으로 생성)
+
+    반드시 코루틴 안에서 호출해야 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+
+    if pool is None:
+        pool = BrowserPool(
+            size=getattr(settings, 'CRAWLER_BROWSER_POOL_SIZE', 1),
+            max_pages_per_browser=getattr(
+                settings, 'CRAWLER_BROWSER_MAX_PAGES', 100),
+            max_memory_mb=getattr(
+                settings, 'CRAWLER_BROWSER_MAX_MEMORY_MB', 1024),
+        )
+        _pools[loop] = pool
+
+    return pool
+
+
+def run_in_worker_loop(coro):
+    """
+    워커 프로세스 수명 동안 유지되는 이벤트 루프에서 코루틴 실행
+
+    asyncio.run()은 호출마다 루프를 새로 만들고 닫기 때문에 루프에 묶인
+    브라우저 풀을 재사용할 수 없습니다. Celery 태스크와 동기 뷰에서는 asyncio.run()
+    대신 이 함수를 사용합니다 (루프는 스레드별).
+    """
+    loop = getattr(_worker_loops, 'loop', None)
+
+    # fork 이후 부모 프로세스의 루프는 사용하지 않음
+    if loop is None or loop.is_closed() or getattr(_worker_loops, 'pid', None) != os.getpid():
+        loop = asyncio.new_event_loop()
+        _worker_loops.loop = loop
+        _worker_loops.pid = os.getpid()
+
+    asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
+def shutdown_browser_pools():
+    """
+    모든 브라우저 풀 종료 (Celery 워커 종료 시그널에서 호출)
+
+    실행 중이 아닌 루프에 묶인 풀만 정리할 수 있습니다.
+    """
+    for loop, pool in list(_pools.items()):
+        if loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(pool.close())
+        except Exception as e:
+            logger.warning(f'Browser pool shutdown failed: {e}')
+
+    _pools.clear()
+
+    loop = getattr(_worker_loops, 'loop', None)
+    if loop is not None and not loop.is_closed() and not loop.is_running():
+        loop.close()
+    _worker_loops.loop = None
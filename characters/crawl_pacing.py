@@ -0,0 +1,100 @@
+"""
+크롤링 요청 페이싱 (토큰 버킷 + 적응형 동시성 제한)
+
+고정 sleep 대신 설정된 요청률(politeness budget) 안에서 요청을 흘려보내고,
+429/5xx 응답이 관측되면 동시 요청 수를 줄였다가 정상 응답이 이어지면 다시 늘립니다.
+
+- get_detail_rate_limiter(): 대상 host별 Redis 토큰 버킷 (모든 워커가 요청률 예산을 공유, burst만큼 몰아서 허용)
+- AdaptiveConcurrencyLimiter: AIMD 방식 동시성 제한 (throttle 시 절반, 성공 누적 시 +1, 크롤링 1건 단위)
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from util.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# 서버 과부하/제한으로 판단하는 HTTP 상태 코드
+THROTTLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_throttle_status(status) -> bool:
+    """429/5xx 여부"""
+    return status in THROTTLE_STATUS_CODES
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD 동시성 제한
+
+    on_throttle() 시 limit을 절반으로 줄이고, 연속 increase_after회 성공하면 1씩 늘립니다.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, increase_after: int = 10):
+        """
+        Args:
+            max_limit: 최대 동시 요청 수
+            min_limit: 최소 동시 요청 수
+            increase_after: limit을 1 늘리기 전 필요한 연속 성공 횟수
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.increase_after = increase_after
+        self.limit = self.max_limit
+
+        self._active = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self):
+        """동시 요청 슬롯 획득 (limit 이상이면 대기)"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def on_success(self):
+        self._successes += 1
+        if self._successes >= self.increase_after and self.limit < self.max_limit:
+            self.limit += 1
+            self._successes = 0
+            logger.info(f'Concurrency limit increased to {self.limit}')
+
+    def on_throttle(self):
+        self._successes = 0
+        new_limit = max(self.min_limit, self.limit // 2)
+        if new_limit != self.limit:
+            logger.warning(f'Throttled: concurrency limit {self.limit} -> {new_limit}')
+        self.limit = new_limit
+
+
+# (rate, capacity)별 상세 페이지 리미터 (버킷 상태는 Redis에 있으므로 프로세스당 객체 1개면 충분)
+_detail_limiters: Dict[Tuple[float, float], RateLimiter] = {}
+
+
+def get_detail_rate_limiter(rate: float, capacity: float = 1) -> RateLimiter:
+    """
+    아이템 상세 페이지 요청률 리미터 (util.rate_limiter Redis 토큰 버킷)
+
+    버킷은 Redis에 있으므로 모든 Celery 워커/프로세스가 대상 host별로 하나의 예산을 공유합니다.
+    키는 detail_rate_key(url)로 만듭니다.
+    """
+    capacity = max(1.0, capacity)
+    limiter = _detail_limiters.get((rate, capacity))
+    if limiter is None:
+        limiter = _detail_limiters[(rate, capacity)] = RateLimiter('crawl_detail', rate=rate, capacity=capacity)
+    return limiter
+
+
+def detail_rate_key(url: Optional[str]) -> str:
+    """요청 대상 host (리미터 버킷 키)"""
+    return urlsplit(url or '').netloc.lower() or 'default'
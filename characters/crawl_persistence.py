@@ -0,0 +1,252 @@
+"""
+크롤링 아이템 청크 단위 검증/저장 (인벤토리, 창고)
+
+파서 generator(또는 아이템 목록)를 chunk_size개씩 읽어 Pydantic 검증 → ORM 객체 생성 →
+bulk_create 합니다. 아이템 dict/검증 모델/ORM 객체는 한 청크만 메모리에 있으므로
+크롤링 1건의 최대 메모리가 아이템 수가 아니라 청크 크기에 비례합니다.
+
+스냅샷 전체를 하나의 트랜잭션으로 저장하고 같은 트랜잭션에서 CrawlSnapshot 현재 포인터를 바꾸므로
+순회 중 파싱 오류가 나면 앞서 저장한 청크도 롤백됩니다 (반쯤 저장된 스냅샷이 보이지 않음).
+
+PostgreSQL에서 CRAWLER_PERSIST_USE_COPY=True이면 INSERT 대신 COPY FROM STDIN으로 씁니다.
+COPY는 생성된 id를 돌려주지 않으므로 시퀀스에서 id를 먼저 할당해 함께 씁니다.
+
+CRAWLER_HISTORY_MODE='delta'이면 첫 스냅샷만 전체 저장하고, 이후에는 현재 스냅샷과
+(슬롯 위치, 유형) 키로 비교해 추가/변경된 슬롯만 새 행으로 저장합니다. 변경/제거된 슬롯의
+기존 행은 superseded_at으로 닫으므로 히스토리 크기는 크롤링 빈도가 아니라 실제 변경량에 비례합니다.
+(스냅샷 재구성: CrawlSnapshot.materialize)
+
+settings:
+- CRAWLER_PERSIST_CHUNK_SIZE: 청크당 아이템 수 = bulk_create batch_size (기본 200)
+- CRAWLER_PERSIST_USE_COPY: PostgreSQL COPY 사용 여부 (기본 False, 다른 DB는 무시)
+- CRAWLER_HISTORY_MODE: 'full' (매번 전체 복사, 기본) 또는 'delta' (변경분만)
+"""
+import io
+import json
+import logging
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import connection, models, transaction
+from pydantic import ValidationError
+
+from .models import CrawlSnapshot, Inventory, Storage
+from .schemas import InventoryItemSchema, StorageItemSchema
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 200
+
+
+def iter_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """items를 chunk_size개씩 묶어 반환 (마지막 청크는 더 작을 수 있음)"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _inventory_row(character_basic, item: InventoryItemSchema, crawled_at) -> Inventory:
+    # AC 2.3.8: detail_url 포함, 상세 정보는 아직 크롤링 안됨
+    return Inventory(
+        character_basic=character_basic,
+        item_type=item.item_type,
+        item_name=item.item_name,
+        item_icon=item.item_icon,
+        quantity=item.quantity,
+        item_options=item.item_options,
+        slot_position=item.slot_position,
+        expiry_date=item.expiry_date,
+        detail_url=item.detail_url,
+        has_detail=False,
+        crawled_at=crawled_at,
+    )
+
+
+def _storage_row(character_basic, item: StorageItemSchema, crawled_at) -> Storage:
+    return Storage(
+        character_basic=character_basic,
+        storage_type='storage',  # 단일 창고 타입
+        item_name=item.item_name,
+        item_icon=item.item_icon,
+        quantity=item.quantity,
+        item_options=item.item_options,
+        slot_position=item.slot_position,
+        expiry_date=item.expiry_date,
+        crawled_at=crawled_at,
+    )
+
+
+def _copy_text(field, value) -> str:
+    """COPY text 형식 컬럼 값 (NULL은 \\N, 구분자/개행은 이스케이프)"""
+    if value is None:
+        return r'\N'
+    if isinstance(value, bool):
+        text = 't' if value else 'f'
+    elif isinstance(field, models.JSONField):
+        text = json.dumps(value, cls=field.encoder, ensure_ascii=False)
+    elif isinstance(value, (datetime, date)):
+        text = value.isoformat()
+    else:
+        text = str(value)
+    return (text.replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def _copy_rows(model, rows: List[Any]) -> List[int]:
+    """
+    PostgreSQL COPY로 rows 저장 (할당한 id 목록 반환)
+
+    id는 테이블 시퀀스에서 미리 받아 rows에 채운 뒤 함께 씁니다.
+    """
+    meta = model._meta
+    fields = [meta.pk] + [f for f in meta.concrete_fields if not f.primary_key]
+    quote_name = connection.ops.quote_name
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)',
+            [meta.db_table, meta.pk.column, len(rows)]
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+
+        buffer = io.StringIO()
+        for obj, pk in zip(rows, ids):
+            obj.pk = pk
+            buffer.write('\t'.join(_copy_text(f, f.pre_save(obj, True)) for f in fields))
+            buffer.write('\n')
+            obj._state.adding = False
+            obj._state.db = connection.alias
+
+        sql = 'COPY {} ({}) FROM STDIN'.format(
+            quote_name(meta.db_table), ', '.join(quote_name(f.column) for f in fields))
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, 'copy_expert'):  # psycopg2
+            buffer.seek(0)
+            raw_cursor.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with raw_cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+
+    return ids
+
+
+def _load_slots(crawl_type: str, snapshot) -> Dict[tuple, List[tuple]]:
+    """스냅샷 행을 슬롯 키별 (id, 내용) 목록으로"""
+    fields = ('id',) + CrawlSnapshot.SLOT_KEY_FIELDS[crawl_type] + CrawlSnapshot.CONTENT_FIELDS[crawl_type]
+    slots: Dict[tuple, List[tuple]] = {}
+    for row in snapshot.materialize().order_by('id').only(*fields):
+        slots.setdefault(CrawlSnapshot.slot_key(crawl_type, row), []).append(
+            (row.id, CrawlSnapshot.slot_content(crawl_type, row)))
+    return slots
+
+
+def _take_unchanged(crawl_type: str, previous_slots: Dict[tuple, List[tuple]], row) -> bool:
+    """같은 슬롯에 같은 내용의 기존 행이 있으면 비교 대상에서 빼고 True (새 행 불필요)"""
+    entries = previous_slots.get(CrawlSnapshot.slot_key(crawl_type, row))
+    if not entries:
+        return False
+
+    content = CrawlSnapshot.slot_content(crawl_type, row)
+    for index, (_, previous_content) in enumerate(entries):
+        if previous_content == content:
+            del entries[index]
+            return True
+    return False
+
+
+def _use_copy() -> bool:
+    return connection.vendor == 'postgresql' and getattr(settings, 'CRAWLER_PERSIST_USE_COPY', False)
+
+
+# crawl_type → (모델, 검증 스키마, ORM 객체 생성 함수)
+_ITEM_TYPES: Dict[str, tuple] = {
+    'inventory': (Inventory, InventoryItemSchema, _inventory_row),
+    'storage': (Storage, StorageItemSchema, _storage_row),
+}
+
+
+def save_crawled_items(
+    crawl_type: str,
+    character_basic,
+    items: Iterable[Dict[str, Any]],
+    crawled_at,
+    chunk_size: Optional[int] = None,
+    content_hash: Optional[str] = None,
+) -> List[int]:
+    """
+    크롤링 아이템을 청크 단위로 검증 후 저장 (모든 아이템에 같은 crawled_at)
+
+    검증에 실패한 아이템은 경고 로그만 남기고 건너뜁니다 (AC 2.3.7).
+
+    Args:
+        crawl_type: 'inventory' 또는 'storage'
+        character_basic: CharacterBasic 객체
+        items: 아이템 dict iterable (파서 generator, StreamedItems 또는 list)
+        crawled_at: 스냅샷 시각
+        chunk_size: 청크당 아이템 수 (없으면 settings.CRAWLER_PERSIST_CHUNK_SIZE)
+        content_hash: 페이지 해시 (CrawlSnapshot에 기록)
+
+    Returns:
+        생성된 id 목록 (아이템 순서, delta 모드에서는 추가/변경된 슬롯만)
+
+    Raises:
+        ParsingError/StorageParsingError: items 순회 중 파싱 실패 (저장한 청크는 롤백)
+    """
+    model, schema, build_row = _ITEM_TYPES[crawl_type]
+    chunk_size = chunk_size or getattr(settings, 'CRAWLER_PERSIST_CHUNK_SIZE', DEFAULT_CHUNK_SIZE)
+    use_copy = _use_copy()
+
+    created_ids: List[int] = []
+    with transaction.atomic():
+        previous = None
+        if getattr(settings, 'CRAWLER_HISTORY_MODE', 'full') == 'delta':
+            previous = CrawlSnapshot.current(character_basic, crawl_type)
+        # 비교 대상 현재 행: 슬롯 키 → [(id, 내용)] (delta 모드, 이전 스냅샷이 있을 때만)
+        previous_slots = _load_slots(crawl_type, previous) if previous else None
+        item_count = 0
+
+        for chunk in iter_chunks(items, chunk_size):
+            rows = []
+            for item_data in chunk:
+                try:
+                    row = build_row(character_basic, schema(**item_data), crawled_at)
+                except ValidationError as ve:
+                    logger.warning(
+                        f'{crawl_type} item validation failed for slot {item_data.get("slot_position")}: {ve}')
+                    continue
+
+                item_count += 1
+                if previous_slots is not None and _take_unchanged(crawl_type, previous_slots, row):
+                    continue
+                rows.append(row)
+
+            if not rows:
+                continue
+            if use_copy:
+                created_ids.extend(_copy_rows(model, rows))
+            else:
+                # PostgreSQL/SQLite는 RETURNING으로 pk를 채워줌
+                model.objects.bulk_create(rows, batch_size=chunk_size)
+                created_ids.extend(row.pk for row in rows)
+
+        if previous_slots is None:
+            # 전체 저장: 이전 스냅샷의 행은 모두 이 시점에 대체됨
+            model.objects.filter(
+                character_basic=character_basic, superseded_at__isnull=True, crawled_at__lt=crawled_at
+            ).update(superseded_at=crawled_at)
+            CrawlSnapshot.publish(character_basic, crawl_type, crawled_at, item_count, content_hash)
+        else:
+            # 변경/제거된 슬롯의 기존 행 닫기 (비교에서 남은 행)
+            stale_ids = [pk for entries in previous_slots.values() for pk, _ in entries]
+            for id_chunk in iter_chunks(stale_ids, chunk_size):
+                model.objects.filter(id__in=id_chunk).update(superseded_at=crawled_at)
+            CrawlSnapshot.publish(
+                character_basic, crawl_type, crawled_at, item_count, content_hash,
+                encoding='delta', base_crawled_at=previous.base_crawled_at, rows_written=len(created_ids))
+
+    return created_ids
@@ -7,13 +7,102 @@ Crawler services for web scraping (Story 2.3-2.6)
 import logging
 import asyncio
 import random
-from typing import List, Dict, Any, Optional, Callable
+import re
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Callable, Tuple
 from datetime import datetime
+from urllib.parse import urlsplit
+import pytz
 from bs4 import BeautifulSoup
+from lxml import etree
 from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .browser_pool import get_browser_pool
+from .info_url_cache import CharacterInfoUrlCache
+from .crawl_pacing import AdaptiveConcurrencyLimiter, detail_rate_key, get_detail_rate_limiter, is_throttle_status
+from .resource_blocking import get_resource_blocking_profile
+from .page_fetchers import PageFetchError, get_http_fetcher, has_required_class, is_redirected
+from .html_parsing import class_xpath, first, joined_text, parse_html, stripped_text
+from .parse_cache import cached_parse, cached_parse_many, content_hash as html_content_hash
 
 logger = logging.getLogger(__name__)
 
+KST = pytz.timezone('Asia/Seoul')
+
+# 파싱 결과(detail_url, item_icon)에 저장하는 공식 사이트 주소
+MAPLESTORY_BASE_URL = 'https://maplestory.nexon.com'
+_MAPLESTORY_HOST = urlsplit(MAPLESTORY_BASE_URL).netloc
+
+
+def get_base_url(base_url: Optional[str] = None) -> str:
+    """크롤링 대상 주소 (인자 > settings.CRAWLER_BASE_URL > 공식 사이트, 끝의 / 제거)"""
+    return (base_url or getattr(settings, 'CRAWLER_BASE_URL', None) or MAPLESTORY_BASE_URL).rstrip('/')
+
+
+def rebase_url(url: Optional[str], base_url: str) -> Optional[str]:
+    """
+    공식 사이트 URL의 scheme/host를 base_url로 교체 (경로와 쿼리는 유지)
+
+    저장된 URL(detail_url, 캐시된 character_info_url)은 공식 사이트 주소이므로
+    replay 서버 등으로 요청할 때 사용합니다. 다른 host의 URL은 그대로 둡니다.
+    """
+    if not url or base_url == MAPLESTORY_BASE_URL:
+        return url
+
+    parts = urlsplit(url)
+    if parts.netloc and parts.netloc != _MAPLESTORY_HOST:
+        return url
+    if not parts.netloc and not url.startswith('/'):
+        return url
+
+    return f"{base_url}{parts.path}" + (f'?{parts.query}' if parts.query else '')
+
+
+class StreamedItems:
+    """
+    파싱을 소비 시점까지 미루는 아이템 목록 (crawl_bundle(stream_items=True) 결과의 'items')
+
+    순회할 때마다 HTML을 generator 파서로 파싱하므로 아이템 dict 전체 목록을 만들지 않습니다.
+    저장 단계(characters/crawl_persistence.py)가 청크 단위로 소비하며, 파싱 오류는 순회 중
+    ParsingError/StorageParsingError로 발생합니다.
+    """
+
+    def __init__(self, parser: Callable[..., Iterator[Dict[str, Any]]], html_content: str, *args):
+        self._parser = parser
+        self._html_content = html_content
+        self._args = args
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self._parser(self._html_content, *self._args)
+
+
+class _LazyBrowserContext:
+    """
+    첫 new_page() 호출 시에만 브라우저 풀에서 BrowserContext를 발급받는 래퍼 (crawl_bundle용)
+
+    _open_page()에 공유 context로 전달되며, close() 호출 시 발급된 context를 반환합니다.
+    """
+
+    def __init__(self, **context_kwargs):
+        self._context_kwargs = context_kwargs
+        self._context_manager = None
+        self._context = None
+        self._lock = asyncio.Lock()
+
+    async def new_page(self):
+        async with self._lock:
+            if self._context is None:
+                self._context_manager = get_browser_pool().new_context(**self._context_kwargs)
+                self._context = await self._context_manager.__aenter__()
+        return await self._context.new_page()
+
+    async def close(self):
+        if self._context_manager is not None:
+            await self._context_manager.__aexit__(None, None, None)
+        self._context_manager = None
+        self._context = None
+
 
 class CrawlerService:
     """
@@ -23,20 +112,331 @@ class CrawlerService:
     캐릭터 정보를 크롤링합니다.
     """
 
-    def __init__(self):
-        """Initialize crawler service"""
+    # 랭킹 페이지는 일반 브라우저 User-Agent로 요청 (레거시 동작 유지)
+    RANKING_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+    # crawl_bundle에서 한 context의 탭으로 처리하는 크롤링 타입
+    BUNDLE_CRAWL_TYPES = ('inventory', 'storage', 'meso')
+
+    # HTTP fetch 결과에 반드시 있어야 하는 class (없으면 Playwright로 폴백)
+    REQUIRED_CLASSES = {
+        'ranking': ('rank_table_wrap',),
+        'inventory': ('inven_list',),
+        'storage': ('inven_item_img', 'inven_list', 'my_info'),
+        'meso': ('tab01_con_wrap',),
+    }
+
+    # Playwright 경로에서 networkidle 대신 기다리는 콘텐츠 셀렉터
+    STORAGE_CONTENT_SELECTOR = '.inven_item_img, .inven_list, .my_info'
+    CHARACTER_INFO_CONTENT_SELECTOR = '.tab01_con_wrap table, table'
+
+    # 랭킹 링크 셀렉터 (레거시: div.rank_table_wrap > table > tbody > tr > td.left > dl > dt > a)
+    RANKING_LINK_SELECTOR = 'div.rank_table_wrap > table > tbody > tr > td.left > dl > dt > a'
+
+    def __init__(self, fetch_backend: Optional[str] = None, base_url: Optional[str] = None):
+        """
+        Initialize crawler service
+
+        Args:
+            fetch_backend: 'http' (정적 HTTP 우선, 필수 요소 없으면 Playwright 폴백)
+                또는 'playwright'. 없으면 settings.CRAWLER_FETCH_BACKEND 사용
+            base_url: 크롤링 대상 주소 (없으면 settings.CRAWLER_BASE_URL, 오프라인 벤치마크용)
+        """
         self.user_agent = "MapleStorage/1.0 (Educational Purpose)"
-        self.request_delay = 2  # 요청 간격 (초) for rate limiting
+        self.request_delay = getattr(settings, 'CRAWLER_REQUEST_DELAY', 2)  # 요청 간격 (초) for rate limiting
+        self.base_url = get_base_url(base_url)
+        self.viewport = {'width': 1920, 'height': 1080}
+        self.bundle_concurrency = 3  # crawl_bundle 동시 탭 수
+        self.fetch_backend = fetch_backend or getattr(
+            settings, 'CRAWLER_FETCH_BACKEND', 'playwright')
+        self.resource_blocking = get_resource_blocking_profile()
+
+    async def _fetch_static_html(
+        self,
+        url: str,
+        page_type: str,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[str]:
+        """
+        Playwright 없이 HTTP로 페이지 HTML 가져오기
+
+        fetch_backend가 'http'가 아니거나, 요청이 실패하거나, REQUIRED_CLASSES의
+        필수 요소가 없으면 None을 반환합니다 (호출자는 Playwright로 폴백).
+
+        Args:
+            url: 요청 URL
+            page_type: REQUIRED_CLASSES 키
+            headers: 추가 요청 헤더
+
+        Returns:
+            HTML 문자열 또는 None
+
+        Raises:
+            CharacterInfoUrlExpiredError: 리다이렉트 또는 4xx 응답 (?p= 토큰 만료)
+        """
+        if self.fetch_backend != 'http':
+            return None
+
+        try:
+            html = await get_http_fetcher().fetch_html(url, headers=headers)
+        except PageFetchError as e:
+            # 리다이렉트/4xx는 토큰 만료이므로 브라우저로 재시도하지 않음
+            if e.redirected or (e.status is not None and 400 <= e.status < 500 and e.status != 429):
+                raise CharacterInfoUrlExpiredError(str(e))
+            logger.info(f'HTTP fetch failed, falling back to Playwright: {e}')
+            return None
+        except Exception as e:
+            logger.info(f'HTTP fetch failed, falling back to Playwright: {e}')
+            return None
+
+        if not has_required_class(html, self.REQUIRED_CLASSES[page_type]):
+            logger.info(
+                f'Required {page_type} element missing in HTTP response, falling back to Playwright')
+            return None
+
+        logger.info(f'Fetched {page_type} page over HTTP ({len(html)} bytes)')
+        return html
+
+    @classmethod
+    def _find_character_link(
+        cls,
+        html_content: str,
+        character_name: str,
+        base_url: str = MAPLESTORY_BASE_URL
+    ) -> Optional[str]:
+        """
+        랭킹 페이지 HTML에서 캐릭터 정보 URL 추출 (HTTP 경로용)
+
+        Args:
+            html_content: 랭킹 페이지 HTML
+            character_name: 캐릭터 이름 (대소문자 무시)
+            base_url: 상대 경로 링크에 붙일 주소
+
+        Returns:
+            절대 URL 또는 None
+        """
+        soup = BeautifulSoup(html_content, 'lxml')
+
+        for link in soup.select(cls.RANKING_LINK_SELECTOR):
+            if link.get_text().strip().lower() != character_name.lower():
+                continue
+
+            href = link.get('href')
+            if href:
+                if href.startswith('/'):
+                    return f"{base_url}{href}"
+                return href
+
+        return None
+
+    @asynccontextmanager
+    async def _open_page(self, context=None, **context_kwargs):
+        """
+        새 페이지(탭) 열기
+
+        context가 주어지면 해당 context에 탭을 추가하고 (crawl_bundle),
+        없으면 브라우저 풀에서 새 context를 발급받습니다.
+
+        Args:
+            context: 공유 BrowserContext (선택)
+            **context_kwargs: 새 context 생성 인자 (context가 없을 때만 사용)
+
+        Yields:
+            Page (리소스 차단 프로필 적용됨)
+        """
+        if context is not None:
+            page = await context.new_page()
+            try:
+                await self._apply_resource_blocking(page)
+                yield page
+            finally:
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.warning(f'Failed to close page: {e}')
+            return
+
+        async with get_browser_pool().new_context(**context_kwargs) as new_context:
+            page = await new_context.new_page()
+            await self._apply_resource_blocking(page)
+            yield page
+
+    async def _apply_resource_blocking(self, page):
+        """이미지/미디어/폰트/트래커 요청 차단 (CRAWLER_BLOCK_RESOURCES=False면 생략)"""
+        if self.resource_blocking is not None:
+            await self.resource_blocking.apply(page)
+
+    @staticmethod
+    def _check_sub_page_response(response, requested_url: str, final_url) -> None:
+        """
+        서브 페이지(인벤토리/창고/기본정보) 응답 확인
+
+        ?p= 토큰이 만료되면 다른 페이지로 리다이렉트되거나 4xx가 반환됩니다.
+
+        Raises:
+            CharacterInfoUrlExpiredError: 리다이렉트 또는 4xx 응답
+            CrawlingError: 그 외 실패 응답
+        """
+        if isinstance(final_url, str) and is_redirected(requested_url, final_url):
+            raise CharacterInfoUrlExpiredError(f'페이지 리다이렉트: {final_url}')
+
+        if not response or not response.ok:
+            status = response.status if response else None
+            if status is not None and 400 <= status < 500 and status != 429:
+                raise CharacterInfoUrlExpiredError(f'페이지 로드 실패: HTTP {status}')
+            raise CrawlingError(
+                f'페이지 로드 실패: HTTP {status if status is not None else "N/A"}')
+
+    async def crawl_bundle(
+        self,
+        character_name: str,
+        crawl_types: List[str],
+        character_info_url: Optional[str] = None,
+        stream_items: bool = False
+    ) -> Dict[str, Any]:
+        """
+        랭킹 조회 + 인벤토리/창고/메소 페이지를 하나의 브라우저 context에서 크롤링
+
+        ?p= 토큰은 한 번만 조회하고, 요청된 페이지들은 같은 context의 탭으로
+        동시에 (최대 bundle_concurrency개) 엽니다. 쿠키와 연결을 공유하므로
+        페이지마다 context를 새로 만드는 것보다 가볍습니다.
+        context는 첫 탭이 필요할 때 발급되므로, 모든 페이지가 HTTP 경로로
+        처리되면 브라우저를 띄우지 않습니다.
+
+        ?p= 토큰은 CharacterInfoUrlCache에서 먼저 찾고, 캐시된 토큰으로 실패한
+        페이지는 새 토큰을 받아 한 번 재시도합니다. 새 토큰 조회가 실패하면
+        성공한 페이지 결과는 그대로 두고 실패한 타입만 errors에 기록합니다.
+
+        Args:
+            character_name: 캐릭터 이름
+            crawl_types: 크롤링 타입 목록 (BUNDLE_CRAWL_TYPES 외 타입은 무시)
+            character_info_url: 이미 알고 있는 캐릭터 정보 URL (없으면 캐시 또는 랭킹 페이지에서 조회)
+            stream_items: True면 인벤토리/창고 'items'를 StreamedItems로 반환 (저장 시 파싱)
+
+        Returns:
+            {
+                'character_name': str,
+                'character_info_url': str,
+                'results': {crawl_type: crawl_inventory/crawl_storage/crawl_character_meso 결과},
+                'errors': {crawl_type: Exception},
+                'crawled_at': str
+            }
+
+        Raises:
+            CrawlingError: 캐릭터 정보 URL 최초 조회 또는 브라우저 context 생성 실패 시
+        """
+        page_crawlers = {
+            'inventory': self.crawl_inventory,
+            'storage': self.crawl_storage,
+            'meso': self.crawl_character_meso,
+        }
+        page_types = [t for t in self.BUNDLE_CRAWL_TYPES if t in crawl_types]
+        page_kwargs = {
+            'inventory': {'stream_items': stream_items},
+            'storage': {'stream_items': stream_items},
+            'meso': {},
+        }
+
+        bundle = {
+            'character_name': character_name,
+            'character_info_url': character_info_url,
+            'results': {},
+            'errors': {},
+            'crawled_at': datetime.now().isoformat()
+        }
+
+        if not page_types:
+            return bundle
+
+        semaphore = asyncio.Semaphore(self.bundle_concurrency)
+
+        # 브라우저 context는 Playwright 폴백이 필요할 때만 발급 (HTTP 경로만 쓰면 브라우저 미사용)
+        context = _LazyBrowserContext(user_agent=self.user_agent, viewport=self.viewport)
+
+        async def crawl_page(crawl_type: str):
+            async with semaphore:
+                try:
+                    bundle['results'][crawl_type] = await page_crawlers[crawl_type](
+                        bundle['character_info_url'], character_name, context=context,
+                        **page_kwargs[crawl_type])
+                except Exception as e:
+                    # 타입별 실패는 호출자가 개별 처리 (다른 탭은 계속 진행)
+                    bundle['errors'][crawl_type] = e
+
+        # 호출자가 URL을 주지 않으면 유효 시간 내 캐시된 ?p= 토큰 재사용
+        url_from_cache = False
+        if not bundle['character_info_url']:
+            bundle['character_info_url'] = CharacterInfoUrlCache.get_valid(character_name)
+            url_from_cache = bool(bundle['character_info_url'])
+
+        # 저장된 URL은 다른 주소(공식 사이트 ↔ replay 서버)일 수 있으므로 대상 주소로 맞춤
+        bundle['character_info_url'] = rebase_url(bundle['character_info_url'], self.base_url)
+
+        try:
+            if not bundle['character_info_url']:
+                bundle['character_info_url'] = await self.fetch_character_info_url(
+                    character_name, context=context)
+                CharacterInfoUrlCache.store(character_name, bundle['character_info_url'])
+
+            await asyncio.gather(*(crawl_page(t) for t in page_types))
+
+            if url_from_cache:
+                failed_types = [
+                    t for t, e in bundle['errors'].items() if isinstance(e, CrawlingError)]
+
+                if not failed_types:
+                    CharacterInfoUrlCache.mark_valid(character_name)
+                else:
+                    # 캐시된 토큰으로 실패한 페이지는 새 토큰으로 한 번만 재시도
+                    if any(isinstance(bundle['errors'][t], CharacterInfoUrlExpiredError)
+                           for t in failed_types):
+                        CharacterInfoUrlCache.mark_invalid(character_name)
+                    else:
+                        CharacterInfoUrlCache.invalidate(character_name)
+
+                    logger.info(
+                        f'Retrying {failed_types} for {character_name} with a fresh character_info_url')
+                    try:
+                        fresh_url = await self.fetch_character_info_url(character_name, context=context)
+                    except Exception as e:
+                        # 새 토큰 조회 실패: 캐시 토큰으로 성공한 페이지는 유지하고 실패한 타입만 오류로 기록
+                        logger.warning(
+                            f'Fresh character_info_url lookup failed for {character_name}: {e}')
+                        error = e if isinstance(e, CrawlingError) else CrawlingError(
+                            f'캐릭터 정보 URL 재조회 실패: {str(e)}')
+                        for crawl_type in failed_types:
+                            bundle['errors'][crawl_type] = error
+                    else:
+                        bundle['character_info_url'] = fresh_url
+                        CharacterInfoUrlCache.store(character_name, fresh_url)
+
+                        for crawl_type in failed_types:
+                            del bundle['errors'][crawl_type]
+                        await asyncio.gather(*(crawl_page(t) for t in failed_types))
+
+        except CrawlingError:
+            raise
+        except Exception as e:
+            logger.error(f'Bundle crawling failed for {character_name}: {e}', exc_info=True)
+            raise CrawlingError(f'크롤링 세션 생성 실패: {str(e)}')
+        finally:
+            await context.close()
+
+        logger.info(
+            f'Bundle crawl finished for {character_name}: '
+            f'success={list(bundle["results"])}, failed={list(bundle["errors"])}')
+        return bundle
 
-    async def fetch_character_info_url(self, character_name: str) -> str:
+    async def fetch_character_info_url(self, character_name: str, context=None) -> str:
         """
         랭킹 페이지에서 캐릭터 정보 URL (p 파라미터 포함) 가져오기
 
-        p 파라미터는 만료 시간이 있으므로 크롤링 전마다 새로 얻어와야 함.
+        p 파라미터는 만료 시간이 있으므로 재사용 여부는 CharacterInfoUrlCache가 판단함.
         레거시 mapleApi.py의 extract_character_details 로직 기반.
 
         Args:
             character_name: 캐릭터 이름
+            context: 공유 BrowserContext (crawl_bundle에서 전달, 선택)
 
         Returns:
             캐릭터 정보 URL (예: https://maplestory.nexon.com/Common/Character/Detail/{name}?p={token})
@@ -44,7 +444,7 @@ class CrawlerService:
         Raises:
             CrawlingError: 크롤링 실패 시
         """
-        from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
         import urllib.parse
 
         encoded_name = urllib.parse.quote(character_name)
@@ -52,24 +452,22 @@ class CrawlerService:
         # 본섭 랭킹 URL (레거시: N23Ranking)
         ranking_urls = [
             # 본섭
-            f"https://maplestory.nexon.com/N23Ranking/World/Total?c={encoded_name}&w=0",
+            f"{self.base_url}/N23Ranking/World/Total?c={encoded_name}&w=0",
             # 리부트
-            f"https://maplestory.nexon.com/N23Ranking/World/Total?c={encoded_name}&w=254",
+            f"{self.base_url}/N23Ranking/World/Total?c={encoded_name}&w=254",
         ]
 
-        try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=['--no-sandbox', '--disable-setuid-sandbox',
-                          '--disable-dev-shm-usage']
-                )
-
-                context = await browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
+        if self.fetch_backend == 'http':
+            character_info_url = await self._fetch_character_info_url_http(
+                ranking_urls, character_name)
+            if character_info_url:
+                return character_info_url
 
-                page = await context.new_page()
+        try:
+            async with self._open_page(context, user_agent=self.RANKING_USER_AGENT) as page:
+                if context is not None:
+                    # 공유 context는 크롤러 UA를 사용하므로 랭킹 페이지만 브라우저 UA로 요청
+                    await page.set_extra_http_headers({'User-Agent': self.RANKING_USER_AGENT})
 
                 try:
                     for ranking_url in ranking_urls:
@@ -100,7 +498,7 @@ class CrawlerService:
                                 if href:
                                     # 절대 URL로 변환
                                     if href.startswith('/'):
-                                        character_info_url = f"https://maplestory.nexon.com{href}"
+                                        character_info_url = f"{self.base_url}{href}"
                                     else:
                                         character_info_url = href
 
@@ -114,9 +512,6 @@ class CrawlerService:
                 except PlaywrightTimeoutError:
                     raise CrawlingError(f'랭킹 페이지 로드 타임아웃: {character_name}')
 
-                finally:
-                    await browser.close()
-
         except PlaywrightTimeoutError as e:
             raise CrawlingError(f'Playwright timeout: {str(e)}')
         except CrawlingError:
@@ -126,13 +521,62 @@ class CrawlerService:
                 f'Failed to fetch character_info_url: {e}', exc_info=True)
             raise CrawlingError(f'캐릭터 정보 URL 조회 실패: {str(e)}')
 
-    async def crawl_inventory(self, character_info_url: str, character_name: str) -> Dict[str, Any]:
+    async def _fetch_character_info_url_http(self, ranking_urls: List[str], character_name: str) -> Optional[str]:
+        """
+        HTTP 요청으로 랭킹 페이지에서 캐릭터 정보 URL 조회
+
+        Args:
+            ranking_urls: 조회할 랭킹 URL 목록 (본섭, 리부트 순)
+            character_name: 캐릭터 이름
+
+        Returns:
+            캐릭터 정보 URL 또는 None (Playwright 폴백 필요)
+
+        Raises:
+            CrawlingError: 모든 랭킹 페이지를 정상 수신했지만 캐릭터가 없을 때
+        """
+        fetcher = get_http_fetcher()
+
+        for ranking_url in ranking_urls:
+            try:
+                html_content = await fetcher.fetch_html(
+                    ranking_url, headers={'User-Agent': self.RANKING_USER_AGENT})
+            except Exception as e:
+                logger.info(f'HTTP ranking fetch failed, falling back to Playwright: {e}')
+                return None
+
+            if '랭킹정보가 없습니다' in html_content:
+                logger.info(
+                    f'No ranking info found at {ranking_url}, trying next...')
+                continue
+
+            if not has_required_class(html_content, self.REQUIRED_CLASSES['ranking']):
+                logger.info('Ranking table missing in HTTP response, falling back to Playwright')
+                return None
+
+            character_info_url = self._find_character_link(html_content, character_name, self.base_url)
+            if character_info_url:
+                logger.info(
+                    f'Found character_info_url over HTTP: {character_info_url}')
+                return character_info_url
+
+        raise CrawlingError(f'캐릭터 링크를 찾을 수 없습니다: {character_name}')
+
+    async def crawl_inventory(
+        self,
+        character_info_url: str,
+        character_name: str,
+        context=None,
+        stream_items: bool = False
+    ) -> Dict[str, Any]:
         """
         인벤토리 크롤링 (AC 2.3.1 - 2.3.7)
 
         Args:
             character_info_url: 캐릭터 정보 페이지 URL
             character_name: 캐릭터 이름
+            context: 공유 BrowserContext (crawl_bundle에서 전달, 선택)
+            stream_items: True면 파싱하지 않고 StreamedItems 반환 (저장 단계에서 청크 단위로 파싱)
 
         Returns:
             Dict containing inventory items
@@ -144,32 +588,45 @@ class CrawlerService:
 
         try:
             # AC 2.3.1: Playwright로 메이플 공식 사이트 접속
-            html_content = await self._fetch_inventory_page(character_info_url, character_name)
+            html_content = await self._fetch_inventory_page(
+                character_info_url, character_name, context=context)
 
-            # AC 2.3.2: 인벤토리 탭으로 이동 후 모든 슬롯 파싱
-            items = InventoryParser.parse_inventory(html_content)
+            if stream_items:
+                # 저장 단계에서 generator 파서로 파싱 (변경 없는 페이지는 파싱 자체를 생략)
+                items = StreamedItems(InventoryParser.iter_inventory, html_content)
+                content_hash = html_content_hash(html_content)
+                logger.info(
+                    f'Successfully crawled inventory page for {character_name} ({len(html_content)} bytes)')
+            else:
+                # AC 2.3.2: 인벤토리 탭으로 이동 후 모든 슬롯 파싱 (같은 페이지면 캐시된 결과)
+                items, content_hash = await cached_parse(
+                    'inventory', InventoryParser.parse_inventory, html_content)
 
-            logger.info(
-                f'Successfully crawled {len(items)} items for {character_name}')
+                logger.info(
+                    f'Successfully crawled {len(items)} items for {character_name}')
             return {
                 'character_name': character_name,
                 'items': items,
+                'content_hash': content_hash,
                 'crawled_at': datetime.now().isoformat()
             }
 
+        except CharacterInfoUrlExpiredError:
+            raise
         except Exception as e:
             # AC 2.3.7: 실패 시 구체적 에러 메시지 로깅
             logger.error(
                 f'Inventory crawling failed for {character_name}: {str(e)}')
             raise CrawlingError(f'인벤토리 크롤링 실패: {str(e)}')
 
-    async def _fetch_inventory_page(self, character_info_url: str, character_name: str) -> str:
+    async def _fetch_inventory_page(self, character_info_url: str, character_name: str, context=None) -> str:
         """
-        인벤토리 페이지 HTML 가져오기 (Playwright 사용)
+        인벤토리 페이지 HTML 가져오기 (HTTP 우선, 필요 시 Playwright 사용)
 
         Args:
             character_info_url: 캐릭터 정보 페이지 URL (예: https://maplestory.nexon.com/MyMaple/Character/Detail/{name}?p={id})
             character_name: 캐릭터 이름
+            context: 공유 BrowserContext (선택)
 
         Returns:
             HTML content as string
@@ -178,9 +635,7 @@ class CrawlerService:
             CrawlingError: 크롤링 실패 시
             TimeoutError: 페이지 로드 타임아웃 시
         """
-        from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-        import asyncio
-        import random
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
         # Rate limiting: 요청 간격 랜덤 딜레이 (2-5초)
         delay = self.request_delay + random.uniform(0, 3)
@@ -191,25 +646,17 @@ class CrawlerService:
         inventory_url = self._build_inventory_url(character_info_url)
         logger.info(f'Inventory URL: {inventory_url}')
 
-        try:
-            async with async_playwright() as p:
-                # AC 2.3.1: Playwright 브라우저 초기화 (headless 모드)
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',  # Docker 환경 대응
-                    ]
-                )
-
-                context = await browser.new_context(
-                    user_agent=self.user_agent,
-                    viewport={'width': 1920, 'height': 1080}
-                )
-
-                page = await context.new_page()
+        html = await self._fetch_static_html(inventory_url, 'inventory')
+        if html is not None:
+            return html
 
+        try:
+            # AC 2.3.1: 브라우저 풀의 headless 브라우저에서 페이지 열기
+            async with self._open_page(
+                context,
+                user_agent=self.user_agent,
+                viewport=self.viewport
+            ) as page:
                 # Timeout 설정: 페이지 로드 30초
                 try:
                     logger.info(
@@ -220,9 +667,7 @@ class CrawlerService:
                         timeout=30000  # 30초
                     )
 
-                    if not response or not response.ok:
-                        raise CrawlingError(
-                            f'페이지 로드 실패: HTTP {response.status if response else "N/A"}')
+                    self._check_sub_page_response(response, inventory_url, page.url)
 
                     # 페이지 내용 로드 대기 (동적 콘텐츠 대응)
                     await page.wait_for_selector('.inven_list', timeout=10000)
@@ -239,13 +684,12 @@ class CrawlerService:
                     raise CrawlingError(
                         f'페이지 로드 타임아웃 (30초 초과): {character_name}')
 
-                finally:
-                    await browser.close()
-
                 return html
 
         except PlaywrightTimeoutError as e:
             raise CrawlingError(f'Playwright timeout: {str(e)}')
+        except CharacterInfoUrlExpiredError:
+            raise
         except Exception as e:
             logger.error(
                 f'Unexpected error fetching inventory page: {e}', exc_info=True)
@@ -272,13 +716,21 @@ class CrawlerService:
         else:
             return f'{character_info_url}/Inventory'
 
-    async def crawl_storage(self, character_info_url: str, character_name: str) -> Dict[str, Any]:
+    async def crawl_storage(
+        self,
+        character_info_url: str,
+        character_name: str,
+        context=None,
+        stream_items: bool = False
+    ) -> Dict[str, Any]:
         """
         창고 크롤링 (AC 2.4.1 - 2.4.7, AC 2.5.1 - 2.5.6 메소 포함)
 
         Args:
             character_info_url: 캐릭터 정보 페이지 URL (사용 안됨, 새로 가져옴)
             character_name: 캐릭터 이름
+            context: 공유 BrowserContext (crawl_bundle에서 전달, 선택)
+            stream_items: True면 파싱하지 않고 StreamedItems 반환 (저장 단계에서 청크 단위로 파싱)
 
         Returns:
             Dict containing storage items and meso:
@@ -301,11 +753,17 @@ class CrawlerService:
             logger.info(f'Fresh character_info_url: {character_info_url}')
 
             # AC 2.4.1: Playwright로 창고 페이지 접속
-            storage_html = await self._fetch_storage_page(character_info_url, character_name)
+            storage_html = await self._fetch_storage_page(
+                character_info_url, character_name, context=context)
             # AC 2.4.2 - 2.4.4: 창고 파싱 (공유/개인 구분 없음)
-            items = StorageParser.parse_storage(storage_html, 'storage')
+            if stream_items:
+                items = StreamedItems(StorageParser.iter_storage, storage_html, 'storage')
+                content_hash = html_content_hash(storage_html)
+            else:
+                items, content_hash = await cached_parse(
+                    'storage', StorageParser.parse_storage, storage_html, 'storage')
 
-            # AC 2.5.1 - 2.5.2: 창고 메소 파싱
+            # AC 2.5.1 - 2.5.2: 창고 메소 파싱 (정규식 fast path라 파싱 워커로 보내지 않음)
             storage_meso = MesoParser.parse_storage_meso(storage_html)
             if storage_meso is not None:
                 logger.info(f'Parsed storage meso: {storage_meso:,}')
@@ -313,12 +771,14 @@ class CrawlerService:
                 logger.warning(f'Failed to parse storage meso for {character_name}')
 
             logger.info(
-                f'Successfully crawled storage for {character_name}: {len(items)} items, meso={storage_meso}')
+                f'Successfully crawled storage for {character_name}: '
+                f'{"streamed" if stream_items else len(items)} items, meso={storage_meso}')
 
             return {
                 'character_name': character_name,
                 'items': items,
                 'meso': storage_meso,
+                'content_hash': content_hash,
                 'crawled_at': datetime.now().isoformat()
             }
 
@@ -327,19 +787,22 @@ class CrawlerService:
             logger.error(
                 f'Storage parsing failed for {character_name}: {str(e)}')
             raise
+        except CharacterInfoUrlExpiredError:
+            raise
         except Exception as e:
             # AC 2.4.10: 구체적 에러 메시지 로깅
             logger.error(
                 f'Storage crawling failed for {character_name}: {str(e)}')
             raise CrawlingError(f'창고 크롤링 실패: {str(e)}')
 
-    async def _fetch_storage_page(self, character_info_url: str, character_name: str) -> str:
+    async def _fetch_storage_page(self, character_info_url: str, character_name: str, context=None) -> str:
         """
-        창고 페이지 HTML 가져오기 (Playwright 사용)
+        창고 페이지 HTML 가져오기 (HTTP 우선, 필요 시 Playwright 사용)
 
         Args:
             character_info_url: 캐릭터 정보 페이지 URL
             character_name: 캐릭터 이름
+            context: 공유 BrowserContext (선택)
 
         Returns:
             창고 페이지 HTML 문자열
@@ -347,7 +810,7 @@ class CrawlerService:
         Raises:
             CrawlingError: 크롤링 실패 시
         """
-        from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
         # Rate limiting: 요청 간격 랜덤 딜레이 (2-5초)
         # delay = self.request_delay + random.uniform(0, 3)
@@ -358,64 +821,38 @@ class CrawlerService:
         storage_url = self._build_storage_url(character_info_url)
         logger.info(f'Storage URL: {storage_url}')
 
-        try:
-            async with async_playwright() as p:
-                # AC 2.4.1: Playwright 브라우저 초기화 (headless 모드)
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',  # Docker 환경 대응
-                    ]
-                )
-
-                context = await browser.new_context(
-                    user_agent=self.user_agent,
-                    viewport={'width': 1920, 'height': 1080}
-                )
+        storage_html = await self._fetch_static_html(storage_url, 'storage')
+        if storage_html is not None:
+            return storage_html
 
-                page = await context.new_page()
+        try:
+            # AC 2.4.1: 브라우저 풀의 headless 브라우저에서 페이지 열기
+            async with self._open_page(
+                context,
+                user_agent=self.user_agent,
+                viewport=self.viewport
+            ) as page:
 
                 try:
                     logger.info(
                         f'Navigating to storage page for {character_name}')
                     response = await page.goto(
                         storage_url,
-                        wait_until='networkidle',  # 모든 네트워크 요청 완료 대기
+                        wait_until='domcontentloaded',  # DOM 로드 완료 대기 (리소스는 차단됨)
                         timeout=30000  # 30초
                     )
 
-                    if not response or not response.ok:
-                        raise CrawlingError(
-                            f'페이지 로드 실패: HTTP {response.status if response else "N/A"}')
+                    self._check_sub_page_response(response, storage_url, page.url)
 
                     # 창고 컨텐츠 로드 대기 - 레거시: inven_item_img 클래스 사용
-                    # 여러 selector 시도
-                    selectors_to_try = [
-                        '.inven_item_img',
-                        '.inven_list',
-                        '.my_info',
-                        'li',  # 최소한의 fallback
-                    ]
-
-                    selector_found = False
-                    for selector in selectors_to_try:
-                        try:
-                            await page.wait_for_selector(selector, timeout=5000)
-                            logger.info(f'Found selector: {selector}')
-                            selector_found = True
-                            break
-                        except:
-                            continue
-
-                    if not selector_found:
+                    # 셀렉터를 하나씩 시도하지 않고 하나라도 나타나면 진행
+                    try:
+                        await page.wait_for_selector(
+                            self.STORAGE_CONTENT_SELECTOR, state='attached', timeout=10000)
+                    except PlaywrightTimeoutError:
                         logger.warning(
                             'No storage content selector found, proceeding with page content')
 
-                    # 추가 대기 (동적 컨텐츠 로드)
-                    # await asyncio.sleep(2)
-
                     # 창고 HTML 추출
                     storage_html = await page.content()
                     logger.info(
@@ -427,13 +864,12 @@ class CrawlerService:
                     raise CrawlingError(
                         f'페이지 로드 타임아웃 (30초 초과): {character_name}')
 
-                finally:
-                    await browser.close()
-
                 return storage_html
 
         except PlaywrightTimeoutError as e:
             raise CrawlingError(f'Playwright timeout: {str(e)}')
+        except CharacterInfoUrlExpiredError:
+            raise
         except Exception as e:
             logger.error(
                 f'Unexpected error fetching storage page: {e}', exc_info=True)
@@ -460,7 +896,7 @@ class CrawlerService:
         else:
             return f'{character_info_url}/Storage'
 
-    async def crawl_character_meso(self, character_info_url: str, character_name: str) -> Dict[str, Any]:
+    async def crawl_character_meso(self, character_info_url: str, character_name: str, context=None) -> Dict[str, Any]:
         """
         캐릭터 보유 메소 크롤링 (AC 2.5.1 - 2.5.6)
 
@@ -469,6 +905,7 @@ class CrawlerService:
         Args:
             character_info_url: 캐릭터 정보 페이지 URL
             character_name: 캐릭터 이름
+            context: 공유 BrowserContext (crawl_bundle에서 전달, 선택)
 
         Returns:
             Dict containing character meso:
@@ -481,88 +918,120 @@ class CrawlerService:
         Raises:
             CrawlingError: 크롤링 실패 시
         """
-        from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-
         logger.info(f'Starting character meso crawl for {character_name}')
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',
-                    ]
-                )
-
-                context = await browser.new_context(
-                    user_agent=self.user_agent,
-                    viewport={'width': 1920, 'height': 1080}
-                )
+            html_content = await self._fetch_character_info_page(
+                character_info_url, character_name, context=context)
 
-                page = await context.new_page()
+            # AC 2.5.1-2.5.2: 메소 파싱 (정규식 fast path라 파싱 워커로 보내지 않음)
+            character_meso = MesoParser.parse_character_meso(html_content)
+
+            if character_meso is not None:
+                logger.info(f'Parsed character meso: {character_meso:,}')
+            else:
+                # AC 2.5.6: 파싱 실패 시 로깅
+                logger.warning(f'Failed to parse character meso for {character_name}')
+
+            return {
+                'character_name': character_name,
+                'meso': character_meso,
+                'crawled_at': datetime.now().isoformat()
+            }
+
+        except CharacterInfoUrlExpiredError:
+            raise
+        except Exception as e:
+            logger.error(f'Character meso crawling failed: {e}', exc_info=True)
+            raise CrawlingError(f'캐릭터 메소 크롤링 실패: {str(e)}')
+
+    async def _fetch_character_info_page(self, character_info_url: str, character_name: str, context=None) -> str:
+        """
+        캐릭터 기본정보 페이지 HTML 가져오기 (HTTP 우선, 필요 시 Playwright 사용)
+
+        Args:
+            character_info_url: 캐릭터 정보 페이지 URL
+            character_name: 캐릭터 이름
+            context: 공유 BrowserContext (선택)
+
+        Returns:
+            HTML 문자열
+
+        Raises:
+            CrawlingError: 크롤링 실패 시
+        """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+        html_content = await self._fetch_static_html(character_info_url, 'meso')
+        if html_content is not None:
+            return html_content
+
+        try:
+            async with self._open_page(
+                context,
+                user_agent=self.user_agent,
+                viewport=self.viewport
+            ) as page:
                 try:
                     logger.info(f'Navigating to character info page: {character_info_url}')
                     response = await page.goto(
                         character_info_url,
-                        wait_until='networkidle',
+                        wait_until='domcontentloaded',
                         timeout=30000
                     )
 
-                    if not response or not response.ok:
-                        raise CrawlingError(
-                            f'페이지 로드 실패: HTTP {response.status if response else "N/A"}')
+                    self._check_sub_page_response(response, character_info_url, page.url)
 
                     # 기본정보 테이블 로드 대기
                     try:
-                        await page.wait_for_selector('table', timeout=5000)
+                        await page.wait_for_selector(
+                            self.CHARACTER_INFO_CONTENT_SELECTOR, state='attached', timeout=5000)
                     except:
                         logger.warning('Table selector not found, proceeding anyway')
 
-                    html_content = await page.content()
-
-                    # AC 2.5.1-2.5.2: 메소 파싱
-                    character_meso = MesoParser.parse_character_meso(html_content)
-
-                    if character_meso is not None:
-                        logger.info(f'Parsed character meso: {character_meso:,}')
-                    else:
-                        # AC 2.5.6: 파싱 실패 시 로깅
-                        logger.warning(f'Failed to parse character meso for {character_name}')
-
-                    return {
-                        'character_name': character_name,
-                        'meso': character_meso,
-                        'crawled_at': datetime.now().isoformat()
-                    }
+                    return await page.content()
 
                 except PlaywrightTimeoutError as e:
                     logger.error(f'Timeout while loading character info page: {e}')
                     raise CrawlingError(f'페이지 로드 타임아웃: {character_name}')
 
-                finally:
-                    await browser.close()
-
         except PlaywrightTimeoutError as e:
             raise CrawlingError(f'Playwright timeout: {str(e)}')
-        except Exception as e:
-            logger.error(f'Character meso crawling failed: {e}', exc_info=True)
-            raise CrawlingError(f'캐릭터 메소 크롤링 실패: {str(e)}')
 
 
 class InventoryParser:
     """
     인벤토리 HTML 파싱 클래스 (AC 2.3.2 - 2.3.5)
 
-    레거시 크롤링 로직 기반으로 실제 메이플스토리 웹사이트 HTML을 파싱합니다.
+    페이지를 lxml로 한 번만 파싱한 뒤 .inven_list(탭) > .inven_item_img(아이템) 노드를
+    순회하며 같은 노드 범위에서 이름/수량/스타포스/희귀도/상세 URL/만료일을 추출합니다.
+    (반환 형식은 레거시 parseItem 기반 파서와 동일)
     """
 
+    # 5개 아이템 타입 (장비, 소비, 기타, 설치, 캐시) - 레거시: for itemType in range(1, 6)
+    ITEM_TYPES = ['equips', 'consumables', 'miscs', 'installables', 'cashes']
+
+    _TAB_XPATH = class_xpath('//div[{tab}]', tab='inven_list')
+    _ITEM_XPATH = class_xpath('.//div[{item}]', item='inven_item_img')
+    _CONTAINS_ITEM_XPATH = class_xpath(
+        'boolean(descendant-or-self::*[{item}])', item='inven_item_img')
+    _IMG_XPATH = etree.XPath('descendant-or-self::img')
+    _TITLE_LINK_XPATH = class_xpath(
+        'descendant-or-self::*[{title}]//h1//a', title='inven_item_memo_title')
+    _LINK_XPATH = etree.XPath('descendant-or-self::a')
+    _EM_XPATH = etree.XPath('descendant-or-self::em')
+    _RARITY_XPATH = class_xpath('descendant-or-self::div[{rarity}]', rarity='item_memo_sel')
+    _DATE_XPATH = class_xpath('descendant-or-self::*[{date}]', date='date')
+
+    _QUANTITY_RE = re.compile(r'\((\d+)개\)')
+    _QUANTITY_STRIP_RE = re.compile(r'\s*\(\d+개\)')
+    _STAR_FORCE_RE = re.compile(r'(\d+)성 강화')
+    _SPELL_TRACE_RE = re.compile(r'\+(\d+)')
+
     @staticmethod
     def parse_inventory(html_content: str) -> List[Dict[str, Any]]:
         """
-        인벤토리 HTML 파싱 (레거시 parseItem 함수 기반)
+        인벤토리 HTML 파싱
 
         Args:
             html_content: HTML 문자열
@@ -573,61 +1042,103 @@ class InventoryParser:
         Raises:
             ParsingError: 파싱 실패 시
         """
-        import re
-
-        try:
-            soup = BeautifulSoup(html_content, 'lxml')
-            items = []
-
-            # AC 2.3.2: 인벤토리 탭 찾기 (레거시: '<div class="inven_list">')
-            inven_list_divs = html_content.split('<div class="inven_list">')
-
-            if len(inven_list_divs) < 2:
-                logger.warning('No inventory lists found in HTML')
-                return []
-
-            # 5개 아이템 타입 순회 (장비, 소비, 기타, 설치, 캐시)
-            # 레거시: for itemType in range(1, 6)
-            item_types = ['equips', 'consumables',
-                          'miscs', 'installables', 'cashes']
+        return list(InventoryParser.iter_inventory(html_content))
 
-            for item_type_idx in range(1, min(6, len(inven_list_divs))):
-                tab_html = inven_list_divs[item_type_idx]
-                item_type = item_types[item_type_idx - 1]
-
-                # AC 2.3.3: 아이템 이미지 div로 분할
-                item_divs = tab_html.split('<div class="inven_item_img">')
-
-                for item_div in item_divs:
-                    if len(item_div) < 200 or "없습니다." in item_div:
-                        continue
+    @staticmethod
+    def iter_inventory(html_content: str) -> Iterator[Dict[str, Any]]:
+        """
+        인벤토리 HTML 파싱 (아이템을 찾는 대로 하나씩 반환하는 generator)
 
-                    try:
-                        item_data = InventoryParser._parse_single_item(
-                            item_div, item_type, len(items)
-                        )
-                        if item_data:
-                            items.append(item_data)
+        전체 목록을 만들지 않으므로 저장 단계가 청크 단위로 소비하면
+        아이템 dict는 청크 크기만큼만 메모리에 남습니다. (lxml 트리는 순회 동안 유지)
+        만료일은 ExpiryDateParser.fill_expiry_dates가 EXPIRY_BATCH_SIZE개씩 묶어 파싱합니다.
 
-                    except Exception as e:
-                        logger.warning(
-                            f'Failed to parse item in {item_type}: {e}')
-                        continue
+        Args:
+            html_content: HTML 문자열
 
-            logger.info(
-                f'Successfully parsed {len(items)} items from inventory')
-            return items
+        Yields:
+            item dictionary (parse_inventory 항목과 동일)
 
+        Raises:
+            ParsingError: 파싱 실패 시 (순회 중 발생)
+        """
+        try:
+            yield from ExpiryDateParser.fill_expiry_dates(InventoryParser._iter_items(html_content))
         except Exception as e:
             logger.error(f'Inventory parsing failed: {e}', exc_info=True)
             raise ParsingError(f'인벤토리 파싱 실패: {str(e)}')
 
     @staticmethod
-    def _parse_single_item(item_html: str, item_type: str, slot_position: int) -> Optional[Dict[str, Any]]:
-        """
-        단일 아이템 HTML 파싱 (BeautifulSoup 사용)
+    def _iter_items(html_content: str) -> Iterator[Tuple[Dict[str, Any], Optional[str]]]:
+        """(만료일을 채우기 전 아이템 dict, 만료일 영역 텍스트) generator"""
+        root = parse_html(html_content)
+        tabs = InventoryParser._TAB_XPATH(root) if root is not None else []
+
+        # AC 2.3.2: 인벤토리 탭 찾기
+        if not tabs:
+            logger.warning('No inventory lists found in HTML')
+            return
+
+        count = 0
+        for item_type, tab in zip(InventoryParser.ITEM_TYPES, tabs):
+            # AC 2.3.3: 아이템 노드 순회
+            for item_node in InventoryParser._ITEM_XPATH(tab):
+                try:
+                    scope = InventoryParser._item_scope(item_node)
+                    item_data = InventoryParser._parse_item_scope(scope, item_type, count, parse_expiry=False)
+                    expiry_text = InventoryParser._expiry_text(scope) if item_data else None
+                except Exception as e:
+                    logger.warning(
+                        f'Failed to parse item in {item_type}: {e}')
+                    continue
 
-        Args:
+                if item_data:
+                    count += 1
+                    yield item_data, expiry_text
+
+        logger.info(
+            f'Successfully parsed {count} items from inventory')
+
+    @staticmethod
+    def _expiry_text(scope: List[Any]) -> Optional[str]:
+        """아이템 노드 범위에서 만료일 영역 텍스트 (class="date" 엘리먼트 또는 기간/만료 문구)"""
+        date_node = InventoryParser._first(InventoryParser._DATE_XPATH, scope)
+        if date_node is not None:
+            return ' '.join(date_node.itertext()).strip() or None
+        return ExpiryDateParser.expiry_text_from_chunks(
+            text for node in scope for text in node.itertext())
+
+    @staticmethod
+    def _item_scope(item_node) -> List[Any]:
+        """
+        아이템 하나의 노드 범위: .inven_item_img와 다음 아이템 전까지의 형제 노드
+
+        이름/희귀도가 담긴 .inven_item_memo는 .inven_item_img의 형제로 나오므로 함께 포함합니다.
+        """
+        scope = [item_node]
+        for sibling in item_node.itersiblings():
+            if not isinstance(sibling.tag, str):
+                continue  # 주석 등
+            if InventoryParser._CONTAINS_ITEM_XPATH(sibling):
+                break
+            scope.append(sibling)
+        return scope
+
+    @staticmethod
+    def _first(xpath, scope) -> Optional[Any]:
+        """범위 내 노드 중 문서 순서상 첫 번째 매칭"""
+        for node in scope:
+            matches = xpath(node)
+            if matches:
+                return matches[0]
+        return None
+
+    @staticmethod
+    def _parse_single_item(item_html: str, item_type: str, slot_position: int) -> Optional[Dict[str, Any]]:
+        """
+        단일 아이템 HTML 조각 파싱
+
+        Args:
             item_html: 아이템 HTML 문자열
             item_type: 아이템 타입 (equips, consumables, etc.)
             slot_position: 슬롯 위치
@@ -635,105 +1146,116 @@ class InventoryParser:
         Returns:
             Item data dictionary or None
         """
-        import re
-
         try:
-            # BeautifulSoup으로 안전한 파싱
-            soup = BeautifulSoup(item_html, 'lxml')
-
-            # AC 2.3.3: 아이템 정보 추출
-
-            # 아이템 아이콘 URL (inven_item_img 영역의 img 태그)
-            img_tag = soup.select_one('.inven_item_img img')
-            if not img_tag:
-                img_tag = soup.find('img')  # fallback
-            image_url = img_tag.get('src', '') if img_tag else ''
+            root = parse_html(item_html)
+            if root is None:
+                return None
+            return InventoryParser._parse_item_scope([root], item_type, slot_position)
+        except Exception as e:
+            logger.warning(f'Failed to parse single item: {e}', exc_info=True)
+            return None
 
-            # 아이템 이름 및 상세 URL (inven_item_memo_title 영역의 h1 > a 태그)
-            memo_title_tag = soup.select_one('.inven_item_memo_title h1 a')
-            if not memo_title_tag:
-                memo_title_tag = soup.find('a')  # fallback
+    @staticmethod
+    def _parse_item_scope(
+        scope: List[Any], item_type: str, slot_position: int, parse_expiry: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        아이템 노드 범위에서 아이템 정보 추출
 
-            detail_url = memo_title_tag.get(
-                'href', '') if memo_title_tag else ''
+        Args:
+            parse_expiry: False면 expiry_date를 None으로 두고 호출자가 묶어서 채움
 
-            # 아이템 이름 및 수량 파싱
-            text_content = memo_title_tag.get_text(
-                strip=True) if memo_title_tag else ''
+        Returns:
+            Item data dictionary (이름이 없는 빈 슬롯/안내 문구면 None)
+        """
+        scope_text = joined_text(scope)
+        if "없습니다." in scope_text:
+            return None
 
-            # &nbsp; 및 일반 공백 정규화
-            text_content = text_content.replace(
-                '\xa0', ' ').replace('&nbsp;', ' ')
+        # AC 2.3.3: 아이템 정보 추출
 
-            # 수량 파싱: "아이템명 (100개)" 형식
-            quantity = 1
-            quantity_match = re.search(r'\((\d+)개\)', text_content)
-            if quantity_match:
-                quantity = int(quantity_match.group(1))
-                # 아이템 이름에서 수량 부분 제거
-                item_name = re.sub(r'\s*\(\d+개\)', '', text_content).strip()
-            else:
-                item_name = text_content.strip()
+        # 아이템 아이콘 URL
+        img_tag = InventoryParser._first(InventoryParser._IMG_XPATH, scope)
+        image_url = img_tag.get('src', '') if img_tag is not None else ''
 
-            # &#39; 처리 (작은따옴표)
-            item_name = item_name.replace("&#39;", "'")
+        # 아이템 이름 및 상세 URL (inven_item_memo_title 영역의 h1 > a 태그)
+        memo_title_tag = InventoryParser._first(InventoryParser._TITLE_LINK_XPATH, scope)
+        if memo_title_tag is None:
+            memo_title_tag = InventoryParser._first(InventoryParser._LINK_XPATH, scope)  # fallback
 
-            # 스타포스 강화 수치
-            star_force_count = None
-            em_tag = soup.find('em')
-            if em_tag and '성 강화' in em_tag.get_text():
-                star_force_match = re.search(r'(\d+)성 강화', em_tag.get_text())
-                if star_force_match:
-                    star_force_count = int(star_force_match.group(1))
+        detail_url = memo_title_tag.get(
+            'href', '') if memo_title_tag is not None else ''
 
-            # 주문서 강화 수치 (+7 등)
-            spell_trace_count = None
-            spell_trace_match = re.search(r'\+(\d+)', text_content)
-            if spell_trace_match:
-                spell_trace_count = int(spell_trace_match.group(1))
+        # 아이템 이름 및 수량 파싱 (&nbsp; 및 일반 공백 정규화)
+        text_content = stripped_text(memo_title_tag).replace(
+            '\xa0', ' ').replace('&nbsp;', ' ')
 
-            # 희귀도 (rarity)
-            rarity = None
-            rarity_div = soup.find('div', class_='item_memo_sel')
-            if rarity_div:
-                rarity = rarity_div.get_text(strip=True)
-
-            # item_options 구성
-            item_options = {}
-            if star_force_count:
-                item_options['star_force'] = star_force_count
-            if spell_trace_count:
-                item_options['spell_trace'] = spell_trace_count
-            if rarity:
-                item_options['rarity'] = rarity
-
-            # 아이콘 URL 정규화
-            if image_url.startswith('//'):
-                image_url = f'https:{image_url}'
-            elif not image_url.startswith('http'):
-                image_url = f'https://maplestory.nexon.com{image_url}' if image_url else ''
-
-            # 상세 URL 정규화
-            if detail_url and detail_url.startswith('/'):
-                detail_url = f'https://maplestory.nexon.com{detail_url}'
+        # 수량 파싱: "아이템명 (100개)" 형식
+        quantity = 1
+        quantity_match = InventoryParser._QUANTITY_RE.search(text_content)
+        if quantity_match:
+            quantity = int(quantity_match.group(1))
+            # 아이템 이름에서 수량 부분 제거
+            item_name = InventoryParser._QUANTITY_STRIP_RE.sub('', text_content).strip()
+        else:
+            item_name = text_content.strip()
 
-            # AC 2.6.1: 만료 날짜 추출 (기간제 아이템)
-            expiry_date = ExpiryDateParser.parse_expiry_date(item_html)
+        # &#39; 처리 (작은따옴표)
+        item_name = item_name.replace("&#39;", "'")
+        if not item_name:
+            return None
 
-            return {
-                'item_name': item_name,
-                'item_icon': image_url,
-                'quantity': quantity,
-                'item_options': item_options if item_options else None,
-                'slot_position': slot_position,
-                'expiry_date': expiry_date,  # AC 2.6.1-2.6.3: 만료 날짜 (없으면 None)
-                'item_type': item_type,
-                'detail_url': detail_url
-            }
+        # 스타포스 강화 수치
+        star_force_count = None
+        em_tag = InventoryParser._first(InventoryParser._EM_XPATH, scope)
+        if em_tag is not None:
+            star_force_match = InventoryParser._STAR_FORCE_RE.search(stripped_text(em_tag))
+            if star_force_match:
+                star_force_count = int(star_force_match.group(1))
+
+        # 주문서 강화 수치 (+7 등)
+        spell_trace_count = None
+        spell_trace_match = InventoryParser._SPELL_TRACE_RE.search(text_content)
+        if spell_trace_match:
+            spell_trace_count = int(spell_trace_match.group(1))
+
+        # 희귀도 (rarity)
+        rarity = stripped_text(InventoryParser._first(InventoryParser._RARITY_XPATH, scope)) or None
+
+        # item_options 구성
+        item_options = {}
+        if star_force_count:
+            item_options['star_force'] = star_force_count
+        if spell_trace_count:
+            item_options['spell_trace'] = spell_trace_count
+        if rarity:
+            item_options['rarity'] = rarity
+
+        # 아이콘 URL 정규화
+        if image_url.startswith('//'):
+            image_url = f'https:{image_url}'
+        elif not image_url.startswith('http'):
+            image_url = f'https://maplestory.nexon.com{image_url}' if image_url else ''
+
+        # 상세 URL 정규화
+        if detail_url and detail_url.startswith('/'):
+            detail_url = f'https://maplestory.nexon.com{detail_url}'
+
+        # AC 2.6.1: 만료 날짜 추출 (기간제 아이템, 같은 노드 범위의 만료일 영역에서)
+        expiry_date = None
+        if parse_expiry:
+            expiry_date = ExpiryDateParser.parse_expiry_text(InventoryParser._expiry_text(scope))
 
-        except Exception as e:
-            logger.warning(f'Failed to parse single item: {e}', exc_info=True)
-            return None
+        return {
+            'item_name': item_name,
+            'item_icon': image_url,
+            'quantity': quantity,
+            'item_options': item_options if item_options else None,
+            'slot_position': slot_position,
+            'expiry_date': expiry_date,  # AC 2.6.1-2.6.3: 만료 날짜 (없으면 None)
+            'item_type': item_type,
+            'detail_url': detail_url
+        }
 
 
 class StorageParser:
@@ -743,6 +1265,8 @@ class StorageParser:
     메이플스토리 웹사이트의 창고 페이지 HTML을 파싱합니다.
     """
 
+    _LI_RE = re.compile(r'<li>[\s\S]*?<\/li>')
+
     @staticmethod
     def parse_storage(html_content: str, storage_type: str) -> List[Dict[str, Any]]:
         """
@@ -771,6 +1295,25 @@ class StorageParser:
                 f'Storage parsing failed for {storage_type}: {e}', exc_info=True)
             raise StorageParsingError(f'창고 파싱 실패 ({storage_type}): {str(e)}')
 
+    @staticmethod
+    def iter_storage(html_content: str, storage_type: str) -> Iterator[Dict[str, Any]]:
+        """
+        창고 HTML 파싱 (아이템을 찾는 대로 하나씩 반환하는 generator)
+
+        Yields:
+            storage item dictionary (parse_storage 항목과 동일)
+
+        Raises:
+            StorageParsingError: 파싱 실패 시 (순회 중 발생)
+        """
+        try:
+            yield from ExpiryDateParser.fill_expiry_dates(
+                StorageParser._iter_storage_legacy(html_content, storage_type))
+        except Exception as e:
+            logger.error(
+                f'Storage parsing failed for {storage_type}: {e}', exc_info=True)
+            raise StorageParsingError(f'창고 파싱 실패 ({storage_type}): {str(e)}')
+
     @staticmethod
     def _parse_storage_legacy(html_content: str, storage_type: str) -> List[Dict[str, Any]]:
         """
@@ -785,121 +1328,135 @@ class StorageParser:
         Returns:
             List of storage item dictionaries
         """
-        import re
+        try:
+            return list(ExpiryDateParser.fill_expiry_dates(
+                StorageParser._iter_storage_legacy(html_content, storage_type)))
+        except Exception as e:
+            logger.error(f'Legacy storage parsing failed: {e}', exc_info=True)
+            return []
 
-        items = []
+    @staticmethod
+    def _iter_storage_legacy(
+        html_content: str, storage_type: str
+    ) -> Iterator[Tuple[Dict[str, Any], Optional[str]]]:
+        """
+        레거시 방식의 창고 HTML 파싱 generator
 
-        try:
-            # 레거시 방식: <li> 태그를 regex로 찾아서 inven_item_img 포함 여부 확인
-            pattern = r'<li>[\s\S]*?<\/li>'
-            matches = re.findall(pattern, html_content)
+        레거시 방식: <li> 태그를 regex로 찾아서 inven_item_img 포함 여부 확인
+        (<li> 목록을 미리 만들지 않고 finditer로 순회)
 
-            logger.info(f'Found {len(matches)} <li> elements in storage HTML')
+        Yields:
+            (만료일을 채우기 전 아이템 dict, 만료일 영역 텍스트) - ExpiryDateParser.fill_expiry_dates로 처리
+        """
+        li_count = 0
+        slot_position = 0
 
-            for match in matches:
-                # inven_item_img 클래스가 없으면 스킵
-                if 'inven_item_img' not in match:
-                    continue
+        for li_match in StorageParser._LI_RE.finditer(html_content):
+            match = li_match.group(0)
+            li_count += 1
 
-                try:
-                    # 이미지 URL 추출
-                    image_url = ''
-                    if 'src="' in match:
-                        image_url = match.split('src="')[1].split('"')[0]
-
-                    # 상세 URL 추출
-                    detail_url = ''
-                    if 'href="' in match:
-                        detail_url = match.split('href="')[1].split('"')[0]
-
-                    # 아이템 이름 추출 (레거시 로직 개선)
-                    name = None
-                    if "font color" in match:
-                        # regex로 font color 태그 내 텍스트 추출
-                        font_match = re.search(
-                            r'<font color[^>]*>([^<]+)</font>', match)
-                        if font_match:
-                            name = font_match.group(1).strip()
-
-                    if not name:
-                        if "&nbsp;" in match:
-                            name = match.split("&nbsp;")[0].split(
-                                ">")[-1].replace("\r\n", "").strip()
-                        else:
-                            name = match.split(
-                                "</a></h1>")[0].split("<br>")[0].split(">")[-1].replace("\r\n", "").strip()
-
-                    if name and "&#39;" in name:
-                        name = name.replace("&#39;", "'")
-
-                    if not name or name == ' ':
-                        continue
+            # inven_item_img 클래스가 없으면 스킵
+            if 'inven_item_img' not in match:
+                continue
 
-                    # 수량 추출
-                    count = 1
-                    if '개)' in match:
-                        try:
-                            count_str = match.split('개)')[0].split(">(")[1]
-                            if "일)" not in count_str and '유닛)' not in count_str and '분)' not in count_str and '왼쪽용)' not in count_str:
-                                count = int(count_str)
-                        except:
-                            count = 1
-
-                    # 스타포스 추출
-                    star_force_count = None
-                    if "성 강화]<br />" in match:
-                        try:
-                            star_force_count = int(
-                                match.split("[")[1].split("성 강화]")[0])
-                        except:
-                            pass
+            try:
+                # AC 2.6.1: 만료 날짜 영역 (기간제 아이템, 날짜 파싱은 묶어서 처리)
+                expiry_text = ExpiryDateParser.extract_expiry_text(match)
+
+                # 이미지 URL 추출
+                image_url = ''
+                if 'src="' in match:
+                    image_url = match.split('src="')[1].split('"')[0]
+
+                # 상세 URL 추출
+                detail_url = ''
+                if 'href="' in match:
+                    detail_url = match.split('href="')[1].split('"')[0]
+
+                # 아이템 이름 추출 (레거시 로직 개선)
+                name = None
+                if "font color" in match:
+                    # regex로 font color 태그 내 텍스트 추출
+                    font_match = re.search(
+                        r'<font color[^>]*>([^<]+)</font>', match)
+                    if font_match:
+                        name = font_match.group(1).strip()
+
+                if not name:
+                    if "&nbsp;" in match:
+                        name = match.split("&nbsp;")[0].split(
+                            ">")[-1].replace("\r\n", "").strip()
+                    else:
+                        name = match.split(
+                            "</a></h1>")[0].split("<br>")[0].split(">")[-1].replace("\r\n", "").strip()
 
-                    # URL 정규화
-                    if image_url.startswith('//'):
-                        image_url = f'https:{image_url}'
-                    elif image_url and not image_url.startswith('http'):
-                        image_url = f'https://maplestory.nexon.com{image_url}'
-
-                    if detail_url and detail_url.startswith('/'):
-                        detail_url = f'https://maplestory.nexon.com{detail_url}'
-
-                    # item_options 구성
-                    item_options = {}
-                    if star_force_count:
-                        item_options['star_force'] = star_force_count
-
-                    # 주문서 강화 추출
-                    spell_trace_match = re.search(r'\+(\d+)', name)
-                    if spell_trace_match:
-                        item_options['spell_trace'] = int(
-                            spell_trace_match.group(1))
-
-                    # AC 2.6.1: 만료 날짜 추출 (기간제 아이템)
-                    expiry_date = ExpiryDateParser.parse_expiry_date(match)
-
-                    items.append({
-                        'storage_type': storage_type,
-                        'item_name': name,
-                        'item_icon': image_url,
-                        'quantity': count,
-                        'slot_position': len(items),
-                        'item_options': item_options if item_options else None,
-                        'expiry_date': expiry_date,  # AC 2.6.1-2.6.3: 만료 날짜 (없으면 None)
-                        'detail_url': detail_url
-                    })
+                if name and "&#39;" in name:
+                    name = name.replace("&#39;", "'")
 
-                except Exception as e:
-                    logger.warning(
-                        f'Failed to parse storage item from li: {e}')
+                if not name or name == ' ':
                     continue
 
-            logger.info(
-                f'Parsed {len(items)} {storage_type} storage items using legacy method')
-            return items
+                # 수량 추출
+                count = 1
+                if '개)' in match:
+                    try:
+                        count_str = match.split('개)')[0].split(">(")[1]
+                        if "일)" not in count_str and '유닛)' not in count_str and '분)' not in count_str and '왼쪽용)' not in count_str:
+                            count = int(count_str)
+                    except:
+                        count = 1
 
-        except Exception as e:
-            logger.error(f'Legacy storage parsing failed: {e}', exc_info=True)
-            return []
+                # 스타포스 추출
+                star_force_count = None
+                if "성 강화]<br />" in match:
+                    try:
+                        star_force_count = int(
+                            match.split("[")[1].split("성 강화]")[0])
+                    except:
+                        pass
+
+                # URL 정규화
+                if image_url.startswith('//'):
+                    image_url = f'https:{image_url}'
+                elif image_url and not image_url.startswith('http'):
+                    image_url = f'https://maplestory.nexon.com{image_url}'
+
+                if detail_url and detail_url.startswith('/'):
+                    detail_url = f'https://maplestory.nexon.com{detail_url}'
+
+                # item_options 구성
+                item_options = {}
+                if star_force_count:
+                    item_options['star_force'] = star_force_count
+
+                # 주문서 강화 추출
+                spell_trace_match = re.search(r'\+(\d+)', name)
+                if spell_trace_match:
+                    item_options['spell_trace'] = int(
+                        spell_trace_match.group(1))
+
+                item_data = {
+                    'storage_type': storage_type,
+                    'item_name': name,
+                    'item_icon': image_url,
+                    'quantity': count,
+                    'slot_position': slot_position,
+                    'item_options': item_options if item_options else None,
+                    'expiry_date': None,  # AC 2.6.1-2.6.3: 만료 날짜 (fill_expiry_dates가 채움, 없으면 None)
+                    'detail_url': detail_url
+                }
+
+            except Exception as e:
+                logger.warning(
+                    f'Failed to parse storage item from li: {e}')
+                continue
+
+            slot_position += 1
+            yield item_data, expiry_text
+
+        logger.info(f'Found {li_count} <li> elements in storage HTML')
+        logger.info(
+            f'Parsed {slot_position} {storage_type} storage items using legacy method')
 
     @staticmethod
     def _parse_single_storage_item(slot_element, storage_type: str, slot_position: int) -> Optional[Dict[str, Any]]:
@@ -1074,6 +1631,19 @@ class CrawlingError(Exception):
     pass
 
 
+class CharacterInfoUrlExpiredError(CrawlingError):
+    """캐릭터 정보 URL(?p= 토큰) 만료 (서브 페이지 리다이렉트 또는 4xx 응답)"""
+    pass
+
+
+class CrawlThrottledError(CrawlingError):
+    """대상 서버의 요청 제한/과부하 응답 (429/5xx)"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
 class ParsingError(Exception):
     """HTML 파싱 중 발생하는 에러"""
     pass
@@ -1111,10 +1681,76 @@ class ExpiryDateParser:
     # "2025.12.31 23:59" 형식
     NUMERIC_DATETIME_PATTERN = r'(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})\s+(\d{1,2}):(\d{1,2})'
 
+    # 4개 형식을 한 번의 스캔으로 찾는 결합 패턴
+    # - 전방탐색(?=...)으로 위치마다 검사하므로 앞 매칭이 뒤 후보를 삼키지 않음
+    # - 한 위치에서는 한국어/숫자 중 한 계열만 매칭되며, 시간 포함 형식을 우선 시도
+    # 우선순위: 한국어 날짜+시간 > 숫자 날짜+시간 > 한국어 날짜 > 숫자 날짜
+    FORMATS = ('korean_datetime', 'numeric_datetime', 'korean_date', 'numeric_date')
+    _FORMAT_LABELS = {
+        'korean_datetime': '한국어 날짜+시간',
+        'numeric_datetime': '숫자 날짜+시간',
+        'korean_date': '한국어 날짜',
+        'numeric_date': '숫자 날짜',
+    }
+    _EXPIRY_RE = re.compile(
+        r'(?=(?P<korean>(?P<k_y>\d{4})년\s*(?P<k_m>\d{1,2})월\s*(?P<k_d>\d{1,2})일'
+        r'(?:\s*(?P<k_h>\d{1,2})시\s*(?P<k_i>\d{1,2})분)?)'
+        r'|(?P<numeric>(?P<n_y>\d{4})[.\-/](?P<n_m>\d{1,2})[.\-/](?P<n_d>\d{1,2})'
+        r'(?:\s+(?P<n_h>\d{1,2}):(?P<n_i>\d{1,2}))?))'
+    )
+    # 날짜 후보가 없는 텍스트는 정규식 스캔 생략 (숫자 4자리 연도가 반드시 필요)
+    _YEAR_HINT_RE = re.compile(r'\d{4}')
+    # 태그 제거 (속성값 안의 숫자/날짜는 만료일이 아님)
+    _TAG_RE = re.compile(r'<[^>]*>')
+    # 만료일 영역: class="date" 엘리먼트, 없으면 기간/만료 문구가 있는 텍스트 조각 ('기간제'는 이름일 수 있어 제외)
+    _DATE_ELEMENT_RE = re.compile(
+        r'<(?P<tag>[a-zA-Z][a-zA-Z0-9]*)\b[^>]*\bclass="(?:[^"]*\s)?date(?:\s[^"]*)?"[^>]*>'
+        r'(?P<body>[\s\S]*?)</(?P=tag)>')
+    _EXPIRY_KEYWORD_RE = re.compile(r'기간(?!제)|만료|까지')
+    # fill_expiry_dates가 parse_many에 한 번에 넘기는 아이템 수
+    EXPIRY_BATCH_SIZE = 100
+
+    @staticmethod
+    def extract_text(item_html: str) -> str:
+        """아이템 HTML에서 텍스트만 추출 (태그는 공백으로 치환)"""
+        if '<' not in item_html:
+            return item_html
+        return ExpiryDateParser._TAG_RE.sub(' ', item_html)
+
+    @staticmethod
+    def expiry_text_from_chunks(chunks: Iterable[str]) -> Optional[str]:
+        """
+        텍스트 조각 중 만료 문구가 있는 조각만 연결 (없으면 None)
+
+        '기간' 라벨과 날짜가 다른 태그로 나뉜 경우를 위해 바로 다음 조각도 포함합니다.
+        """
+        chunks = [chunk.strip() for chunk in chunks]
+        chunks = [chunk for chunk in chunks if chunk]
+        selected = []
+        for index, chunk in enumerate(chunks):
+            if ExpiryDateParser._EXPIRY_KEYWORD_RE.search(chunk):
+                selected.extend(chunks[index:index + 2])
+        return ' '.join(selected) or None
+
+    @staticmethod
+    def extract_expiry_text(item_html: Optional[str]) -> Optional[str]:
+        """
+        아이템 HTML에서 만료일 영역 텍스트만 추출 (없으면 None)
+
+        아이템 전체 텍스트를 스캔하면 이름/설명의 날짜를 만료일로 잘못 읽을 수 있으므로
+        class="date" 엘리먼트나 기간/만료 문구 부분만 parse_expiry_text에 넘깁니다.
+        """
+        if not item_html:
+            return None
+        date_element = ExpiryDateParser._DATE_ELEMENT_RE.search(item_html)
+        if date_element:
+            return ExpiryDateParser.extract_text(date_element.group('body')).strip() or None
+        return ExpiryDateParser.expiry_text_from_chunks(ExpiryDateParser._TAG_RE.split(item_html))
+
     @staticmethod
     def parse_expiry_date(item_html: str) -> Optional[datetime]:
         """
-        아이템 HTML에서 만료 날짜 추출 (AC 2.6.1, 2.6.2)
+        아이템 HTML(또는 텍스트)에서 만료 날짜 추출 (AC 2.6.1, 2.6.2)
 
         Args:
             item_html: 아이템 HTML 문자열
@@ -1122,60 +1758,116 @@ class ExpiryDateParser:
         Returns:
             datetime 객체 (ISO 8601 호환) 또는 None (만료일 없음)
         """
-        import re
-        from datetime import datetime
-        import pytz
-
         if not item_html:
             return None
+        return ExpiryDateParser.parse_expiry_text(ExpiryDateParser.extract_text(item_html))
 
-        # KST 타임존
-        kst = pytz.timezone('Asia/Seoul')
+    @staticmethod
+    def parse_expiry_text(text: str) -> Optional[datetime]:
+        """
+        텍스트에서 만료 날짜 추출 (결합 정규식 1회 스캔)
 
-        # 1. 한국어 날짜+시간 형식 시도: "2025년 12월 31일 23시 59분"
-        match = re.search(ExpiryDateParser.KOREAN_DATETIME_PATTERN, item_html)
-        if match:
-            try:
-                year, month, day, hour, minute = map(int, match.groups())
-                dt = datetime(year, month, day, hour, minute, 0)
-                # KST로 설정 후 반환
-                return kst.localize(dt)
-            except (ValueError, TypeError) as e:
-                logger.warning(f'한국어 날짜+시간 파싱 실패: {match.group()} - {e}')
-
-        # 2. 숫자 날짜+시간 형식 시도: "2025.12.31 23:59"
-        match = re.search(ExpiryDateParser.NUMERIC_DATETIME_PATTERN, item_html)
-        if match:
-            try:
-                year, month, day, hour, minute = map(int, match.groups())
-                dt = datetime(year, month, day, hour, minute, 0)
-                return kst.localize(dt)
-            except (ValueError, TypeError) as e:
-                logger.warning(f'숫자 날짜+시간 파싱 실패: {match.group()} - {e}')
-
-        # 3. 한국어 날짜만 형식 시도: "2025년 12월 31일" (시간은 23:59:59로 설정)
-        match = re.search(ExpiryDateParser.KOREAN_DATE_PATTERN, item_html)
-        if match:
-            try:
-                year, month, day = map(int, match.groups())
-                dt = datetime(year, month, day, 23, 59, 59)
-                return kst.localize(dt)
-            except (ValueError, TypeError) as e:
-                logger.warning(f'한국어 날짜 파싱 실패: {match.group()} - {e}')
-
-        # 4. 숫자 날짜만 형식 시도: "2025.12.31" (시간은 23:59:59로 설정)
-        match = re.search(ExpiryDateParser.NUMERIC_DATE_PATTERN, item_html)
-        if match:
-            try:
-                year, month, day = map(int, match.groups())
-                dt = datetime(year, month, day, 23, 59, 59)
-                return kst.localize(dt)
-            except (ValueError, TypeError) as e:
-                logger.warning(f'숫자 날짜 파싱 실패: {match.group()} - {e}')
+        형식별 첫 번째 매칭을 모은 뒤 우선순위대로 datetime 변환을 시도하며,
+        날짜가 잘못된 경우(13월 등) 다음 형식으로 넘어갑니다. (형식별 re.search 4회와 같은 결과)
+        """
+        if not text or not ExpiryDateParser._YEAR_HINT_RE.search(text):
+            return None
+
+        # 형식별 첫 번째 후보 (날짜+시간 매칭은 같은 위치의 날짜만 형식 후보이기도 함)
+        candidates = {}
+        for match in ExpiryDateParser._EXPIRY_RE.finditer(text):
+            family = match.lastgroup
+            prefix = family[0]
+            date_parts = tuple(match.group(f'{prefix}_{part}') for part in 'ymd')
+            time_parts = (match.group(f'{prefix}_h'), match.group(f'{prefix}_i'))
+
+            if time_parts[0] is not None:
+                fmt = f'{family}_datetime'
+                if fmt not in candidates:
+                    candidates[fmt] = (match.group(family), date_parts + time_parts)
+                    if fmt == 'korean_datetime':
+                        # 최우선 형식이 유효하면 나머지 스캔 생략
+                        dt = ExpiryDateParser._to_datetime(fmt, *candidates[fmt])
+                        if dt is not None:
+                            return dt
+            fmt = f'{family}_date'
+            if fmt not in candidates:
+                date_text = match.group(family) if time_parts[0] is None else None
+                candidates[fmt] = (date_text, date_parts)
+
+        for fmt in ExpiryDateParser.FORMATS:
+            if fmt in candidates and fmt != 'korean_datetime':
+                dt = ExpiryDateParser._to_datetime(fmt, *candidates[fmt])
+                if dt is not None:
+                    return dt
 
         # 만료 날짜를 찾지 못함 (AC 2.6.3: null 반환)
         return None
 
+    @staticmethod
+    def _to_datetime(fmt: str, matched_text: Optional[str], parts) -> Optional[datetime]:
+        """매칭 값 → KST datetime (날짜가 잘못된 경우 None)"""
+        try:
+            values = [int(part) for part in parts]
+            if len(values) == 5:
+                dt = datetime(*values, 0)
+            else:
+                # 날짜만 있으면 시간은 23:59:59로 설정
+                dt = datetime(*values, 23, 59, 59)
+            return KST.localize(dt)
+        except (ValueError, TypeError) as e:
+            logger.warning(
+                f'{ExpiryDateParser._FORMAT_LABELS[fmt]} 파싱 실패: {matched_text or "-".join(parts)} - {e}')
+            return None
+
+    @staticmethod
+    def parse_many(item_htmls: Iterable[Optional[str]]) -> List[Optional[datetime]]:
+        """
+        여러 아이템 HTML의 만료 날짜 일괄 추출
+
+        같은 텍스트(동일 기간제 아이템 묶음 등)는 한 번만 파싱합니다.
+
+        Returns:
+            입력 순서와 같은 만료 날짜 목록 (없으면 None)
+        """
+        parsed: Dict[str, Optional[datetime]] = {}
+        results = []
+        for item_html in item_htmls:
+            if not item_html:
+                results.append(None)
+                continue
+            text = ExpiryDateParser.extract_text(item_html)
+            if text not in parsed:
+                parsed[text] = ExpiryDateParser.parse_expiry_text(text)
+            results.append(parsed[text])
+        return results
+
+    @staticmethod
+    def fill_expiry_dates(
+        items: Iterable[Tuple[Dict[str, Any], Optional[str]]],
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        (아이템 dict, 만료일 영역 텍스트)를 batch_size개씩 parse_many로 파싱해 expiry_date를 채운 아이템 반환
+
+        generator이므로 묶음 크기만큼만 메모리에 모은 뒤 입력 순서대로 내보냅니다.
+        """
+        batch_size = batch_size or ExpiryDateParser.EXPIRY_BATCH_SIZE
+        batch: List[Tuple[Dict[str, Any], Optional[str]]] = []
+
+        def flush():
+            expiry_dates = ExpiryDateParser.parse_many(text for _, text in batch)
+            for (item, _), expiry_date in zip(batch, expiry_dates):
+                item['expiry_date'] = expiry_date
+                yield item
+
+        for pair in items:
+            batch.append(pair)
+            if len(batch) >= batch_size:
+                yield from flush()
+                batch = []
+        yield from flush()
+
     @staticmethod
     def get_alert_flags(expiry_date: Optional[datetime]) -> dict:
         """
@@ -1257,54 +1949,60 @@ class MesoParser:
     메이플스토리 웹사이트에서 메소 보유량을 파싱합니다.
     - 캐릭터 보유 메소: 기본정보 페이지
     - 창고 메소: 창고 페이지
+
+    메소 라벨에 고정한 정규식 한 번으로 HTML 문자열에서 바로 찾고 (트리 생성 없음),
+    실패했을 때만 lxml 트리에서 XPath 하나로 찾습니다.
+    이미 파싱한 트리가 있으면 root로 넘겨 다시 파싱하지 않습니다.
     """
 
-    # 캐릭터 보유 메소 selector (기본정보 페이지)
-    CHARACTER_MESO_SELECTOR = '#container > div.con_wrap > div.contents_wrap > div > div.tab01_con_wrap > table:nth-child(2) > tbody > tr:nth-child(3) > td:nth-child(2) > span'
+    # 캐릭터 보유 메소: 텍스트가 '메소'인 표 셀 바로 다음 셀의 숫자
+    CHARACTER_MESO_RE = re.compile(
+        r'<t[hd]\b[^>]*>\s*(?:<[^<>]+>\s*)*메소\s*(?:<[^<>]+>\s*)*</t[hd]>\s*'
+        r'<t[hd]\b[^>]*>\s*(?:<[^<>]+>\s*)*(\d[\d,]*)')
+
+    # 창고 메소: '메소'/'골드' 라벨 뒤(태그 사이 허용) 또는 같은 텍스트 안 라벨 바로 앞의 숫자
+    STORAGE_MESO_RE = re.compile(
+        r'(?:메소|골드)\s*:?\s*(?:<[^<>]+>\s*)*(\d[\d,]*)|(\d[\d,]*)[ \t]*(?:메소|골드)')
 
-    # 창고 메소 selector (창고 페이지)
-    STORAGE_MESO_SELECTOR = '#container > div.con_wrap > div.contents_wrap > div > div > div > div'
+    # fallback: '메소'가 들어간 첫 표 셀 (값은 다음 셀 또는 같은 셀)
+    _CHARACTER_MESO_CELL = etree.XPath(
+        "(//tr/*[self::th or self::td][contains(., '메소')])[1]")
+    # fallback: 창고 페이지 메소 영역 (#container > div.con_wrap > div.contents_wrap > div > div > div > div)
+    _STORAGE_MESO_AREA = class_xpath(
+        "(//*[@id='container']/div[{con_wrap}]/div[{contents_wrap}]/div/div/div/div)[1]",
+        con_wrap='con_wrap', contents_wrap='contents_wrap')
 
     @staticmethod
-    def parse_character_meso(html_content: str) -> Optional[int]:
+    def parse_character_meso(html_content: str, root: Optional[etree._Element] = None) -> Optional[int]:
         """
         캐릭터 보유 메소 파싱 (기본정보 페이지)
 
         Args:
             html_content: HTML 문자열
+            root: 이미 파싱한 lxml 트리 (있으면 fallback에서 재사용)
 
         Returns:
             메소 금액 (int) 또는 None (파싱 실패 시)
         """
-        import re
-
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
-
-            # CSS selector로 메소 영역 찾기
-            meso_element = soup.select_one(MesoParser.CHARACTER_MESO_SELECTOR)
-
-            if meso_element:
-                meso_text = meso_element.get_text(strip=True)
-                return MesoParser._extract_meso_amount(meso_text)
-
-            # fallback: 테이블에서 '메소' 행 찾기
-            tables = soup.select('table')
-            for table in tables:
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    for i, cell in enumerate(cells):
-                        if '메소' in cell.get_text():
-                            # 다음 셀에서 값 추출
-                            if i + 1 < len(cells):
-                                meso_text = cells[i + 1].get_text(strip=True)
-                                return MesoParser._extract_meso_amount(meso_text)
-                            # 같은 셀에서 숫자 추출
-                            meso_text = cell.get_text(strip=True)
-                            amount = MesoParser._extract_meso_amount(meso_text)
-                            if amount is not None:
-                                return amount
+            match = MesoParser.CHARACTER_MESO_RE.search(html_content)
+            if match:
+                return MesoParser._extract_meso_amount(match.group(1))
+
+            # fallback: '메소' 셀 → 다음 셀 값 (없으면 같은 셀의 숫자)
+            if root is None:
+                root = parse_html(html_content)
+            cell = first(MesoParser._CHARACTER_MESO_CELL(root)) if root is not None else None
+
+            if cell is not None:
+                value_cell = cell.getnext()
+                while value_cell is not None and value_cell.tag not in ('td', 'th'):
+                    value_cell = value_cell.getnext()
+                if value_cell is not None:
+                    return MesoParser._extract_meso_amount(stripped_text(value_cell))
+                amount = MesoParser._extract_meso_amount(stripped_text(cell))
+                if amount is not None:
+                    return amount
 
             logger.warning('메소 영역을 찾을 수 없습니다 (캐릭터 기본정보)')
             return None
@@ -1314,46 +2012,32 @@ class MesoParser:
             return None
 
     @staticmethod
-    def parse_storage_meso(html_content: str) -> Optional[int]:
+    def parse_storage_meso(html_content: str, root: Optional[etree._Element] = None) -> Optional[int]:
         """
         창고 메소 파싱 (창고 페이지)
 
         Args:
             html_content: HTML 문자열
+            root: 이미 파싱한 lxml 트리 (있으면 fallback에서 재사용)
 
         Returns:
             메소 금액 (int) 또는 None (파싱 실패 시)
         """
-        import re
-
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
+            match = MesoParser.STORAGE_MESO_RE.search(html_content)
+            if match:
+                return MesoParser._extract_meso_amount(match.group(1) or match.group(2))
 
-            # CSS selector로 메소 영역 찾기
-            meso_element = soup.select_one(MesoParser.STORAGE_MESO_SELECTOR)
+            # fallback: 메소 영역 위치의 숫자
+            if root is None:
+                root = parse_html(html_content)
+            area = first(MesoParser._STORAGE_MESO_AREA(root)) if root is not None else None
 
-            if meso_element:
-                meso_text = meso_element.get_text(strip=True)
-                amount = MesoParser._extract_meso_amount(meso_text)
+            if area is not None:
+                amount = MesoParser._extract_meso_amount(stripped_text(area))
                 if amount is not None:
                     return amount
 
-            # fallback: div에서 '메소' 텍스트 찾기
-            divs = soup.find_all('div')
-            for div in divs:
-                text = div.get_text(strip=True)
-                if '메소' in text or '골드' in text:
-                    amount = MesoParser._extract_meso_amount(text)
-                    if amount is not None:
-                        return amount
-
-            # fallback: span에서 숫자 패턴 찾기
-            for span in soup.find_all('span'):
-                text = span.get_text(strip=True)
-                amount = MesoParser._extract_meso_amount(text)
-                if amount is not None and amount > 0:
-                    return amount
-
             logger.warning('메소 영역을 찾을 수 없습니다 (창고)')
             return None
 
@@ -1402,8 +2086,100 @@ class ItemDetailParser:
     아이템 상세 페이지 HTML 파싱 클래스
 
     레거시 parseDetail() 함수 로직 기반으로 구현
+
+    페이지를 lxml로 한 번만 파싱하고, stet_info 항목은 라벨 → 처리 함수 표로 분기합니다.
+    라벨 종류는 많지 않으므로 처음 보는 라벨만 _LABEL_RULES를 순서대로 확인하고
+    결정된 처리 함수를 표에 기억합니다 (이후 같은 라벨은 dict 조회 한 번).
     """
 
+    NO_OPTION_TEXT = '해당 사항이 없습니다'
+
+    # 등급 색상 (우선순위 순, 속성값에서 대소문자 구분 없이 확인)
+    GRADE_COLORS = (
+        ('#00FF00', '레전드리'),
+        ('#E3D04D', '유니크'),
+        ('#9966FF', '에픽'),
+        ('#66CCFF', '레어'),
+    )
+    GRADE_NAMES = ('레전드리', '유니크', '에픽', '레어')
+
+    REQ_FIELDS = {
+        'REQ LEV': 'required_level',
+        'REQ STR': 'required_str',
+        'REQ DEX': 'required_dex',
+        'REQ INT': 'required_int',
+        'REQ LUK': 'required_luk',
+    }
+
+    # 분해값 있는 스탯 (라벨에 포함된 첫 키 적용)
+    BREAKDOWN_STAT_FIELDS = (
+        ('STR', 'str_stat', 'str_breakdown'),
+        ('DEX', 'dex_stat', 'dex_breakdown'),
+        ('INT', 'int_stat', 'int_breakdown'),
+        ('LUK', 'luk_stat', 'luk_breakdown'),
+        ('MaxHP', 'hp_stat', 'hp_breakdown'),
+        ('MaxMP', 'mp_stat', 'mp_breakdown'),
+        ('공격력', 'attack_power', 'attack_breakdown'),
+        ('마력', 'magic_power', 'magic_breakdown'),
+        ('물리방어력', 'defense', 'defense_breakdown'),
+    )
+
+    # 분해값 없는 스탯
+    SIMPLE_STAT_FIELDS = (
+        ('보스 몬스터 공격 시 데미지', 'boss_damage'),
+        ('몬스터 방어율 무시', 'ignore_defense'),
+        ('몬스터 방어력 무시', 'ignore_defense'),
+        ('올스탯', 'all_stat'),
+    )
+
+    ETC_KEYWORDS = (
+        '교환 불가', '고유장착', '고유 아이템',
+        '1회 교환가능', '장착 시 교환 불가',
+        '사용시 교환 불가', '퀘스트 아이템',
+    )
+
+    # 라벨 → 처리 함수 결정 규칙 (위에서부터 먼저 맞는 규칙 적용, 없으면 스탯)
+    _LABEL_RULES = (
+        (lambda label: '잠재옵션' in label and '에디셔널' not in label,
+         '_handle_potential', ('potential_grade', 'potential_option')),
+        (lambda label: '에디셔널 잠재옵션' in label,
+         '_handle_potential', ('additional_potential_grade', 'additional_potential_option')),
+        (lambda label: '소울' in label, '_handle_soul', ()),
+        (lambda label: '가위 사용 가능 횟수' in label, '_handle_scissors', ()),
+        (lambda label: '기타' in label, '_handle_etc', ()),
+    )
+    # 라벨별로 결정된 (처리 함수 이름, 인자) (None이면 무시하는 라벨)
+    _label_handlers: Dict[str, Optional[tuple]] = {}
+    _LABEL_HANDLERS_MAX = 1024
+
+    _NUMBER_RE = re.compile(r'\+?(\d+)%?')
+    _BREAKDOWN_RE = re.compile(r'\((\d+)\s*\+\s*(\d+)\s*\+\s*(\d+)\)')
+    _DIGITS_RE = re.compile(r'(\d+)')
+    _STAR_FORCE_RE = re.compile(r'(\d+)성 강화')
+    _MAX_STAR_FORCE_RE = re.compile(r'(\d+)성까지 강화 가능')
+    _SOUL_NAME_RE = re.compile(r'(.+?)의 소울')
+
+    _ABLILTY02_XPATH = class_xpath('//div[{ablilty02}]', ablilty02='ablilty02')
+    _ABLILTY01_XPATH = class_xpath('(//div[{ablilty01}])[1]', ablilty01='ablilty01')
+    _STET_INFO_XPATH = class_xpath('(//div[{stet_info}])[1]', stet_info='stet_info')
+    _ITEM_TITLE_XPATH = class_xpath('(//div[{item_title}])[1]', item_title='item_title')
+    _STET_TH_XPATH = class_xpath('(.//div[{stet_th}])[1]', stet_th='stet_th')
+    _POINT_TD_XPATH = class_xpath('(.//div[{point_td}])[1]', point_td='point_td')
+    _LI_XPATH = etree.XPath('.//li')
+    _EM_XPATH = etree.XPath('(.//em)[1]')
+    _SPAN_XPATH = etree.XPath('(.//span)[1]')
+    _ATTRIBUTES_XPATH = etree.XPath('descendant-or-self::*/@*')
+
+    @staticmethod
+    def _text(element: etree._Element) -> str:
+        """BeautifulSoup get_text()와 같은 결과"""
+        return ''.join(element.itertext())
+
+    @staticmethod
+    def _strings(element: etree._Element) -> List[str]:
+        """BeautifulSoup stripped_strings와 같은 결과"""
+        return [text.strip() for text in element.itertext() if text.strip()]
+
     @staticmethod
     def _parse_stat_breakdown(value_text: str) -> Dict[str, Any]:
         """
@@ -1412,18 +2188,16 @@ class ItemDetailParser:
         Returns:
             {'total': 36, 'base': 5, 'bonus': 0, 'scroll': 31}
         """
-        import re
-
         result = {'total': None, 'base': None, 'bonus': None, 'scroll': None}
 
         # 전체값 추출 (+36 또는 +36%)
-        total_match = re.search(r'\+?(\d+)%?', value_text)
+        total_match = ItemDetailParser._NUMBER_RE.search(value_text)
         if total_match:
             result['total'] = int(total_match.group(1))
 
         # 분해값 추출: (base + bonus + scroll)
         # 형식: (5 + 0 + 31) 또는 (200 + 0 + 180)
-        breakdown_match = re.search(r'\((\d+)\s*\+\s*(\d+)\s*\+\s*(\d+)\)', value_text)
+        breakdown_match = ItemDetailParser._BREAKDOWN_RE.search(value_text)
         if breakdown_match:
             result['base'] = int(breakdown_match.group(1))
             result['bonus'] = int(breakdown_match.group(2))
@@ -1432,43 +2206,117 @@ class ItemDetailParser:
         return result
 
     @staticmethod
-    def _extract_grade_from_html(html_element) -> Optional[str]:
+    def _extract_grade(element: etree._Element) -> Optional[str]:
         """
-        HTML 요소에서 등급 색상으로 등급 추출
+        요소의 등급 추출 (속성의 색상 코드 우선, 없으면 텍스트의 등급 이름)
         유니크: #E3D04D (금색), 레전드리: #00FF00 (녹색),
         에픽: #9966FF (보라), 레어: #66CCFF (하늘)
         """
-        html_str = str(html_element)
-
-        # 색상코드로 등급 판별
-        grade_colors = {
-            '#00FF00': '레전드리',
-            '#00ff00': '레전드리',
-            '#E3D04D': '유니크',
-            '#e3d04d': '유니크',
-            '#9966FF': '에픽',
-            '#9966ff': '에픽',
-            '#66CCFF': '레어',
-            '#66ccff': '레어',
-        }
-
-        for color, grade in grade_colors.items():
-            if color in html_str:
+        attributes = ' '.join(ItemDetailParser._ATTRIBUTES_XPATH(element)).upper()
+        for color, grade in ItemDetailParser.GRADE_COLORS:
+            if color in attributes:
                 return grade
 
-        # 텍스트로 등급 판별
-        text = html_element.get_text() if hasattr(html_element, 'get_text') else str(html_element)
-        if '레전드리' in text:
-            return '레전드리'
-        elif '유니크' in text:
-            return '유니크'
-        elif '에픽' in text:
-            return '에픽'
-        elif '레어' in text:
-            return '레어'
+        text = ItemDetailParser._text(element)
+        for grade in ItemDetailParser.GRADE_NAMES:
+            if grade in text:
+                return grade
 
         return None
 
+    @classmethod
+    def _handler_for(cls, label: str) -> Optional[tuple]:
+        """라벨의 (처리 함수 이름, 인자) (처음 보는 라벨만 규칙 확인 후 기억)"""
+        try:
+            return cls._label_handlers[label]
+        except KeyError:
+            pass
+
+        handler = None
+        for matches, name, args in cls._LABEL_RULES:
+            if matches(label):
+                handler = (name, args)
+                break
+        else:
+            for key, total_field, breakdown_field in cls.BREAKDOWN_STAT_FIELDS:
+                if key in label:
+                    handler = ('_handle_breakdown_stat', (total_field, breakdown_field))
+                    break
+            else:
+                for key, field in cls.SIMPLE_STAT_FIELDS:
+                    if key in label:
+                        handler = ('_handle_simple_stat', (field,))
+                        break
+
+        if len(cls._label_handlers) < cls._LABEL_HANDLERS_MAX:
+            cls._label_handlers[label] = handler
+        return handler
+
+    @staticmethod
+    def _handle_potential(result, etc_info, stet_th, point_td, value_text, grade_field, option_prefix):
+        """(에디셔널) 잠재옵션: 등급 + 옵션 3줄 (br 태그로 구분)"""
+        if ItemDetailParser.NO_OPTION_TEXT in value_text:
+            return
+
+        grade = ItemDetailParser._extract_grade(stet_th)
+        if grade:
+            result[grade_field] = grade
+
+        options = [
+            text for text in ItemDetailParser._strings(point_td)
+            if ItemDetailParser.NO_OPTION_TEXT not in text
+        ]
+        for i, option in enumerate(options[:3]):
+            result[f'{option_prefix}_{i+1}'] = option
+
+    @staticmethod
+    def _handle_soul(result, etc_info, stet_th, point_td, value_text):
+        """소울 이름 + 옵션"""
+        soul_text = ItemDetailParser._text(stet_th)
+        if '의 소울' in soul_text:
+            soul_name_match = ItemDetailParser._SOUL_NAME_RE.search(soul_text)
+            if soul_name_match:
+                result['soul_name'] = soul_name_match.group(1).strip() + '의 소울'
+        result['soul_option'] = value_text
+
+    @staticmethod
+    def _handle_scissors(result, etc_info, stet_th, point_td, value_text):
+        """가위 사용 가능 횟수"""
+        scissor_match = ItemDetailParser._DIGITS_RE.search(value_text)
+        if scissor_match:
+            result['scissor_count'] = int(scissor_match.group(1))
+
+    @staticmethod
+    def _handle_etc(result, etc_info, stet_th, point_td, value_text):
+        """기타: 성 강화 정보, 교환 불가 등"""
+        for content in ItemDetailParser._strings(point_td):
+            star_match = ItemDetailParser._STAR_FORCE_RE.search(content)
+            if star_match:
+                result['star_force'] = int(star_match.group(1))
+
+            max_star_match = ItemDetailParser._MAX_STAR_FORCE_RE.search(content)
+            if max_star_match:
+                result['max_star_force'] = int(max_star_match.group(1))
+
+            if any(keyword in content for keyword in ItemDetailParser.ETC_KEYWORDS):
+                etc_info.append(content)
+
+    @staticmethod
+    def _handle_breakdown_stat(result, etc_info, stet_th, point_td, value_text, total_field, breakdown_field):
+        """일반 스탯 (분해값이 있으면 함께 저장)"""
+        breakdown = ItemDetailParser._parse_stat_breakdown(value_text)
+        if breakdown['total'] is not None:
+            result[total_field] = breakdown['total']
+            if breakdown['base'] is not None:
+                result[breakdown_field] = breakdown
+
+    @staticmethod
+    def _handle_simple_stat(result, etc_info, stet_th, point_td, value_text, field):
+        """분해값 없는 스탯 (보공/방무/올스탯)"""
+        match = ItemDetailParser._NUMBER_RE.search(value_text)
+        if match:
+            result[field] = int(match.group(1))
+
     @staticmethod
     def parse_detail_page(html_content: str, item_name: str) -> Dict[str, Any]:
         """
@@ -1481,197 +2329,71 @@ class ItemDetailParser:
         Returns:
             파싱된 상세 정보 딕셔너리
         """
-        import re
-
         try:
-            html_content = html_content.replace('\r\n', '').strip()
-            soup = BeautifulSoup(html_content, 'html.parser')
-
+            root = parse_html(html_content.replace('\r\n', '').strip())
             result = {}
+            if root is None:
+                return result
 
             # 1. 장비 분류 및 착용 가능 직업 파싱 (ablilty02 영역)
-            for ablilty02 in soup.find_all('div', class_='ablilty02'):
-                text = ablilty02.get_text()
+            for ablilty02 in ItemDetailParser._ABLILTY02_XPATH(root):
+                text = ItemDetailParser._text(ablilty02)
                 if '장비분류' in text:
-                    em = ablilty02.find('em')
-                    if em:
-                        result['item_category'] = em.get_text().strip()
+                    field = 'item_category'
                 elif '착용 가능한 직업' in text:
-                    em = ablilty02.find('em')
-                    if em:
-                        result['required_job'] = em.get_text().strip()
+                    field = 'required_job'
+                else:
+                    continue
+                em = first(ItemDetailParser._EM_XPATH(ablilty02))
+                if em is not None:
+                    result[field] = ItemDetailParser._text(em).strip()
 
             # 2. REQ 스탯 파싱 (ablilty01 영역)
-            ablilty01 = soup.find('div', class_='ablilty01')
-            if ablilty01:
-                req_mapping = {
-                    'REQ LEV': 'required_level',
-                    'REQ STR': 'required_str',
-                    'REQ DEX': 'required_dex',
-                    'REQ INT': 'required_int',
-                    'REQ LUK': 'required_luk',
-                }
-                for li in ablilty01.find_all('li'):
-                    span = li.find('span')
-                    em = li.find('em')
-                    if span and em:
-                        label = span.get_text().strip()
-                        value = em.get_text().strip()
-                        if label in req_mapping:
-                            try:
-                                result[req_mapping[label]] = int(value)
-                            except ValueError:
-                                pass
-
-            # 3. 스탯 정보 파싱 (stet_info 영역)
-            stet_info = soup.find('div', class_='stet_info')
+            ablilty01 = first(ItemDetailParser._ABLILTY01_XPATH(root))
+            if ablilty01 is not None:
+                for li in ItemDetailParser._LI_XPATH(ablilty01):
+                    span = first(ItemDetailParser._SPAN_XPATH(li))
+                    em = first(ItemDetailParser._EM_XPATH(li))
+                    if span is None or em is None:
+                        continue
+                    field = ItemDetailParser.REQ_FIELDS.get(ItemDetailParser._text(span).strip())
+                    if field:
+                        try:
+                            result[field] = int(ItemDetailParser._text(em).strip())
+                        except ValueError:
+                            pass
+
+            # 3. 스탯 정보 파싱 (stet_info 영역): 라벨별 처리 함수로 분기
+            stet_info = first(ItemDetailParser._STET_INFO_XPATH(root))
             etc_info = []
 
-            if stet_info:
-                for li in stet_info.find_all('li'):
-                    stet_th = li.find('div', class_='stet_th')
-                    point_td = li.find('div', class_='point_td')
+            if stet_info is not None:
+                for li in ItemDetailParser._LI_XPATH(stet_info):
+                    stet_th = first(ItemDetailParser._STET_TH_XPATH(li))
+                    point_td = first(ItemDetailParser._POINT_TD_XPATH(li))
+                    if stet_th is None or point_td is None:
+                        continue
 
-                    if not stet_th or not point_td:
+                    handler = ItemDetailParser._handler_for(ItemDetailParser._text(stet_th).strip())
+                    if handler is None:
                         continue
 
-                    label = stet_th.get_text().strip()
-                    value_text = point_td.get_text().strip()
-                    point_td_html = str(point_td)
-
-                    # 잠재옵션 파싱
-                    if '잠재옵션' in label and '에디셔널' not in label:
-                        if '해당 사항이 없습니다' not in value_text:
-                            # 등급 추출
-                            grade = ItemDetailParser._extract_grade_from_html(stet_th)
-                            if grade:
-                                result['potential_grade'] = grade
-
-                            # 옵션 파싱 (br 태그로 구분)
-                            options = []
-                            for content in point_td.stripped_strings:
-                                if content and '해당 사항이 없습니다' not in content:
-                                    options.append(content.strip())
-                            for i, opt in enumerate(options[:3]):
-                                result[f'potential_option_{i+1}'] = opt
-
-                    # 에디셔널 잠재옵션 파싱
-                    elif '에디셔널 잠재옵션' in label:
-                        if '해당 사항이 없습니다' not in value_text:
-                            # 등급 추출
-                            grade = ItemDetailParser._extract_grade_from_html(stet_th)
-                            if grade:
-                                result['additional_potential_grade'] = grade
-
-                            # 옵션 파싱
-                            options = []
-                            for content in point_td.stripped_strings:
-                                if content and '해당 사항이 없습니다' not in content:
-                                    options.append(content.strip())
-                            for i, opt in enumerate(options[:3]):
-                                result[f'additional_potential_option_{i+1}'] = opt
-
-                    # 소울 옵션 파싱
-                    elif '소울옵션' in label or '소울' in label:
-                        # 소울 이름 추출
-                        soul_text = stet_th.get_text()
-                        if '의 소울' in soul_text:
-                            soul_name_match = re.search(r'(.+?)의 소울', soul_text)
-                            if soul_name_match:
-                                result['soul_name'] = soul_name_match.group(1).strip() + '의 소울'
-                        result['soul_option'] = value_text
-
-                    # 가위 사용 가능 횟수 파싱
-                    elif '가위 사용 가능 횟수' in label:
-                        scissor_match = re.search(r'(\d+)', value_text)
-                        if scissor_match:
-                            result['scissor_count'] = int(scissor_match.group(1))
-
-                    # 기타 정보 파싱
-                    elif '기타' in label:
-                        # 성 강화 정보, 교환 불가 등 추출
-                        for content in point_td.stripped_strings:
-                            content = content.strip()
-                            if not content:
-                                continue
-
-                            # 성 강화 정보 추출
-                            star_match = re.search(r'(\d+)성 강화', content)
-                            if star_match:
-                                result['star_force'] = int(star_match.group(1))
-
-                            max_star_match = re.search(r'(\d+)성까지 강화 가능', content)
-                            if max_star_match:
-                                result['max_star_force'] = int(max_star_match.group(1))
-
-                            # 기타 정보 수집
-                            if any(keyword in content for keyword in [
-                                '교환 불가', '고유장착', '고유 아이템',
-                                '1회 교환가능', '장착 시 교환 불가',
-                                '사용시 교환 불가', '퀘스트 아이템'
-                            ]):
-                                etc_info.append(content)
-
-                    # 일반 스탯 파싱 (분해값 포함)
-                    else:
-                        # 스탯 매핑
-                        stat_mapping = {
-                            'STR': ('str_stat', 'str_breakdown'),
-                            'DEX': ('dex_stat', 'dex_breakdown'),
-                            'INT': ('int_stat', 'int_breakdown'),
-                            'LUK': ('luk_stat', 'luk_breakdown'),
-                            'MaxHP': ('hp_stat', 'hp_breakdown'),
-                            'MaxMP': ('mp_stat', 'mp_breakdown'),
-                            '공격력': ('attack_power', 'attack_breakdown'),
-                            '마력': ('magic_power', 'magic_breakdown'),
-                            '물리방어력': ('defense', 'defense_breakdown'),
-                        }
-
-                        # 분해값 없는 스탯 매핑
-                        simple_stat_mapping = {
-                            '보스 몬스터 공격 시 데미지': 'boss_damage',
-                            '몬스터 방어율 무시': 'ignore_defense',
-                            '몬스터 방어력 무시': 'ignore_defense',
-                            '올스탯': 'all_stat',
-                        }
-
-                        # 스탯 파싱
-                        matched = False
-                        for key, (total_field, breakdown_field) in stat_mapping.items():
-                            if key in label:
-                                breakdown = ItemDetailParser._parse_stat_breakdown(value_text)
-                                if breakdown['total'] is not None:
-                                    result[total_field] = breakdown['total']
-                                    # 분해값이 있으면 저장
-                                    if breakdown['base'] is not None:
-                                        result[breakdown_field] = {
-                                            'total': breakdown['total'],
-                                            'base': breakdown['base'],
-                                            'bonus': breakdown['bonus'],
-                                            'scroll': breakdown['scroll'],
-                                        }
-                                matched = True
-                                break
-
-                        if not matched:
-                            for key, field in simple_stat_mapping.items():
-                                if key in label:
-                                    match = re.search(r'\+?(\d+)%?', value_text)
-                                    if match:
-                                        result[field] = int(match.group(1))
-                                    break
+                    name, args = handler
+                    getattr(ItemDetailParser, name)(
+                        result, etc_info, stet_th, point_td,
+                        ItemDetailParser._text(point_td).strip(), *args)
 
             # 기타 정보 저장
             if etc_info:
                 result['etc_info'] = etc_info
 
             # 4. 스타포스 정보가 item_title 영역에도 있을 수 있음
-            item_title = soup.find('div', class_='item_title')
-            if item_title and 'star_force' not in result:
-                title_text = item_title.get_text()
-                star_match = re.search(r'(\d+)성 강화', title_text)
-                if star_match:
-                    result['star_force'] = int(star_match.group(1))
+            if 'star_force' not in result:
+                item_title = first(ItemDetailParser._ITEM_TITLE_XPATH(root))
+                if item_title is not None:
+                    star_match = ItemDetailParser._STAR_FORCE_RE.search(ItemDetailParser._text(item_title))
+                    if star_match:
+                        result['star_force'] = int(star_match.group(1))
 
             return result
 
@@ -1681,167 +2403,26 @@ class ItemDetailParser:
             raise ParsingError(f'Item detail parsing failed: {e}')
 
     @staticmethod
-    def _map_to_detail_fields(span_data: Dict[str, Any]) -> Dict[str, Any]:
+    def parse_detail_page_or_none(html_content: str, item_name: str) -> Optional[Dict[str, Any]]:
+        """parse_detail_page와 같으나 파싱 실패 시 None (묶음 파싱에서 한 페이지 실패가 묶음 전체를 실패시키지 않도록)"""
+        try:
+            return ItemDetailParser.parse_detail_page(html_content, item_name)
+        except ParsingError:
+            return None
+
+    @staticmethod
+    def parse_many(pages: Iterable[tuple]) -> List[Optional[Dict[str, Any]]]:
         """
-        파싱된 span_data를 ItemDetail 모델 필드에 매핑
+        여러 상세 페이지 일괄 파싱
 
         Args:
-            span_data: 파싱된 원시 데이터
+            pages: (html_content, item_name) 목록
 
         Returns:
-            ItemDetail 모델 필드에 맞춘 딕셔너리
+            입력 순서대로 파싱 결과 (파싱 실패한 페이지는 None)
         """
-        detail = {}
-
-        # 기본 정보
-        detail['item_category'] = span_data.get('장비분류')
-
-        # 착용 레벨 추출 (REQ LEV : 200 형식)
-        req_lev = span_data.get('REQ LEV')
-        if req_lev and isinstance(req_lev, list) and len(req_lev) > 0:
-            try:
-                detail['required_level'] = int(req_lev[0])
-            except (ValueError, IndexError):
-                detail['required_level'] = None
-
-        detail['required_job'] = span_data.get('착용 가능한 직업')
-
-        # 스탯 추출
-        detail.update(ItemDetailParser._parse_base_stats(span_data))
-
-        # 잠재능력
-        detail.update(ItemDetailParser._parse_potential(span_data))
-
-        # 에디셔널 잠재능력
-        detail.update(ItemDetailParser._parse_additional_potential(span_data))
-
-        # 소울 옵션
-        detail.update(ItemDetailParser._parse_soul_option(span_data))
-
-        return detail
-
-    @staticmethod
-    def _parse_base_stats(span_data: Dict[str, Any]) -> Dict[str, int]:
-        """장비 기본 스탯 파싱"""
-        stats = {}
-
-        # 공격력/마력
-        attack_power = span_data.get('공격력')
-        if attack_power and isinstance(attack_power, list) and len(attack_power) > 0:
-            try:
-                stats['attack_power'] = int(attack_power[0].replace('+', ''))
-            except (ValueError, IndexError):
-                pass
-
-        magic_power = span_data.get('마력')
-        if magic_power and isinstance(magic_power, list) and len(magic_power) > 0:
-            try:
-                stats['magic_power'] = int(magic_power[0].replace('+', ''))
-            except (ValueError, IndexError):
-                pass
-
-        # 기본 스탯 (STR, DEX, INT, LUK)
-        for stat_name, field_name in [('STR', 'str_stat'), ('DEX', 'dex_stat'), ('INT', 'int_stat'), ('LUK', 'luk_stat')]:
-            stat_value = span_data.get(stat_name)
-            if stat_value and isinstance(stat_value, list) and len(stat_value) > 0:
-                try:
-                    stats[field_name] = int(stat_value[0].replace('+', ''))
-                except (ValueError, IndexError):
-                    pass
-
-        # HP/MP
-        for stat_name, field_name in [('MaxHP', 'hp_stat'), ('MaxMP', 'mp_stat')]:
-            stat_value = span_data.get(stat_name)
-            if stat_value and isinstance(stat_value, list) and len(stat_value) > 0:
-                try:
-                    stats[field_name] = int(stat_value[0].replace('+', ''))
-                except (ValueError, IndexError):
-                    pass
-
-        # 방어력
-        defense = span_data.get('방어력')
-        if defense and isinstance(defense, list) and len(defense) > 0:
-            try:
-                stats['defense'] = int(defense[0].replace('+', ''))
-            except (ValueError, IndexError):
-                pass
-
-        # 올스탯
-        all_stat = span_data.get('올스탯')
-        if all_stat and isinstance(all_stat, list) and len(all_stat) > 0:
-            try:
-                stats['all_stat'] = int(
-                    all_stat[0].replace('+', '').replace('%', ''))
-            except (ValueError, IndexError):
-                pass
-
-        # 보스 공격력 증가
-        boss_damage = span_data.get('보스 몬스터 공격 시 데미지')
-        if boss_damage and isinstance(boss_damage, list) and len(boss_damage) > 0:
-            try:
-                stats['boss_damage'] = int(
-                    boss_damage[0].replace('+', '').replace('%', ''))
-            except (ValueError, IndexError):
-                pass
-
-        # 방어율 무시
-        ignore_defense = span_data.get('몬스터 방어율 무시')
-        if ignore_defense and isinstance(ignore_defense, list) and len(ignore_defense) > 0:
-            try:
-                stats['ignore_defense'] = int(
-                    ignore_defense[0].replace('+', '').replace('%', ''))
-            except (ValueError, IndexError):
-                pass
-
-        return stats
-
-    @staticmethod
-    def _parse_potential(span_data: Dict[str, Any]) -> Dict[str, Any]:
-        """잠재능력 파싱"""
-        potential = {}
-
-        potential['potential_grade'] = span_data.get('잠재옵션 등급')
-
-        # 잠재능력 옵션 (3줄)
-        potential_options = span_data.get('아이템', [])
-        if isinstance(potential_options, list):
-            for i in range(min(3, len(potential_options))):
-                potential[f'potential_option_{i+1}'] = potential_options[i]
-
-        return potential
-
-    @staticmethod
-    def _parse_additional_potential(span_data: Dict[str, Any]) -> Dict[str, Any]:
-        """에디셔널 잠재능력 파싱"""
-        additional = {}
-
-        additional['additional_potential_grade'] = span_data.get(
-            '에디셔널 잠재옵션 등급')
-
-        # 에디셔널 잠재능력 옵션 (3줄)
-        additional_options = span_data.get('에디셔널 아이템', [])
-        if isinstance(additional_options, list):
-            for i in range(min(3, len(additional_options))):
-                additional[f'additional_potential_option_{i+1}'] = additional_options[i]
-
-        return additional
-
-    @staticmethod
-    def _parse_soul_option(span_data: Dict[str, Any]) -> Dict[str, str]:
-        """소울 옵션 파싱"""
-        soul = {}
-
-        soul_option_text = span_data.get('소울옵션')
-        if soul_option_text:
-            # "매그너스의 소울 : STR +7%, DEX +7%" 형식
-            parts = soul_option_text.split(':')
-            if len(parts) >= 2:
-                soul['soul_name'] = parts[0].strip()
-                soul['soul_option'] = parts[1].strip()
-            else:
-                soul['soul_option'] = soul_option_text
-
-        return soul
+        return [ItemDetailParser.parse_detail_page_or_none(html_content, item_name)
+                for html_content, item_name in pages]
 
 
 class ItemDetailCrawler:
@@ -1850,14 +2431,33 @@ class ItemDetailCrawler:
 
     인벤토리 아이템의 detail_url을 사용하여
     상세 스탯과 옵션을 크롤링합니다.
+
+    concurrency > 1이면 동시 모드로 동작합니다. 고정 sleep 대신 전역 토큰 버킷으로
+    요청률을 제한하고, 429/5xx 응답 시 동시 요청 수를 자동으로 줄입니다.
     """
 
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None):
+        """
+        Args:
+            base_url: 크롤링 대상 주소 (없으면 settings.CRAWLER_BASE_URL, 오프라인 벤치마크용)
+                detail_url의 host를 이 주소로 바꿔 요청합니다.
+        """
         self.user_agent = "MapleStorage/1.0 (Educational Purpose)"
+        self.base_url = get_base_url(base_url)
         self.request_delay_min = 2.0  # 최소 2초
         self.request_delay_max = 3.0  # 최대 3초
         self.batch_size = 50  # 배치 크기
         self.batch_rest_time = 30  # 배치 간 휴식 (초)
+        self.fetch_backend = getattr(settings, 'CRAWLER_FETCH_BACKEND', 'playwright')
+
+        # 동시 모드 설정 (concurrency=1이면 위의 순차 딜레이 방식 사용)
+        self.concurrency = getattr(settings, 'CRAWLER_DETAIL_CONCURRENCY', 4)
+        self.requests_per_second = getattr(settings, 'CRAWLER_DETAIL_RATE_PER_SEC', 1.0)
+        self.burst = getattr(settings, 'CRAWLER_DETAIL_BURST', 3)
+        self.max_throttle_retries = 2  # 429/5xx 응답 시 아이템별 재시도 횟수
+        # 동시 모드에서 한 번에 파싱 워커로 넘기는 상세 페이지 수
+        self.parse_chunk_size = max(1, getattr(settings, 'CRAWLER_PARSE_CHUNK_SIZE', 16))
+        self.resource_blocking = get_resource_blocking_profile()
 
     async def crawl_item_details(
         self,
@@ -1865,7 +2465,7 @@ class ItemDetailCrawler:
         progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> Dict[str, Any]:
         """
-        여러 아이템의 상세 정보를 배치로 크롤링
+        여러 아이템의 상세 정보를 크롤링
 
         Args:
             inventory_items: Inventory 모델 객체 리스트
@@ -1878,6 +2478,17 @@ class ItemDetailCrawler:
                 'total_time': float
             }
         """
+        if self.concurrency > 1:
+            return await self._crawl_item_details_concurrent(inventory_items, progress_callback)
+
+        return await self._crawl_item_details_serial(inventory_items, progress_callback)
+
+    async def _crawl_item_details_serial(
+        self,
+        inventory_items: list,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """아이템을 하나씩 순차 크롤링 (요청 간 2-3초, 배치 간 30초 휴식)"""
         import time
         start_time = time.time()
 
@@ -1897,25 +2508,7 @@ class ItemDetailCrawler:
                     detail_data = await self._crawl_single_item(item)
 
                     if detail_data:
-                        # Pydantic 검증
-                        from characters.schemas import ItemDetailSchema
-                        validated_data = ItemDetailSchema(**detail_data)
-
-                        # DB 저장 (sync_to_async 래핑)
-                        from characters.models import ItemDetail
-
-                        @sync_to_async
-                        def save_item_detail():
-                            ItemDetail.objects.update_or_create(
-                                inventory_item=item,
-                                defaults=validated_data.model_dump(
-                                    exclude_none=True)
-                            )
-                            # Inventory의 has_detail 플래그 업데이트
-                            item.has_detail = True
-                            item.save(update_fields=['has_detail'])
-
-                        await save_item_detail()
+                        await self._save_item_detail(item, detail_data)
 
                         success_count += 1
                         logger.info(
@@ -1953,74 +2546,289 @@ class ItemDetailCrawler:
             'total_time': total_time
         }
 
-    async def _crawl_single_item(self, inventory_item) -> Optional[Dict[str, Any]]:
+    async def _crawl_item_details_concurrent(
+        self,
+        inventory_items: list,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        워커 concurrency개로 아이템을 동시에 크롤링
+
+        - 요청률: 대상 host별 Redis 토큰 버킷 (requests_per_second, burst, 모든 Celery 워커가 공유)
+        - 동시 요청 수: AdaptiveConcurrencyLimiter (429/5xx 시 절반, 성공 누적 시 +1)
+        - Playwright 폴백 페이지는 하나의 BrowserContext를 공유
+        - 받아 온 페이지는 parse_chunk_size개씩 모아 파싱 워커에 한 번에 넘긴 뒤 저장
+        """
+        import time
+        start_time = time.time()
+
+        total = len(inventory_items)
+        success_count = 0
+        completed = 0
+        failed_items = []
+        fetched = []  # 파싱 대기 중인 (아이템, HTML)
+
+        def report_progress():
+            nonlocal completed
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total)
+
+        async def parse_and_save():
+            nonlocal success_count
+            batch = fetched[:]
+            fetched.clear()
+            if not batch:
+                return
+
+            parsed = await self._parse_detail_pages(batch)
+            for (item, _), detail_data in zip(batch, parsed):
+                try:
+                    if detail_data:
+                        await self._save_item_detail(item, detail_data)
+                        success_count += 1
+                        logger.info(f'Item detail crawled: {item.item_name}')
+                    else:
+                        failed_items.append(item.item_name)
+                        logger.warning(f'Failed to crawl detail for: {item.item_name}')
+                except Exception as e:
+                    failed_items.append(item.item_name)
+                    logger.error(
+                        f'Error saving {item.item_name}: {e}', exc_info=True)
+                report_progress()
+
+        bucket = get_detail_rate_limiter(self.requests_per_second, self.burst)
+        limiter = AdaptiveConcurrencyLimiter(max_limit=self.concurrency)
+        context = _LazyBrowserContext(
+            user_agent=self.user_agent,
+            extra_http_headers={'X-Requested-With': 'XMLHttpRequest'}
+        )
+
+        queue = asyncio.Queue()
+        for item in inventory_items:
+            queue.put_nowait(item)
+
+        async def worker():
+            nonlocal success_count, completed
+
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    html_content = await self._crawl_item_paced(item, bucket, limiter, context)
+                except Exception as e:
+                    html_content = None
+                    logger.error(
+                        f'Error crawling {item.item_name}: {e}', exc_info=True)
+
+                if html_content is None:
+                    failed_items.append(item.item_name)
+                    report_progress()
+                    continue
+
+                fetched.append((item, html_content))
+                if len(fetched) >= self.parse_chunk_size:
+                    await parse_and_save()
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, total))))
+            await parse_and_save()
+        finally:
+            await context.close()
+
+        total_time = time.time() - start_time
+        logger.info(
+            f'Concurrent item detail crawl finished: {success_count}/{total} '
+            f'in {total_time:.1f}s (final concurrency={limiter.limit})')
+
+        return {
+            'success_count': success_count,
+            'failed_items': failed_items,
+            'total_time': total_time
+        }
+
+    async def _crawl_item_paced(self, item, bucket, limiter, context) -> Optional[str]:
+        """
+        토큰 버킷/동시성 제한 하에서 단일 아이템 상세 페이지 요청 (파싱/저장은 호출자가 묶어서 처리)
+
+        429/5xx 응답이면 동시성을 줄이고 백오프 후 최대 max_throttle_retries회 재시도합니다.
+
+        Returns:
+            HTML 문자열 (실패 시 None)
+        """
+        bucket_key = detail_rate_key(rebase_url(item.detail_url, self.base_url))
+
+        for attempt in range(self.max_throttle_retries + 1):
+            try:
+                async with limiter.slot():
+                    await bucket.acquire(bucket_key)
+                    html_content = await self._fetch_single_item(item, context=context)
+                limiter.on_success()
+                return html_content
+            except CrawlThrottledError as e:
+                limiter.on_throttle()
+                await bucket.drain_async(bucket_key)
+
+                if attempt == self.max_throttle_retries:
+                    logger.error(f'Giving up {item.item_name} after throttling: {e}')
+                    return None
+
+                backoff = min(30, 2 ** (attempt + 1)) + random.uniform(0, 1)
+                logger.warning(
+                    f'Throttled on {item.item_name} ({e}), retrying in {backoff:.1f}s')
+                await asyncio.sleep(backoff)
+
+        return None
+
+    async def _parse_detail_pages(self, fetched: List[tuple]) -> List[Optional[Dict[str, Any]]]:
+        """
+        (아이템, HTML) 목록을 파싱 워커에서 묶음 파싱 (CRAWLER_PARSE_CHUNK_SIZE개씩 한 작업)
+
+        Returns:
+            입력 순서대로 상세 정보 딕셔너리 (파싱 실패 시 None)
+        """
+        try:
+            parsed = await cached_parse_many(
+                'item_detail', ItemDetailParser.parse_detail_page_or_none,
+                [(html_content, item.item_name) for item, html_content in fetched])
+        except Exception:
+            logger.error(f'Failed to parse {len(fetched)} item detail pages', exc_info=True)
+            return [None] * len(fetched)
+        return [detail_data for detail_data, _ in parsed]
+
+    async def _save_item_detail(self, item, detail_data: Dict[str, Any]):
+        """상세 정보 Pydantic 검증 후 ItemDetail 저장 및 has_detail 플래그 갱신"""
+        # Pydantic 검증
+        from characters.schemas import ItemDetailSchema
+        validated_data = ItemDetailSchema(**detail_data)
+
+        # DB 저장 (sync_to_async 래핑)
+        from characters.models import ItemDetail
+
+        @sync_to_async
+        def save_item_detail():
+            ItemDetail.objects.update_or_create(
+                inventory_item=item,
+                defaults=validated_data.model_dump(
+                    exclude_none=True)
+            )
+            # Inventory의 has_detail 플래그 업데이트
+            item.has_detail = True
+            item.save(update_fields=['has_detail'])
+
+        await save_item_detail()
+
+    async def _crawl_single_item(self, inventory_item, context=None) -> Optional[Dict[str, Any]]:
         """
         단일 아이템의 상세 정보 크롤링
 
         Args:
             inventory_item: Inventory 모델 객체
+            context: 공유 BrowserContext (동시 모드에서 전달, 선택)
 
         Returns:
             파싱된 상세 정보 딕셔너리 또는 None (실패 시)
+
+        Raises:
+            CrawlThrottledError: 429/5xx 응답 (호출자가 페이싱 조정)
         """
-        if not inventory_item.detail_url:
-            logger.warning(
-                f'No detail_url for item: {inventory_item.item_name}')
+        html_content = await self._fetch_single_item(inventory_item, context=context)
+        if html_content is None:
             return None
 
         try:
-            # HTML 가져오기
-            html_content = await self._fetch_detail_page(inventory_item.detail_url)
-
             # HTML 파싱
-            detail_data = ItemDetailParser.parse_detail_page(
-                html_content, inventory_item.item_name)
+            detail_data, _ = await cached_parse(
+                'item_detail', ItemDetailParser.parse_detail_page, html_content, inventory_item.item_name)
 
             return detail_data
 
+        except Exception as e:
+            logger.error(
+                f'Failed to parse item detail: {inventory_item.item_name}', exc_info=True)
+            return None
+
+    async def _fetch_single_item(self, inventory_item, context=None) -> Optional[str]:
+        """
+        단일 아이템의 상세 페이지 HTML 요청
+
+        Returns:
+            HTML 문자열 또는 None (detail_url 없음/요청 실패)
+
+        Raises:
+            CrawlThrottledError: 429/5xx 응답 (호출자가 페이싱 조정)
+        """
+        if not inventory_item.detail_url:
+            logger.warning(
+                f'No detail_url for item: {inventory_item.item_name}')
+            return None
+
+        try:
+            # 저장된 공식 사이트 URL을 대상 주소로 변환
+            return await self._fetch_detail_page(
+                rebase_url(inventory_item.detail_url, self.base_url), context=context)
+        except CrawlThrottledError:
+            raise
         except Exception as e:
             logger.error(
                 f'Failed to crawl item detail: {inventory_item.item_name}', exc_info=True)
             return None
 
-    async def _fetch_detail_page(self, detail_url: str) -> str:
+    async def _fetch_detail_page(self, detail_url: str, context=None) -> str:
         """
         아이템 상세 페이지 HTML 가져오기
 
+        fetch_backend가 'http'이면 XHR 요청의 JSON view를 먼저 시도하고,
+        실패 시 Playwright로 폴백합니다.
+
         Args:
             detail_url: 아이템 상세 페이지 URL
+            context: 공유 BrowserContext (없으면 브라우저 풀에서 새로 발급)
 
         Returns:
             HTML 문자열
+
+        Raises:
+            CrawlThrottledError: 429/5xx 응답 시
+            CrawlingError: 그 외 실패 시
         """
-        from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-        try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=['--disable-dev-shm-usage']
-                )
-
-                context = await browser.new_context(
-                    user_agent=self.user_agent,
-                    extra_http_headers={
-                        'X-Requested-With': 'XMLHttpRequest'
-                    }
-                )
+        if self.fetch_backend == 'http':
+            try:
+                return await get_http_fetcher().fetch_detail_view(detail_url)
+            except PageFetchError as e:
+                # 서버가 제한 중이면 브라우저로 재요청하지 않음
+                if is_throttle_status(e.status):
+                    raise CrawlThrottledError(str(e), status=e.status)
+                logger.info(f'HTTP detail fetch failed, falling back to Playwright: {e}')
+            except Exception as e:
+                logger.info(f'HTTP detail fetch failed, falling back to Playwright: {e}')
 
+        try:
+            if context is not None:
                 page = await context.new_page()
+                try:
+                    await self._apply_resource_blocking(page)
+                    return await self._load_detail_page(page, detail_url)
+                finally:
+                    await page.close()
 
-                # 페이지 로드 (30초 timeout)
-                await page.goto(detail_url, timeout=30000, wait_until='domcontentloaded')
-
-                # HTML 가져오기
-                html_content = await page.content()
-
-                await browser.close()
-
-                return html_content
+            async with get_browser_pool().new_context(
+                user_agent=self.user_agent,
+                extra_http_headers={
+                    'X-Requested-With': 'XMLHttpRequest'
+                }
+            ) as new_context:
+                page = await new_context.new_page()
+                await self._apply_resource_blocking(page)
+                return await self._load_detail_page(page, detail_url)
 
+        except CrawlThrottledError:
+            raise
         except PlaywrightTimeoutError:
             logger.error(f'Timeout fetching detail page: {detail_url}')
             raise CrawlingError(f'Timeout: {detail_url}')
@@ -2028,3 +2836,20 @@ class ItemDetailCrawler:
             logger.error(
                 f'Failed to fetch detail page: {detail_url}', exc_info=True)
             raise CrawlingError(f'Failed to fetch: {e}')
+
+    async def _apply_resource_blocking(self, page):
+        """이미지/미디어/폰트/트래커 요청 차단 (CRAWLER_BLOCK_RESOURCES=False면 생략)"""
+        if self.resource_blocking is not None:
+            await self.resource_blocking.apply(page)
+
+    @staticmethod
+    async def _load_detail_page(page, detail_url: str) -> str:
+        """Playwright 페이지로 상세 페이지 로드 (30초 timeout)"""
+        response = await page.goto(detail_url, timeout=30000, wait_until='domcontentloaded')
+
+        if response is not None and is_throttle_status(response.status):
+            raise CrawlThrottledError(
+                f'HTTP {response.status}: {detail_url}', status=response.status)
+
+        # HTML 가져오기
+        return await page.content()
@@ -0,0 +1,120 @@
+"""
+Nexon 데이터 공개 주기 기반 캐시 신선도 정책
+
+Nexon 캐릭터 API는 하루 단위 스냅샷을 공개하므로(전일 데이터는 매일 오전 1시
+이후 조회 가능) 고정 1시간 캐시는 같은 데이터를 하루에 여러 번 다시 받게 됩니다.
+엔드포인트별 공개 시각을 기준으로
+
+- 마지막 공개 이후에 받은 데이터는 최신 (다음 공개 전까지 재조회 불필요)
+- 캐시 만료 = 다음 공개 시각 + 안전 여유
+- force_refresh는 마지막 조회 이후 새 데이터가 공개됐을 때만 의미가 있음
+
+settings:
+- NEXON_PUBLISH_TIMES: 엔드포인트별 공개 시각 {'character/basic': '01:00', ...} (KST)
+- NEXON_DEFAULT_PUBLISH_TIME: 기본 공개 시각 (기본 '01:00')
+- NEXON_PUBLISH_SAFETY_MARGIN: 공개 시각 이후 여유 시간 (초, 기본 600)
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Optional, Union
+
+import pytz
+from django.conf import settings
+from django.utils import timezone
+
+KST = pytz.timezone('Asia/Seoul')
+
+DEFAULT_PUBLISH_TIME = time(1, 0)
+DEFAULT_SAFETY_MARGIN = timedelta(minutes=10)
+# 과거 날짜(date 파라미터) 데이터는 바뀌지 않으므로 길게 캐싱
+HISTORICAL_TTL = timedelta(days=7)
+MIN_TTL_SECONDS = 60
+
+
+def _parse_time(value: Union[str, time]) -> time:
+    if isinstance(value, time):
+        return value
+    hour, minute = value.split(':')
+    return time(int(hour), int(minute))
+
+
+class FreshnessPolicy:
+    """
+    엔드포인트별 공개 시각 기반 신선도 계산
+
+    endpoint는 util.rate_limiter.endpoint_from_url()과 같은 이름
+    ('character/basic', 'character/item-equipment' 등)을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        publish_times: Optional[Dict[str, Union[str, time]]] = None,
+        default_publish_time: Union[str, time] = DEFAULT_PUBLISH_TIME,
+        safety_margin: timedelta = DEFAULT_SAFETY_MARGIN,
+    ):
+        self.publish_times = {
+            endpoint: _parse_time(value) for endpoint, value in (publish_times or {}).items()
+        }
+        self.default_publish_time = _parse_time(default_publish_time)
+        self.safety_margin = safety_margin
+
+    def _publish_at(self, endpoint: Optional[str], day: date) -> datetime:
+        """day의 공개 시각 + 안전 여유 (KST aware)"""
+        publish_time = self.publish_times.get(endpoint, self.default_publish_time)
+        return KST.localize(datetime.combine(day, publish_time)) + self.safety_margin
+
+    def last_publish(self, endpoint: Optional[str] = None, now: Optional[datetime] = None) -> datetime:
+        """now 이전 마지막 공개 시각 (이 시각 이후 받은 데이터는 최신)"""
+        now_kst = (now or timezone.now()).astimezone(KST)
+        published = self._publish_at(endpoint, now_kst.date())
+        if published > now_kst:
+            published = self._publish_at(endpoint, now_kst.date() - timedelta(days=1))
+        return published
+
+    def next_publish(self, endpoint: Optional[str] = None, now: Optional[datetime] = None) -> datetime:
+        """now 이후 다음 공개 시각"""
+        now_kst = (now or timezone.now()).astimezone(KST)
+        published = self._publish_at(endpoint, now_kst.date())
+        if published <= now_kst:
+            published = self._publish_at(endpoint, now_kst.date() + timedelta(days=1))
+        return published
+
+    def ttl_seconds(
+        self,
+        endpoint: Optional[str] = None,
+        target_date: Optional[Union[str, date]] = None,
+        now: Optional[datetime] = None,
+    ) -> int:
+        """
+        캐시 TTL (초): 다음 공개 시각까지
+
+        Args:
+            target_date: 조회 기준일 (date 파라미터). 이미 공개된 과거 날짜면 HISTORICAL_TTL
+        """
+        now = now or timezone.now()
+        if target_date:
+            if isinstance(target_date, str):
+                target_date = date.fromisoformat(target_date)
+            # target_date 데이터는 다음날 공개 시각에 확정
+            if self._publish_at(endpoint, target_date + timedelta(days=1)) <= now:
+                return int(HISTORICAL_TTL.total_seconds())
+
+        remaining = (self.next_publish(endpoint, now) - now).total_seconds()
+        return max(MIN_TTL_SECONDS, int(remaining))
+
+
+_freshness_policy: Optional[FreshnessPolicy] = None
+
+
+def get_freshness_policy() -> FreshnessPolicy:
+    """settings 기반 신선도 정책 (프로세스당 1개)"""
+    global _freshness_policy
+
+    if _freshness_policy is None:
+        _freshness_policy = FreshnessPolicy(
+            publish_times=getattr(settings, 'NEXON_PUBLISH_TIMES', None),
+            default_publish_time=getattr(settings, 'NEXON_DEFAULT_PUBLISH_TIME', DEFAULT_PUBLISH_TIME),
+            safety_margin=timedelta(
+                seconds=getattr(settings, 'NEXON_PUBLISH_SAFETY_MARGIN', DEFAULT_SAFETY_MARGIN.total_seconds())),
+        )
+
+    return _freshness_policy
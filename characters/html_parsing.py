@@ -0,0 +1,70 @@
+"""
+lxml 기반 HTML 파싱 헬퍼 (크롤링 파서 공용)
+
+BeautifulSoup 트리는 노드마다 파이썬 객체를 만들기 때문에 인벤토리처럼
+아이템이 많은 페이지에서는 느리고 메모리를 많이 씁니다. 파서들은 페이지를
+lxml로 한 번만 파싱하고 미리 컴파일한 XPath로 필요한 노드만 찾습니다.
+
+(cssselect 의존성 없이 XPath만 사용)
+"""
+import threading
+from typing import Iterable, List, Optional
+
+from lxml import etree
+
+_local = threading.local()
+
+
+def _parser() -> etree.HTMLParser:
+    """스레드별 HTML 파서 (lxml 파서 객체는 스레드 간 공유하지 않음)"""
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        # str을 UTF-8 바이트로 넘기므로 인코딩을 고정 (meta charset 없는 조각도 깨지지 않음)
+        parser = _local.parser = etree.HTMLParser(encoding='utf-8')
+    return parser
+
+
+def parse_html(html: str) -> Optional[etree._Element]:
+    """
+    HTML 문자열을 lxml 트리로 파싱 (페이지 전체/조각 모두 가능)
+
+    Returns:
+        루트 엘리먼트 (빈 문자열이거나 파싱 불가 시 None)
+    """
+    if not html or not html.strip():
+        return None
+    return etree.fromstring(html.encode('utf-8'), _parser())
+
+
+def has_class(class_name: str) -> str:
+    """class 속성에 class_name 토큰이 있는지 확인하는 XPath 조건식"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def class_xpath(path: str, **class_names: str) -> etree.XPath:
+    """
+    {이름} 자리에 class 조건을 채워 XPath 컴파일
+
+    예: class_xpath('.//div[{item}]', item='inven_item_img')
+    """
+    return etree.XPath(path.format(**{key: has_class(value) for key, value in class_names.items()}))
+
+
+def stripped_text(element: Optional[etree._Element]) -> str:
+    """BeautifulSoup get_text(strip=True)와 같은 결과 (텍스트 조각별 strip 후 연결)"""
+    if element is None:
+        return ''
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def joined_text(elements: Iterable[etree._Element], separator: str = ' ') -> str:
+    """여러 엘리먼트의 텍스트를 separator로 연결 (정규식 검색용)"""
+    parts: List[str] = []
+    for element in elements:
+        parts.extend(element.itertext())
+    return separator.join(parts)
+
+
+def first(nodes: List[etree._Element]) -> Optional[etree._Element]:
+    return nodes[0] if nodes else None
+
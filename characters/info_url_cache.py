@@ -0,0 +1,134 @@
+"""
+캐릭터 정보 URL (?p= 토큰) 캐시
+
+랭킹 페이지 조회는 크롤링에서 가장 느린 단계이므로, 발급된 character_info_url을
+발급 시각과 함께 캐시하고 유효한 동안 크롤링 타입/작업 간에 재사용합니다.
+
+토큰의 실제 유효 시간은 공개되어 있지 않으므로 관측으로 학습합니다.
+- 재사용에 성공한 토큰의 나이 → max_valid_age (이 나이까지는 유효했음)
+- 만료로 판정된 토큰의 나이 → min_invalid_age (이 나이에 이미 만료됨)
+재사용 허용 시간은 max_valid_age보다 조금 길게 잡아 점진적으로 늘리되,
+min_invalid_age의 안전 비율을 넘지 않습니다.
+
+Redis 키 구조:
+- crawl:info_url:{character_name} - {'url': str, 'issued_at': float}
+- crawl:info_url:validity - {'max_valid_age': float, 'min_invalid_age': float | None}
+"""
+import logging
+import time
+from typing import Optional
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+class CharacterInfoUrlCache:
+    """character_info_url 캐시 및 유효 시간 학습"""
+
+    KEY_PREFIX = 'crawl:info_url'
+    VALIDITY_KEY = 'crawl:info_url:validity'
+
+    DEFAULT_VALIDITY = 600  # 관측 전 기본 재사용 허용 시간 (10분)
+    MAX_VALIDITY = 6 * 3600  # 재사용 허용 시간 상한 (6시간)
+    GROWTH_FACTOR = 1.5  # 성공 관측 후 허용 시간 확장 비율
+    SAFETY_FACTOR = 0.8  # 만료 관측 나이 대비 허용 비율
+    URL_TTL = MAX_VALIDITY  # 캐시 항목 TTL
+    VALIDITY_TTL = 30 * 86400  # 학습 결과 보관 기간 (30일)
+
+    @classmethod
+    def _url_key(cls, character_name: str) -> str:
+        return f'{cls.KEY_PREFIX}:{character_name.lower()}'
+
+    @classmethod
+    def _get_validity_stats(cls) -> dict:
+        return cache.get(cls.VALIDITY_KEY) or {'max_valid_age': 0.0, 'min_invalid_age': None}
+
+    @classmethod
+    def validity_window(cls) -> float:
+        """현재 학습된 재사용 허용 시간 (초)"""
+        stats = cls._get_validity_stats()
+
+        window = max(cls.DEFAULT_VALIDITY, stats['max_valid_age'] * cls.GROWTH_FACTOR)
+        if stats['min_invalid_age'] is not None:
+            window = min(window, stats['min_invalid_age'] * cls.SAFETY_FACTOR)
+
+        return min(window, cls.MAX_VALIDITY)
+
+    @classmethod
+    def store(cls, character_name: str, url: str, issued_at: Optional[float] = None) -> None:
+        """새로 발급받은 URL 저장"""
+        cache.set(
+            cls._url_key(character_name),
+            {'url': url, 'issued_at': issued_at if issued_at is not None else time.time()},
+            cls.URL_TTL
+        )
+
+    @classmethod
+    def get_valid(cls, character_name: str) -> Optional[str]:
+        """
+        재사용 가능한 URL 반환
+
+        Returns:
+            유효 시간 내 URL 또는 None (없거나 만료 추정)
+        """
+        entry = cache.get(cls._url_key(character_name))
+        if not entry:
+            return None
+
+        age = time.time() - entry['issued_at']
+        window = cls.validity_window()
+        if age >= window:
+            logger.info(
+                f'Cached character_info_url too old for {character_name} ({age:.0f}s >= {window:.0f}s)')
+            return None
+
+        logger.info(f'Reusing cached character_info_url for {character_name} (age {age:.0f}s)')
+        return entry['url']
+
+    @classmethod
+    def mark_valid(cls, character_name: str) -> None:
+        """캐시된 URL로 크롤링 성공 (유효 시간 하한 학습)"""
+        age = cls._entry_age(character_name)
+        if age is None:
+            return
+
+        stats = cls._get_validity_stats()
+        stats['max_valid_age'] = max(stats['max_valid_age'], age)
+
+        # 더 오래된 토큰이 유효했다면 이전 만료 관측은 일시적 오류로 간주
+        if stats['min_invalid_age'] is not None and age >= stats['min_invalid_age']:
+            stats['min_invalid_age'] = None
+
+        cache.set(cls.VALIDITY_KEY, stats, cls.VALIDITY_TTL)
+
+    @classmethod
+    def mark_invalid(cls, character_name: str) -> None:
+        """캐시된 URL이 만료됨 (유효 시간 상한 학습 후 캐시 삭제)"""
+        age = cls._entry_age(character_name)
+        cache.delete(cls._url_key(character_name))
+        if age is None:
+            return
+
+        stats = cls._get_validity_stats()
+
+        # 이미 더 오래된 토큰이 유효했던 적이 있으면 만료가 아닌 개별 폐기로 보고 학습하지 않음
+        if age <= stats['max_valid_age']:
+            return
+
+        if stats['min_invalid_age'] is None or age < stats['min_invalid_age']:
+            stats['min_invalid_age'] = age
+            logger.info(f'Learned character_info_url expiry: invalid at {age:.0f}s')
+            cache.set(cls.VALIDITY_KEY, stats, cls.VALIDITY_TTL)
+
+    @classmethod
+    def invalidate(cls, character_name: str) -> None:
+        """학습 없이 캐시 삭제"""
+        cache.delete(cls._url_key(character_name))
+
+    @classmethod
+    def _entry_age(cls, character_name: str) -> Optional[float]:
+        entry = cache.get(cls._url_key(character_name))
+        if not entry:
+            return None
+        return time.time() - entry['issued_at']
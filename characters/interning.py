@@ -0,0 +1,107 @@
+"""
+내용 해시 기반 행 재사용 (장비/옵션, 스킬, 헥사 코어 등 여러 캐릭터/날짜가 공유하는 카탈로그 행)
+
+모든 컬럼을 조건으로 get_or_create 하는 대신 정규화한 컬럼 값 JSON의 sha256을
+content_hash(unique)에 저장하고 그 값으로 찾습니다. 한 묶음의 해시를 IN 쿼리로 한 번에 조회하고
+없는 행만 bulk_create(ignore_conflicts=True) 한 뒤 다시 조회하므로 행 수와 관계없이 모델당 쿼리가
+3회 정도입니다 (동시에 같은 행을 만든 요청이 있어도 unique 충돌은 무시되고 재조회로 가져옴).
+
+정규화 규칙:
+- 없는 키는 필드 기본값, 값은 field.to_python으로 변환 ('3'과 3, 누락과 None은 같은 해시)
+- aware datetime은 UTC 기준
+- FK 컬럼은 참조 행의 content_hash (참조 모델도 content_hash가 있어야 함)
+
+카탈로그 행과의 M2M 연결은 bulk_add_m2m으로 through 테이블에 한 번에 추가합니다.
+
+기존 행 백필 마이그레이션은 이 계산을 복사한 characters/migrations/_helpers.py를 사용하므로
+정규화 규칙을 바꾸면 기존 해시를 다시 계산하는 마이그레이션도 함께 추가하세요.
+"""
+import hashlib
+import json
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, Iterable, List, Tuple
+
+from django.utils import timezone
+
+LOOKUP_BATCH_SIZE = 500  # IN 조회 한 번에 넣는 해시 수 (SQLite 변수 개수 제한)
+
+
+def _canonical_value(field, value):
+    if field.is_relation:
+        # 참조 객체, 해시 문자열 또는 None
+        return getattr(value, 'content_hash', value)
+    if value is None:
+        return None
+    value = field.to_python(value)
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        value = value.astimezone(dt_timezone.utc)
+    return value
+
+
+def content_digest(model, values: Dict[str, Any]) -> str:
+    """values(필드 이름 → 값)를 model 컬럼 기준으로 정규화한 JSON의 sha256"""
+    payload = {}
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.name == 'content_hash':
+            continue
+        value = values[field.name] if field.name in values else field.get_default()
+        payload[field.name] = _canonical_value(field, value)
+    text = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _fetch(model, hashes: Iterable[str]) -> Dict[str, Any]:
+    hashes = list(set(hashes))
+    found = {}
+    for start in range(0, len(hashes), LOOKUP_BATCH_SIZE):
+        for obj in model.objects.filter(content_hash__in=hashes[start:start + LOOKUP_BATCH_SIZE]):
+            found[obj.content_hash] = obj
+    return found
+
+
+def intern_rows(model, values_list: List[Dict[str, Any]]) -> List[Any]:
+    """
+    values_list 각 항목과 같은 내용의 행을 찾거나 생성
+
+    Args:
+        model: content_hash 필드가 있는 모델
+        values_list: 필드 이름 → 값 dict 목록 (FK는 저장된 참조 객체)
+
+    Returns:
+        입력 순서의 모델 객체 목록 (같은 내용은 같은 객체)
+    """
+    if not values_list:
+        return []
+
+    hashes = [content_digest(model, values) for values in values_list]
+    found = _fetch(model, hashes)
+
+    missing = {}
+    for content_hash, values in zip(hashes, values_list):
+        if content_hash not in found and content_hash not in missing:
+            missing[content_hash] = model(content_hash=content_hash, **values)
+    if missing:
+        model.objects.bulk_create(missing.values(), ignore_conflicts=True)
+        # ignore_conflicts는 pk를 채우지 않으므로 다시 조회
+        found.update(_fetch(model, missing))
+
+    return [found[content_hash] for content_hash in hashes]
+
+
+def bulk_add_m2m(model, field_name: str, links: Iterable[Tuple[Any, Any]]) -> None:
+    """
+    model.field_name M2M에 (원본 객체, 대상 객체) 연결을 through bulk_create 한 번으로 추가
+
+    .add()처럼 이미 있는 연결은 무시합니다 (m2m_changed 시그널은 보내지 않음).
+    """
+    field = model._meta.get_field(field_name)
+    through = field.remote_field.through
+    source_attname = through._meta.get_field(field.m2m_field_name()).attname
+    target_attname = through._meta.get_field(field.m2m_reverse_field_name()).attname
+
+    pairs = dict.fromkeys((source.pk, target.pk) for source, target in links)
+    if pairs:
+        through.objects.bulk_create(
+            [through(**{source_attname: source_id, target_attname: target_id}) for source_id, target_id in pairs],
+            ignore_conflicts=True,
+        )
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.4 on 2026-10-17 10:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0017_add_itemdetail_extended_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrawlContentState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('crawl_type', models.CharField(choices=[('inventory', '인벤토리'), ('storage', '창고')], help_text='크롤링 유형 (inventory/storage)', max_length=20)),
+                ('content_hash', models.CharField(help_text='정규화한 페이지 HTML 해시', max_length=64)),
+                ('crawled_at', models.DateTimeField(help_text='이 해시로 저장한 스냅샷의 crawled_at')),
+                ('confirmed_at', models.DateTimeField(help_text='내용이 바뀌지 않았음을 마지막으로 확인한 시간')),
+                ('character_basic', models.ForeignKey(help_text='연결된 캐릭터', on_delete=django.db.models.deletion.CASCADE, related_name='crawl_states', to='characters.characterbasic')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('character_basic', 'crawl_type'), name='unique_crawl_state_per_type')],
+            },
+        ),
+    ]
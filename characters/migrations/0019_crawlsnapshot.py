@@ -0,0 +1,72 @@
+# Generated by Django 5.1.4 on 2026-10-17 02:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def backfill_snapshots(apps, schema_editor):
+    """기존 인벤토리/창고 행으로 스냅샷 기록 (캐릭터/유형별 가장 최근 것을 현재 스냅샷으로)"""
+    CrawlSnapshot = apps.get_model('characters', 'CrawlSnapshot')
+    CrawlContentState = apps.get_model('characters', 'CrawlContentState')
+
+    for kind, model_name in (('inventory', 'Inventory'), ('storage', 'Storage')):
+        model = apps.get_model('characters', model_name)
+        hashes = {
+            (state.character_basic_id, state.crawled_at): state.content_hash
+            for state in CrawlContentState.objects.filter(crawl_type=kind)
+        }
+        latest = dict(
+            model.objects.values('character_basic_id')
+            .annotate(latest=Max('crawled_at'))
+            .values_list('character_basic_id', 'latest')
+        )
+
+        snapshots = []
+        groups = (
+            model.objects.values('character_basic_id', 'crawled_at')
+            .annotate(item_count=Count('id'))
+            .order_by('character_basic_id', 'crawled_at')
+        )
+        for group in groups.iterator():
+            key = (group['character_basic_id'], group['crawled_at'])
+            snapshots.append(CrawlSnapshot(
+                character_basic_id=key[0],
+                kind=kind,
+                crawled_at=key[1],
+                item_count=group['item_count'],
+                content_hash=hashes.get(key, ''),
+                is_current=latest.get(key[0]) == key[1],
+            ))
+            if len(snapshots) >= 1000:
+                CrawlSnapshot.objects.bulk_create(snapshots)
+                snapshots = []
+        CrawlSnapshot.objects.bulk_create(snapshots)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0018_crawlcontentstate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrawlSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('inventory', '인벤토리'), ('storage', '창고')], help_text='스냅샷 유형 (inventory/storage)', max_length=20)),
+                ('crawled_at', models.DateTimeField(help_text='스냅샷 아이템의 crawled_at')),
+                ('item_count', models.PositiveIntegerField(default=0, help_text='저장한 아이템 수')),
+                ('content_hash', models.CharField(blank=True, default='', help_text='정규화한 페이지 HTML 해시 (없으면 빈 문자열)', max_length=64)),
+                ('is_current', models.BooleanField(default=False, help_text='캐릭터/유형의 현재 스냅샷 여부')),
+                ('character_basic', models.ForeignKey(help_text='연결된 캐릭터', on_delete=django.db.models.deletion.CASCADE, related_name='crawl_snapshots', to='characters.characterbasic')),
+            ],
+            options={
+                'ordering': ['-crawled_at'],
+                'indexes': [models.Index(fields=['character_basic', 'kind', '-crawled_at'], name='characters__charact_93040b_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('is_current', True)), fields=('character_basic', 'kind'), name='unique_current_crawl_snapshot')],
+            },
+        ),
+        migrations.RunPython(backfill_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.1.4 on 2026-10-17 02:39
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_intervals(apps, schema_editor):
+    """
+    기존(full) 스냅샷의 유효 구간 기록
+
+    각 스냅샷 아이템 행의 superseded_at을 다음 스냅샷의 crawled_at으로 채웁니다.
+    """
+    CrawlSnapshot = apps.get_model('characters', 'CrawlSnapshot')
+    CrawlSnapshot.objects.update(
+        encoding='full', base_crawled_at=F('crawled_at'), rows_written=F('item_count'))
+
+    for kind, model_name in (('inventory', 'Inventory'), ('storage', 'Storage')):
+        model = apps.get_model('characters', model_name)
+        previous = None
+        snapshots = (
+            CrawlSnapshot.objects.filter(kind=kind)
+            .order_by('character_basic_id', 'crawled_at')
+            .values('character_basic_id', 'crawled_at')
+        )
+        for snapshot in snapshots.iterator():
+            if previous and previous['character_basic_id'] == snapshot['character_basic_id']:
+                model.objects.filter(
+                    character_basic_id=previous['character_basic_id'],
+                    crawled_at=previous['crawled_at'],
+                ).update(superseded_at=snapshot['crawled_at'])
+            previous = snapshot
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0019_crawlsnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='crawlsnapshot',
+            name='base_crawled_at',
+            field=models.DateTimeField(blank=True, help_text='스냅샷 아이템 행의 가장 이른 crawled_at (체인 시작 full 스냅샷)', null=True),
+        ),
+        migrations.AddField(
+            model_name='crawlsnapshot',
+            name='encoding',
+            field=models.CharField(choices=[('full', '전체'), ('delta', '변경분')], default='full', help_text='저장 방식 (full: 전체 복사, delta: 변경분만)', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='crawlsnapshot',
+            name='rows_written',
+            field=models.PositiveIntegerField(default=0, help_text='이 스냅샷에서 새로 저장한 행 수 (full이면 item_count와 같음)'),
+        ),
+        migrations.AddField(
+            model_name='inventory',
+            name='superseded_at',
+            field=models.DateTimeField(blank=True, help_text='다음 스냅샷에서 바뀌거나 빠진 시간 (null이면 현재 스냅샷에 포함)', null=True),
+        ),
+        migrations.AddField(
+            model_name='storage',
+            name='superseded_at',
+            field=models.DateTimeField(blank=True, help_text='다음 스냅샷에서 바뀌거나 빠진 시간 (null이면 현재 스냅샷에 포함)', null=True),
+        ),
+        migrations.RunPython(backfill_intervals, migrations.RunPython.noop),
+    ]
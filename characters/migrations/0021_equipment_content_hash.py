@@ -0,0 +1,64 @@
+# Generated by Django 5.1.4 on 2026-10-17 02:50
+
+from django.db import migrations, models
+
+from characters.migrations._helpers import backfill_content_hashes as backfill_model
+
+OPTION_MODELS = (
+    'ItemTotalOption', 'ItemBaseOption', 'ItemExceptionalOption',
+    'ItemAddOption', 'ItemEtcOption', 'ItemStarforceOption',
+)
+
+
+def backfill_content_hashes(apps, schema_editor):
+    """옵션 먼저, 그 다음 옵션 해시를 포함해 장비 해시 계산"""
+    related_hashes = {}
+    for model_name in OPTION_MODELS:
+        related_hashes[model_name] = backfill_model(apps.get_model('characters', model_name))
+    backfill_model(apps.get_model('characters', 'ItemEquipment'), related_hashes)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0020_delta_history'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='itemaddoption',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)', max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='itembaseoption',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)', max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='itemequipment',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)', max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='itemetcoption',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)', max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='itemexceptionaloption',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)', max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='itemstarforceoption',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)', max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='itemtotaloption',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)', max_length=64, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_content_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-17 02:55
+
+from django.db import migrations, models
+
+from characters.migrations._helpers import backfill_content_hashes as backfill_model
+
+
+def backfill_content_hashes(apps, schema_editor):
+    for model_name in ('Skill', 'LinkSkill', 'HexaSkill', 'HexaCore'):
+        backfill_model(apps.get_model('characters', model_name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('characters', '0021_equipment_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='hexacore',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)', max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='hexaskill',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)', max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='linkskill',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)', max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)', max_length=64, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_content_hashes, migrations.RunPython.noop),
+    ]
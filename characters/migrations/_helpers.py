@@ -0,0 +1,74 @@
+"""
+content_hash 백필 마이그레이션(0021, 0022) 공용 함수
+
+characters.interning의 해시 계산을 복사해 고정한 것입니다. 마이그레이션은 작성 시점의 코드로
+계속 실행되어야 하므로 앱 코드를 import하지 않습니다 (interning 정규화 규칙을 바꾸면
+기존 해시와 맞추는 새 마이그레이션을 추가하세요).
+
+Django 마이그레이션 로더는 '_'로 시작하는 모듈을 마이그레이션으로 읽지 않습니다.
+"""
+import hashlib
+import json
+from datetime import datetime, timezone as dt_timezone
+
+from django.utils import timezone
+
+
+def _canonical_value(field, value):
+    if field.is_relation:
+        # 참조 객체, 해시 문자열 또는 None
+        return getattr(value, 'content_hash', value)
+    if value is None:
+        return None
+    value = field.to_python(value)
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        value = value.astimezone(dt_timezone.utc)
+    return value
+
+
+def content_digest(model, values):
+    """values(필드 이름 → 값)를 model 컬럼 기준으로 정규화한 JSON의 sha256"""
+    payload = {}
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.name == 'content_hash':
+            continue
+        value = values[field.name] if field.name in values else field.get_default()
+        payload[field.name] = _canonical_value(field, value)
+    text = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def backfill_content_hashes(model, related_hashes=None):
+    """
+    기존 행의 content_hash 채우기 (id → 해시 반환)
+
+    같은 내용의 중복 행은 가장 먼저 만든 행에만 해시를 기록하고 나머지는 NULL로 둡니다
+    (기존 M2M/FK 연결은 그대로, 이후 저장부터 해시가 있는 행을 재사용).
+
+    Args:
+        model: 마이그레이션 상태의 모델 (apps.get_model)
+        related_hashes: FK 대상 모델 이름 → {id: 해시} (FK 컬럼이 있을 때)
+    """
+    related_hashes = related_hashes or {}
+    fields = [f for f in model._meta.concrete_fields if not f.primary_key and f.name != 'content_hash']
+    hashes, seen, pending = {}, set(), []
+    for obj in model.objects.order_by('id').iterator(chunk_size=2000):
+        values = {}
+        for field in fields:
+            value = getattr(obj, field.attname)
+            if field.is_relation:
+                value = related_hashes[field.related_model._meta.object_name].get(value)
+            values[field.name] = value
+        content_hash = content_digest(model, values)
+        hashes[obj.id] = content_hash
+        if content_hash in seen:
+            continue
+        seen.add(content_hash)
+        obj.content_hash = content_hash
+        pending.append(obj)
+        if len(pending) >= 1000:
+            model.objects.bulk_update(pending, ['content_hash'])
+            pending = []
+    if pending:
+        model.objects.bulk_update(pending, ['content_hash'])
+    return hashes
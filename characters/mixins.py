@@ -10,8 +10,10 @@ from django.db import models
 
 from define.define import APIKEY
 from characters.models import *
-from util.rate_limiter import rate_limited
+from util.nexon_client import get_nexon_client
+from util.rate_limiter import endpoint_from_url, get_nexon_all_data_limiter
 from .exceptions import MapleAPIError
+from .freshness import get_freshness_policy
 
 logger = logging.getLogger('maple_api')
 
@@ -28,7 +30,6 @@ class MapleAPIClientMixin:
             "x-nxopen-api-key": APIKEY
         }
 
-    @rate_limited(500)
     def get_api_data(self, url, params=None):
         """
         API 호출 및 응답 데이터 반환
@@ -47,7 +48,9 @@ class MapleAPIClientMixin:
         headers = self.get_headers()
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            # 뷰 요청은 전체 조회와 같은 서비스 키 한도 버킷 사용 (NEXON_API_RATE_LIMIT는 크롤링 태스크용)
+            response = get_nexon_client().get(
+                url, headers=headers, params=params, limiter=get_nexon_all_data_limiter)
             response.raise_for_status()
             data = response.json()
 
@@ -150,7 +153,7 @@ class APIViewMixin(APIView):
         """요청 로깅"""
         print(f"{action} 요청 - 캐릭터: {character_name}")
 
-    def get_cached_data(self, ocid, model_class, related_name=None, hours=1, additional_filters=None, additional_cache_key=None):
+    def get_cached_data(self, ocid, model_class, related_name=None, hours=None, additional_filters=None, additional_cache_key=None, endpoint=None):
         """
         캐시된 데이터 조회를 위한 공통 메서드
 
@@ -158,16 +161,20 @@ class APIViewMixin(APIView):
             ocid (str): 캐릭터 식별자
             model_class: 조회할 모델 클래스
             related_name (str): 관련 데이터 필드명 (있는 경우)
-            hours (int): 캐시 유효 시간 (기본 1시간)
+            hours (int): 캐시 유효 시간 (지정하지 않으면 Nexon 공개 주기 기준)
             additional_filters (dict): 추가 필터링 조건 (있는 경우)
             additional_cache_key (str): 캐시 키에 추가할 구분자 (있는 경우)
+            endpoint (str): Nexon API 엔드포인트 이름 (공개 주기 조회용)
 
         Returns:
             tuple: (캐시된 데이터, 관련 데이터)
         """
         try:
-            # 현재 시간에서 지정된 시간 전 계산
-            cache_time = timezone.now() - timedelta(hours=hours)
+            # 마지막 Nexon 데이터 공개 이후 저장된 데이터만 유효
+            if hours is not None:
+                cache_time = timezone.now() - timedelta(hours=hours)
+            else:
+                cache_time = get_freshness_policy().last_publish(endpoint)
             # logger.info(f"현재 시간: {timezone.now()}, {hours}시간 전: {cache_time}")
 
             # 먼저 CharacterBasic에서 캐릭터 정보 조회
@@ -228,7 +235,7 @@ class APIViewMixin(APIView):
 
                         if any_data:
                             logger.info(
-                                f"관련 데이터 있으나 {hours}시간 초과: {character.character_name}, 날짜: {any_data.date}")
+                                f"관련 데이터 있으나 캐시 기준({cache_time}) 이전: {character.character_name}, 날짜: {any_data.date}")
                         else:
                             logger.info(
                                 f"관련 데이터 없음: {character.character_name}")
@@ -275,7 +282,7 @@ class APIViewMixin(APIView):
 
                 if any_data:
                     logger.info(
-                        f"캐시된 데이터 있으나 {hours}시간 초과: {character.character_name}, 날짜: {any_data.date}")
+                        f"캐시된 데이터 있으나 캐시 기준({cache_time}) 이전: {character.character_name}, 날짜: {any_data.date}")
                 else:
                     logger.info(f"캐시된 데이터 없음: {character.character_name}")
 
@@ -305,18 +312,22 @@ class APIViewMixin(APIView):
             # force_refresh 파라미터 확인
             force_refresh = request.query_params.get(
                 'force_refresh', 'false').lower() == 'true'
-            if force_refresh:
-                return None
 
             # 캐릭터 기본 정보 조회
             if not ocid:
                 return None
 
-            # 캐시된 데이터 조회
+            # 캐시된 데이터 조회 (마지막 Nexon 공개 이후 저장된 데이터만 반환됨)
+            api_url = getattr(self, 'api_url', None)
             cached_data, related_data = self.get_cached_data(
-                ocid, model_class, related_name, additional_filters=additional_filters, additional_cache_key=additional_cache_key)
+                ocid, model_class, related_name, additional_filters=additional_filters, additional_cache_key=additional_cache_key,
+                endpoint=endpoint_from_url(api_url) if api_url else None)
 
             if cached_data:
+                # 다음 공개 전까지 Nexon 데이터는 바뀌지 않으므로 force_refresh여도 캐시 사용
+                if force_refresh:
+                    logger.info(
+                        f"force_refresh 무시 - 마지막 공개 이후 데이터: {model_class.__name__}, {ocid}")
                 # serializer_class가 제공된 경우 해당 serializer 사용
                 if serializer_class:
                     if related_data and isinstance(related_data, (list, models.QuerySet)):
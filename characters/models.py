@@ -1,8 +1,11 @@
 from django.db import models
 from django.utils import timezone
 from django.db import transaction
+from django.db.models.functions import Coalesce
 import pytz
 
+from .interning import bulk_add_m2m, intern_rows
+
 
 class CharacterBasic(models.Model):
     ocid = models.CharField(max_length=255, unique=True)
@@ -189,7 +192,22 @@ class CharacterPopularity(models.Model):
             raise Exception(f"인기도 정보 생성 중 오류 발생: {str(e)}")
 
 
-class ItemTotalOption(models.Model):
+class ContentHashedModel(models.Model):
+    """content_hash로 같은 내용의 행을 재사용하는 카탈로그 모델 (characters.interning)"""
+    content_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text='정규화한 컬럼 값의 sha256 (해시 도입 전 중복 행은 NULL)'
+    )
+
+    class Meta:
+        abstract = True
+
+
+class ItemTotalOption(ContentHashedModel):
     str = models.CharField(max_length=50, null=True, blank=True)
     dex = models.CharField(max_length=50, null=True, blank=True)
     int = models.CharField(max_length=50, null=True, blank=True)
@@ -211,7 +229,7 @@ class ItemTotalOption(models.Model):
     max_mp_rate = models.CharField(max_length=50, null=True, blank=True)
 
 
-class ItemBaseOption(models.Model):
+class ItemBaseOption(ContentHashedModel):
     str = models.CharField(max_length=50, null=True, blank=True)
     dex = models.CharField(max_length=50, null=True, blank=True)
     int = models.CharField(max_length=50, null=True, blank=True)
@@ -232,7 +250,7 @@ class ItemBaseOption(models.Model):
     base_equipment_level = models.IntegerField(null=True, blank=True)
 
 
-class ItemExceptionalOption(models.Model):
+class ItemExceptionalOption(ContentHashedModel):
     str = models.CharField(max_length=50, null=True, blank=True)
     dex = models.CharField(max_length=50, null=True, blank=True)
     int = models.CharField(max_length=50, null=True, blank=True)
@@ -244,7 +262,7 @@ class ItemExceptionalOption(models.Model):
     exceptional_upgrade = models.IntegerField(null=True, blank=True)
 
 
-class ItemAddOption(models.Model):
+class ItemAddOption(ContentHashedModel):
     str = models.CharField(max_length=50, null=True, blank=True)
     dex = models.CharField(max_length=50, null=True, blank=True)
     int = models.CharField(max_length=50, null=True, blank=True)
@@ -262,7 +280,7 @@ class ItemAddOption(models.Model):
     equipment_level_decrease = models.IntegerField(null=True, blank=True)
 
 
-class ItemEtcOption(models.Model):
+class ItemEtcOption(ContentHashedModel):
     str = models.CharField(max_length=50, null=True, blank=True)
     dex = models.CharField(max_length=50, null=True, blank=True)
     int = models.CharField(max_length=50, null=True, blank=True)
@@ -276,7 +294,7 @@ class ItemEtcOption(models.Model):
     jump = models.CharField(max_length=50, null=True, blank=True)
 
 
-class ItemStarforceOption(models.Model):
+class ItemStarforceOption(ContentHashedModel):
     str = models.CharField(max_length=50, null=True, blank=True)
     dex = models.CharField(max_length=50, null=True, blank=True)
     int = models.CharField(max_length=50, null=True, blank=True)
@@ -422,7 +440,7 @@ class CharacterItemEquipment(models.Model):
             raise Exception(f"장비 정보 생성 중 오류 발생: {str(e)}")
 
 
-class ItemEquipment(models.Model):
+class ItemEquipment(ContentHashedModel):
     item_equipment_part = models.CharField(max_length=50)
     item_equipment_slot = models.CharField(max_length=50)
     item_name = models.CharField(max_length=255)
@@ -487,7 +505,15 @@ class ItemEquipment(models.Model):
     @classmethod
     @transaction.atomic
     def bulk_create_from_data(cls, equipment_data_list):
-        """여러 장비 데이터를 한 번에 생성"""
+        """
+        여러 장비 데이터를 한 번에 저장 (같은 내용의 장비/옵션 행은 재사용)
+
+        옵션 모델별로, 그 다음 장비 전체를 content_hash IN 조회 + 없는 행 bulk_create로 처리합니다.
+        장비 해시에는 옵션 해시가 포함되므로 옵션만 다른 장비는 별도 행입니다.
+
+        Returns:
+            입력 순서의 ItemEquipment 목록 (같은 내용의 장비는 같은 객체)
+        """
         if not equipment_data_list:
             return []
 
@@ -500,29 +526,19 @@ class ItemEquipment(models.Model):
             'item_starforce_option': ItemStarforceOption
         }
 
-        created_equipments = []
-
-        for equip_data in equipment_data_list:
-            equip_data_copy = equip_data.copy()
-            option_objects = {}
+        equipment_values = [dict(equip_data) for equip_data in equipment_data_list]
 
-            # 각 옵션 객체 생성
-            for option_name, model in option_models.items():
-                if option_name in equip_data_copy and equip_data_copy[option_name]:
-                    option_objects[option_name], created = model.objects.get_or_create(
-                        **equip_data_copy[option_name])
-                    del equip_data_copy[option_name]
+        # 각 옵션 모델마다 한 묶음으로 조회/생성 후 옵션 dict를 옵션 객체로 교체
+        for option_name, model in option_models.items():
+            with_option = [values for values in equipment_values if values.get(option_name)]
+            options = intern_rows(model, [values[option_name] for values in with_option])
+            for values, option in zip(with_option, options):
+                values[option_name] = option
+            for values in equipment_values:
+                if not values.get(option_name):
+                    values.pop(option_name, None)
 
-            # 장비 객체 생성 시 옵션 객체들을 함께 설정
-            equipment, created = cls.objects.get_or_create(
-                **equip_data_copy)
-            for option_name, option_obj in option_objects.items():
-                setattr(equipment, option_name, option_obj)
-            equipment.save()
-
-            created_equipments.append(equipment)
-
-        return created_equipments
+        return intern_rows(cls, equipment_values)
 
 
 class CharacterStat(models.Model):
@@ -939,7 +955,7 @@ class CharacterSymbolEquipment(models.Model):
             raise Exception(f"심볼 데이터 생성 중 오류 발생: {str(e)}")
 
 
-class Skill(models.Model):
+class Skill(ContentHashedModel):
     skill_name = models.CharField(max_length=255)
     skill_description = models.TextField()
     skill_level = models.IntegerField()
@@ -947,6 +963,21 @@ class Skill(models.Model):
     skill_effect_next = models.TextField(null=True, blank=True)
     skill_icon = models.TextField()
 
+    @classmethod
+    def bulk_create_from_data(cls, data_list):
+        """스킬 데이터 목록을 한 번에 저장 (같은 내용의 스킬 행은 재사용, 입력 순서로 반환)"""
+        return intern_rows(cls, [
+            {
+                'skill_name': data.get('skill_name'),
+                'skill_description': data.get('skill_description'),
+                'skill_level': data.get('skill_level'),
+                'skill_effect': data.get('skill_effect'),
+                'skill_effect_next': data.get('skill_effect_next'),
+                'skill_icon': data.get('skill_icon'),
+            }
+            for data in data_list or []
+        ])
+
 
 class CharacterSkill(models.Model):
     character = models.ForeignKey(
@@ -971,28 +1002,20 @@ class CharacterSkill(models.Model):
             CharacterSkill: 생성된 스킬 정보 객체
         """
         try:
-            # 기본 객체 생성
+            # 기본 객체 생성 (캐릭터 + 날짜 + 전직 차수 기준, 차수마다 따로 조회함)
             skill_info, created = cls.objects.get_or_create(
+                character=character,
+                date=data.get('date'),
+                character_skill_grade=data.get('character_skill_grade'),
                 defaults={
-                    'character': character,
-                    'date': data.get('date'),
                     'character_class': data.get('character_class'),
-                    'character_skill_grade': data.get('character_skill_grade')
                 }
             )
 
-            # 스킬 처리
+            # 스킬 처리 (스킬 행 묶음 조회/생성 후 연결을 한 번에 추가)
             if 'character_skill' in data and data['character_skill']:
-                for skill_data in data['character_skill']:
-                    skill, created = Skill.objects.get_or_create(
-                        skill_name=skill_data.get('skill_name'),
-                        skill_description=skill_data.get('skill_description'),
-                        skill_level=skill_data.get('skill_level'),
-                        skill_effect=skill_data.get('skill_effect'),
-                        skill_effect_next=skill_data.get('skill_effect_next'),
-                        skill_icon=skill_data.get('skill_icon')
-                    )
-                    skill_info.character_skill.add(skill)
+                skills = Skill.bulk_create_from_data(data['character_skill'])
+                bulk_add_m2m(cls, 'character_skill', [(skill_info, skill) for skill in skills])
 
             return skill_info
 
@@ -1000,7 +1023,7 @@ class CharacterSkill(models.Model):
             raise Exception(f"스킬 정보 생성 중 오류 발생: {str(e)}")
 
 
-class LinkSkill(models.Model):
+class LinkSkill(ContentHashedModel):
     skill_name = models.CharField(max_length=100)
     skill_description = models.TextField(null=True, blank=True)
     skill_level = models.IntegerField(null=True, blank=True)
@@ -1010,22 +1033,18 @@ class LinkSkill(models.Model):
 
     @classmethod
     def bulk_create_from_data(cls, data_list):
-        if not data_list:
-            return []
-
-        skills = []
-        for data in data_list:
-            skill, created = cls.objects.get_or_create(
-                skill_name=data.get('skill_name', ''),
-                skill_description=data.get('skill_description', ''),
-                skill_level=data.get('skill_level', 0),
-                skill_effect=data.get('skill_effect', ''),
-                skill_effect_next=data.get('skill_effect_next'),
-                skill_icon=data.get('skill_icon', '')
-            )
-            skills.append(skill)
-
-        return skills
+        """링크 스킬 데이터 목록을 한 번에 저장 (같은 내용의 행은 재사용, 입력 순서로 반환)"""
+        return intern_rows(cls, [
+            {
+                'skill_name': data.get('skill_name', ''),
+                'skill_description': data.get('skill_description', ''),
+                'skill_level': data.get('skill_level', 0),
+                'skill_effect': data.get('skill_effect', ''),
+                'skill_effect_next': data.get('skill_effect_next'),
+                'skill_icon': data.get('skill_icon', ''),
+            }
+            for data in data_list or []
+        ])
 
 
 class CharacterLinkSkill(models.Model):
@@ -1074,53 +1093,37 @@ class CharacterLinkSkill(models.Model):
 
             if not created:
                 link_skill.character_class = data.get('character_class')
-                link_skill.save()
-
-            # 기본 링크 스킬 처리
-            if 'character_link_skill' in data and data['character_link_skill']:
-                link_skill.character_link_skill.clear()
-                skills = LinkSkill.bulk_create_from_data(
 
-                    data['character_link_skill'])
-                if skills:
-                    link_skill.character_link_skill.add(*skills)
-
-            # 보유 링크 스킬 처리
-            if 'character_owned_link_skill' in data and data['character_owned_link_skill']:
-                owned_skills = LinkSkill.bulk_create_from_data(
-                    [data['character_owned_link_skill']])
-                if owned_skills:
-                    link_skill.character_owned_link_skill = owned_skills[0]
-                    link_skill.save()
-
-            # 프리셋 처리
-            preset_fields = {
-                'character_link_skill_preset_1': 'character_link_skill_preset_1',
-                'character_link_skill_preset_2': 'character_link_skill_preset_2',
-                'character_link_skill_preset_3': 'character_link_skill_preset_3'
-            }
-
-            for field_name, attr_name in preset_fields.items():
-                if field_name in data and isinstance(data[field_name], list):
-                    getattr(link_skill, attr_name).clear()
-                    skills = LinkSkill.bulk_create_from_data(data[field_name])
-                    if skills:
-                        getattr(link_skill, attr_name).add(*skills)
-
-            # 프리셋 보유 링크 스킬 처리
-            preset_owned_fields = {
-                'character_owned_link_skill_preset_1': 'character_owned_link_skill_preset_1',
-                'character_owned_link_skill_preset_2': 'character_owned_link_skill_preset_2',
-                'character_owned_link_skill_preset_3': 'character_owned_link_skill_preset_3'
-            }
+            # 필드별 링크 스킬 데이터 (M2M 여부)
+            groups = []
+            # 기본 링크 스킬 / 프리셋 (프리셋은 빈 목록이어도 기존 연결 제거)
+            if data.get('character_link_skill'):
+                groups.append(('character_link_skill', data['character_link_skill'], True))
+            for field_name in ('character_link_skill_preset_1', 'character_link_skill_preset_2',
+                               'character_link_skill_preset_3'):
+                if isinstance(data.get(field_name), list):
+                    groups.append((field_name, data[field_name], True))
+            # 보유 링크 스킬 / 프리셋 보유 링크 스킬
+            for field_name in ('character_owned_link_skill', 'character_owned_link_skill_preset_1',
+                               'character_owned_link_skill_preset_2', 'character_owned_link_skill_preset_3'):
+                if data.get(field_name):
+                    groups.append((field_name, [data[field_name]], False))
+
+            # 모든 필드의 링크 스킬을 한 묶음으로 조회/생성한 뒤 필드별로 나눔
+            skills = LinkSkill.bulk_create_from_data(
+                [skill_data for _, data_list, _ in groups for skill_data in data_list])
+            offset = 0
+            for field_name, data_list, is_m2m in groups:
+                field_skills = skills[offset:offset + len(data_list)]
+                offset += len(data_list)
+                if is_m2m:
+                    getattr(link_skill, field_name).clear()
+                    bulk_add_m2m(cls, field_name, [(link_skill, skill) for skill in field_skills])
+                else:
+                    setattr(link_skill, field_name, field_skills[0])
 
-            for field_name, attr_name in preset_owned_fields.items():
-                if field_name in data and data[field_name]:
-                    skills = LinkSkill.bulk_create_from_data(
-                        [data[field_name]])
-                    if skills:
-                        setattr(link_skill, attr_name, skills[0])
-                        link_skill.save()
+            if not created or any(not is_m2m for _, _, is_m2m in groups):
+                link_skill.save()
 
             return link_skill
 
@@ -1213,7 +1216,7 @@ class CharacterVMatrix(models.Model):
             raise Exception(f"V매트릭스 정보 생성 중 오류 발생: {str(e)}")
 
 
-class HexaSkill(models.Model):
+class HexaSkill(ContentHashedModel):
     hexa_skill_id = models.CharField(max_length=255)
 
     def __str__(self):
@@ -1221,11 +1224,15 @@ class HexaSkill(models.Model):
 
     @classmethod
     def get_or_create_from_data(cls, skill_data):
-        skill_id = skill_data.get('hexa_skill_id')
-        return cls.objects.get_or_create(hexa_skill_id=skill_id)[0]
+        return cls.bulk_create_from_data([skill_data])[0]
+
+    @classmethod
+    def bulk_create_from_data(cls, data_list):
+        """헥사 스킬 데이터 목록을 한 번에 저장 (같은 id의 행은 재사용, 입력 순서로 반환)"""
+        return intern_rows(cls, [{'hexa_skill_id': data.get('hexa_skill_id')} for data in data_list or []])
 
 
-class HexaCore(models.Model):
+class HexaCore(ContentHashedModel):
     hexa_core_name = models.CharField(max_length=255)
     hexa_core_level = models.IntegerField()
     hexa_core_type = models.CharField(max_length=50)
@@ -1234,6 +1241,34 @@ class HexaCore(models.Model):
     def __str__(self):
         return f"{self.hexa_core_name} Lv.{self.hexa_core_level}"
 
+    @classmethod
+    def bulk_create_from_data(cls, data_list):
+        """
+        헥사 코어 데이터 목록을 한 번에 저장 (입력 순서로 반환)
+
+        코어는 이름/레벨/유형으로 재사용하고, 코어마다의 linked_skill은
+        모든 코어의 스킬을 한 묶음으로 조회/생성한 뒤 연결을 한 번에 추가합니다.
+        """
+        data_list = data_list or []
+        cores = intern_rows(cls, [
+            {
+                'hexa_core_name': data.get('hexa_core_name'),
+                'hexa_core_level': data.get('hexa_core_level'),
+                'hexa_core_type': data.get('hexa_core_type'),
+            }
+            for data in data_list
+        ])
+
+        core_skills = [
+            (core, skill_data)
+            for core, data in zip(cores, data_list)
+            for skill_data in data.get('linked_skill') or []
+        ]
+        skills = HexaSkill.bulk_create_from_data([skill_data for _, skill_data in core_skills])
+        bulk_add_m2m(cls, 'linked_skill', [(core, skill) for (core, _), skill in zip(core_skills, skills)])
+
+        return cores
+
 
 class CharacterHexaMatrix(models.Model):
     character = models.ForeignKey(
@@ -1265,23 +1300,9 @@ class CharacterHexaMatrix(models.Model):
                 # 기존 데이터 삭제
                 hexa_matrix.character_hexa_core_equipment.clear()
 
-                for core_data in data['character_hexa_core_equipment']:
-                    # 헥사 코어 생성
-                    core, created = HexaCore.objects.get_or_create(
-                        hexa_core_name=core_data.get('hexa_core_name'),
-                        hexa_core_level=core_data.get('hexa_core_level'),
-                        hexa_core_type=core_data.get('hexa_core_type')
-                    )
-
-                    # linked_skill 처리
-                    if 'linked_skill' in core_data:
-                        for skill_data in core_data['linked_skill']:
-                            skill, created = HexaSkill.objects.get_or_create(
-                                hexa_skill_id=skill_data.get('hexa_skill_id')
-                            )
-                            core.linked_skill.add(skill)
-
-                    hexa_matrix.character_hexa_core_equipment.add(core)
+                # 헥사 코어/스킬 묶음 조회/생성 후 연결을 한 번에 추가
+                cores = HexaCore.bulk_create_from_data(data['character_hexa_core_equipment'])
+                bulk_add_m2m(cls, 'character_hexa_core_equipment', [(hexa_matrix, core) for core in cores])
 
             return hexa_matrix
 
@@ -2104,6 +2125,11 @@ class Inventory(models.Model):
         default=False,
         help_text='상세 정보 크롤링 완료 여부'
     )
+    superseded_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='다음 스냅샷에서 바뀌거나 빠진 시간 (null이면 현재 스냅샷에 포함)'
+    )
 
     class Meta:
         indexes = [
@@ -2471,6 +2497,11 @@ class Storage(models.Model):
     crawled_at = models.DateTimeField(
         help_text='크롤링된 시간'
     )
+    superseded_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='다음 스냅샷에서 바뀌거나 빠진 시간 (null이면 현재 스냅샷에 포함)'
+    )
 
     class Meta:
         indexes = [
@@ -2508,3 +2539,275 @@ class Storage(models.Model):
     def is_personal(self):
         """개인 창고 여부"""
         return self.storage_type == 'personal'
+
+
+class CrawlContentState(models.Model):
+    """
+    크롤링 페이지 내용 해시 (인벤토리/창고)
+
+    마지막으로 저장한 스냅샷의 페이지 해시를 보관합니다. 다음 크롤링에서
+    같은 해시가 나오면 파싱/검증/저장을 건너뛰고 confirmed_at만 갱신합니다.
+    """
+    CRAWL_TYPE_CHOICES = [
+        ('inventory', '인벤토리'),
+        ('storage', '창고'),
+    ]
+
+    character_basic = models.ForeignKey(
+        CharacterBasic,
+        on_delete=models.CASCADE,
+        related_name='crawl_states',
+        help_text='연결된 캐릭터'
+    )
+    crawl_type = models.CharField(
+        max_length=20,
+        choices=CRAWL_TYPE_CHOICES,
+        help_text='크롤링 유형 (inventory/storage)'
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        help_text='정규화한 페이지 HTML 해시'
+    )
+    crawled_at = models.DateTimeField(
+        help_text='이 해시로 저장한 스냅샷의 crawled_at'
+    )
+    confirmed_at = models.DateTimeField(
+        help_text='내용이 바뀌지 않았음을 마지막으로 확인한 시간'
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['character_basic', 'crawl_type'],
+                name='unique_crawl_state_per_type'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.character_basic.character_name} - {self.crawl_type} ({self.content_hash[:12]})"
+
+    @classmethod
+    def confirm_unchanged(cls, character_basic, crawl_type: str, content_hash: str, snapshot_model) -> 'CrawlContentState | None':
+        """
+        마지막 스냅샷과 해시가 같으면 confirmed_at 갱신
+
+        Args:
+            snapshot_model: 스냅샷 행 모델 (Inventory/Storage). 해당 스냅샷 행이 없으면 변경으로 처리
+
+        Returns:
+            갱신된 상태 (변경됐거나 이전 기록이 없으면 None)
+        """
+        if not content_hash:
+            return None
+
+        state = cls.objects.filter(
+            character_basic=character_basic,
+            crawl_type=crawl_type,
+            content_hash=content_hash
+        ).first()
+        if state is None:
+            return None
+
+        # delta 저장 스냅샷은 바뀐 행이 없으면 그 crawled_at의 행이 없으므로 스냅샷 기록도 확인
+        if not (
+            CrawlSnapshot.objects.filter(
+                character_basic=character_basic,
+                kind=crawl_type,
+                crawled_at=state.crawled_at
+            ).exists()
+            or snapshot_model.objects.filter(
+                character_basic=character_basic,
+                crawled_at=state.crawled_at
+            ).exists()
+        ):
+            return None
+
+        state.confirmed_at = timezone.now()
+        state.save(update_fields=['confirmed_at'])
+        return state
+
+    @classmethod
+    def record(cls, character_basic, crawl_type: str, content_hash: str, crawled_at) -> 'CrawlContentState | None':
+        """새 스냅샷을 저장한 뒤 해시 기록"""
+        if not content_hash:
+            return None
+
+        state, _ = cls.objects.update_or_create(
+            character_basic=character_basic,
+            crawl_type=crawl_type,
+            defaults={
+                'content_hash': content_hash,
+                'crawled_at': crawled_at,
+                'confirmed_at': crawled_at,
+            }
+        )
+        return state
+
+
+class CrawlSnapshot(models.Model):
+    """
+    인벤토리/창고 크롤링 스냅샷 (한 번의 저장 = 한 행)
+
+    캐릭터/유형별로 is_current=True인 행이 하나뿐이며 현재 상태를 가리킵니다.
+    아이템 저장과 같은 트랜잭션에서 교체되므로 읽는 쪽은 반쯤 저장된 스냅샷을 보지 않습니다.
+    현재 상태 조회는 current_items()로 이 행에 join해 인덱스 조회 한 번으로 끝납니다.
+
+    아이템 행은 [crawled_at, superseded_at) 구간 동안 유효합니다.
+    - full: 모든 아이템을 새 행으로 저장 (base_crawled_at = crawled_at)
+    - delta: 이전 스냅샷 대비 추가/변경된 슬롯만 새 행으로 저장하고, 변경/제거된 슬롯의
+      기존 행에 superseded_at을 기록 (base_crawled_at = 체인 시작 full 스냅샷의 crawled_at)
+    materialize()가 어느 스냅샷이든 구간 조건으로 다시 구성합니다.
+    """
+    KIND_CHOICES = [
+        ('inventory', '인벤토리'),
+        ('storage', '창고'),
+    ]
+    ENCODING_CHOICES = [
+        ('full', '전체'),
+        ('delta', '변경분'),
+    ]
+
+    # delta 비교 키와 변경 판단 필드 (키는 슬롯 위치 + 유형)
+    SLOT_KEY_FIELDS = {
+        'inventory': ('slot_position', 'item_type'),
+        'storage': ('slot_position', 'storage_type'),
+    }
+    CONTENT_FIELDS = {
+        'inventory': ('item_name', 'item_icon', 'quantity', 'item_options', 'expiry_date', 'detail_url'),
+        'storage': ('item_name', 'item_icon', 'quantity', 'item_options', 'expiry_date'),
+    }
+
+    character_basic = models.ForeignKey(
+        CharacterBasic,
+        on_delete=models.CASCADE,
+        related_name='crawl_snapshots',
+        help_text='연결된 캐릭터'
+    )
+    kind = models.CharField(
+        max_length=20,
+        choices=KIND_CHOICES,
+        help_text='스냅샷 유형 (inventory/storage)'
+    )
+    crawled_at = models.DateTimeField(
+        help_text='스냅샷 아이템의 crawled_at'
+    )
+    item_count = models.PositiveIntegerField(
+        default=0,
+        help_text='저장한 아이템 수'
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        help_text='정규화한 페이지 HTML 해시 (없으면 빈 문자열)'
+    )
+    is_current = models.BooleanField(
+        default=False,
+        help_text='캐릭터/유형의 현재 스냅샷 여부'
+    )
+    encoding = models.CharField(
+        max_length=10,
+        choices=ENCODING_CHOICES,
+        default='full',
+        help_text='저장 방식 (full: 전체 복사, delta: 변경분만)'
+    )
+    base_crawled_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='스냅샷 아이템 행의 가장 이른 crawled_at (체인 시작 full 스냅샷)'
+    )
+    rows_written = models.PositiveIntegerField(
+        default=0,
+        help_text='이 스냅샷에서 새로 저장한 행 수 (full이면 item_count와 같음)'
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['character_basic', 'kind'],
+                condition=models.Q(is_current=True),
+                name='unique_current_crawl_snapshot'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['character_basic', 'kind', '-crawled_at']),
+        ]
+        ordering = ['-crawled_at']
+
+    def __str__(self):
+        current = ' (current)' if self.is_current else ''
+        return f"{self.character_basic.character_name} - {self.kind} {self.crawled_at:%Y-%m-%d %H:%M}{current}"
+
+    @staticmethod
+    def item_model(kind: str):
+        """스냅샷 유형의 아이템 모델"""
+        return {'inventory': Inventory, 'storage': Storage}[kind]
+
+    @classmethod
+    def publish(cls, character_basic, kind: str, crawled_at, item_count: int, content_hash: str = None,
+                encoding: str = 'full', base_crawled_at=None, rows_written: int = None) -> 'CrawlSnapshot':
+        """
+        새 스냅샷을 현재 스냅샷으로 기록
+
+        아이템 저장과 같은 트랜잭션 안에서 호출하세요 (커밋 시점에 현재 스냅샷이 함께 바뀜).
+        """
+        with transaction.atomic():
+            cls.objects.filter(
+                character_basic=character_basic, kind=kind, is_current=True
+            ).update(is_current=False)
+            return cls.objects.create(
+                character_basic=character_basic,
+                kind=kind,
+                crawled_at=crawled_at,
+                item_count=item_count,
+                content_hash=content_hash or '',
+                is_current=True,
+                encoding=encoding,
+                base_crawled_at=base_crawled_at or crawled_at,
+                rows_written=item_count if rows_written is None else rows_written,
+            )
+
+    @classmethod
+    def slot_key(cls, kind: str, row) -> tuple:
+        return tuple(getattr(row, field) for field in cls.SLOT_KEY_FIELDS[kind])
+
+    @classmethod
+    def slot_content(cls, kind: str, row) -> tuple:
+        return tuple(getattr(row, field) for field in cls.CONTENT_FIELDS[kind])
+
+    def materialize(self):
+        """이 스냅샷 시점의 아이템 queryset (full/delta 공통)"""
+        return self.item_model(self.kind).objects.filter(
+            models.Q(superseded_at__isnull=True) | models.Q(superseded_at__gt=self.crawled_at),
+            character_basic_id=self.character_basic_id,
+            crawled_at__gte=self.base_crawled_at or self.crawled_at,
+            crawled_at__lte=self.crawled_at,
+        )
+
+    @classmethod
+    def current(cls, character_basic, kind: str) -> 'CrawlSnapshot | None':
+        return cls.objects.filter(character_basic=character_basic, kind=kind, is_current=True).first()
+
+    @classmethod
+    def current_items(cls, kind: str):
+        """
+        캐릭터별 현재 스냅샷의 아이템 queryset (캐릭터 조건은 호출하는 쪽에서 filter)
+
+        현재 스냅샷의 아이템은 [base_crawled_at, crawled_at] 구간에서 아직 대체되지 않은 행입니다.
+        스냅샷이 기록되지 않은 캐릭터(크롤러 밖에서 저장한 행)는 가장 최근 crawled_at의 아이템을 사용합니다.
+        """
+        model = cls.item_model(kind)
+        current = cls.objects.filter(
+            character_basic=models.OuterRef('character_basic'), kind=kind, is_current=True
+        )
+        latest_crawled_at = models.Subquery(
+            model.objects.filter(
+                character_basic=models.OuterRef('character_basic')
+            ).order_by('-crawled_at').values('crawled_at')[:1]
+        )
+
+        return model.objects.filter(
+            superseded_at__isnull=True,
+            crawled_at__gte=Coalesce(models.Subquery(current.values('base_crawled_at')[:1]), latest_crawled_at),
+            crawled_at__lte=Coalesce(models.Subquery(current.values('crawled_at')[:1]), latest_crawled_at),
+        )
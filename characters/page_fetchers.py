@@ -0,0 +1,219 @@
+"""
+HTTP 페이지 fetcher (Playwright 우회 경로)
+
+랭킹/인벤토리/창고/기본정보 페이지와 아이템 상세(JSON view)는 서버 렌더링된
+정적 HTML이므로 headless 브라우저 없이 HTTP 요청만으로 가져올 수 있습니다.
+CrawlerService는 fetch_backend='http'일 때 이 경로를 먼저 시도하고,
+필수 요소가 없을 때만 Playwright로 폴백합니다.
+
+- aiohttp ClientSession을 이벤트 루프별로 재사용 (keep-alive 커넥션 풀 + 쿠키 jar 공유)
+- 워커 종료 시 shutdown_http_fetchers()로 세션 정리
+"""
+import asyncio
+import logging
+import re
+import weakref
+from typing import Dict, Iterable, Optional
+from urllib.parse import unquote, urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class PageFetchError(Exception):
+    """HTTP 페이지 요청 실패 (Playwright 폴백 대상)"""
+
+    def __init__(self, message: str, status: Optional[int] = None, redirected: bool = False):
+        super().__init__(message)
+        self.status = status  # HTTP 상태 코드 (네트워크 오류면 None)
+        self.redirected = redirected  # 요청한 경로와 다른 페이지로 리다이렉트됨
+
+
+def is_redirected(requested_url: str, final_url: str) -> bool:
+    """
+    최종 URL이 요청한 페이지와 다른 페이지인지 확인
+
+    경로의 마지막 segment(Inventory, Storage, 캐릭터 이름)만 비교하므로
+    /Common ↔ /MyMaple 같은 상위 경로 변경은 리다이렉트로 보지 않습니다.
+    """
+    def normalize(url: str) -> str:
+        return unquote(urlsplit(url).path).rstrip('/').rsplit('/', 1)[-1].lower()
+
+    return normalize(requested_url) != normalize(final_url)
+
+
+def has_required_class(html: Optional[str], class_names: Iterable[str]) -> bool:
+    """
+    HTML에 지정한 class 중 하나라도 있는지 확인
+
+    전체 DOM을 파싱하지 않고 class 속성만 정규식으로 확인합니다.
+    """
+    if not html:
+        return False
+
+    for class_name in class_names:
+        if _class_pattern(class_name).search(html):
+            return True
+    return False
+
+
+_CLASS_PATTERNS: Dict[str, 're.Pattern'] = {}
+
+
+def _class_pattern(class_name: str) -> 're.Pattern':
+    pattern = _CLASS_PATTERNS.get(class_name)
+    if pattern is None:
+        pattern = re.compile(
+            r'class\s*=\s*["\'](?:[^"\']*\s)?' + re.escape(class_name) + r'(?:\s[^"\']*)?["\']')
+        _CLASS_PATTERNS[class_name] = pattern
+    return pattern
+
+
+class HttpPageFetcher:
+    """
+    aiohttp 기반 정적 페이지 fetcher
+
+    같은 이벤트 루프 안에서는 하나의 ClientSession을 공유하므로
+    TCP/TLS 연결과 쿠키가 요청 간에 재사용됩니다.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = "MapleStorage/1.0 (Educational Purpose)",
+        timeout: float = 15,
+        max_connections: int = 20,
+        max_connections_per_host: int = 8,
+    ):
+        """
+        Args:
+            user_agent: 기본 User-Agent 헤더
+            timeout: 요청 전체 타임아웃 (초)
+            max_connections: 커넥션 풀 최대 크기
+            max_connections_per_host: 호스트당 최대 동시 연결 수
+        """
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.CookieJar(),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    'User-Agent': self.user_agent,
+                    'Accept-Language': 'ko-KR,ko;q=0.9',
+                },
+            )
+        return self._session
+
+    async def fetch_html(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """
+        페이지 HTML 가져오기
+
+        Args:
+            url: 요청 URL
+            headers: 추가 요청 헤더
+
+        Returns:
+            HTML 문자열
+
+        Raises:
+            PageFetchError: 네트워크 오류, 200이 아닌 응답 또는 다른 경로로 리다이렉트
+        """
+        session = self._get_session()
+
+        try:
+            async with session.get(url, headers=headers, allow_redirects=True) as response:
+                if response.status != 200:
+                    raise PageFetchError(f'HTTP {response.status}: {url}', status=response.status)
+                if response.history and is_redirected(url, str(response.url)):
+                    raise PageFetchError(
+                        f'리다이렉트: {url} -> {response.url}', status=response.status, redirected=True)
+                return await response.text()
+        except PageFetchError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise PageFetchError(f'HTTP 요청 실패: {url} ({e})')
+
+    async def fetch_detail_view(self, detail_url: str) -> str:
+        """
+        아이템 상세 HTML 가져오기
+
+        상세 페이지는 XHR 요청 시 {'view': '<html>'} 형태의 JSON을 반환합니다.
+        JSON이 아니면 응답 본문을 그대로 HTML로 사용합니다.
+        """
+        session = self._get_session()
+
+        try:
+            async with session.get(
+                detail_url,
+                headers={'X-Requested-With': 'XMLHttpRequest'},
+                allow_redirects=True
+            ) as response:
+                if response.status != 200:
+                    raise PageFetchError(f'HTTP {response.status}: {detail_url}', status=response.status)
+
+                text = await response.text()
+                try:
+                    data = await response.json(content_type=None)
+                except ValueError:
+                    return text
+
+                view = data.get('view') if isinstance(data, dict) else None
+                if not view:
+                    raise PageFetchError(f'상세 정보 view 필드 없음: {detail_url}')
+                return view
+        except PageFetchError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise PageFetchError(f'HTTP 요청 실패: {detail_url} ({e})')
+
+    async def close(self):
+        """세션 및 커넥션 풀 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# 이벤트 루프별 HTTP fetcher (ClientSession은 생성된 루프에 묶임)
+_fetchers: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, HttpPageFetcher]' = weakref.WeakKeyDictionary()
+
+
+def get_http_fetcher() -> HttpPageFetcher:
+    """
+    현재 실행 중인 이벤트 루프의 HTTP fetcher 반환 (없으면 생성)
+
+    반드시 코루틴 안에서 호출해야 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    fetcher = _fetchers.get(loop)
+
+    if fetcher is None:
+        fetcher = HttpPageFetcher()
+        _fetchers[loop] = fetcher
+
+    return fetcher
+
+
+def shutdown_http_fetchers():
+    """모든 HTTP fetcher 세션 종료 (Celery 워커 종료 시그널에서 호출)"""
+    for loop, fetcher in list(_fetchers.items()):
+        if loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(fetcher.close())
+        except Exception as e:
+            logger.warning(f'HTTP fetcher shutdown failed: {e}')
+
+    _fetchers.clear()
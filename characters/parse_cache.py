@@ -0,0 +1,215 @@
+"""
+페이지 내용 해시 기반 파싱 결과 캐시
+
+정기 갱신에서 받아오는 인벤토리/창고/아이템 상세 HTML은 대부분 지난 크롤링과
+같은데도 매번 다시 파싱됩니다. 정규화한 HTML의 blake2b 해시를 키로 파싱 결과를
+캐시해 같은 페이지는 파싱을 건너뜁니다.
+
+- 정규화: <script>/<style>/주석 제거 + 공백 압축 (요청마다 바뀌는 토큰 등이 해시를 바꾸지 않도록)
+- 저장: 프로세스 내 LRU(OrderedDict) + Django 캐시(운영 Redis)에 zlib 압축 pickle
+  (Redis 쪽 축출은 maxmemory-policy(allkeys-lru) + TTL)
+- 키에 PARSE_CACHE_VERSION이 들어가므로 파서 출력이 바뀌면 버전을 올려 기존 결과를 무효화
+
+파싱 결과가 같아도 저장까지 건너뛸지는 호출자가 content_hash로 판단합니다
+(CrawlContentState.confirm_unchanged).
+
+settings:
+- CRAWLER_PARSE_CACHE_ENABLED: 사용 여부 (기본 True)
+- CRAWLER_PARSE_CACHE_TIMEOUT: Django 캐시 TTL (초, 기본 7일)
+- CRAWLER_PARSE_CACHE_LOCAL_SIZE: 프로세스 내 LRU 항목 수 (기본 256)
+"""
+import hashlib
+import logging
+import pickle
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .parse_executor import get_parse_executor
+
+logger = logging.getLogger(__name__)
+
+# 파서 출력 형식이 바뀌면 올림
+PARSE_CACHE_VERSION = 1
+
+_VOLATILE_RE = re.compile(r'<script\b.*?</script>|<style\b.*?</style>|<!--.*?-->', re.S | re.I)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 캐시 미스와 구분하기 위한 표식 (파싱 결과가 None일 수 있음)
+_MISSING = object()
+
+
+def normalize_html(html: str) -> str:
+    """해시용 HTML 정규화 (파서가 읽지 않는 script/style/주석 제거, 공백 압축)"""
+    return _WHITESPACE_RE.sub(' ', _VOLATILE_RE.sub('', html)).strip()
+
+
+def content_hash(html: Optional[str]) -> str:
+    """정규화한 HTML의 blake2b 해시 (hex 32자, 빈 페이지는 '')"""
+    if not html:
+        return ''
+    return hashlib.blake2b(normalize_html(html).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ParseCache:
+    """
+    해시 → 파싱 결과 캐시
+
+    Args:
+        timeout: Django 캐시 TTL (초)
+        local_size: 프로세스 내 LRU 최대 항목 수 (0이면 사용 안 함)
+    """
+
+    def __init__(self, timeout: int = 7 * 24 * 3600, local_size: int = 256):
+        self.timeout = timeout
+        self.local_size = local_size
+        self._local: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(kind: str, digest: str) -> str:
+        return f"parse_cache:v{PARSE_CACHE_VERSION}:{kind}:{digest}"
+
+    def _remember(self, key: str, blob: bytes):
+        if self.local_size <= 0:
+            return
+        with self._lock:
+            self._local[key] = blob
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_size:
+                self._local.popitem(last=False)
+
+    def get(self, kind: str, digest: str) -> Any:
+        """캐시된 파싱 결과 (없으면 _MISSING)"""
+        key = self._key(kind, digest)
+
+        with self._lock:
+            blob = self._local.get(key)
+            if blob is not None:
+                self._local.move_to_end(key)
+
+        if blob is None:
+            try:
+                blob = cache.get(key)
+            except Exception as e:
+                logger.warning(f'Parse cache read failed ({kind}): {e}')
+                blob = None
+            if blob is None:
+                return _MISSING
+            self._remember(key, blob)
+
+        try:
+            return pickle.loads(zlib.decompress(blob))
+        except Exception as e:
+            logger.warning(f'Parse cache entry corrupted ({kind}): {e}')
+            return _MISSING
+
+    def set(self, kind: str, digest: str, result: Any):
+        key = self._key(kind, digest)
+        blob = zlib.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        self._remember(key, blob)
+
+        try:
+            cache.set(key, blob, timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f'Parse cache write failed ({kind}): {e}')
+
+    def clear_local(self):
+        with self._lock:
+            self._local.clear()
+
+
+_parse_cache: Optional[ParseCache] = None
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """settings 기반 파싱 캐시 (프로세스당 1개, 비활성화 시 None)"""
+    global _parse_cache
+
+    if not getattr(settings, 'CRAWLER_PARSE_CACHE_ENABLED', True):
+        return None
+
+    if _parse_cache is None:
+        _parse_cache = ParseCache(
+            timeout=getattr(settings, 'CRAWLER_PARSE_CACHE_TIMEOUT', 7 * 24 * 3600),
+            local_size=getattr(settings, 'CRAWLER_PARSE_CACHE_LOCAL_SIZE', 256),
+        )
+
+    return _parse_cache
+
+
+def _key_kind(kind: str, args: Sequence[Any]) -> str:
+    """캐시 키의 종류 부분 (파서 인자 포함)"""
+    return ':'.join([kind, *map(str, args)]) if args else kind
+
+
+async def cached_parse(kind: str, func: Callable[..., Any], html_content: str, *args) -> Tuple[Any, str]:
+    """
+    캐시를 거쳐 func(html_content, *args) 실행 (미스 시 파싱 실행기로 파싱)
+
+    같은 HTML이라도 args가 다르면 결과가 다를 수 있으므로 args도 캐시 키에 포함됩니다
+    (예: 아이템 상세의 item_name).
+
+    Returns:
+        (파싱 결과, content_hash)
+    """
+    digest = content_hash(html_content)
+    parse_cache = get_parse_cache()
+    key_kind = _key_kind(kind, args)
+
+    if parse_cache is not None and digest:
+        result = parse_cache.get(key_kind, digest)
+        if result is not _MISSING:
+            logger.debug(f'Parse cache hit: {key_kind} ({digest})')
+            return result, digest
+
+    result = await get_parse_executor().run(func, html_content, *args)
+
+    if parse_cache is not None and digest:
+        parse_cache.set(key_kind, digest, result)
+
+    return result, digest
+
+
+async def cached_parse_many(
+    kind: str, func: Callable[..., Any], args_list: Sequence[Tuple[Any, ...]]
+) -> List[Tuple[Any, str]]:
+    """
+    여러 페이지를 캐시를 거쳐 파싱 (args_list 항목: (html_content, *args))
+
+    캐시에 없는 페이지만 파싱 실행기 map()으로 CRAWLER_PARSE_CHUNK_SIZE개씩 묶어 파싱합니다
+    (아이템 상세처럼 작은 페이지를 하나씩 제출하면 pickle/IPC 비용이 파싱 비용보다 큼).
+    func는 페이지 하나의 실패를 None으로 반환해야 하며 None 결과는 캐시하지 않습니다.
+
+    Returns:
+        입력 순서대로 (파싱 결과, content_hash) 목록
+    """
+    parse_cache = get_parse_cache()
+    results: List[Any] = [None] * len(args_list)
+    digests: List[str] = []
+    misses: List[int] = []
+
+    for index, (html_content, *args) in enumerate(args_list):
+        digest = content_hash(html_content)
+        digests.append(digest)
+        if parse_cache is not None and digest:
+            result = parse_cache.get(_key_kind(kind, args), digest)
+            if result is not _MISSING:
+                results[index] = result
+                continue
+        misses.append(index)
+
+    if misses:
+        parsed = await get_parse_executor().map(func, [tuple(args_list[index]) for index in misses])
+        for index, result in zip(misses, parsed):
+            results[index] = result
+            if parse_cache is not None and digests[index] and result is not None:
+                parse_cache.set(_key_kind(kind, args_list[index][1:]), digests[index], result)
+
+    logger.debug(f'Parsed {len(misses)}/{len(args_list)} {kind} pages (rest from cache)')
+    return list(zip(results, digests))
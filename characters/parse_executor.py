@@ -0,0 +1,147 @@
+"""
+크롤링 HTML 파싱 실행기 (프로세스 풀)
+
+인벤토리/창고/메소/아이템 상세 파서는 CPU 작업이라 crawl_* 코루틴 안에서
+직접 호출하면 큰 페이지를 파싱하는 동안 같은 이벤트 루프의 다른 페이지 요청이 멈춥니다.
+파싱을 ProcessPoolExecutor로 넘기고 코루틴은 loop.run_in_executor() 결과만 기다립니다.
+
+- mode='process': 워커 프로세스 풀에서 파싱 (풀은 첫 작업 시 생성)
+- mode='inline': 호출한 루프에서 바로 파싱 (테스트용, 파서 mock이 그대로 적용됨)
+- map(): 아이템 상세처럼 작은 페이지 여러 개는 chunk_size개씩 묶어 한 작업으로 제출
+  (페이지마다 작업을 제출하면 pickle/IPC 비용이 파싱 비용보다 커짐)
+
+프로세스 풀에 넘기는 함수와 인자는 pickle 가능해야 합니다 (모듈/클래스 수준 함수).
+
+settings:
+- CRAWLER_PARSE_MODE: 'process' 또는 'inline' (기본 'process')
+- CRAWLER_PARSE_WORKERS: 파싱 워커 프로세스 수 (기본 2)
+- CRAWLER_PARSE_CHUNK_SIZE: map()의 작업당 페이지 수 (기본 16)
+"""
+import asyncio
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+PARSE_MODES = ('process', 'inline')
+
+
+def _run_chunk(func: Callable[..., T], chunk: Sequence[Tuple[Any, ...]]) -> List[T]:
+    """워커 프로세스에서 chunk의 인자 묶음마다 func 실행"""
+    return [func(*args) for args in chunk]
+
+
+class ParseExecutor:
+    """
+    파싱 작업 실행기
+
+    Args:
+        mode: 'process' 또는 'inline'
+        max_workers: 워커 프로세스 수 (process 모드)
+        chunk_size: map()에서 한 작업으로 묶을 인자 수
+    """
+
+    def __init__(self, mode: str = 'process', max_workers: int = 2, chunk_size: int = 16):
+        if mode not in PARSE_MODES:
+            raise ValueError(f'Unknown parse mode: {mode} (expected one of {PARSE_MODES})')
+
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self.chunk_size = max(1, chunk_size)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def inline(self) -> bool:
+        return self.mode == 'inline'
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                logger.info(f'Parse process pool started ({self.max_workers} workers)')
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        """워커가 비정상 종료된 풀 폐기 (다음 작업 때 새로 생성)"""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _submit(self, func: Callable[..., T], *args) -> T:
+        pool = self._get_pool()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+        except BrokenProcessPool as e:
+            # 워커가 죽은 풀은 다시 쓸 수 없으므로 교체하고 이번 작업만 다시 제출
+            logger.warning(f'Parse process pool broken, restarting: {e}')
+            self._discard_pool(pool)
+            return await asyncio.get_running_loop().run_in_executor(self._get_pool(), func, *args)
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """func(*args)를 파싱 워커에서 실행하고 결과 반환 (파서 예외는 그대로 전파)"""
+        if self.inline:
+            return func(*args)
+        return await self._submit(func, *args)
+
+    async def map(
+        self,
+        func: Callable[..., T],
+        args_list: Sequence[Tuple[Any, ...]],
+        chunk_size: Optional[int] = None,
+    ) -> List[T]:
+        """
+        args_list의 인자 묶음마다 func 실행 (입력 순서대로 결과 반환)
+
+        chunk_size개씩 묶어 작업 하나로 제출하고, 묶음들은 워커들에 나눠 동시에 실행됩니다.
+        """
+        if self.inline:
+            return [func(*args) for args in args_list]
+
+        size = chunk_size or self.chunk_size
+        chunks = [args_list[i:i + size] for i in range(0, len(args_list), size)]
+        chunk_results = await asyncio.gather(*(self._submit(_run_chunk, func, chunk) for chunk in chunks))
+        return [result for chunk_result in chunk_results for result in chunk_result]
+
+    def shutdown(self, wait: bool = True):
+        """워커 프로세스 종료"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_parse_executor: Optional[ParseExecutor] = None
+_parse_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> ParseExecutor:
+    """settings 기반 파싱 실행기 (프로세스당 1개, 워커 풀은 첫 작업 시 생성)"""
+    global _parse_executor
+
+    with _parse_executor_lock:
+        if _parse_executor is None:
+            _parse_executor = ParseExecutor(
+                mode=getattr(settings, 'CRAWLER_PARSE_MODE', 'process'),
+                max_workers=getattr(settings, 'CRAWLER_PARSE_WORKERS', 2),
+                chunk_size=getattr(settings, 'CRAWLER_PARSE_CHUNK_SIZE', 16),
+            )
+        return _parse_executor
+
+
+def shutdown_parse_executor():
+    """파싱 워커 프로세스 종료 (Celery 워커 종료 시그널에서 호출)"""
+    global _parse_executor
+
+    with _parse_executor_lock:
+        executor, _parse_executor = _parse_executor, None
+    if executor is not None:
+        executor.shutdown()
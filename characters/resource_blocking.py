@@ -0,0 +1,85 @@
+"""
+크롤링 페이지 리소스 차단 (Playwright page.route)
+
+크롤링에 필요한 것은 HTML뿐이므로 이미지/미디어/폰트와 외부 트래커 요청은
+네트워크에 나가기 전에 abort합니다. 아이콘 URL은 HTML의 img src 속성에서
+추출하므로 이미지 다운로드를 막아도 파싱 결과는 같습니다.
+
+settings:
+- CRAWLER_BLOCK_RESOURCES: 차단 사용 여부 (기본 True)
+- CRAWLER_BLOCKED_RESOURCE_TYPES: 차단할 Playwright resource_type 목록
+- CRAWLER_BLOCKED_URL_KEYWORDS: URL에 포함되면 차단할 문자열 (트래커 도메인 등)
+"""
+import logging
+from typing import Iterable, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = ('image', 'media', 'font')
+
+DEFAULT_BLOCKED_URL_KEYWORDS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'facebook.net',
+    'connect.facebook',
+    'analytics.tiktok.com',
+    'wcs.naver.net',
+    'hotjar.com',
+    'nexon.com/logging',  # 넥슨 로그 수집 스크립트
+)
+
+
+class ResourceBlockingProfile:
+    """
+    page.route() 차단 규칙
+
+    사용 예:
+        await get_resource_blocking_profile().apply(page)
+    """
+
+    def __init__(
+        self,
+        resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+        url_keywords: Iterable[str] = DEFAULT_BLOCKED_URL_KEYWORDS,
+    ):
+        """
+        Args:
+            resource_types: 차단할 resource_type (image, media, font, stylesheet 등)
+            url_keywords: URL에 포함되면 차단할 문자열
+        """
+        self.resource_types = frozenset(resource_types)
+        self.url_keywords = tuple(url_keywords)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.resource_types:
+            return True
+        return any(keyword in url for keyword in self.url_keywords)
+
+    async def handle_route(self, route):
+        """page.route() 핸들러: 차단 대상이면 abort, 아니면 그대로 진행"""
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def apply(self, target):
+        """Page 또는 BrowserContext에 차단 규칙 등록"""
+        await target.route('**/*', self.handle_route)
+
+
+def get_resource_blocking_profile() -> Optional[ResourceBlockingProfile]:
+    """settings 기반 차단 프로필 반환 (차단 비활성화 시 None)"""
+    if not getattr(settings, 'CRAWLER_BLOCK_RESOURCES', True):
+        return None
+
+    return ResourceBlockingProfile(
+        resource_types=getattr(
+            settings, 'CRAWLER_BLOCKED_RESOURCE_TYPES', DEFAULT_BLOCKED_RESOURCE_TYPES),
+        url_keywords=getattr(
+            settings, 'CRAWLER_BLOCKED_URL_KEYWORDS', DEFAULT_BLOCKED_URL_KEYWORDS),
+    )
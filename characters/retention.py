@@ -0,0 +1,303 @@
+"""
+히스토리 보존 정책 / 압축 (인벤토리, 창고, 날짜별 API 데이터)
+
+크롤링/API 조회마다 쌓이는 히스토리를 단계별 보존 정책으로 줄입니다.
+- 최근 keep_all_days일: 모두 보존
+- 그 뒤 daily_days일까지: 캐릭터별 하루 1개 (그날 가장 늦은 것)
+- 그 뒤 weekly_days일까지: 캐릭터별 주 1개 (그 주 가장 늦은 것), weekly_days가 None이면 기한 없음
+- 그보다 오래된 것: 삭제
+캐릭터별 가장 최근 스냅샷(인벤토리/창고는 현재 스냅샷)은 항상 보존합니다.
+
+날짜별 API 데이터는 파티션 키(기본 character_id, 스킬은 전직 차수 포함)마다 따로 고르고,
+남긴 날짜와 같은 날짜의 행은 모두 보존합니다 (한 시점이 여러 행인 테이블).
+
+인벤토리/창고는 CrawlSnapshot 단위로 고릅니다. delta 저장 행은 여러 스냅샷에 걸쳐 유효하므로
+남는 스냅샷 어디에도 포함되지 않는 행([crawled_at, superseded_at) 구간)만 지웁니다.
+
+삭제는 id 키셋 범위로 읽고 chunk_size개씩 id__in으로 지워 짧은 트랜잭션만 사용합니다.
+회수 바이트는 테이블 크기 / 행 수로 구한 평균 행 크기 기준 추정치입니다
+(PostgreSQL은 VACUUM 이후 재사용 가능, 연결된 ItemDetail/M2M 행은 행 수만 집계).
+
+settings:
+- HISTORY_RETENTION_KEEP_ALL_DAYS (기본 7)
+- HISTORY_RETENTION_DAILY_DAYS (기본 90)
+- HISTORY_RETENTION_WEEKLY_DAYS (기본 None = 주 1개는 계속 보존)
+- HISTORY_RETENTION_CHUNK_SIZE (기본 1000)
+"""
+import bisect
+import copy
+import logging
+from datetime import timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, connection
+from django.db.models import Q
+from django.utils import timezone
+
+from . import models as character_models
+from .models import CrawlSnapshot
+
+logger = logging.getLogger(__name__)
+
+# character + date로 한 시점을 저장하는 API 데이터 테이블
+DATED_HISTORY_MODELS = (
+    'CharacterBasicHistory', 'CharacterPopularity', 'CharacterItemEquipment', 'CharacterStat',
+    'CharacterAbility', 'CharacterCashItemEquipment', 'CharacterSymbolEquipment', 'CharacterSkill',
+    'CharacterLinkSkill', 'CharacterVMatrix', 'CharacterHexaMatrix', 'CharacterHexaMatrixStat',
+    'CharacterDojang', 'CharacterSetEffect', 'CharacterBeautyEquipment', 'AndroidEquipment',
+    'CharacterPetEquipment', 'CharacterPropensity', 'CharacterHyperStat',
+)
+# 한 캐릭터/날짜에 여러 행을 저장하는 테이블의 파티션 키 (없으면 character_id)
+DATED_HISTORY_PARTITION_KEYS = {
+    'CharacterSkill': ('character_id', 'character_skill_grade'),
+}
+
+
+def get_retention_policy() -> Dict[str, Optional[int]]:
+    return {
+        'keep_all_days': getattr(settings, 'HISTORY_RETENTION_KEEP_ALL_DAYS', 7),
+        'daily_days': getattr(settings, 'HISTORY_RETENTION_DAILY_DAYS', 90),
+        'weekly_days': getattr(settings, 'HISTORY_RETENTION_WEEKLY_DAYS', None),
+    }
+
+
+class TieredRetention:
+    """
+    단계별 보존 판단 (한 캐릭터의 시점을 최신순으로 keep()에 넣음)
+
+    캐릭터가 바뀌면 start()로 초기화합니다. 첫 시점(가장 최근)은 항상 보존합니다.
+    """
+
+    def __init__(self, policy: Dict[str, Optional[int]], now=None):
+        now = now or timezone.now()
+        self.keep_all_after = now - timedelta(days=policy['keep_all_days'])
+        self.daily_after = now - timedelta(days=policy['daily_days'])
+        weekly_days = policy['weekly_days']
+        self.weekly_after = now - timedelta(days=weekly_days) if weekly_days is not None else None
+        self.start()
+
+    def start(self):
+        self._first = True
+        self._buckets = set()
+
+    def fork(self) -> 'TieredRetention':
+        """같은 기준 시각의 새 판단 상태 (파티션별로 따로 고를 때)"""
+        forked = copy.copy(self)
+        forked.start()
+        return forked
+
+    def keep(self, timestamp) -> bool:
+        if self._first:
+            self._first = False
+            self._buckets.add(self._bucket(timestamp))
+            return True
+        if timestamp >= self.keep_all_after:
+            return True
+        if self.weekly_after is not None and timestamp < self.weekly_after:
+            return False
+
+        bucket = self._bucket(timestamp)
+        if bucket in self._buckets:
+            return False
+        self._buckets.add(bucket)
+        return True
+
+    def _bucket(self, timestamp) -> tuple:
+        local = timezone.localtime(timestamp)
+        if timestamp >= self.daily_after:
+            return ('day', local.date())
+        return ('week',) + tuple(local.isocalendar()[:2])
+
+
+def _iter_chunks(values: List[int], chunk_size: int) -> Iterator[List[int]]:
+    for start in range(0, len(values), chunk_size):
+        yield values[start:start + chunk_size]
+
+
+def _table_stats(model) -> Tuple[Optional[int], int]:
+    """테이블 (바이트, 행 수), 크기를 구할 수 없으면 바이트는 None"""
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                'SELECT pg_total_relation_size(c.oid), GREATEST(c.reltuples, 0)::bigint '
+                'FROM pg_class c WHERE c.oid = %s::regclass', [table])
+            size, rows = cursor.fetchone()
+            return size, rows
+        rows = model.objects.count()
+        if connection.vendor == 'sqlite':
+            try:
+                cursor.execute('SELECT SUM(pgsize) FROM dbstat WHERE name = %s', [table])
+                return cursor.fetchone()[0], rows
+            except DatabaseError:
+                pass  # dbstat 미지원 빌드
+    return None, rows
+
+
+class _Report:
+    """모델별 삭제 행 수 / 추정 회수 바이트"""
+
+    def __init__(self, dry_run: bool):
+        self.dry_run = dry_run
+        self.tables: Dict[str, Dict[str, Optional[int]]] = {}
+        self._row_bytes: Dict[str, Optional[float]] = {}
+
+    def _entry(self, label: str, estimated: bool = True) -> Dict[str, Optional[int]]:
+        return self.tables.setdefault(label, {'rows': 0, 'bytes': 0 if estimated else None})
+
+    def delete(self, model, ids: List[int], chunk_size: int):
+        """ids를 chunk_size개씩 삭제 (dry_run이면 집계만)"""
+        if not ids:
+            return
+        label = model._meta.label
+        if label not in self._row_bytes:
+            size, rows = _table_stats(model)
+            self._row_bytes[label] = size / rows if size is not None and rows else None
+
+        for id_chunk in _iter_chunks(ids, chunk_size):
+            if self.dry_run:
+                counts = {label: len(id_chunk)}
+            else:
+                _, counts = model.objects.filter(id__in=id_chunk).delete()
+            for counted_label, count in counts.items():
+                # CASCADE로 함께 지워진 모델은 행 수만 집계
+                self._entry(counted_label, estimated=counted_label == label)['rows'] += count
+
+        entry = self._entry(label)
+        row_bytes = self._row_bytes[label]
+        if row_bytes is None:
+            entry['bytes'] = None
+        elif entry['bytes'] is not None:
+            entry['bytes'] += int(row_bytes * len(ids))
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            'dry_run': self.dry_run,
+            'tables': self.tables,
+            'total_rows': sum(entry['rows'] for entry in self.tables.values()),
+            'total_bytes': sum(entry['bytes'] or 0 for entry in self.tables.values()),
+        }
+
+
+def _compact_snapshots(kind: str, retention: TieredRetention, report: _Report, chunk_size: int):
+    """인벤토리/창고: 보존하지 않는 스냅샷과 남는 스냅샷에 포함되지 않는 행 삭제"""
+    model = CrawlSnapshot.item_model(kind)
+    candidates = (
+        CrawlSnapshot.objects.filter(kind=kind, is_current=False, crawled_at__lt=retention.keep_all_after)
+        .order_by('character_basic_id').values_list('character_basic_id', flat=True).distinct()
+    )
+
+    for character_id in candidates.iterator():
+        snapshots = list(
+            CrawlSnapshot.objects.filter(character_basic_id=character_id, kind=kind)
+            .order_by('-crawled_at', '-id').values_list('id', 'crawled_at', 'is_current')
+        )
+        retention.start()
+        kept_times, dropped_ids = [], []
+        for snapshot_id, crawled_at, is_current in snapshots:
+            if retention.keep(crawled_at) or is_current:
+                kept_times.append(crawled_at)
+            else:
+                dropped_ids.append(snapshot_id)
+        if not dropped_ids:
+            continue
+        kept_times.sort()
+
+        # 대체된 행 중 남는 스냅샷 시점이 [crawled_at, superseded_at)에 없는 행 (id 키셋 순회)
+        stale_ids, last_id = [], 0
+        while True:
+            page = list(
+                model.objects.filter(
+                    character_basic_id=character_id,
+                    superseded_at__isnull=False,
+                    crawled_at__lt=retention.keep_all_after,
+                    id__gt=last_id,
+                ).order_by('id').values_list('id', 'crawled_at', 'superseded_at')[:chunk_size]
+            )
+            if not page:
+                break
+            last_id = page[-1][0]
+            for row_id, crawled_at, superseded_at in page:
+                index = bisect.bisect_left(kept_times, crawled_at)
+                if index == len(kept_times) or kept_times[index] >= superseded_at:
+                    stale_ids.append(row_id)
+
+        # 스냅샷을 먼저 지워 읽는 쪽이 행이 빠진 스냅샷을 보지 않게 함
+        report.delete(CrawlSnapshot, dropped_ids, chunk_size)
+        report.delete(model, stale_ids, chunk_size)
+
+
+def _compact_dated(model, retention: TieredRetention, report: _Report, chunk_size: int):
+    """
+    character + date 테이블: (character, date 최신순, id) 키셋으로 읽으며 보존하지 않는 행 삭제
+
+    캐릭터 안에서는 파티션 키마다 따로 판단하고, 파티션에서 남긴 날짜와 같은 날짜의 행은 함께 보존합니다.
+    """
+    partition_key = DATED_HISTORY_PARTITION_KEYS.get(model.__name__, ('character_id',))
+    queryset = model.objects.filter(date__isnull=False).order_by('character_id', '-date', '-id')
+    stale_ids: List[int] = []
+    last = None
+    # 현재 캐릭터의 파티션 → (판단 상태, 마지막으로 남긴 날짜)
+    partitions: Dict[tuple, list] = {}
+    while True:
+        page_query = queryset
+        if last is not None:
+            character_id, date, row_id = last
+            page_query = queryset.filter(
+                Q(character_id__gt=character_id)
+                | Q(character_id=character_id, date__lt=date)
+                | Q(character_id=character_id, date=date, id__lt=row_id)
+            )
+        page = list(page_query.values_list('character_id', 'date', 'id', *partition_key)[:chunk_size])
+        if not page:
+            break
+
+        for character_id, date, row_id, *partition in page:
+            if last is None or character_id != last[0]:
+                partitions = {}
+            state = partitions.setdefault(tuple(partition), [retention.fork(), None])
+            if date == state[1] or state[0].keep(date):
+                state[1] = date
+            else:
+                stale_ids.append(row_id)
+            last = (character_id, date, row_id)
+
+        # 키셋 다음 페이지는 last 이후이므로 이번 페이지 삭제가 읽기에 영향 없음
+        if len(stale_ids) >= chunk_size:
+            report.delete(model, stale_ids, chunk_size)
+            stale_ids = []
+
+    report.delete(model, stale_ids, chunk_size)
+
+
+def compact_history(dry_run: bool = False, policy: Dict[str, Optional[int]] = None,
+                    chunk_size: int = None, now=None) -> Dict[str, object]:
+    """
+    보존 정책에 따라 히스토리 압축
+
+    Args:
+        dry_run: True면 지울 행 수/바이트만 계산
+        policy: 보존 정책 (없으면 settings)
+        chunk_size: 키셋 페이지/삭제 청크 크기 (없으면 settings.HISTORY_RETENTION_CHUNK_SIZE)
+        now: 기준 시각 (테스트용)
+
+    Returns:
+        {'dry_run', 'policy', 'tables': {모델: {'rows', 'bytes'}}, 'total_rows', 'total_bytes'}
+    """
+    policy = policy or get_retention_policy()
+    chunk_size = chunk_size or getattr(settings, 'HISTORY_RETENTION_CHUNK_SIZE', 1000)
+    retention = TieredRetention(policy, now)
+    report = _Report(dry_run)
+
+    for kind in ('inventory', 'storage'):
+        _compact_snapshots(kind, retention, report, chunk_size)
+    for model_name in DATED_HISTORY_MODELS:
+        _compact_dated(getattr(character_models, model_name), retention, report, chunk_size)
+
+    result = report.as_dict()
+    result['policy'] = policy
+    logger.info(
+        f"History compaction {'(dry run) ' if dry_run else ''}removed {result['total_rows']} rows, "
+        f"~{result['total_bytes']} bytes")
+    return result
@@ -14,7 +14,7 @@ from .models import (
     LinkSkill, CharacterLinkSkill, PetItemEquipment, PetAutoSkill,
     PetEquipment, CharacterPetEquipment, CharacterPopularity, CharacterPropensity,
     CharacterSetEffect, Skill, CharacterSkill, StatDetail, CharacterStat,
-    Symbol, CharacterSymbolEquipment, VCore, CharacterVMatrix
+    Symbol, CharacterSymbolEquipment, VCore, CharacterVMatrix, CrawlSnapshot
 )
 from accounts.models import Character
 
@@ -243,7 +243,7 @@ class CharacterHexaMatrixStatSerializer(serializers.ModelSerializer):
 class HexaSkillSerializer(serializers.ModelSerializer):
     class Meta:
         model = HexaSkill
-        exclude = ['id']
+        exclude = ['id', 'content_hash']
 
 
 class HexaCoreSerializer(serializers.ModelSerializer):
@@ -251,7 +251,7 @@ class HexaCoreSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = HexaCore
-        exclude = ['id']
+        exclude = ['id', 'content_hash']
 
 
 class CharacterHexaMatrixSerializer(serializers.ModelSerializer):
@@ -282,37 +282,37 @@ class CharacterHyperStatSerializer(serializers.ModelSerializer):
 class ItemTotalOptionSerializer(serializers.ModelSerializer):
     class Meta:
         model = ItemTotalOption
-        exclude = ['id']
+        exclude = ['id', 'content_hash']
 
 
 class ItemBaseOptionSerializer(serializers.ModelSerializer):
     class Meta:
         model = ItemBaseOption
-        exclude = ['id']
+        exclude = ['id', 'content_hash']
 
 
 class ItemExceptionalOptionSerializer(serializers.ModelSerializer):
     class Meta:
         model = ItemExceptionalOption
-        exclude = ['id']
+        exclude = ['id', 'content_hash']
 
 
 class ItemAddOptionSerializer(serializers.ModelSerializer):
     class Meta:
         model = ItemAddOption
-        exclude = ['id']
+        exclude = ['id', 'content_hash']
 
 
 class ItemEtcOptionSerializer(serializers.ModelSerializer):
     class Meta:
         model = ItemEtcOption
-        exclude = ['id']
+        exclude = ['id', 'content_hash']
 
 
 class ItemStarforceOptionSerializer(serializers.ModelSerializer):
     class Meta:
         model = ItemStarforceOption
-        exclude = ['id']
+        exclude = ['id', 'content_hash']
 
 
 class TitleSerializer(serializers.ModelSerializer):
@@ -331,7 +331,7 @@ class ItemEquipmentSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ItemEquipment
-        exclude = ['id']
+        exclude = ['id', 'content_hash']
 
 
 class CharacterItemEquipmentSerializer(serializers.ModelSerializer):
@@ -637,14 +637,12 @@ class CharacterListSerializer(serializers.ModelSerializer):
         if not basic:
             return 0
 
-        # 가장 최근 크롤링의 아이템 수
-        latest_item = basic.inventory_items.order_by('-crawled_at').first()
-        if not latest_item:
-            return 0
+        # 현재 스냅샷의 아이템 수 (스냅샷 기록이 없으면 가장 최근 크롤링 기준으로 count)
+        snapshot = CrawlSnapshot.current(basic, 'inventory')
+        if snapshot:
+            return snapshot.item_count
 
-        return basic.inventory_items.filter(
-            crawled_at=latest_item.crawled_at
-        ).count()
+        return CrawlSnapshot.current_items('inventory').filter(character_basic=basic).count()
 
     def get_has_expiring_items(self, obj):
         """7일 이내 만료 아이템 유무"""
@@ -883,37 +881,32 @@ class CharacterAllDataSerializer(serializers.ModelSerializer):
     # 크롤링 데이터 get 메서드
     def get_inventory(self, obj):
         """최근 크롤링된 인벤토리 아이템 목록"""
-        # 가장 최근 크롤링 시점의 아이템들만 반환
-        latest_crawled = obj.inventory_items.order_by('-crawled_at').first()
-        if not latest_crawled:
+        # 현재 스냅샷의 아이템 (CrawlSnapshot join, 쿼리 1회)
+        items = list(
+            CrawlSnapshot.current_items('inventory').filter(character_basic=obj).order_by('slot_position')
+        )
+        if not items:
             return None
 
-        # 해당 크롤링 시점의 모든 아이템 반환
-        items = obj.inventory_items.filter(
-            crawled_at=latest_crawled.crawled_at
-        ).order_by('slot_position')
-
         return {
-            'crawled_at': latest_crawled.crawled_at.isoformat(),
+            'crawled_at': items[0].crawled_at.isoformat(),
             'items': InventoryItemSerializer(items, many=True).data,
-            'total_count': items.count()
+            'total_count': len(items)
         }
 
     def get_storage(self, obj):
         """최근 크롤링된 창고 아이템 목록"""
-        latest_crawled = obj.storage_items.order_by('-crawled_at').first()
-        if not latest_crawled:
+        # 현재 스냅샷의 아이템 (CrawlSnapshot join, 쿼리 1회)
+        items = list(
+            CrawlSnapshot.current_items('storage').filter(character_basic=obj).order_by('slot_position')
+        )
+        if not items:
             return None
 
-        # 해당 크롤링 시점의 아이템들
-        items = obj.storage_items.filter(
-            crawled_at=latest_crawled.crawled_at
-        ).order_by('slot_position')
-
         return {
-            'crawled_at': latest_crawled.crawled_at.isoformat(),
+            'crawled_at': items[0].crawled_at.isoformat(),
             'items': StorageItemSerializer(items, many=True).data,
-            'total_count': items.count()
+            'total_count': len(items)
         }
 
     def get_meso(self, obj):
@@ -1,5 +1,4 @@
 import time
-import requests
 from django.utils import timezone
 from datetime import timedelta
 import logging
@@ -21,9 +20,7 @@ from define.define import (
 )
 from accounts.models import Character
 from .models import (
-    CharacterBasic, CharacterItemEquipment, ItemEquipment,
-    ItemTotalOption, ItemBaseOption, ItemEtcOption,
-    ItemStarforceOption, ItemExceptionalOption, ItemAddOption, Title
+    CharacterBasic, CharacterItemEquipment, ItemEquipment, Title
 )
 from .schemas import (
     CharacterItemEquipmentSchema, CharacterBasicSchema,
@@ -33,14 +30,10 @@ from .schemas import (
 from .mixins import MapleAPIClientMixin, CharacterDataMixin
 from .utils import handle_api_exception, log_api_call
 from .exceptions import CharacterNotFoundError, DatabaseError, DataValidationError
-from util.rate_limiter import rate_limited
+from util.nexon_client import get_nexon_client
 
 logger = logging.getLogger(__name__)
 
-# Nexon API Rate Limit (개발 단계: 초당 5건, 1일 1000건)
-# 서비스 단계로 전환 시 NEXON_API_RATE_LIMIT = 500으로 변경
-NEXON_API_RATE_LIMIT = 5  # 개발 단계
-
 
 class MapleAPIService(CharacterDataMixin):
     """메이플스토리 API 호출 서비스"""
@@ -68,7 +61,7 @@ class MapleAPIService(CharacterDataMixin):
         }
 
     @staticmethod
-    @rate_limited(max_calls=NEXON_API_RATE_LIMIT)  # AC 2.2.5: Rate Limit 준수
+    # AC 2.2.5: Rate Limit 준수 (settings.NEXON_API_RATE_LIMIT, Nexon 클라이언트가 시도마다 적용)
     @handle_api_exception
     def get_ocid(character_name):
         """
@@ -94,8 +87,9 @@ class MapleAPIService(CharacterDataMixin):
 
         # API 호출
         headers = MapleAPIService.get_headers()
-        response = requests.get(
-            f"{CHARACTER_ID_URL}?character_name={character_name}",
+        response = get_nexon_client().get(
+            CHARACTER_ID_URL,
+            params={'character_name': character_name},
             headers=headers
         )
         response.raise_for_status()
@@ -110,7 +104,7 @@ class MapleAPIService(CharacterDataMixin):
         return ocid
 
     @staticmethod
-    @rate_limited(max_calls=NEXON_API_RATE_LIMIT)  # AC 2.2.5: Rate Limit 준수
+    # AC 2.2.5: Rate Limit 준수 (settings.NEXON_API_RATE_LIMIT, 엔드포인트별 제한 포함)
     @handle_api_exception
     def get_character_data(endpoint_key, ocid, date=None, **kwargs):
         """
@@ -145,7 +139,7 @@ class MapleAPIService(CharacterDataMixin):
         param_str = '&'.join(f"{k}={v}" for k, v in params.items())
         url = f"{base_url}?{param_str}"
 
-        response = requests.get(url, headers=headers)
+        response = get_nexon_client().get(url, headers=headers)
         response.raise_for_status()
 
         return response.json()
@@ -297,93 +291,8 @@ class EquipmentService:
 
     @staticmethod
     def process_equipment_group(item_datas):
-        """장비 그룹 처리"""
-        item_list = []
-        bulk_items = []
-        bulk_total_options = []
-        bulk_base_options = []
-        bulk_etc_options = []
-        bulk_starforce_options = []
-        bulk_exceptional_options = []
-        bulk_add_options = []
-
-        for item_data in item_datas:
-            # 옵션 객체 생성 (아직 저장하지 않음)
-            total_option = ItemTotalOption(**item_data['item_total_option'])
-            base_option = ItemBaseOption(**item_data['item_base_option'])
-            etc_option = ItemEtcOption(**item_data['item_etc_option'])
-            starforce_option = ItemStarforceOption(
-                **item_data['item_starforce_option'])
-            exceptional_option = ItemExceptionalOption(
-                **item_data['item_exceptional_option']) if item_data['item_exceptional_option'] else None
-            add_option = ItemAddOption(
-                **item_data['item_add_option']) if item_data['item_add_option'] else None
-
-            # 옵션 객체들을 각각의 리스트에 추가
-            bulk_total_options.append(total_option)
-            bulk_base_options.append(base_option)
-            bulk_etc_options.append(etc_option)
-            bulk_starforce_options.append(starforce_option)
-            if exceptional_option:
-                bulk_exceptional_options.append(exceptional_option)
-            if add_option:
-                bulk_add_options.append(add_option)
-
-            # 장비 데이터 생성 준비
-            equipment_data = {
-                key: item_data[key] for key in item_data.keys() if key not in ['item_total_option', 'item_base_option', 'item_etc_option', 'item_starforce_option', 'item_exceptional_option', 'item_add_option']
-            }
-
-            # date_expire 필드가 있으면 형식 변환
-            if 'date_expire' in equipment_data and equipment_data['date_expire']:
-                try:
-                    equipment_data['date_expire'] = timezone.datetime.fromisoformat(
-                        equipment_data['date_expire'].replace('Z', '+00:00'))
-                except (ValueError, AttributeError):
-                    equipment_data['date_expire'] = None
-
-            equipment = ItemEquipment.objects.filter(**equipment_data).first()
-            if not equipment:
-                bulk_items.append(
-                    (equipment_data, len(bulk_total_options) - 1))
-            else:
-                item_list.append(equipment)
-
-        # bulk_create로 옵션 데이터들을 한 번에 저장
-        created_total_options = ItemTotalOption.objects.bulk_create(
-            bulk_total_options)
-        created_base_options = ItemBaseOption.objects.bulk_create(
-            bulk_base_options)
-        created_etc_options = ItemEtcOption.objects.bulk_create(
-            bulk_etc_options)
-        created_starforce_options = ItemStarforceOption.objects.bulk_create(
-            bulk_starforce_options)
-        created_exceptional_options = ItemExceptionalOption.objects.bulk_create(
-            bulk_exceptional_options) if bulk_exceptional_options else []
-        created_add_options = ItemAddOption.objects.bulk_create(
-            bulk_add_options) if bulk_add_options else []
-
-        # ItemEquipment 객체들 생성 및 옵션 연결
-        new_items = []
-        for equipment_data, idx in bulk_items:
-            equipment_data.update({
-                'item_total_option': created_total_options[idx],
-                'item_base_option': created_base_options[idx],
-                'item_etc_option': created_etc_options[idx],
-                'item_starforce_option': created_starforce_options[idx],
-            })
-            if idx < len(created_exceptional_options):
-                equipment_data['item_exceptional_option'] = created_exceptional_options[idx]
-            if idx < len(created_add_options):
-                equipment_data['item_add_option'] = created_add_options[idx]
-            new_items.append(ItemEquipment(**equipment_data))
-
-        # bulk_create로 ItemEquipment 객체들 생성
-        if new_items:
-            created_items = ItemEquipment.objects.bulk_create(new_items)
-            item_list.extend(created_items)
-
-        return item_list
+        """장비 그룹 처리 (같은 내용의 장비/옵션 행은 content_hash로 재사용)"""
+        return ItemEquipment.bulk_create_from_data(item_datas)
 
     @staticmethod
     def process_title(item_datas):
@@ -8,6 +8,7 @@ import logging
 from typing import Dict, List
 from util.redis_client import redis_client
 from .models import Inventory, Storage
+from . import retention
 
 logger = logging.getLogger(__name__)
 
@@ -182,3 +183,18 @@ def _process_expirable_item(item, today, item_source: str) -> Dict | None:
         }
 
     return None
+
+
+@shared_task
+def compact_history(dry_run: bool = False) -> Dict:
+    """
+    Compact Inventory/Storage snapshots and dated API history daily
+
+    Applies the tiered retention policy (settings.HISTORY_RETENTION_*):
+    everything for N days, then one snapshot per day, then one per week.
+    Deletes in keyset-ranged chunks so no long-running lock is held.
+
+    Returns:
+        dict: Rows and estimated bytes reclaimed per model
+    """
+    return retention.compact_history(dry_run=dry_run)
@@ -0,0 +1,115 @@
+"""
+BrowserPool 단위 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_browser_pool
+"""
+import asyncio
+from django.test import TestCase
+from unittest.mock import Mock, AsyncMock, MagicMock, patch
+
+from characters.browser_pool import BrowserPool, get_browser_pool, run_in_worker_loop
+
+
+def make_mock_playwright():
+    """chromium.launch() 호출마다 새 mock 브라우저를 반환하는 playwright mock"""
+    browsers = []
+
+    def new_browser(*args, **kwargs):
+        browser = AsyncMock()
+        context = AsyncMock()
+        context.on = Mock()
+        browser.new_context = AsyncMock(return_value=context)
+        browsers.append(browser)
+        return browser
+
+    playwright_instance = MagicMock()
+    playwright_instance.chromium.launch = AsyncMock(side_effect=new_browser)
+
+    manager = MagicMock()
+    manager.__aenter__ = AsyncMock(return_value=playwright_instance)
+    manager.__aexit__ = AsyncMock(return_value=None)
+
+    return manager, playwright_instance, browsers
+
+
+class BrowserPoolTests(TestCase):
+    """브라우저 재사용/교체/종료 테스트"""
+
+    def setUp(self):
+        self.manager, self.playwright, self.browsers = make_mock_playwright()
+        patcher = patch('playwright.async_api.async_playwright', return_value=self.manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_browser_reused_across_contexts(self):
+        """여러 context 발급 시 브라우저는 한 번만 실행"""
+        pool = BrowserPool(size=1, max_pages_per_browser=100, max_memory_mb=None)
+
+        async def run():
+            for _ in range(3):
+                async with pool.new_context(user_agent='test') as context:
+                    self.assertIsNotNone(context)
+            await pool.close()
+
+        asyncio.run(run())
+
+        self.assertEqual(self.playwright.chromium.launch.await_count, 1)
+        self.assertEqual(self.browsers[0].new_context.await_count, 3)
+        self.browsers[0].new_context.assert_awaited_with(user_agent='test')
+        self.manager.__aexit__.assert_awaited_once()
+
+    def test_browser_recycled_after_max_pages(self):
+        """최대 페이지 수를 넘긴 브라우저는 종료되고 새 브라우저로 교체"""
+        pool = BrowserPool(size=1, max_pages_per_browser=2, max_memory_mb=None)
+
+        async def run():
+            for _ in range(2):
+                async with pool.new_context() as context:
+                    # context.on('page', ...)에 등록된 콜백으로 페이지 수 집계
+                    page_callback = context.on.call_args[0][1]
+                    page_callback(Mock())
+            async with pool.new_context():
+                pass
+            await pool.close()
+
+        asyncio.run(run())
+
+        self.assertEqual(len(self.browsers), 2)
+        self.browsers[0].close.assert_awaited()
+
+    def test_browser_recycled_when_memory_limit_exceeded(self):
+        """Chromium 메모리 한도 초과 시 브라우저 교체"""
+        pool = BrowserPool(size=1, max_pages_per_browser=100, max_memory_mb=512)
+
+        async def run():
+            with patch('characters.browser_pool.chromium_rss_mb', return_value=2048):
+                async with pool.new_context():
+                    pass
+            self.assertEqual(pool.stats()['browsers'], 0)
+            await pool.close()
+
+        asyncio.run(run())
+
+        self.browsers[0].close.assert_awaited()
+
+    def test_closed_pool_rejects_new_context(self):
+        """종료된 풀은 새 context를 발급하지 않음"""
+        pool = BrowserPool(max_memory_mb=None)
+
+        async def run():
+            await pool.close()
+            async with pool.new_context():
+                pass
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(run())
+
+    def test_pool_shared_within_worker_loop(self):
+        """run_in_worker_loop 호출 간 같은 풀 재사용"""
+        async def current_pool():
+            return get_browser_pool()
+
+        first = run_in_worker_loop(current_pool())
+        second = run_in_worker_loop(current_pool())
+
+        self.assertIs(first, second)
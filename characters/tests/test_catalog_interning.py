@@ -0,0 +1,131 @@
+"""
+스킬 / 링크 스킬 / 헥사 코어 카탈로그 묶음 저장 (characters.interning) 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_catalog_interning
+"""
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from characters.models import (
+    CharacterBasic, CharacterHexaMatrix, CharacterLinkSkill, CharacterSkill,
+    HexaCore, HexaSkill, LinkSkill, Skill,
+)
+
+
+def skill_data(index):
+    return {
+        'skill_name': f'스킬{index}',
+        'skill_description': '긴 설명 ' * 20,
+        'skill_level': 30,
+        'skill_effect': f'데미지 {index}% 증가',
+        'skill_effect_next': None,
+        'skill_icon': f'https://example.com/skill{index}.png',
+    }
+
+
+def link_skill_data(name, level=1):
+    return {'skill_name': name, 'skill_description': '설명', 'skill_level': level, 'skill_effect': '효과',
+            'skill_icon': 'https://example.com/link.png'}
+
+
+class CatalogInterningTests(TestCase):
+    """카탈로그 행 재사용 / M2M 묶음 연결 테스트"""
+
+    def setUp(self):
+        self.date = timezone.now().replace(microsecond=0)
+        self.characters = [
+            CharacterBasic.objects.create(
+                ocid=f'catalog-test-{index}',
+                character_name=f'카탈로그{index}',
+                world_name='스카니아',
+                character_gender='남',
+                character_class='아크메이지(불,독)',
+            )
+            for index in range(2)
+        ]
+
+    def _save_skills(self, character, count, grade='6', start=0):
+        return CharacterSkill.create_from_data(character, {
+            'date': self.date,
+            'character_class': '아크메이지(불,독)',
+            'character_skill_grade': grade,
+            'character_skill': [skill_data(index) for index in range(start, start + count)],
+        })
+
+    def test_skills_shared_between_characters(self):
+        first = self._save_skills(self.characters[0], 5)
+        second = self._save_skills(self.characters[1], 5)
+
+        self.assertNotEqual(first.pk, second.pk)
+        self.assertEqual(Skill.objects.count(), 5)
+        self.assertEqual(first.character_skill.count(), 5)
+        self.assertEqual(set(first.character_skill.all()), set(second.character_skill.all()))
+
+    def test_skill_grades_saved_separately(self):
+        """같은 캐릭터/날짜라도 전직 차수별로 행과 스킬 목록이 따로 저장됨"""
+        for start, grade in enumerate(('0', '5', '6')):
+            self._save_skills(self.characters[0], 1, grade=grade, start=start * 10)
+
+        rows = CharacterSkill.objects.filter(character=self.characters[0], date=self.date)
+        self.assertEqual(sorted(rows.values_list('character_skill_grade', flat=True)), ['0', '5', '6'])
+        for start, grade in enumerate(('0', '5', '6')):
+            self.assertEqual(
+                list(rows.get(character_skill_grade=grade).character_skill.values_list('skill_name', flat=True)),
+                [f'스킬{start * 10}'])
+
+    def test_skill_query_count_independent_of_skill_count(self):
+        with CaptureQueriesContext(connection) as small:
+            self._save_skills(self.characters[0], 2)
+        with CaptureQueriesContext(connection) as large:
+            self._save_skills(self.characters[1], 60)
+
+        self.assertEqual(len(large), len(small))
+        self.assertEqual(Skill.objects.count(), 60)
+
+    def test_link_skill_fields(self):
+        data = {
+            'date': self.date,
+            'character_class': '아크메이지(불,독)',
+            'character_link_skill': [link_skill_data('링크A'), link_skill_data('링크B')],
+            'character_link_skill_preset_1': [link_skill_data('링크A')],
+            'character_link_skill_preset_2': [],
+            'character_owned_link_skill': link_skill_data('보유', 2),
+            'character_owned_link_skill_preset_1': link_skill_data('보유', 2),
+        }
+
+        link_skill = CharacterLinkSkill.create_from_data(self.characters[0], data)
+        link_skill.refresh_from_db()
+
+        self.assertEqual(LinkSkill.objects.count(), 3)
+        self.assertEqual(sorted(link_skill.character_link_skill.values_list('skill_name', flat=True)), ['링크A', '링크B'])
+        self.assertEqual(list(link_skill.character_link_skill_preset_1.values_list('skill_name', flat=True)), ['링크A'])
+        self.assertFalse(link_skill.character_link_skill_preset_2.exists())
+        self.assertEqual(link_skill.character_owned_link_skill.skill_name, '보유')
+        self.assertEqual(link_skill.character_owned_link_skill_preset_1_id, link_skill.character_owned_link_skill_id)
+
+        # 같은 날짜 재저장 시 연결 교체
+        data['character_link_skill'] = [link_skill_data('링크C')]
+        CharacterLinkSkill.create_from_data(self.characters[0], data)
+        self.assertEqual(list(link_skill.character_link_skill.values_list('skill_name', flat=True)), ['링크C'])
+
+    def test_hexa_matrix(self):
+        data = {
+            'date': self.date,
+            'character_hexa_core_equipment': [
+                {'hexa_core_name': '코어1', 'hexa_core_level': 10, 'hexa_core_type': '스킬 코어',
+                 'linked_skill': [{'hexa_skill_id': '스킬1'}]},
+                {'hexa_core_name': '코어2', 'hexa_core_level': 5, 'hexa_core_type': '강화 코어',
+                 'linked_skill': [{'hexa_skill_id': '스킬2'}, {'hexa_skill_id': '스킬1'}]},
+            ],
+        }
+
+        hexa_matrix = CharacterHexaMatrix.create_from_data(self.characters[0], data)
+        CharacterHexaMatrix.create_from_data(self.characters[1], data)
+
+        self.assertEqual(HexaCore.objects.count(), 2)
+        self.assertEqual(HexaSkill.objects.count(), 2)
+        self.assertEqual(hexa_matrix.character_hexa_core_equipment.count(), 2)
+        core = HexaCore.objects.get(hexa_core_name='코어2')
+        self.assertEqual(sorted(core.linked_skill.values_list('hexa_skill_id', flat=True)), ['스킬1', '스킬2'])
@@ -0,0 +1,65 @@
+"""
+크롤링 페이싱 (상세 페이지 리미터, AdaptiveConcurrencyLimiter) 단위 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_crawl_pacing
+"""
+import asyncio
+from django.test import TestCase
+
+from characters.crawl_pacing import AdaptiveConcurrencyLimiter, detail_rate_key, get_detail_rate_limiter
+
+
+class DetailRateLimiterTests(TestCase):
+    """상세 페이지 요청률 리미터 테스트"""
+
+    def test_limiter_shared_per_rate(self):
+        """같은 rate/burst면 프로세스 안에서 같은 리미터 (버킷 상태는 Redis)"""
+        first = get_detail_rate_limiter(1.0, 3)
+
+        self.assertIs(first, get_detail_rate_limiter(1.0, 3))
+        self.assertEqual((first.name, first.rate, first.capacity), ('crawl_detail', 1.0, 3.0))
+        self.assertIsNot(first, get_detail_rate_limiter(2.0, 3))
+
+    def test_detail_rate_key_is_host(self):
+        self.assertEqual(
+            detail_rate_key('https://MapleStory.nexon.com/Common/Resource/Item?p=abc'), 'maplestory.nexon.com')
+        self.assertEqual(detail_rate_key('http://127.0.0.1:8765/Common/Resource/Item'), '127.0.0.1:8765')
+        self.assertEqual(detail_rate_key(None), 'default')
+
+
+class AdaptiveConcurrencyLimiterTests(TestCase):
+    """AIMD 동시성 제한 테스트"""
+
+    def test_throttle_halves_and_success_recovers(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, increase_after=2)
+
+        limiter.on_throttle()
+        self.assertEqual(limiter.limit, 4)
+        limiter.on_throttle()
+        limiter.on_throttle()
+        limiter.on_throttle()
+        self.assertEqual(limiter.limit, 1)
+
+        for _ in range(4):
+            limiter.on_success()
+        self.assertEqual(limiter.limit, 3)
+
+    def test_slot_respects_limit(self):
+        """동시에 limit개까지만 슬롯 진입"""
+        limiter = AdaptiveConcurrencyLimiter(max_limit=2)
+        active = 0
+        peak = 0
+
+        async def task():
+            nonlocal active, peak
+            async with limiter.slot():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        async def run():
+            await asyncio.gather(*(task() for _ in range(6)))
+
+        asyncio.run(run())
+        self.assertEqual(peak, 2)
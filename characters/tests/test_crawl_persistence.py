@@ -0,0 +1,248 @@
+"""
+파서 generator → 청크 단위 저장 (characters.crawl_persistence) 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_crawl_persistence
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest.mock import AsyncMock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from accounts.tasks import crawl_character_data
+from characters.benchmarks.corpus import load_page
+from characters.crawl_persistence import _copy_text, iter_chunks, save_crawled_items
+from characters.crawler_services import InventoryParser, ParsingError, StorageParser, StreamedItems
+from characters.models import CharacterBasic, CrawlSnapshot, Inventory, Storage
+
+
+class StreamingParserTests(SimpleTestCase):
+    """generator 파서가 기존 list 파서와 같은 결과를 내는지 확인"""
+
+    def test_iter_inventory_matches_list(self):
+        html = load_page('inventory', 'full')
+
+        self.assertEqual(list(InventoryParser.iter_inventory(html)), InventoryParser.parse_inventory(html))
+
+    def test_iter_storage_matches_list(self):
+        html = load_page('storage', 'full')
+
+        self.assertEqual(list(StorageParser.iter_storage(html, 'storage')), StorageParser.parse_storage(html, 'storage'))
+
+    def test_streamed_items_reiterable(self):
+        items = StreamedItems(InventoryParser.iter_inventory, load_page('inventory', 'small'))
+
+        self.assertEqual(len(list(items)), 16)
+        self.assertEqual(len(list(items)), 16)
+
+    def test_iter_chunks(self):
+        self.assertEqual(list(iter_chunks(iter(range(5)), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(iter_chunks([], 2)), [])
+
+    def test_copy_text(self):
+        """PostgreSQL COPY text 형식 값 변환"""
+        fields = {f.name: f for f in Inventory._meta.concrete_fields}
+
+        self.assertEqual(_copy_text(fields['expiry_date'], None), r'\N')
+        self.assertEqual(_copy_text(fields['has_detail'], False), 'f')
+        self.assertEqual(_copy_text(fields['item_name'], '이름\t탭\\'), '이름\\t탭\\\\')
+        self.assertEqual(_copy_text(fields['item_options'], {'STR': '+10\n'}), '{"STR": "+10\\\\n"}')
+        self.assertEqual(
+            _copy_text(fields['crawled_at'], datetime(2026, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc)),
+            '2026-01-02T03:04:05+00:00')
+
+
+class SaveCrawledItemsTests(TestCase):
+    """청크 단위 검증/저장 테스트"""
+
+    def setUp(self):
+        self.character = CharacterBasic.objects.create(
+            ocid='persist-test',
+            character_name='저장테스트',
+            world_name='스카니아',
+            character_gender='남',
+            character_class='아크메이지(불,독)',
+        )
+        self.crawled_at = timezone.now()
+
+    def test_inventory_saved_in_chunks(self):
+        items = StreamedItems(InventoryParser.iter_inventory, load_page('inventory', 'full'))
+
+        saved_ids = save_crawled_items('inventory', self.character, items, self.crawled_at, chunk_size=50)
+
+        self.assertEqual(len(saved_ids), 480)
+        self.assertEqual(
+            sorted(saved_ids),
+            list(Inventory.objects.filter(character_basic=self.character, crawled_at=self.crawled_at)
+                 .order_by('id').values_list('id', flat=True)))
+
+    def test_storage_invalid_item_skipped(self):
+        items = StorageParser.parse_storage(load_page('storage', 'small'), 'storage')
+        items[0] = dict(items[0], quantity=-1)
+
+        saved_ids = save_crawled_items('storage', self.character, items, self.crawled_at, chunk_size=3)
+
+        self.assertEqual(len(saved_ids), len(items) - 1)
+        self.assertEqual(Storage.objects.filter(character_basic=self.character).count(), len(items) - 1)
+
+    def test_parse_error_rolls_back(self):
+        """순회 중 파싱 오류가 나면 이미 저장한 청크도 남지 않음"""
+        valid = InventoryParser.parse_inventory(load_page('inventory', 'small'))
+
+        def broken_items():
+            yield from valid
+            raise ParsingError('broken page')
+
+        with self.assertRaises(ParsingError):
+            save_crawled_items('inventory', self.character, broken_items(), self.crawled_at, chunk_size=4)
+
+        self.assertFalse(Inventory.objects.filter(character_basic=self.character).exists())
+        self.assertIsNone(CrawlSnapshot.current(self.character, 'inventory'))
+
+
+class CrawlSnapshotTests(TestCase):
+    """현재 스냅샷 포인터 테스트"""
+
+    def setUp(self):
+        self.character = CharacterBasic.objects.create(
+            ocid='snapshot-test',
+            character_name='스냅샷테스트',
+            world_name='스카니아',
+            character_gender='남',
+            character_class='아크메이지(불,독)',
+        )
+        self.items = InventoryParser.parse_inventory(load_page('inventory', 'small'))
+
+    def test_save_publishes_current_snapshot(self):
+        first_at = timezone.now()
+        second_at = first_at + timedelta(minutes=5)
+
+        save_crawled_items('inventory', self.character, self.items, first_at, content_hash='a' * 64)
+        save_crawled_items('inventory', self.character, self.items[:3], second_at)
+
+        snapshots = CrawlSnapshot.objects.filter(character_basic=self.character, kind='inventory')
+        self.assertEqual(snapshots.count(), 2)
+        current = CrawlSnapshot.current(self.character, 'inventory')
+        self.assertEqual((current.crawled_at, current.item_count, current.content_hash), (second_at, 3, ''))
+        self.assertEqual(snapshots.get(is_current=False).content_hash, 'a' * 64)
+
+    def test_current_items_follows_pointer(self):
+        """포인터가 가리키는 스냅샷의 아이템만 조회 (포인터 밖의 더 최근 행은 무시)"""
+        crawled_at = timezone.now()
+        save_crawled_items('inventory', self.character, self.items, crawled_at)
+        Inventory.objects.create(
+            character_basic=self.character, item_type='etc', item_name='미완료', quantity=1,
+            slot_position=0, crawled_at=crawled_at + timedelta(minutes=1))
+
+        items = CrawlSnapshot.current_items('inventory').filter(character_basic=self.character)
+
+        self.assertEqual(items.count(), len(self.items))
+        self.assertEqual({item.crawled_at for item in items}, {crawled_at})
+
+    def test_current_items_without_snapshot(self):
+        """스냅샷 기록이 없으면 가장 최근 crawled_at의 아이템"""
+        now = timezone.now()
+        for minutes, name in ((0, '이전'), (1, '최근'), (1, '최근2')):
+            Storage.objects.create(
+                character_basic=self.character, storage_type='storage', item_name=name, quantity=1,
+                slot_position=0, crawled_at=now + timedelta(minutes=minutes))
+
+        names = CrawlSnapshot.current_items('storage').filter(
+            character_basic=self.character).values_list('item_name', flat=True)
+
+        self.assertEqual(sorted(names), ['최근', '최근2'])
+
+
+@override_settings(CRAWLER_HISTORY_MODE='delta')
+class DeltaHistoryTests(TestCase):
+    """delta 히스토리 저장/재구성 테스트"""
+
+    def setUp(self):
+        self.character = CharacterBasic.objects.create(
+            ocid='delta-test',
+            character_name='델타테스트',
+            world_name='스카니아',
+            character_gender='남',
+            character_class='아크메이지(불,독)',
+        )
+        self.first = InventoryParser.parse_inventory(load_page('inventory', 'small'))
+        self.first_at = timezone.now()
+
+    @staticmethod
+    def _slots(rows):
+        return sorted((row.slot_position, row.item_type, row.item_name, row.quantity) for row in rows)
+
+    @staticmethod
+    def _expected(items):
+        return sorted((item['slot_position'], item['item_type'], item['item_name'], item['quantity']) for item in items)
+
+    def _snapshot(self, crawled_at):
+        return CrawlSnapshot.objects.get(character_basic=self.character, kind='inventory', crawled_at=crawled_at)
+
+    def test_only_changed_slots_written(self):
+        save_crawled_items('inventory', self.character, self.first, self.first_at)
+
+        second = [dict(item) for item in self.first[1:]]  # 첫 슬롯 제거
+        second[0]['quantity'] += 1  # 변경
+        second.append(dict(self.first[0], slot_position=99))  # 추가
+        second_at = self.first_at + timedelta(hours=1)
+        created_ids = save_crawled_items('inventory', self.character, second, second_at)
+
+        self.assertEqual(len(created_ids), 2)
+        snapshot = self._snapshot(second_at)
+        self.assertEqual(
+            (snapshot.encoding, snapshot.item_count, snapshot.rows_written, snapshot.base_crawled_at),
+            ('delta', len(second), 2, self.first_at))
+        self.assertEqual(Inventory.objects.filter(character_basic=self.character).count(), len(self.first) + 2)
+
+        # 어느 스냅샷이든 재구성
+        self.assertEqual(self._slots(self._snapshot(self.first_at).materialize()), self._expected(self.first))
+        self.assertEqual(self._slots(snapshot.materialize()), self._expected(second))
+        self.assertEqual(
+            self._slots(CrawlSnapshot.current_items('inventory').filter(character_basic=self.character)),
+            self._expected(second))
+
+    def test_unchanged_crawl_writes_no_rows(self):
+        save_crawled_items('inventory', self.character, self.first, self.first_at)
+        second_at = self.first_at + timedelta(hours=1)
+
+        created_ids = save_crawled_items('inventory', self.character, self.first, second_at)
+
+        self.assertEqual(created_ids, [])
+        self.assertEqual(Inventory.objects.filter(character_basic=self.character).count(), len(self.first))
+        self.assertEqual(self._slots(self._snapshot(second_at).materialize()), self._expected(self.first))
+
+    def test_item_details_selects_current_rows_without_detail(self):
+        """delta 저장 후 상세 크롤링 대상은 저장된 id가 아니라 현재 스냅샷에서 상세가 없는 행"""
+        save_crawled_items('inventory', self.character, self.first, self.first_at)
+        Inventory.objects.filter(character_basic=self.character, slot_position=self.first[1]['slot_position']
+                                 ).update(has_detail=True)
+        second = [dict(item) for item in self.first]
+        second[0]['quantity'] += 1  # 변경된 슬롯 1개만 새 행
+        bundle = {
+            'character_info_url': self.character.character_info_url,
+            'results': {'inventory': {'items': second, 'crawled_at': timezone.now().isoformat()}},
+            'errors': {},
+        }
+        crawl_item_details = AsyncMock(return_value={'success_count': 0, 'failed_items': [], 'total_time': 0})
+
+        with patch('accounts.tasks.CrawlerService.crawl_bundle', AsyncMock(return_value=bundle)), \
+                patch('accounts.tasks.ItemDetailCrawler.crawl_item_details', crawl_item_details):
+            result = crawl_character_data.apply(args=[self.character.ocid, ['inventory', 'item_details']]).get()
+
+        self.assertEqual(
+            (result['inventory']['item_count'], result['inventory']['rows_written']), (len(second), 1))
+        requested = crawl_item_details.call_args.args[0]
+        # 변경되지 않은 슬롯(이전 행)도 포함, 이미 상세가 있는 슬롯은 제외
+        self.assertEqual(len(requested), len(second) - 1)
+        self.assertNotIn(self.first[1]['slot_position'], [row.slot_position for row in requested])
+
+    @override_settings(CRAWLER_HISTORY_MODE='full')
+    def test_full_mode_supersedes_previous_rows(self):
+        save_crawled_items('inventory', self.character, self.first, self.first_at)
+        second_at = self.first_at + timedelta(hours=1)
+        save_crawled_items('inventory', self.character, self.first[:2], second_at)
+
+        self.assertEqual(self._snapshot(second_at).encoding, 'full')
+        self.assertEqual(self._slots(self._snapshot(self.first_at).materialize()), self._expected(self.first))
+        self.assertEqual(self._slots(self._snapshot(second_at).materialize()), self._expected(self.first[:2]))
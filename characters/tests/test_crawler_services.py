@@ -163,3 +163,254 @@ class CrawlerServiceTests(TestCase):
             inventory_url_no_query,
             "https://maplestory.nexon.com/MyMaple/Character/Detail/test123/Inventory"
         )
+
+
+class CrawlBundleTests(TestCase):
+    """CrawlerService.crawl_bundle 단위 테스트 (단일 브라우저 context 크롤링)"""
+
+    INVENTORY_HTML = """
+    <div class="inven_list">
+        <div class="inven_item_img">
+            <img src="//avatar.maplestory.nexon.com/ItemIcon/KEODIEPC.png" />
+            <h1><a href="/MyMaple/Item/Detail?itemId=12345">엘릭서&nbsp;(100개)</a></h1>
+        </div>
+    </div>
+    """
+
+    def setUp(self):
+        from contextlib import asynccontextmanager
+        from django.core.cache import cache
+
+        cache.clear()
+        self.context = AsyncMock()
+        self.pool = Mock()
+        self.context_calls = []
+
+        @asynccontextmanager
+        async def new_context(**kwargs):
+            self.context_calls.append(kwargs)
+            yield self.context
+
+        self.pool.new_context = new_context
+        patcher = patch('characters.crawler_services.get_browser_pool', return_value=self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.crawler = CrawlerService()
+        self.test_url = "https://maplestory.nexon.com/MyMaple/Character/Detail/테스트캐릭터?p=1234"
+
+    def test_crawl_bundle_single_context(self):
+        """토큰은 한 번만 조회하고 모든 페이지를 같은 context에서 크롤링"""
+        with patch.object(self.crawler, 'fetch_character_info_url', new_callable=AsyncMock) as mock_url, \
+                patch.object(self.crawler, '_fetch_inventory_page', new_callable=AsyncMock) as mock_inventory, \
+                patch.object(self.crawler, '_fetch_storage_page', new_callable=AsyncMock) as mock_storage, \
+                patch.object(self.crawler, 'crawl_character_meso', new_callable=AsyncMock) as mock_meso:
+            mock_url.return_value = self.test_url
+            mock_inventory.return_value = self.INVENTORY_HTML
+            mock_storage.return_value = '<div></div>'
+            mock_meso.return_value = {'character_name': '테스트캐릭터', 'meso': 100, 'crawled_at': 'now'}
+
+            bundle = asyncio.run(self.crawler.crawl_bundle(
+                '테스트캐릭터', ['api_data', 'inventory', 'storage', 'meso']))
+
+        shared_context = mock_url.await_args.kwargs['context']
+        mock_url.assert_awaited_once_with('테스트캐릭터', context=shared_context)
+        mock_inventory.assert_awaited_once_with(self.test_url, '테스트캐릭터', context=shared_context)
+        mock_storage.assert_awaited_once_with(self.test_url, '테스트캐릭터', context=shared_context)
+        mock_meso.assert_awaited_once_with(self.test_url, '테스트캐릭터', context=shared_context)
+        # 탭을 연 페이지가 없으므로 브라우저 context는 발급되지 않음
+        self.assertEqual(self.context_calls, [])
+
+        self.assertEqual(bundle['character_info_url'], self.test_url)
+        self.assertEqual(set(bundle['results']), {'inventory', 'storage', 'meso'})
+        self.assertEqual(bundle['results']['inventory']['character_name'], '테스트캐릭터')
+        self.assertEqual(bundle['results']['meso']['meso'], 100)
+        self.assertEqual(bundle['errors'], {})
+
+    def test_crawl_bundle_partial_failure(self):
+        """한 페이지 실패는 errors에 기록되고 나머지 결과는 유지"""
+        with patch.object(self.crawler, '_fetch_inventory_page', new_callable=AsyncMock) as mock_inventory, \
+                patch.object(self.crawler, '_fetch_storage_page', new_callable=AsyncMock) as mock_storage:
+            mock_inventory.return_value = self.INVENTORY_HTML
+            mock_storage.side_effect = CrawlingError('창고 페이지 로드 실패')
+
+            bundle = asyncio.run(self.crawler.crawl_bundle(
+                '테스트캐릭터', ['inventory', 'storage'], character_info_url=self.test_url))
+
+        self.assertIn('inventory', bundle['results'])
+        self.assertIsInstance(bundle['errors']['storage'], CrawlingError)
+
+    def test_crawl_bundle_without_page_types(self):
+        """웹 크롤링 타입이 없으면 브라우저를 사용하지 않음"""
+        bundle = asyncio.run(self.crawler.crawl_bundle('테스트캐릭터', ['api_data']))
+
+        self.assertEqual(self.context_calls, [])
+        self.assertEqual(bundle['results'], {})
+
+    def test_crawl_bundle_opens_single_context_lazily(self):
+        """Playwright 폴백 페이지들은 첫 탭에서 발급된 context 하나를 공유"""
+        async def run():
+            bundle_context = None
+
+            async def fake_fetch(url, name, context=None):
+                nonlocal bundle_context
+                bundle_context = context
+                async with self.crawler._open_page(context) as page:
+                    return self.INVENTORY_HTML
+
+            with patch.object(self.crawler, '_fetch_inventory_page', side_effect=fake_fetch), \
+                    patch.object(self.crawler, '_fetch_storage_page', side_effect=fake_fetch):
+                await self.crawler.crawl_bundle(
+                    '테스트캐릭터', ['inventory', 'storage'], character_info_url=self.test_url)
+
+        asyncio.run(run())
+
+        self.assertEqual(len(self.context_calls), 1)
+        self.assertEqual(self.context.new_page.await_count, 2)
+
+    def test_crawl_bundle_reuses_cached_url(self):
+        """유효 시간 내 캐시된 ?p= 토큰이 있으면 랭킹 조회 생략"""
+        from characters.info_url_cache import CharacterInfoUrlCache
+        CharacterInfoUrlCache.store('테스트캐릭터', self.test_url)
+
+        with patch.object(self.crawler, 'fetch_character_info_url', new_callable=AsyncMock) as mock_url, \
+                patch.object(self.crawler, '_fetch_inventory_page', new_callable=AsyncMock) as mock_inventory:
+            mock_inventory.return_value = self.INVENTORY_HTML
+
+            bundle = asyncio.run(self.crawler.crawl_bundle('테스트캐릭터', ['inventory']))
+
+        mock_url.assert_not_awaited()
+        self.assertEqual(bundle['character_info_url'], self.test_url)
+        self.assertIn('inventory', bundle['results'])
+
+    def test_crawl_bundle_retries_with_fresh_url_when_cached_url_expired(self):
+        """캐시된 토큰이 만료되면 새 토큰으로 한 번 재시도하고 만료 시점 학습"""
+        from characters.crawler_services import CharacterInfoUrlExpiredError
+        from characters.info_url_cache import CharacterInfoUrlCache
+        import time
+
+        stale_url = "https://maplestory.nexon.com/MyMaple/Character/Detail/테스트캐릭터?p=old"
+        CharacterInfoUrlCache.store('테스트캐릭터', stale_url, issued_at=time.time() - 300)
+
+        with patch.object(self.crawler, 'fetch_character_info_url', new_callable=AsyncMock) as mock_url, \
+                patch.object(self.crawler, '_fetch_inventory_page', new_callable=AsyncMock) as mock_inventory:
+            mock_url.return_value = self.test_url
+            mock_inventory.side_effect = [
+                CharacterInfoUrlExpiredError('페이지 리다이렉트'),
+                self.INVENTORY_HTML,
+            ]
+
+            bundle = asyncio.run(self.crawler.crawl_bundle('테스트캐릭터', ['inventory']))
+
+        mock_url.assert_awaited_once()
+        self.assertEqual(mock_inventory.await_args.args[0], self.test_url)
+        self.assertEqual(bundle['character_info_url'], self.test_url)
+        self.assertEqual(bundle['errors'], {})
+        self.assertIn('inventory', bundle['results'])
+        # 300초 만료 관측 → 재사용 허용 시간은 그보다 짧아짐
+        self.assertLess(CharacterInfoUrlCache.validity_window(), 300)
+
+    def test_crawl_bundle_keeps_results_when_fresh_url_lookup_fails(self):
+        """재시도용 새 토큰 조회가 실패해도 캐시 토큰으로 성공한 페이지 결과는 유지"""
+        from characters.crawler_services import CharacterInfoUrlExpiredError
+        from characters.info_url_cache import CharacterInfoUrlCache
+
+        CharacterInfoUrlCache.store('테스트캐릭터', self.test_url)
+
+        with patch.object(self.crawler, 'fetch_character_info_url', new_callable=AsyncMock) as mock_url, \
+                patch.object(self.crawler, '_fetch_inventory_page', new_callable=AsyncMock) as mock_inventory, \
+                patch.object(self.crawler, '_fetch_storage_page', new_callable=AsyncMock) as mock_storage:
+            mock_url.side_effect = CrawlingError('랭킹 페이지 로드 실패')
+            mock_inventory.return_value = self.INVENTORY_HTML
+            mock_storage.side_effect = CharacterInfoUrlExpiredError('페이지 리다이렉트')
+
+            bundle = asyncio.run(self.crawler.crawl_bundle('테스트캐릭터', ['inventory', 'storage']))
+
+        mock_url.assert_awaited_once()
+        self.assertIn('inventory', bundle['results'])
+        self.assertEqual(list(bundle['errors']), ['storage'])
+        self.assertEqual(str(bundle['errors']['storage']), '랭킹 페이지 로드 실패')
+
+
+class HttpFetchBackendTests(TestCase):
+    """fetch_backend='http' 경로 테스트 (HTTP 우선, Playwright 폴백)"""
+
+    RANKING_HTML = """
+    <div class="rank_table_wrap"><table><tbody><tr>
+        <td class="left"><dl><dt><a href="/Common/Character/Detail/테스트캐릭터?p=abcd">테스트캐릭터</a></dt></dl></td>
+    </tr></tbody></table></div>
+    """
+
+    def setUp(self):
+        self.fetcher = Mock()
+        self.fetcher.fetch_html = AsyncMock()
+        patcher = patch('characters.crawler_services.get_http_fetcher', return_value=self.fetcher)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.crawler = CrawlerService(fetch_backend='http')
+        self.crawler.request_delay = 0
+        self.test_url = "https://maplestory.nexon.com/MyMaple/Character/Detail/테스트캐릭터?p=1234"
+
+    def test_inventory_page_fetched_over_http(self):
+        """필수 요소가 있으면 브라우저 없이 HTTP 응답 사용"""
+        html = '<div class="inven_list"></div>'
+        self.fetcher.fetch_html.return_value = html
+
+        with patch.object(self.crawler, '_open_page') as mock_open_page, \
+                patch('characters.crawler_services.random.uniform', return_value=0):
+            result = asyncio.run(self.crawler._fetch_inventory_page(self.test_url, '테스트캐릭터'))
+
+        self.assertEqual(result, html)
+        mock_open_page.assert_not_called()
+        self.fetcher.fetch_html.assert_awaited_once_with(
+            "https://maplestory.nexon.com/MyMaple/Character/Detail/테스트캐릭터/Inventory?p=1234",
+            headers=None)
+
+    def test_falls_back_to_playwright_when_required_element_missing(self):
+        """필수 요소가 없으면 Playwright 경로로 폴백"""
+        self.fetcher.fetch_html.return_value = '<div class="login_wrap"></div>'
+
+        self.assertIsNone(asyncio.run(
+            self.crawler._fetch_static_html(self.test_url, 'storage')))
+
+    def test_falls_back_when_http_request_fails(self):
+        """HTTP 요청 실패 시 None 반환 (Playwright 폴백)"""
+        from characters.page_fetchers import PageFetchError
+        self.fetcher.fetch_html.side_effect = PageFetchError('HTTP 503')
+
+        self.assertIsNone(asyncio.run(
+            self.crawler._fetch_static_html(self.test_url, 'meso')))
+
+    def test_playwright_backend_skips_http(self):
+        """fetch_backend='playwright'이면 HTTP 요청을 하지 않음"""
+        crawler = CrawlerService(fetch_backend='playwright')
+
+        self.assertIsNone(asyncio.run(crawler._fetch_static_html(self.test_url, 'inventory')))
+        self.fetcher.fetch_html.assert_not_awaited()
+
+    def test_character_info_url_fetched_over_http(self):
+        """랭킹 페이지 HTML에서 캐릭터 링크 추출"""
+        self.fetcher.fetch_html.side_effect = ['랭킹정보가 없습니다', self.RANKING_HTML]
+
+        result = asyncio.run(self.crawler.fetch_character_info_url('테스트캐릭터'))
+
+        self.assertEqual(
+            result, "https://maplestory.nexon.com/Common/Character/Detail/테스트캐릭터?p=abcd")
+        self.assertEqual(self.fetcher.fetch_html.await_count, 2)
+
+    def test_character_not_found_over_http(self):
+        """랭킹 페이지를 정상 수신했지만 캐릭터가 없으면 CrawlingError"""
+        self.fetcher.fetch_html.return_value = self.RANKING_HTML
+
+        with self.assertRaises(CrawlingError):
+            asyncio.run(self.crawler.fetch_character_info_url('다른캐릭터'))
+
+    def test_redirect_raises_expired_url_error(self):
+        """리다이렉트 응답은 Playwright로 폴백하지 않고 토큰 만료로 처리"""
+        from characters.crawler_services import CharacterInfoUrlExpiredError
+        from characters.page_fetchers import PageFetchError
+        self.fetcher.fetch_html.side_effect = PageFetchError('리다이렉트', status=200, redirected=True)
+
+        with self.assertRaises(CharacterInfoUrlExpiredError):
+            asyncio.run(self.crawler._fetch_static_html(self.test_url, 'inventory'))
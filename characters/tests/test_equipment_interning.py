@@ -0,0 +1,100 @@
+"""
+장비/장비 옵션 content_hash 재사용 (characters.interning) 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_equipment_interning
+"""
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from characters.interning import content_digest
+from characters.migrations import _helpers as migration_helpers
+from characters.models import ItemAddOption, ItemEquipment, ItemTotalOption
+
+
+def equipment_data(name, starforce='22', total_str='100'):
+    return {
+        'item_equipment_part': '모자',
+        'item_equipment_slot': '모자',
+        'item_name': name,
+        'item_icon': 'https://example.com/icon.png',
+        'starforce': starforce,
+        'date_expire': '2026-01-01T00:00:00Z',
+        'item_total_option': {'str': total_str, 'dex': '0', 'equipment_level_decrease': 0},
+        'item_base_option': {'str': '40', 'base_equipment_level': 160},
+        'item_exceptional_option': None,
+        'item_add_option': {'str': '30'},
+        'item_etc_option': {'str': '20'},
+        'item_starforce_option': {'str': '10'},
+    }
+
+
+class ContentDigestTests(SimpleTestCase):
+    """해시 정규화 테스트"""
+
+    def test_equivalent_values_same_hash(self):
+        base = content_digest(ItemTotalOption, {'str': '10', 'equipment_level_decrease': 5})
+
+        self.assertEqual(base, content_digest(ItemTotalOption, {'str': '10', 'dex': None, 'equipment_level_decrease': '5'}))
+        self.assertNotEqual(base, content_digest(ItemTotalOption, {'str': '11', 'equipment_level_decrease': 5}))
+        self.assertNotEqual(base, content_digest(ItemTotalOption, {'str': '10', 'dex': '', 'equipment_level_decrease': 5}))
+
+    def test_datetime_normalized_to_utc(self):
+        values = {'item_name': '모자', 'date_expire': '2026-01-01T09:00:00+09:00'}
+
+        self.assertEqual(
+            content_digest(ItemEquipment, values),
+            content_digest(ItemEquipment, dict(values, date_expire='2026-01-01T00:00:00Z')))
+
+    def test_migration_digest_matches(self):
+        """백필 마이그레이션의 고정 해시가 현재 저장 해시와 같아야 기존 행이 재사용됨"""
+        values = {'item_name': '모자', 'starforce': '22', 'date_expire': '2026-01-01T09:00:00+09:00',
+                  'item_total_option': 'a' * 64}
+        options = {'str': '10', 'equipment_level_decrease': '5'}
+
+        self.assertEqual(
+            migration_helpers.content_digest(ItemTotalOption, options), content_digest(ItemTotalOption, options))
+        self.assertEqual(
+            migration_helpers.content_digest(ItemEquipment, values), content_digest(ItemEquipment, values))
+
+
+class BulkCreateFromDataTests(TestCase):
+    """ItemEquipment.bulk_create_from_data 묶음 저장 테스트"""
+
+    def test_reuses_rows_across_calls(self):
+        first = ItemEquipment.bulk_create_from_data([equipment_data('모자A'), equipment_data('모자B')])
+        second = ItemEquipment.bulk_create_from_data([equipment_data('모자B'), equipment_data('모자A')])
+
+        self.assertEqual([item.pk for item in second], [first[1].pk, first[0].pk])
+        self.assertEqual(ItemEquipment.objects.count(), 2)
+        self.assertEqual(ItemTotalOption.objects.count(), 1)  # 두 장비가 같은 옵션 행 공유
+        self.assertIsNone(first[0].item_exceptional_option)
+        self.assertEqual(first[0].item_add_option.str, '30')
+
+    def test_option_difference_separate_equipment(self):
+        """옵션만 다른 장비는 기존 행을 덮어쓰지 않고 새 행"""
+        original, = ItemEquipment.bulk_create_from_data([equipment_data('모자A')])
+        changed, = ItemEquipment.bulk_create_from_data([equipment_data('모자A', total_str='120')])
+
+        self.assertNotEqual(original.pk, changed.pk)
+        original.refresh_from_db()
+        self.assertEqual(original.item_total_option.str, '100')
+        self.assertEqual(changed.item_total_option.str, '120')
+
+    def test_query_count_independent_of_item_count(self):
+        ItemEquipment.bulk_create_from_data([equipment_data('준비')])
+
+        with CaptureQueriesContext(connection) as small:
+            ItemEquipment.bulk_create_from_data([equipment_data('모자0', starforce='0')])
+        with CaptureQueriesContext(connection) as large:
+            ItemEquipment.bulk_create_from_data([equipment_data(f'모자{i}', starforce=str(i)) for i in range(1, 25)])
+
+        self.assertEqual(len(large), len(small))
+        self.assertLessEqual(len(large), 25)
+        self.assertEqual(ItemEquipment.objects.count(), 26)
+
+    def test_duplicates_in_one_call(self):
+        items = ItemEquipment.bulk_create_from_data([equipment_data('모자A')] * 3)
+
+        self.assertEqual(len({item.pk for item in items}), 1)
+        self.assertEqual(ItemAddOption.objects.count(), 1)
@@ -126,6 +126,40 @@ class ExpiryDateParserTests(TestCase):
         self.assertIn("2025-01-15", iso_string)
         self.assertIn("12:30", iso_string)
 
+    def test_parse_expiry_date_format_priority(self):
+        """앞에 숫자 날짜가 있어도 한국어 날짜+시간 형식 우선"""
+        result = ExpiryDateParser.parse_expiry_date(
+            "<span>2024.01.01</span> 기간: 2025년 12월 31일 23시 59분까지")
+
+        self.assertEqual((result.year, result.month, result.day, result.hour), (2025, 12, 31, 23))
+
+    def test_parse_expiry_date_invalid_falls_back_to_next_format(self):
+        """잘못된 날짜(13월)는 건너뛰고 다음 형식 사용"""
+        result = ExpiryDateParser.parse_expiry_date("2025년 13월 1일 1시 1분 / 2025.06.15")
+
+        self.assertEqual((result.year, result.month, result.day), (2025, 6, 15))
+
+    def test_parse_expiry_date_ignores_attribute_values(self):
+        """태그 속성값(이미지 URL 등)의 숫자는 만료일로 보지 않음"""
+        html = '<img src="https://example.com/2025-12-31/item.png"/><span>일반 아이템</span>'
+
+        self.assertIsNone(ExpiryDateParser.parse_expiry_date(html))
+
+    def test_parse_many(self):
+        """일괄 추출: 입력 순서 유지, 없는 항목은 None"""
+        results = ExpiryDateParser.parse_many([
+            "<span>2025년 6월 15일</span>",
+            None,
+            "<span>일반 아이템</span>",
+            "<span>2025년 6월 15일</span>",
+        ])
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[0].day, 15)
+        self.assertIsNone(results[1])
+        self.assertIsNone(results[2])
+        self.assertEqual(results[3], results[0])
+
 
 class CalculateDaysUntilExpiryTests(TestCase):
     """calculate_days_until_expiry 함수 테스트 (AC 2.6.4)"""
@@ -471,3 +505,72 @@ class StorageParserExpiryDateTests(TestCase):
 
         # 결과 확인 (아이템이 파싱되었다면)
         self.assertIsInstance(items, list)
+
+    def test_storage_expiry_from_date_element_only(self):
+        """AC 2.6.1: 이름/설명의 날짜는 무시하고 만료일 영역(class="date")만 파싱"""
+        html_content = """
+        <li><div class="inven_item_img"><img src="//example.com/a.png"/>
+            <h1><a href="/item/1">2024.01.01 기념 훈장</a></h1>
+            <p>2024년 3월 1일 이벤트 보상</p>
+            <span class="date">2025년 6월 15일 12시 0분까지 사용가능</span>
+        </div></li>
+        <li><div class="inven_item_img"><img src="//example.com/b.png"/>
+            <h1><a href="/item/2">2023.05.05 기념 의자</a></h1>
+        </div></li>
+        """
+
+        items = StorageParser.parse_storage(html_content, 'storage')
+
+        self.assertEqual(len(items), 2)
+        self.assertEqual((items[0]['expiry_date'].year, items[0]['expiry_date'].month,
+                          items[0]['expiry_date'].hour), (2025, 6, 12))
+        self.assertIsNone(items[1]['expiry_date'])
+
+
+class ExpiryTextExtractionTests(TestCase):
+    """만료일 영역 추출 및 묶음 파싱 테스트"""
+
+    def test_extract_expiry_text(self):
+        self.assertEqual(
+            ExpiryDateParser.extract_expiry_text('<li>2024.01.01 훈장<p class="item date">2025.06.15 까지</p></li>'),
+            '2025.06.15 까지')
+        # class="date"가 없으면 기간/만료 문구 조각 (+ 다음 조각)
+        self.assertEqual(
+            ExpiryDateParser.extract_expiry_text('<li><a>2024.01.01 훈장</a><dt>기간</dt><dd>2025.06.15</dd></li>'),
+            '기간 2025.06.15')
+        # '기간제'는 아이템 이름일 수 있으므로 만료 문구로 보지 않음
+        self.assertIsNone(ExpiryDateParser.extract_expiry_text('<a>기간제 2024.01.01 훈장</a>'))
+        self.assertIsNone(ExpiryDateParser.extract_expiry_text(None))
+
+    def test_inventory_ignores_dates_outside_expiry(self):
+        """인벤토리도 아이템 설명의 날짜는 만료일로 읽지 않음"""
+        html_content = """
+        <div class="inven_list">
+            <div class="inven_item_img"><img src="//example.com/a.png"/></div>
+            <div class="inven_item_memo">
+                <div class="inven_item_memo_title"><h1><a href="/item/1">훈장</a></h1></div>
+                <p>2024년 3월 1일 이벤트 보상</p>
+            </div>
+            <div class="inven_item_img"><img src="//example.com/b.png"/></div>
+            <div class="inven_item_memo">
+                <div class="inven_item_memo_title"><h1><a href="/item/2">의자</a></h1></div>
+                <p>2024년 3월 1일 이벤트 보상</p>
+                <p class="date">2026.02.01 까지</p>
+            </div>
+        </div>
+        """
+
+        items = InventoryParser.parse_inventory(html_content)
+
+        self.assertIsNone(items[0]['expiry_date'])
+        self.assertEqual((items[1]['expiry_date'].year, items[1]['expiry_date'].month), (2026, 2))
+
+    def test_fill_expiry_dates_batches_parse_many(self):
+        """fill_expiry_dates는 batch_size개씩 parse_many로 파싱하고 입력 순서 유지"""
+        pairs = [({'slot_position': i, 'expiry_date': None}, f'2025.01.{i + 1:02d} 까지') for i in range(5)]
+
+        with patch.object(ExpiryDateParser, 'parse_many', wraps=ExpiryDateParser.parse_many) as parse_many:
+            items = list(ExpiryDateParser.fill_expiry_dates(pairs, batch_size=2))
+
+        self.assertEqual(parse_many.call_count, 3)
+        self.assertEqual([item['expiry_date'].day for item in items], [1, 2, 3, 4, 5])
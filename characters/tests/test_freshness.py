@@ -0,0 +1,50 @@
+"""
+characters.freshness 공개 주기 기반 신선도 정책 단위 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_freshness
+"""
+from datetime import datetime, time, timedelta
+
+from django.test import TestCase
+
+from characters.freshness import HISTORICAL_TTL, KST, FreshnessPolicy
+
+
+def kst(*args):
+    return KST.localize(datetime(*args))
+
+
+class FreshnessPolicyTests(TestCase):
+    """FreshnessPolicy 테스트 (기본 공개 시각 01:00 KST, 여유 10분)"""
+
+    def setUp(self):
+        self.policy = FreshnessPolicy(
+            publish_times={'character/item-equipment': '03:30'},
+            default_publish_time=time(1, 0),
+            safety_margin=timedelta(minutes=10),
+        )
+
+    def test_last_and_next_publish(self):
+        """공개 시각 이전/이후 기준 마지막/다음 공개 시각"""
+        self.assertEqual(self.policy.last_publish(now=kst(2025, 1, 2, 0, 30)), kst(2025, 1, 1, 1, 10))
+        self.assertEqual(self.policy.next_publish(now=kst(2025, 1, 2, 0, 30)), kst(2025, 1, 2, 1, 10))
+        self.assertEqual(self.policy.last_publish(now=kst(2025, 1, 2, 12, 0)), kst(2025, 1, 2, 1, 10))
+        self.assertEqual(self.policy.next_publish(now=kst(2025, 1, 2, 12, 0)), kst(2025, 1, 3, 1, 10))
+
+    def test_endpoint_specific_publish_time(self):
+        """엔드포인트별 공개 시각 적용"""
+        now = kst(2025, 1, 2, 2, 0)
+        self.assertEqual(self.policy.last_publish('character/item-equipment', now), kst(2025, 1, 1, 3, 40))
+        self.assertEqual(self.policy.last_publish('character/basic', now), kst(2025, 1, 2, 1, 10))
+
+    def test_ttl_until_next_publish(self):
+        """TTL은 다음 공개 시각(+여유)까지"""
+        self.assertEqual(self.policy.ttl_seconds(now=kst(2025, 1, 2, 1, 0)), 600)
+        self.assertEqual(self.policy.ttl_seconds(now=kst(2025, 1, 2, 1, 10)), 24 * 3600)
+
+    def test_ttl_for_historical_date(self):
+        """이미 확정된 과거 날짜는 긴 TTL, 아직 공개 전인 날짜는 다음 공개까지"""
+        now = kst(2025, 1, 2, 12, 0)
+        self.assertEqual(self.policy.ttl_seconds(target_date='2024-12-31', now=now),
+                         int(HISTORICAL_TTL.total_seconds()))
+        self.assertEqual(self.policy.ttl_seconds(target_date='2025-01-02', now=now), 13 * 3600 + 600)
@@ -0,0 +1,58 @@
+"""
+CharacterInfoUrlCache 단위 테스트 (?p= 토큰 재사용 및 유효 시간 학습)
+
+테스트 실행: uv run python manage.py test characters.tests.test_info_url_cache
+"""
+import time
+from django.core.cache import cache
+from django.test import TestCase
+
+from characters.info_url_cache import CharacterInfoUrlCache
+
+URL = 'https://maplestory.nexon.com/MyMaple/Character/Detail/테스트캐릭터?p=1234'
+
+
+class CharacterInfoUrlCacheTests(TestCase):
+    """토큰 캐시 재사용/만료 학습 테스트"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_fresh_url_reused(self):
+        CharacterInfoUrlCache.store('테스트캐릭터', URL)
+
+        self.assertEqual(CharacterInfoUrlCache.get_valid('테스트캐릭터'), URL)
+        # 캐릭터 이름 대소문자 무시
+        self.assertEqual(CharacterInfoUrlCache.get_valid('테스트캐릭터'.upper()), URL)
+
+    def test_url_older_than_window_not_reused(self):
+        CharacterInfoUrlCache.store(
+            '테스트캐릭터', URL, issued_at=time.time() - CharacterInfoUrlCache.DEFAULT_VALIDITY - 1)
+
+        self.assertIsNone(CharacterInfoUrlCache.get_valid('테스트캐릭터'))
+
+    def test_success_extends_window(self):
+        """오래된 토큰으로 성공하면 재사용 허용 시간이 늘어남"""
+        CharacterInfoUrlCache.store('테스트캐릭터', URL, issued_at=time.time() - 500)
+        CharacterInfoUrlCache.mark_valid('테스트캐릭터')
+
+        self.assertGreaterEqual(CharacterInfoUrlCache.validity_window(), 500 * CharacterInfoUrlCache.GROWTH_FACTOR)
+
+    def test_expiry_caps_window_and_drops_entry(self):
+        """만료 관측 시 허용 시간이 만료 나이의 안전 비율로 제한되고 캐시 삭제"""
+        CharacterInfoUrlCache.store('테스트캐릭터', URL, issued_at=time.time() - 400)
+        CharacterInfoUrlCache.mark_invalid('테스트캐릭터')
+
+        self.assertAlmostEqual(
+            CharacterInfoUrlCache.validity_window(), 400 * CharacterInfoUrlCache.SAFETY_FACTOR, delta=1)
+        self.assertIsNone(CharacterInfoUrlCache.get_valid('테스트캐릭터'))
+
+    def test_revocation_younger_than_known_valid_age_ignored(self):
+        """이미 더 오래된 토큰이 유효했던 경우 만료 나이로 학습하지 않음"""
+        CharacterInfoUrlCache.store('테스트캐릭터', URL, issued_at=time.time() - 500)
+        CharacterInfoUrlCache.mark_valid('테스트캐릭터')
+
+        CharacterInfoUrlCache.store('테스트캐릭터', URL, issued_at=time.time() - 100)
+        CharacterInfoUrlCache.mark_invalid('테스트캐릭터')
+
+        self.assertGreaterEqual(CharacterInfoUrlCache.validity_window(), 500)
@@ -130,3 +130,50 @@ class TestInventoryParsingFix(TestCase):
         assert items[0]['item_name'] == '주황버섯의 모자'
         assert items[0]['quantity'] == 1
         assert items[0]['item_options'] is None  # 옵션 없음
+
+    def test_item_fields_do_not_leak_between_items(self):
+        """아이템별 노드 범위 파싱: 다음 아이템의 희귀도/만료일이 섞이지 않음"""
+        html = """
+        <div class="inven_list"><ul>
+            <li>
+                <div class="inven_item_img"><img src="https://avatar.maplestory.nexon.com/ItemIcon/A.png"/></div>
+                <div class="inven_item_memo">
+                    <div class="inven_item_memo_title"><h1><a href="/Common/Resource/Item?p=1">일반 아이템</a></h1></div>
+                </div>
+            </li>
+            <li>
+                <div class="inven_item_img"><img src="https://avatar.maplestory.nexon.com/ItemIcon/B.png"/></div>
+                <div class="inven_item_memo">
+                    <div class="inven_item_memo_title"><h1><a href="/Common/Resource/Item?p=2">기간제 아이템</a></h1></div>
+                    <div class="item_memo_sel">에픽아이템</div>
+                    <span>기간: 2025년 12월 31일 23시 59분까지</span>
+                </div>
+            </li>
+        </ul></div>
+        """
+
+        items = InventoryParser.parse_inventory(html)
+
+        assert len(items) == 2
+        assert items[0]['item_options'] is None
+        assert items[0]['expiry_date'] is None
+        assert items[1]['item_options'] == {'rarity': '에픽아이템'}
+        assert items[1]['expiry_date'].year == 2025
+        assert items[1]['detail_url'] == 'https://maplestory.nexon.com/Common/Resource/Item?p=2'
+
+    def test_item_type_per_tab_and_empty_tab(self):
+        """탭 순서대로 item_type 지정, 빈 탭 안내 문구는 아이템으로 취급하지 않음"""
+        tab = """
+        <div class="inven_list">
+            <div class="inven_item_img"><img src="https://avatar.maplestory.nexon.com/ItemIcon/{0}.png"/></div>
+            <div class="inven_item_memo_title"><h1><a href="/item/{0}">{0}</a></h1></div>
+        </div>
+        """
+        empty_tab = '<div class="inven_list"><div class="inven_item_img"></div><p>아이템이 없습니다.</p></div>'
+        html = tab.format('장비') + empty_tab + tab.format('기타')
+
+        items = InventoryParser.parse_inventory(html)
+
+        assert [(item['item_name'], item['item_type']) for item in items] == [
+            ('장비', 'equips'), ('기타', 'miscs')]
+        assert [item['slot_position'] for item in items] == [0, 1]
@@ -17,27 +17,34 @@ from accounts.models import Character
 class ItemDetailParserTests(TestCase):
     """ItemDetailParser 단위 테스트 (Story 2.3 Phase 6)"""
 
+    @staticmethod
+    def _stet_info_html(*rows):
+        """stet_info 영역 HTML (rows: (라벨 HTML, 값 HTML))"""
+        items = ''.join(
+            f'<li><div class="stet_th">{label}</div><div class="point_td">{value}</div></li>'
+            for label, value in rows)
+        return f'<div class="item_memo"><div class="stet_info"><ul>{items}</ul></div></div>'
+
     def test_parse_base_stats(self):
         """AC-2.3.10: 기본 스탯 파싱"""
-        span_data = {
-            '공격력': ['+171'],
-            '마력': ['+283'],
-            'STR': ['+0'],
-            'DEX': ['+0'],
-            'INT': ['+150'],
-            'LUK': ['+0'],
-            'MaxHP': ['+300'],
-            'MaxMP': ['+500'],
-            '방어력': ['+200'],
-            '올스탯': ['+9%'],
-            '보스 몬스터 공격 시 데미지': ['+30%'],
-            '몬스터 방어율 무시': ['+15%']
-        }
+        html = self._stet_info_html(
+            ('<span>공격력</span>', '+171'),
+            ('<span>마력</span>', '+283'),
+            ('<span>STR</span>', '+0'),
+            ('<span>INT</span>', '+150'),
+            ('<span>MaxHP</span>', '+300'),
+            ('<span>MaxMP</span>', '+500'),
+            ('<span>물리방어력</span>', '+200'),
+            ('<span>올스탯</span>', '+9%'),
+            ('<span>보스 몬스터 공격 시 데미지</span>', '+30%'),
+            ('<span>몬스터 방어율 무시</span>', '+15%'),
+        )
 
-        stats = ItemDetailParser._parse_base_stats(span_data)
+        stats = ItemDetailParser.parse_detail_page(html, '테스트무기')
 
         self.assertEqual(stats['attack_power'], 171)
         self.assertEqual(stats['magic_power'], 283)
+        self.assertEqual(stats['str_stat'], 0)
         self.assertEqual(stats['int_stat'], 150)
         self.assertEqual(stats['hp_stat'], 300)
         self.assertEqual(stats['mp_stat'], 500)
@@ -48,12 +55,10 @@ class ItemDetailParserTests(TestCase):
 
     def test_parse_potential(self):
         """AC-2.3.11: 잠재능력 파싱"""
-        span_data = {
-            '잠재옵션 등급': '유니크',
-            '아이템': ['INT +9%', '마력 +9%', '보스 공격력 +30%']
-        }
+        html = self._stet_info_html(
+            ('<span>잠재옵션</span><em>(유니크)</em>', 'INT +9%<br/>마력 +9%<br/>보스 공격력 +30%'))
 
-        potential = ItemDetailParser._parse_potential(span_data)
+        potential = ItemDetailParser.parse_detail_page(html, '테스트무기')
 
         self.assertEqual(potential['potential_grade'], '유니크')
         self.assertEqual(potential['potential_option_1'], 'INT +9%')
@@ -62,25 +67,22 @@ class ItemDetailParserTests(TestCase):
 
     def test_parse_additional_potential(self):
         """AC-2.3.12: 에디셔널 잠재능력 파싱"""
-        span_data = {
-            '에디셔널 잠재옵션 등급': '에픽',
-            '에디셔널 아이템': ['INT +5%', '마력 +5%', 'HP +100']
-        }
+        html = self._stet_info_html(
+            ('<span>에디셔널 잠재옵션</span><em>(에픽)</em>', 'INT +5%<br/>마력 +5%<br/>HP +100'))
 
-        additional = ItemDetailParser._parse_additional_potential(span_data)
+        additional = ItemDetailParser.parse_detail_page(html, '테스트무기')
 
         self.assertEqual(additional['additional_potential_grade'], '에픽')
         self.assertEqual(additional['additional_potential_option_1'], 'INT +5%')
         self.assertEqual(additional['additional_potential_option_2'], '마력 +5%')
         self.assertEqual(additional['additional_potential_option_3'], 'HP +100')
+        self.assertNotIn('potential_grade', additional)
 
     def test_parse_soul_option(self):
         """AC-2.3.13: 소울 옵션 파싱"""
-        span_data = {
-            '소울옵션': '매그너스의 소울 : STR +7%, DEX +7%'
-        }
+        html = self._stet_info_html(('<span>매그너스의 소울</span>', 'STR +7%, DEX +7%'))
 
-        soul = ItemDetailParser._parse_soul_option(span_data)
+        soul = ItemDetailParser.parse_detail_page(html, '테스트무기')
 
         self.assertEqual(soul['soul_name'], '매그너스의 소울')
         self.assertEqual(soul['soul_option'], 'STR +7%, DEX +7%')
@@ -135,6 +137,72 @@ class ItemDetailParserTests(TestCase):
         self.assertEqual(result['magic_power'], 283)
         self.assertEqual(result['potential_grade'], '유니크')
 
+    DETAIL_HTML = """
+    <div class="item_memo">
+        <div class="item_title"><h1>아케인셰이드 스태프</h1></div>
+        <div class="ablilty02"><span>장비분류</span><em> 스태프 </em></div>
+        <div class="ablilty02"><span>착용 가능한 직업</span><em>마법사</em></div>
+        <div class="ablilty01"><ul>
+            <li><span>REQ LEV</span><em>200</em></li>
+            <li><span>REQ INT</span><em>600</em></li>
+        </ul></div>
+        <div class="stet_info"><ul>
+            <li><div class="stet_th"><span>INT</span></div>
+                <div class="point_td">+150 <span>(100 + 20 + 30)</span></div></li>
+            <li><div class="stet_th"><span>마력</span></div><div class="point_td">+283</div></li>
+            <li><div class="stet_th"><span>몬스터 방어율 무시</span></div><div class="point_td">+20%</div></li>
+            <li><div class="stet_th"><span><font color="#e3d04d">잠재옵션</font></span></div>
+                <div class="point_td">INT : +9%<br/>마력 : +9%</div></li>
+            <li><div class="stet_th"><span>에디셔널 잠재옵션</span><em>(에픽)</em></div>
+                <div class="point_td">해당 사항이 없습니다.</div></li>
+            <li><div class="stet_th"><span>매그너스의 소울</span></div><div class="point_td">INT : +7%</div></li>
+            <li><div class="stet_th"><span>기타</span></div>
+                <div class="point_td">22성 강화<br/>25성까지 강화 가능<br/>교환 불가</div></li>
+        </ul></div>
+    </div>
+    """
+
+    def test_parse_detail_page_structured(self):
+        """상세 페이지 구조(ablilty/stet_info) 파싱"""
+        result = ItemDetailParser.parse_detail_page(self.DETAIL_HTML, '아케인셰이드 스태프')
+
+        self.assertEqual(result['item_category'], '스태프')
+        self.assertEqual(result['required_job'], '마법사')
+        self.assertEqual(result['required_level'], 200)
+        self.assertEqual(result['required_int'], 600)
+        self.assertEqual(result['int_stat'], 150)
+        self.assertEqual(result['int_breakdown'], {'total': 150, 'base': 100, 'bonus': 20, 'scroll': 30})
+        self.assertEqual(result['magic_power'], 283)
+        self.assertNotIn('magic_breakdown', result)
+        self.assertEqual(result['ignore_defense'], 20)
+        self.assertEqual(result['potential_grade'], '유니크')
+        self.assertEqual(result['potential_option_1'], 'INT : +9%')
+        self.assertEqual(result['potential_option_2'], '마력 : +9%')
+        self.assertNotIn('additional_potential_grade', result)
+        self.assertEqual(result['soul_name'], '매그너스의 소울')
+        self.assertEqual(result['soul_option'], 'INT : +7%')
+        self.assertEqual(result['star_force'], 22)
+        self.assertEqual(result['max_star_force'], 25)
+        self.assertEqual(result['etc_info'], ['교환 불가'])
+
+    def test_grade_from_attribute_and_text(self):
+        """등급: 속성의 색상 코드 우선, 없으면 텍스트의 등급 이름"""
+        from characters.html_parsing import parse_html
+
+        by_color = parse_html('<div class="stet_th"><font color="#00FF00">잠재옵션</font> (유니크)</div>')
+        by_text = parse_html('<div class="stet_th">잠재옵션 (에픽)</div>')
+
+        self.assertEqual(ItemDetailParser._extract_grade(by_color), '레전드리')
+        self.assertEqual(ItemDetailParser._extract_grade(by_text), '에픽')
+
+    def test_parse_many(self):
+        """일괄 파싱은 입력 순서대로 결과 반환 (실패한 페이지는 None)"""
+        with patch.object(ItemDetailParser, 'parse_detail_page',
+                          side_effect=[{'star_force': 1}, ParsingError('bad'), {'star_force': 2}]):
+            results = ItemDetailParser.parse_many([('a', '1'), ('b', '2'), ('c', '3')])
+
+        self.assertEqual(results, [{'star_force': 1}, None, {'star_force': 2}])
+
 
 class ItemDetailCrawlerTests(TestCase):
     """ItemDetailCrawler 통합 테스트 (Story 2.3 Phase 6)"""
@@ -181,3 +249,89 @@ class ItemDetailCrawlerTests(TestCase):
         self.assertLessEqual(crawler.request_delay_max, 3.0)
         self.assertEqual(crawler.batch_size, 50)
         self.assertEqual(crawler.batch_rest_time, 30)
+
+
+
+class ItemDetailCrawlerConcurrencyTests(TestCase):
+    """ItemDetailCrawler 동시 모드 테스트 (토큰 버킷 + 적응형 동시성)"""
+
+    def _make_items(self, count):
+        items = []
+        for slot in range(count):
+            item = MagicMock()
+            item.item_name = f'테스트 아이템 {slot}'
+            item.detail_url = f'https://maplestory.nexon.com/Common/Resource/Item?p={slot}'
+            items.append(item)
+        return items
+
+    def test_concurrent_crawl_saves_all_items(self):
+        """동시 모드: 모든 아이템 크롤링/저장 및 진행률 콜백"""
+        import asyncio
+
+        crawler = ItemDetailCrawler()
+        crawler.concurrency = 3
+        crawler.requests_per_second = 1000
+        items = self._make_items(5)
+        progress = []
+
+        with patch.object(crawler, '_fetch_detail_page', new_callable=AsyncMock, return_value='<div></div>'), \
+                patch.object(ItemDetailParser, 'parse_detail_page', return_value={'item_name': 'x'}), \
+                patch.object(crawler, '_save_item_detail', new_callable=AsyncMock) as mock_save:
+            result = asyncio.run(crawler.crawl_item_details(
+                items, progress_callback=lambda current, total: progress.append((current, total))))
+
+        self.assertEqual(result['success_count'], 5)
+        self.assertEqual(result['failed_items'], [])
+        self.assertEqual(mock_save.await_count, 5)
+        self.assertEqual(progress[-1], (5, 5))
+
+    def test_concurrent_crawl_retries_after_throttle(self):
+        """동시 모드: 429 응답 시 백오프 후 재시도"""
+        import asyncio
+        from characters.crawler_services import CrawlThrottledError
+
+        crawler = ItemDetailCrawler()
+        crawler.concurrency = 2
+        crawler.requests_per_second = 1000
+
+        fetch = AsyncMock(side_effect=[CrawlThrottledError('HTTP 429', status=429), '<div></div>'])
+
+        with patch.object(crawler, '_fetch_detail_page', fetch), \
+                patch.object(ItemDetailParser, 'parse_detail_page', return_value={'item_name': 'x'}), \
+                patch.object(crawler, '_save_item_detail', new_callable=AsyncMock), \
+                patch('characters.crawler_services.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = asyncio.run(crawler.crawl_item_details(self._make_items(1)))
+
+        self.assertEqual(result['success_count'], 1)
+        self.assertEqual(fetch.await_count, 2)
+        # 백오프 대기 (2초 이상) 1회
+        backoffs = [c.args[0] for c in mock_sleep.await_args_list if c.args[0] >= 2]
+        self.assertEqual(len(backoffs), 1)
+
+    def test_concurrent_crawl_parses_pages_in_chunks(self):
+        """동시 모드: 받아 온 페이지를 parse_chunk_size개씩 묶어 파싱 실행기 map()으로 파싱"""
+        import asyncio
+        from characters.parse_executor import ParseExecutor
+
+        crawler = ItemDetailCrawler()
+        crawler.concurrency = 3
+        crawler.requests_per_second = 1000
+        crawler.parse_chunk_size = 2
+
+        def parse(html_content, item_name):
+            if item_name.endswith('3'):
+                raise ParsingError('broken page')
+            return {'item_name': item_name}
+
+        with patch.object(crawler, '_fetch_detail_page', new_callable=AsyncMock, return_value='<div></div>'), \
+                patch.object(ItemDetailParser, 'parse_detail_page', side_effect=parse), \
+                patch.object(ParseExecutor, 'map', autospec=True, side_effect=ParseExecutor.map) as mock_map, \
+                patch.object(crawler, '_save_item_detail', new_callable=AsyncMock) as mock_save:
+            result = asyncio.run(crawler.crawl_item_details(self._make_items(5)))
+
+        batch_sizes = [len(call.args[2]) for call in mock_map.call_args_list]
+        self.assertEqual(sum(batch_sizes), 5)
+        self.assertLessEqual(max(batch_sizes), 2)
+        self.assertEqual(result['success_count'], 4)
+        self.assertEqual(result['failed_items'], ['테스트 아이템 3'])
+        self.assertEqual(mock_save.await_count, 4)
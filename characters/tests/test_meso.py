@@ -192,6 +192,46 @@ class MesoParserTests(TestCase):
 
         self.assertEqual(amount, 999999)
 
+    def test_parse_character_meso_xpath_fallback(self):
+        """정규식에 안 걸리는 라벨('보유 메소')은 XPath fallback으로 다음 셀 값 파싱"""
+        html_content = """
+        <table>
+            <tr><th>인기도</th><td>1,234</td></tr>
+            <tr><th>보유 메소</th><td><em>777</em></td></tr>
+        </table>
+        """
+
+        self.assertEqual(MesoParser.parse_character_meso(html_content), 777)
+
+    def test_parse_storage_meso_number_before_label(self):
+        """창고 메소: '5,000 메소' 형식"""
+        html_content = '<div class="meso"><span>5,000 메소</span></div>'
+
+        self.assertEqual(MesoParser.parse_storage_meso(html_content), 5000)
+
+    def test_parse_storage_meso_area_fallback_reuses_root(self):
+        """라벨이 없으면 메소 영역 위치에서 파싱 (이미 파싱한 트리 재사용)"""
+        from characters.html_parsing import parse_html
+
+        html_content = """
+        <div id="container"><div class="con_wrap"><div class="contents_wrap">
+            <div><div><div><div><span>3,210</span></div></div></div></div>
+        </div></div></div>
+        """
+        root = parse_html(html_content)
+
+        with patch('characters.crawler_services.parse_html') as mock_parse:
+            amount = MesoParser.parse_storage_meso(html_content, root=root)
+
+        self.assertEqual(amount, 3210)
+        mock_parse.assert_not_called()
+
+    def test_parse_storage_meso_ignores_unrelated_numbers(self):
+        """메소 라벨/영역이 없으면 다른 숫자(수량 등)를 메소로 반환하지 않음"""
+        html_content = '<ul><li><span>아이템</span><span>150</span></li></ul>'
+
+        self.assertIsNone(MesoParser.parse_storage_meso(html_content))
+
 
 class MesoModelTests(TestCase):
     """CharacterBasic.meso 및 CharacterBasicHistory.meso 모델 테스트"""
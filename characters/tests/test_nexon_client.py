@@ -0,0 +1,193 @@
+"""
+util.nexon_client Nexon API HTTP 클라이언트 단위 테스트
+
+세션 요청은 mock으로 대체하고 재시도/타임아웃/세션 재사용을 검증합니다.
+
+테스트 실행: uv run python manage.py test characters.tests.test_nexon_client
+"""
+import asyncio
+import threading
+import requests
+from django.test import TestCase
+from unittest.mock import MagicMock, patch
+
+from util.nexon_client import AsyncNexonAPIClient, NexonAPIClient, get_async_nexon_client
+from util.rate_limiter import RateLimiter, api_key_scope
+
+
+def make_response(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class NexonAPIClientTests(TestCase):
+    """NexonAPIClient 동기 클라이언트 테스트"""
+
+    def setUp(self):
+        patcher = patch('util.nexon_client.time.sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+        # 기본 리미터 대기와 무관하게 재시도만 검증
+        limiter_patcher = patch('util.nexon_client.get_nexon_api_limiter',
+                                return_value=RateLimiter('test_nexon_client', rate=1000, capacity=1000))
+        limiter_patcher.start()
+        self.addCleanup(limiter_patcher.stop)
+
+    def test_default_timeout_applied(self):
+        """timeout 미지정 시 기본 (connect, read) 타임아웃 사용"""
+        client = NexonAPIClient(timeout=(1, 5))
+        with patch.object(requests.Session, 'get', return_value=make_response(200)) as session_get:
+            client.get('https://open.api.nexon.com/maplestory/v1/id', params={'character_name': 'a'})
+
+        self.assertEqual(session_get.call_args.kwargs['timeout'], (1, 5))
+        self.assertEqual(session_get.call_args.kwargs['params'], {'character_name': 'a'})
+
+    def test_session_reused_per_thread(self):
+        """같은 스레드에서는 세션(커넥션 풀)을 재사용하고 스레드마다 분리"""
+        client = NexonAPIClient()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(client.session))
+        thread.start()
+        thread.join()
+
+        self.assertIs(client.session, client.session)
+        self.assertIsNot(client.session, other[0])
+        self.assertEqual(client.session.get_adapter('https://open.api.nexon.com')._pool_maxsize,
+                         client.pool_maxsize)
+
+    def test_retries_on_429_then_succeeds(self):
+        """429 응답은 Retry-After만큼 대기 후 재시도"""
+        client = NexonAPIClient(max_retries=3)
+        responses = [make_response(429, {'Retry-After': '2'}), make_response(200)]
+        with patch.object(requests.Session, 'get', side_effect=responses) as session_get:
+            response = client.get('https://open.api.nexon.com/maplestory/v1/character/basic')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(session_get.call_count, 2)
+        self.sleep.assert_called_once_with(2.0)
+
+    def test_returns_last_response_after_max_retries(self):
+        """재시도 횟수를 넘기면 마지막 응답을 그대로 반환 (호출자가 raise_for_status)"""
+        client = NexonAPIClient(max_retries=2)
+        with patch.object(requests.Session, 'get', return_value=make_response(503)) as session_get:
+            response = client.get('https://open.api.nexon.com/maplestory/v1/character/basic')
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(session_get.call_count, 3)
+
+    def test_client_error_not_retried(self):
+        """4xx(429 제외)는 재시도하지 않음"""
+        client = NexonAPIClient(max_retries=3)
+        with patch.object(requests.Session, 'get', return_value=make_response(400)) as session_get:
+            response = client.get('https://open.api.nexon.com/maplestory/v1/character/basic')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(session_get.call_count, 1)
+
+    def test_connection_error_raised_after_retries(self):
+        """연결 오류가 계속되면 재시도 후 예외 전달"""
+        client = NexonAPIClient(max_retries=1)
+        with patch.object(requests.Session, 'get',
+                          side_effect=requests.exceptions.ConnectionError('refused')) as session_get:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                client.get('https://open.api.nexon.com/maplestory/v1/character/basic')
+
+        self.assertEqual(session_get.call_count, 2)
+
+    def test_limiter_acquired_per_attempt(self):
+        """재시도를 포함한 모든 시도마다 API 키 + 엔드포인트 토큰 획득"""
+        limiter = MagicMock(spec=RateLimiter)
+        client = NexonAPIClient(max_retries=3, limiter=limiter)
+        responses = [make_response(429), make_response(503), make_response(200)]
+        with patch.object(requests.Session, 'get', side_effect=responses):
+            client.get('https://open.api.nexon.com/maplestory/v1/character/basic',
+                       headers={'x-nxopen-api-key': 'test-key'})
+
+        self.assertEqual(limiter.acquire_sync.call_count, 3)
+        self.assertEqual(limiter.acquire_sync.call_args.args, (api_key_scope('test-key'), 'character/basic'))
+
+
+class FakeAiohttpResponse:
+    def __init__(self, status, body='{}', headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def text(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+class AsyncNexonAPIClientTests(TestCase):
+    """AsyncNexonAPIClient 비동기 클라이언트 테스트"""
+
+    def test_retries_and_aiohttp_compatible_response(self):
+        """429 후 재시도, 응답은 async with / await json()으로 사용"""
+        responses = [FakeAiohttpResponse(429, headers={'Retry-After': '0'}),
+                     FakeAiohttpResponse(200, '{"ocid": "abc"}')]
+
+        async def run():
+            async with AsyncNexonAPIClient(max_retries=2) as client:
+                session = client._get_session()
+                with patch.object(session, 'get', side_effect=responses) as session_get:
+                    async with client.get('https://open.api.nexon.com/maplestory/v1/id') as response:
+                        return response.status, await response.json(), session_get.call_count
+
+        status, data, call_count = asyncio.run(run())
+
+        self.assertEqual(status, 200)
+        self.assertEqual(data, {'ocid': 'abc'})
+        self.assertEqual(call_count, 2)
+
+    def test_limiter_acquired_per_attempt(self):
+        """비동기 재시도도 시도마다 토큰 획득 (요청별 리미터 지정 가능)"""
+        limiter = MagicMock(spec=RateLimiter)
+        responses = [FakeAiohttpResponse(429, headers={'Retry-After': '0'}), FakeAiohttpResponse(200)]
+
+        async def run():
+            async with AsyncNexonAPIClient(max_retries=2) as client:
+                with patch.object(client._get_session(), 'get', side_effect=responses):
+                    async with client.get('https://open.api.nexon.com/maplestory/v1/id', limiter=limiter):
+                        pass
+
+        asyncio.run(run())
+
+        self.assertEqual(limiter.acquire.await_count, 2)
+        self.assertEqual(limiter.acquire.call_args.args[1], 'id')
+
+    def test_shared_client_per_loop(self):
+        """get_async_nexon_client는 같은 루프에서 같은 클라이언트를 반환하고 루프마다 분리"""
+        async def get_twice():
+            return get_async_nexon_client(), get_async_nexon_client()
+
+        async def get_and_close():
+            client = get_async_nexon_client()
+            await client.close()
+            return client
+
+        loop = asyncio.new_event_loop()
+        try:
+            first, second = loop.run_until_complete(get_twice())
+            loop.run_until_complete(first.close())
+        finally:
+            loop.close()
+        other = asyncio.run(get_and_close())
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_session_closed_on_exit(self):
+        """async with 블록을 벗어나면 세션 종료"""
+        async def run():
+            async with AsyncNexonAPIClient() as client:
+                session = client._get_session()
+            return session.closed
+
+        self.assertTrue(asyncio.run(run()))
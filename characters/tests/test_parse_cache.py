@@ -0,0 +1,169 @@
+"""
+characters.parse_cache 내용 해시 파싱 캐시 / CrawlContentState 단위 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_parse_cache
+"""
+import asyncio
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest.mock import MagicMock
+
+from characters.models import CharacterBasic, CrawlContentState, Inventory
+from characters.parse_cache import (
+    ParseCache, _MISSING, cached_parse, cached_parse_many, content_hash, get_parse_cache,
+)
+
+
+class ContentHashTests(TestCase):
+    """content_hash 정규화 테스트"""
+
+    def test_ignores_scripts_comments_and_whitespace(self):
+        html = '<div class="inven">\n  <span>엘릭서</span>\n</div>'
+        noisy = ('<script>var token = "abc123";</script><div class="inven"> <span>엘릭서</span>'
+                 '<!-- rendered 12:00 --> </div>')
+
+        self.assertEqual(content_hash(html), content_hash(noisy))
+
+    def test_changes_with_content(self):
+        self.assertNotEqual(
+            content_hash('<span>엘릭서 (100개)</span>'),
+            content_hash('<span>엘릭서 (99개)</span>'),
+        )
+
+    def test_empty_page(self):
+        self.assertEqual(content_hash(''), '')
+        self.assertEqual(content_hash(None), '')
+
+
+class ParseCacheTests(TestCase):
+    """ParseCache 저장/조회 테스트"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_roundtrip_and_none_result(self):
+        parse_cache = ParseCache()
+        parse_cache.set('meso', 'abc', None)
+        parse_cache.set('inventory', 'abc', [{'item_name': '엘릭서'}])
+
+        self.assertIsNone(parse_cache.get('meso', 'abc'))
+        self.assertEqual(parse_cache.get('inventory', 'abc'), [{'item_name': '엘릭서'}])
+        self.assertIs(parse_cache.get('inventory', 'other'), _MISSING)
+
+    def test_local_lru_eviction_falls_back_to_shared_cache(self):
+        """프로세스 내 LRU에서 밀려난 항목은 Django 캐시에서 다시 읽음"""
+        parse_cache = ParseCache(local_size=2)
+        for digest in ('a', 'b', 'c'):
+            parse_cache.set('inventory', digest, digest)
+
+        self.assertEqual(len(parse_cache._local), 2)
+        self.assertNotIn(parse_cache._key('inventory', 'a'), parse_cache._local)
+        self.assertEqual(parse_cache.get('inventory', 'a'), 'a')
+
+    @override_settings(CRAWLER_PARSE_CACHE_ENABLED=True)
+    def test_cached_parse_skips_parser_for_same_page(self):
+        """같은 페이지(스크립트만 다름)는 파서를 다시 호출하지 않음"""
+        get_parse_cache().clear_local()
+        parser = MagicMock(return_value=[{'item_name': '엘릭서'}])
+
+        async def run():
+            first = await cached_parse('inventory', parser, '<div>엘릭서</div><script>1</script>')
+            second = await cached_parse('inventory', parser, '<div>엘릭서</div><script>2</script>')
+            return first, second
+
+        (items1, hash1), (items2, hash2) = asyncio.run(run())
+
+        parser.assert_called_once()
+        self.assertEqual(items1, items2)
+        self.assertEqual(hash1, hash2)
+
+    @override_settings(CRAWLER_PARSE_CACHE_ENABLED=True)
+    def test_cached_parse_many_parses_only_misses(self):
+        """묶음 파싱: 캐시에 있는 페이지는 건너뛰고 실패(None) 결과는 캐시하지 않음"""
+        get_parse_cache().clear_local()
+        parser = MagicMock(side_effect=lambda html, name: None if name == '실패' else {'item_name': name})
+
+        async def run():
+            await cached_parse_many('item_detail', parser, [('<div>a</div>', '모자'), ('<div>b</div>', '실패')])
+            return await cached_parse_many(
+                'item_detail', parser, [('<div>a</div>', '모자'), ('<div>b</div>', '실패'), ('<div>c</div>', '신발')])
+
+        results = asyncio.run(run())
+
+        self.assertEqual([result for result, _ in results], [{'item_name': '모자'}, None, {'item_name': '신발'}])
+        self.assertEqual(results[2][1], content_hash('<div>c</div>'))
+        self.assertEqual(parser.call_count, 4)  # 모자 1회 + 실패 2회 + 신발 1회
+
+    def test_cached_parse_disabled(self):
+        """캐시 비활성화(테스트 기본값) 시 매번 파싱"""
+        parser = MagicMock(return_value=[])
+
+        async def run():
+            await cached_parse('inventory', parser, '<div>엘릭서</div>')
+            return await cached_parse('inventory', parser, '<div>엘릭서</div>')
+
+        _, digest = asyncio.run(run())
+
+        self.assertEqual(parser.call_count, 2)
+        self.assertEqual(digest, content_hash('<div>엘릭서</div>'))
+
+
+class CrawlContentStateTests(TestCase):
+    """CrawlContentState 변경 여부 판단 테스트"""
+
+    def setUp(self):
+        self.character_basic = CharacterBasic.objects.create(
+            ocid='test_ocid_hash',
+            character_name='테스트캐릭터',
+            world_name='스카니아',
+            character_gender='남',
+            character_class='히어로'
+        )
+        self.crawled_at = timezone.now() - timedelta(hours=6)
+
+    def _save_snapshot(self):
+        Inventory.objects.create(
+            character_basic=self.character_basic,
+            item_name='엘릭서',
+            item_icon='https://example.com/icon.png',
+            quantity=100,
+            slot_position=0,
+            crawled_at=self.crawled_at
+        )
+        CrawlContentState.record(self.character_basic, 'inventory', 'hash1', self.crawled_at)
+
+    def test_same_hash_confirms_unchanged(self):
+        self._save_snapshot()
+
+        state = CrawlContentState.confirm_unchanged(self.character_basic, 'inventory', 'hash1', Inventory)
+
+        self.assertIsNotNone(state)
+        self.assertEqual(state.crawled_at, self.crawled_at)
+        self.assertGreater(state.confirmed_at, self.crawled_at)
+
+    def test_different_hash_is_changed(self):
+        self._save_snapshot()
+
+        self.assertIsNone(
+            CrawlContentState.confirm_unchanged(self.character_basic, 'inventory', 'hash2', Inventory))
+        self.assertIsNone(
+            CrawlContentState.confirm_unchanged(self.character_basic, 'inventory', '', Inventory))
+
+    def test_missing_snapshot_rows_is_changed(self):
+        """해시가 같아도 스냅샷 행이 없으면(삭제됨) 다시 저장"""
+        CrawlContentState.record(self.character_basic, 'inventory', 'hash1', self.crawled_at)
+
+        self.assertIsNone(
+            CrawlContentState.confirm_unchanged(self.character_basic, 'inventory', 'hash1', Inventory))
+
+    def test_record_replaces_previous_hash(self):
+        self._save_snapshot()
+        later = timezone.now()
+        CrawlContentState.record(self.character_basic, 'inventory', 'hash2', later)
+
+        state = CrawlContentState.objects.get(character_basic=self.character_basic, crawl_type='inventory')
+        self.assertEqual(state.content_hash, 'hash2')
+        self.assertEqual(state.confirmed_at, later)
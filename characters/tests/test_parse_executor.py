@@ -0,0 +1,79 @@
+"""
+characters.parse_executor 파싱 실행기 단위 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_parse_executor
+"""
+import asyncio
+import os
+
+from django.test import TestCase
+
+from characters.crawler_services import MesoParser
+from characters.parse_executor import ParseExecutor
+
+
+def _pid_and_double(value):
+    return os.getpid(), value * 2
+
+
+def _fail(value):
+    raise ValueError(f'bad value: {value}')
+
+
+class ParseExecutorTests(TestCase):
+    """ParseExecutor inline/process 모드 테스트"""
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            ParseExecutor(mode='thread')
+
+    def test_inline_runs_in_caller(self):
+        """inline 모드는 호출한 프로세스에서 바로 실행"""
+        executor = ParseExecutor(mode='inline')
+
+        pid, value = asyncio.run(executor.run(_pid_and_double, 21))
+
+        self.assertEqual(pid, os.getpid())
+        self.assertEqual(value, 42)
+
+    def test_inline_map(self):
+        executor = ParseExecutor(mode='inline', chunk_size=2)
+
+        results = asyncio.run(executor.map(_pid_and_double, [(i,) for i in range(5)]))
+
+        self.assertEqual([value for _, value in results], [0, 2, 4, 6, 8])
+
+    def test_process_runs_parser_in_worker(self):
+        """process 모드는 워커 프로세스에서 파싱 (루프는 결과만 기다림)"""
+        executor = ParseExecutor(mode='process', max_workers=1)
+        self.addCleanup(executor.shutdown)
+        html = '<div class="cash_money"><span>1,234,567</span></div>'
+
+        async def run():
+            return (
+                await executor.run(_pid_and_double, 21),
+                await executor.run(MesoParser.parse_storage_meso, html),
+            )
+
+        (pid, value), meso = asyncio.run(run())
+
+        self.assertNotEqual(pid, os.getpid())
+        self.assertEqual(value, 42)
+        self.assertEqual(meso, MesoParser.parse_storage_meso(html))
+
+    def test_process_map_chunks_in_order(self):
+        """map()은 chunk_size개씩 묶어 제출하고 입력 순서대로 결과 반환"""
+        executor = ParseExecutor(mode='process', max_workers=2, chunk_size=3)
+        self.addCleanup(executor.shutdown)
+
+        results = asyncio.run(executor.map(_pid_and_double, [(i,) for i in range(10)]))
+
+        self.assertEqual([value for _, value in results], [i * 2 for i in range(10)])
+        self.assertNotIn(os.getpid(), {pid for pid, _ in results})
+
+    def test_process_propagates_parser_error(self):
+        executor = ParseExecutor(mode='process', max_workers=1)
+        self.addCleanup(executor.shutdown)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(executor.run(_fail, 1))
@@ -0,0 +1,96 @@
+"""
+characters.benchmarks 코퍼스/회귀 검사 단위 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_parser_benchmarks
+"""
+from django.test import SimpleTestCase
+
+from characters.benchmarks.corpus import CORPUS_VERSION, KINDS, SIZES, anonymize_html, load_page
+from characters.benchmarks.runner import compare, measure, run_benchmarks
+from characters.crawler_services import InventoryParser, ItemDetailParser, MesoParser, StorageParser
+
+
+class CorpusTests(SimpleTestCase):
+    """코퍼스 페이지가 파서가 읽을 수 있는 구조인지 확인"""
+
+    def test_pages_are_deterministic(self):
+        for kind in KINDS:
+            for size in SIZES:
+                load_page.cache_clear()
+                first = load_page(kind, size)
+                load_page.cache_clear()
+                self.assertEqual(first, load_page(kind, size), f'{kind}/{size}')
+
+    def test_small_pages_parse(self):
+        inventory = InventoryParser.parse_inventory(load_page('inventory', 'small'))
+        storage = StorageParser.parse_storage(load_page('storage', 'small'), 'storage')
+
+        self.assertEqual(len(inventory), 16)
+        self.assertEqual(len(storage), 8)
+        self.assertIsNotNone(MesoParser.parse_storage_meso(load_page('storage', 'small')))
+        self.assertIsNotNone(MesoParser.parse_character_meso(load_page('character_info', 'small')))
+        self.assertIn('etc_info', ItemDetailParser.parse_detail_page(load_page('item_detail', 'small'), '아이템'))
+
+    def test_pathological_storage_meso_after_item_list(self):
+        """메소 영역이 목록 뒤에 있어도 찾음"""
+        self.assertIsNotNone(MesoParser.parse_storage_meso(load_page('storage', 'pathological')))
+
+    def test_unknown_page(self):
+        with self.assertRaises(ValueError):
+            load_page('inventory', 'huge')
+
+    def test_anonymize_html(self):
+        html = ('<script>var id = 1;</script><a href="/Common/Character/Detail/테스트?p=abc%2Fdef">테스트</a>'
+                '<img src="https://avatar.maplestory.nexon.com/Character/ABCDEF.png"/>')
+
+        anonymized = anonymize_html(html, ['테스트'])
+
+        self.assertNotIn('테스트', anonymized)
+        self.assertNotIn('abc', anonymized)
+        self.assertNotIn('ABCDEF', anonymized)
+        self.assertNotIn('<script', anonymized)
+
+
+class RegressionCheckTests(SimpleTestCase):
+    """기준값 대비 회귀 판단 테스트"""
+
+    @staticmethod
+    def _report(min_time, peak_memory, version=CORPUS_VERSION):
+        return {
+            'corpus_version': version,
+            'results': {'parser[full]': {'median': min_time, 'min': min_time, 'peak_memory': peak_memory}},
+        }
+
+    def test_within_threshold(self):
+        baseline = self._report(0.010, 1024 * 1024)
+
+        self.assertEqual(compare(self._report(0.012, 1200 * 1024), baseline), [])
+
+    def test_time_and_memory_regression(self):
+        baseline = self._report(0.010, 1024 * 1024)
+
+        regressions = compare(self._report(0.020, 2048 * 1024), baseline)
+
+        self.assertEqual(len(regressions), 2)
+        self.assertIn('time', regressions[0])
+        self.assertIn('peak memory', regressions[1])
+
+    def test_tiny_measurements_ignored(self):
+        """잡음 수준의 작은 측정값은 비율이 커도 회귀로 보지 않음"""
+        baseline = self._report(0.00001, 1024)
+
+        self.assertEqual(compare(self._report(0.00003, 3072), baseline), [])
+
+    def test_corpus_version_mismatch(self):
+        regressions = compare(self._report(0.010, 1024), self._report(0.010, 1024, version=CORPUS_VERSION - 1))
+
+        self.assertEqual(len(regressions), 1)
+        self.assertIn('corpus version', regressions[0])
+
+    def test_measure_and_run(self):
+        result = measure(lambda: [0] * 10000, rounds=2)
+        report = run_benchmarks({'a[small]': lambda: 1, 'b[full]': lambda: 2}, rounds=1, name_filter='small')
+
+        self.assertEqual(result['rounds'], 2)
+        self.assertGreater(result['peak_memory'], 0)
+        self.assertEqual(list(report['results']), ['a[small]'])
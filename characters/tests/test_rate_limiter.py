@@ -0,0 +1,159 @@
+"""
+util.rate_limiter 토큰 버킷 리미터 단위 테스트
+
+Redis Lua 스크립트 호출은 mock으로 대체하고, Redis 장애 시 로컬 버킷 동작을 검증합니다.
+
+테스트 실행: uv run python manage.py test characters.tests.test_rate_limiter
+"""
+import asyncio
+import redis
+from django.test import TestCase, override_settings
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from util.rate_limiter import (
+    RateLimiter, api_key_scope, endpoint_from_url, get_nexon_all_data_limiter, rate_limited,
+)
+from util.redis_client import RedisClient
+
+
+def redis_down():
+    """register_script 호출 시 ConnectionError를 내는 Redis mock"""
+    client = MagicMock()
+    client.register_script.side_effect = redis.ConnectionError('connection refused')
+    return client
+
+
+class RateLimiterTests(TestCase):
+    """RateLimiter 동기/비동기 API 테스트"""
+
+    def setUp(self):
+        patcher = patch('util.rate_limiter.RedisClient')
+        self.redis_client_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.redis_client_cls.get_instance.return_value = redis_down()
+        self.redis_client_cls.get_async_instance.return_value = redis_down()
+
+    def test_script_result_used_when_redis_available(self):
+        """Redis Lua 스크립트 결과(허용/대기 시간)를 그대로 사용"""
+        script = MagicMock(side_effect=[[1, '0'], [0, '0.25']])
+        self.redis_client_cls.get_instance.return_value.register_script.side_effect = None
+        self.redis_client_cls.get_instance.return_value.register_script.return_value = script
+        limiter = RateLimiter('test', rate=4)
+
+        self.assertEqual(limiter.try_acquire('key'), 0.0)
+        self.assertEqual(limiter.try_acquire('key'), 0.25)
+        script.assert_called_with(keys=['rate_limit:test:key'], args=[1, 4.0, 4.0])
+
+    def test_local_bucket_allows_burst_then_waits(self):
+        """Redis 장애 시 로컬 버킷: capacity만큼 즉시 통과 후 대기 시간 반환"""
+        limiter = RateLimiter('test', rate=2, capacity=3)
+
+        waits = [limiter.try_acquire('key') for _ in range(4)]
+
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 0.5, places=1)
+
+    def test_endpoint_bucket_limits_separately(self):
+        """엔드포인트별 제한은 키 전체 제한과 함께 적용"""
+        limiter = RateLimiter('test', rate=100, endpoint_rates={'character/basic': 1})
+
+        self.assertEqual(limiter.try_acquire('key', 'character/basic'), 0.0)
+        self.assertGreater(limiter.try_acquire('key', 'character/basic'), 0)
+        self.assertEqual(limiter.try_acquire('key', 'character/stat'), 0.0)
+
+    def test_drain_empties_bucket(self):
+        """drain 후에는 burst 없이 rate에 맞춰 대기 (Redis 장애 시 로컬 버킷)"""
+        limiter = RateLimiter('test', rate=2, capacity=3)
+
+        limiter.drain('key')
+
+        self.assertAlmostEqual(limiter.try_acquire('key'), 0.5, places=1)
+
+    def test_drain_async_uses_script(self):
+        """Redis 사용 가능하면 모든 워커가 공유하는 버킷을 스크립트로 비움"""
+        script = AsyncMock(return_value=1)
+        self.redis_client_cls.get_async_instance.return_value.register_script.side_effect = None
+        self.redis_client_cls.get_async_instance.return_value.register_script.return_value = script
+        limiter = RateLimiter('test', rate=2, capacity=3)
+
+        asyncio.run(limiter.drain_async('host'))
+
+        script.assert_awaited_once_with(keys=['rate_limit:test:host'], args=[0, 2.0, 3.0])
+
+    def test_async_decorator_waits_at_execution_time(self):
+        """코루틴 함수 데코레이터는 await 시점에 토큰을 얻음"""
+        limiter = RateLimiter('test', rate=1)
+        limiter.acquire = AsyncMock()
+
+        @rate_limited(limiter, key='key', endpoint=lambda url: endpoint_from_url(url))
+        async def fetch(url):
+            return url
+
+        coroutine = fetch('https://open.api.nexon.com/maplestory/v1/character/basic?ocid=1')
+        limiter.acquire.assert_not_awaited()
+
+        asyncio.run(coroutine)
+        limiter.acquire.assert_awaited_once_with('key', 'character/basic')
+
+    def test_async_acquire_sleeps_without_blocking(self):
+        """비동기 acquire는 asyncio.sleep으로 대기"""
+        limiter = RateLimiter('test', rate=1, capacity=1)
+
+        async def run():
+            with patch('util.rate_limiter.asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+                    patch.object(limiter, 'try_acquire_async', AsyncMock(side_effect=[0.3, 0.0])):
+                await limiter.acquire('key')
+            return mock_sleep
+
+        mock_sleep = asyncio.run(run())
+        mock_sleep.assert_awaited_once_with(0.3)
+
+    def test_api_key_scope_hides_key(self):
+        scope = api_key_scope('secret-api-key')
+
+        self.assertNotIn('secret', scope)
+        self.assertEqual(scope, api_key_scope('secret-api-key'))
+        self.assertEqual(api_key_scope(None), 'anonymous')
+
+    @override_settings(NEXON_API_RATE_LIMIT=5, NEXON_API_ALL_DATA_RATE_LIMIT=500, NEXON_API_ALL_DATA_BURST=50)
+    def test_all_data_limiter_uses_own_rate(self):
+        """전체 조회 fan-out은 NEXON_API_RATE_LIMIT와 별도 버킷/설정 사용"""
+        with patch('util.rate_limiter._nexon_all_data_limiter', None):
+            limiter = get_nexon_all_data_limiter()
+
+            self.assertIs(limiter, get_nexon_all_data_limiter())
+
+        self.assertEqual((limiter.name, limiter.rate, limiter.capacity), ('nexon_api_all_data', 500, 50))
+        self.assertTrue(all(limiter.try_acquire('key') == 0 for _ in range(21)))
+
+    def test_view_api_calls_use_all_data_limiter(self):
+        """단일 엔드포인트 뷰도 NEXON_API_RATE_LIMIT가 아닌 조회 뷰 버킷 사용"""
+        from characters.mixins import MapleAPIClientMixin
+
+        with patch('characters.mixins.get_nexon_client') as get_client:
+            MapleAPIClientMixin().get_api_data('https://open.api.nexon.com/maplestory/v1/character/basic')
+
+        self.assertIs(get_client.return_value.get.call_args.kwargs['limiter'], get_nexon_all_data_limiter)
+
+
+class AsyncRedisClientTests(TestCase):
+    """리미터가 쓰는 루프별 비동기 Redis 클라이언트 수명 테스트"""
+
+    def test_close_async_instances(self):
+        """워커 종료 시 루프별 클라이언트를 닫고 목록에서 제거"""
+        async def get_client():
+            return RedisClient.get_async_instance(), RedisClient.get_async_instance()
+
+        loop = asyncio.new_event_loop()
+        try:
+            with patch('util.redis_client.redis.asyncio.Redis') as redis_cls:
+                redis_cls.return_value.aclose = AsyncMock()
+                first, second = loop.run_until_complete(get_client())
+                RedisClient.close_async_instances()
+        finally:
+            loop.close()
+
+        self.assertIs(first, second)
+        redis_cls.assert_called_once()
+        first.aclose.assert_awaited_once()
+        self.assertNotIn(loop, RedisClient._async_instances)
@@ -0,0 +1,153 @@
+"""
+characters.benchmarks replay 서버 / 부하 드라이버 / 크롤러 base_url 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_replay_harness
+"""
+import asyncio
+
+from django.db import connection
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+
+from characters.benchmarks.load_driver import (
+    BackgroundReplayServer,
+    _job_failed,
+    create_characters,
+    percentile,
+    run_inline,
+)
+from characters.benchmarks.replay_server import ReplayServer, classify_path
+from characters.crawler_services import CrawlerService, ItemDetailCrawler, rebase_url
+from characters.page_fetchers import get_http_fetcher
+from characters.models import CharacterBasic, Inventory
+
+
+class BaseUrlTests(SimpleTestCase):
+    """크롤러 대상 주소 재정의 테스트"""
+
+    def test_rebase_url(self):
+        base = 'http://127.0.0.1:8765'
+
+        self.assertEqual(
+            rebase_url('https://maplestory.nexon.com/Common/Resource/Item?p=abc', base),
+            'http://127.0.0.1:8765/Common/Resource/Item?p=abc')
+        self.assertEqual(rebase_url('/Common/Character/Detail/a', base), 'http://127.0.0.1:8765/Common/Character/Detail/a')
+        # 다른 host 또는 공식 사이트 대상이면 그대로
+        self.assertEqual(rebase_url('https://example.com/detail', base), 'https://example.com/detail')
+        self.assertEqual(
+            rebase_url('https://maplestory.nexon.com/a', 'https://maplestory.nexon.com'),
+            'https://maplestory.nexon.com/a')
+        self.assertIsNone(rebase_url(None, base))
+
+    @override_settings(CRAWLER_BASE_URL='http://127.0.0.1:8765/')
+    def test_base_url_from_settings(self):
+        self.assertEqual(CrawlerService().base_url, 'http://127.0.0.1:8765')
+        self.assertEqual(ItemDetailCrawler().base_url, 'http://127.0.0.1:8765')
+        self.assertEqual(CrawlerService(base_url='http://localhost:9000').base_url, 'http://localhost:9000')
+
+    def test_character_link_uses_base_url(self):
+        html = ('<div class="rank_table_wrap"><table><tbody><tr><td class="left"><dl><dt>'
+                '<a href="/Common/Character/Detail/테스트?p=1">테스트</a></dt></dl></td></tr></tbody></table></div>')
+
+        self.assertEqual(
+            CrawlerService._find_character_link(html, '테스트', 'http://127.0.0.1:8765'),
+            'http://127.0.0.1:8765/Common/Character/Detail/테스트?p=1')
+
+
+class ReplayServerTests(SimpleTestCase):
+    """replay 서버 응답 선택/오류 주입 테스트"""
+
+    def test_classify_path(self):
+        self.assertEqual(classify_path('/N23Ranking/World/Total'), 'ranking')
+        self.assertEqual(classify_path('/Common/Character/Detail/a/Inventory'), 'inventory')
+        self.assertEqual(classify_path('/Common/Character/Detail/a/Storage'), 'storage')
+        self.assertEqual(classify_path('/Common/Character/Detail/a'), 'character_info')
+        self.assertEqual(classify_path('/Common/Resource/Item'), 'item_detail')
+        self.assertIsNone(classify_path('/favicon.ico'))
+
+    def test_resolve_prefers_exact_capture(self):
+        server = ReplayServer()
+        server.add_response('https://maplestory.nexon.com/Common/Character/Detail/a/Inventory?p=1',
+                            {'status': 200, 'body': 'A', 'content_type': 'text/html'})
+        server.add_response('https://maplestory.nexon.com/Common/Character/Detail/b/Inventory?p=2',
+                            {'status': 200, 'body': 'B', 'content_type': 'text/html'})
+
+        self.assertEqual(server.resolve('/Common/Character/Detail/b/Inventory?p=2', {})['body'], 'B')
+        # 캡처가 없는 URL은 같은 종류 중 하나 (같은 URL이면 항상 같은 응답)
+        first = server.resolve('/Common/Character/Detail/c/Inventory?p=3', {})['body']
+        self.assertIn(first, ('A', 'B'))
+        self.assertEqual(server.resolve('/Common/Character/Detail/c/Inventory?p=3', {})['body'], first)
+        # 캡처가 없는 종류는 코퍼스, 랭킹은 요청한 이름으로 생성
+        self.assertIn('inven_item_img', server.resolve('/Common/Character/Detail/c/Storage?p=3', {})['body'])
+        self.assertIn('>캐릭터<', server.resolve('/N23Ranking/World/Total?c=x', {'c': '캐릭터'})['body'])
+
+    def test_crawl_bundle_against_replay_server(self):
+        """HTTP 경로 크롤링이 replay 서버로 끝까지 동작"""
+        server = ReplayServer(latency=0.01, jitter=0.005, seed=1)
+
+        async def crawl():
+            base_url = await server.start()
+            try:
+                crawler = CrawlerService(fetch_backend='http', base_url=base_url)
+                crawler.request_delay = 0
+                return base_url, await crawler.crawl_bundle('리플레이', ['inventory', 'storage', 'meso'])
+            finally:
+                await get_http_fetcher().close()
+                await server.stop()
+
+        with self.settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            base_url, bundle = asyncio.run(crawl())
+
+        self.assertEqual(bundle['errors'], {})
+        self.assertTrue(bundle['character_info_url'].startswith(base_url))
+        self.assertEqual(len(bundle['results']['inventory']['items']), 480)
+        self.assertIsNotNone(bundle['results']['storage']['meso'])
+        self.assertIsNotNone(bundle['results']['meso']['meso'])
+        self.assertEqual(server.stats['ranking'], 1)
+
+    def test_error_injection(self):
+        server = ReplayServer(error_rate=1.0, error_status=429)
+
+        async def fetch():
+            import aiohttp
+            base_url = await server.start()
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(f'{base_url}/Common/Character/Detail/a') as response:
+                        return response.status
+            finally:
+                await server.stop()
+
+        self.assertEqual(asyncio.run(fetch()), 429)
+        self.assertEqual(server.stats['error'], 1)
+
+
+class LoadDriverTests(TransactionTestCase):
+    """부하 드라이버 집계/실행 테스트"""
+
+    def test_percentile(self):
+        values = [float(v) for v in range(1, 101)]
+
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertIsNone(percentile([], 50))
+
+    def test_job_failed(self):
+        self.assertFalse(_job_failed({'inventory': {'status': 'success'}, 'meso': {'status': 'success'}}))
+        self.assertTrue(_job_failed({'inventory': {'status': 'error', 'error': 'x'}}))
+        self.assertTrue(_job_failed(None))
+
+    def test_run_inline_against_replay_server(self):
+        """replay 서버 대상으로 crawl_character_data 동시 실행"""
+        ocids = create_characters(2)
+        # 테스트용 SQLite 메모리 DB는 공유 캐시 테이블 잠금이라 동시 쓰기가 대기 없이 실패함
+        concurrency = 1 if connection.vendor == 'sqlite' else 2
+
+        with BackgroundReplayServer(ReplayServer(seed=1)) as base_url:
+            with self.settings(CRAWLER_BASE_URL=base_url, CRAWLER_FETCH_BACKEND='http', CRAWLER_REQUEST_DELAY=0):
+                run = run_inline(ocids, ['inventory', 'meso'], concurrency=concurrency)
+
+        self.assertEqual(run['failures'], 0)
+        self.assertEqual(len(run['latencies']), 2)
+        self.assertGreater(run['rss_peak'], 0)
+        self.assertEqual(Inventory.objects.filter(character_basic__ocid__in=ocids).count(), 960)
+        self.assertTrue(CharacterBasic.objects.get(ocid=ocids[0]).character_info_url.startswith(base_url))
@@ -0,0 +1,64 @@
+"""
+ResourceBlockingProfile 단위 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_resource_blocking
+"""
+import asyncio
+from django.test import TestCase, override_settings
+from unittest.mock import AsyncMock, Mock
+
+from characters.crawler_services import CrawlerService
+from characters.resource_blocking import ResourceBlockingProfile, get_resource_blocking_profile
+
+
+def make_route(resource_type, url):
+    route = Mock()
+    route.request.resource_type = resource_type
+    route.request.url = url
+    route.abort = AsyncMock()
+    route.continue_ = AsyncMock()
+    return route
+
+
+class ResourceBlockingProfileTests(TestCase):
+    """리소스 차단 규칙 테스트"""
+
+    def setUp(self):
+        self.profile = ResourceBlockingProfile()
+
+    def test_blocks_images_and_trackers(self):
+        image = make_route('image', 'https://avatar.maplestory.nexon.com/ItemIcon/KEODIEPC.png')
+        tracker = make_route('script', 'https://www.googletagmanager.com/gtag/js?id=G-1')
+
+        asyncio.run(self.profile.handle_route(image))
+        asyncio.run(self.profile.handle_route(tracker))
+
+        image.abort.assert_awaited_once()
+        tracker.abort.assert_awaited_once()
+
+    def test_allows_document_and_scripts(self):
+        document = make_route('document', 'https://maplestory.nexon.com/MyMaple/Character/Detail/test/Storage?p=1')
+
+        asyncio.run(self.profile.handle_route(document))
+
+        document.continue_.assert_awaited_once()
+        document.abort.assert_not_awaited()
+
+    @override_settings(CRAWLER_BLOCK_RESOURCES=False)
+    def test_disabled_by_settings(self):
+        self.assertIsNone(get_resource_blocking_profile())
+
+    def test_crawler_pages_get_route_handler(self):
+        """CrawlerService가 여는 탭에는 차단 규칙이 등록됨"""
+        crawler = CrawlerService(fetch_backend='playwright')
+        context = AsyncMock()
+        page = AsyncMock()
+        context.new_page = AsyncMock(return_value=page)
+
+        async def run():
+            async with crawler._open_page(context):
+                pass
+
+        asyncio.run(run())
+
+        page.route.assert_awaited_once_with('**/*', crawler.resource_blocking.handle_route)
@@ -0,0 +1,130 @@
+"""
+히스토리 보존 정책 / 압축 (characters.retention) 테스트
+
+테스트 실행: uv run python manage.py test characters.tests.test_retention
+"""
+from datetime import datetime, timedelta
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from characters.benchmarks.corpus import load_page
+from characters.crawl_persistence import save_crawled_items
+from characters.crawler_services import InventoryParser
+from characters.models import CharacterBasic, CharacterBasicHistory, CharacterSkill, CrawlSnapshot, Inventory
+from characters.retention import TieredRetention, compact_history
+
+POLICY = {'keep_all_days': 7, 'daily_days': 30, 'weekly_days': 180}
+# 하루/주 경계가 테스트 실행 시각에 따라 바뀌지 않도록 고정 (수요일 정오, 0.01일 = 14.4분)
+NOW = timezone.make_aware(datetime(2026, 6, 17, 12, 0))
+
+
+class TieredRetentionTests(SimpleTestCase):
+    """단계별 보존 판단 테스트"""
+
+    def test_tiers(self):
+        retention = TieredRetention(POLICY, NOW)
+        # 최신순 (age는 일 단위)
+        ages = [0, 1, 1.01, 10, 10.01, 11, 60, 60.01, 61, 200]
+
+        kept = [age for age in ages if retention.keep(NOW - timedelta(days=age))]
+
+        # 7일 이내 모두 / 30일까지 하루 1개 / 180일까지 주 1개 / 그 뒤 삭제
+        self.assertEqual(kept[:3], [0, 1, 1.01])
+        self.assertIn(10, kept)
+        self.assertNotIn(10.01, kept)
+        self.assertIn(11, kept)
+        self.assertIn(60, kept)
+        self.assertNotIn(60.01, kept)
+        self.assertNotIn(61, kept)  # 60일 전과 같은 주
+        self.assertNotIn(200, kept)
+
+    def test_latest_always_kept(self):
+        retention = TieredRetention(POLICY, NOW)
+
+        self.assertTrue(retention.keep(NOW - timedelta(days=400)))
+        self.assertFalse(retention.keep(NOW - timedelta(days=401)))
+
+
+class CompactHistoryTests(TestCase):
+    """스냅샷/날짜별 테이블 압축 테스트"""
+
+    def setUp(self):
+        self.character = CharacterBasic.objects.create(
+            ocid='retention-test',
+            character_name='보존테스트',
+            world_name='스카니아',
+            character_gender='남',
+            character_class='아크메이지(불,독)',
+        )
+        self.items = InventoryParser.parse_inventory(load_page('inventory', 'small'))
+        self.now = NOW
+
+    def _save(self, days_ago, items=None):
+        crawled_at = self.now - timedelta(days=days_ago)
+        save_crawled_items('inventory', self.character, items or self.items, crawled_at)
+        return crawled_at
+
+    def _snapshot_times(self):
+        return set(CrawlSnapshot.objects.filter(character_basic=self.character).values_list('crawled_at', flat=True))
+
+    def test_full_snapshots_downsampled(self):
+        old_same_day = [self._save(20.02), self._save(20.01)]
+        recent = self._save(1)
+        current = self._save(0)
+
+        report = compact_history(policy=POLICY, chunk_size=5, now=self.now)
+
+        self.assertEqual(self._snapshot_times(), {old_same_day[1], recent, current})
+        self.assertEqual(report['tables']['characters.CrawlSnapshot']['rows'], 1)
+        self.assertEqual(report['tables']['characters.Inventory']['rows'], len(self.items))
+        self.assertEqual(Inventory.objects.filter(character_basic=self.character).count(), 3 * len(self.items))
+        for snapshot in CrawlSnapshot.objects.filter(character_basic=self.character):
+            self.assertEqual(snapshot.materialize().count(), len(self.items))
+
+    @override_settings(CRAWLER_HISTORY_MODE='delta')
+    def test_delta_rows_shared_by_kept_snapshots(self):
+        """삭제한 스냅샷에서 저장했어도 남는 스냅샷에 포함된 행은 보존"""
+        self._save(20.02)
+        changed = [dict(item) for item in self.items]
+        changed[0]['quantity'] += 1
+        self._save(20.01, changed)
+        current = self._save(0, changed)
+
+        compact_history(policy=POLICY, now=self.now)
+
+        self.assertEqual(len(self._snapshot_times()), 2)
+        self.assertEqual(Inventory.objects.filter(character_basic=self.character).count(), len(self.items))
+        current_snapshot = CrawlSnapshot.objects.get(character_basic=self.character, crawled_at=current)
+        self.assertEqual(current_snapshot.materialize().count(), len(self.items))
+
+    def test_dated_history_and_dry_run(self):
+        for days_ago in (0, 20.02, 20.01, 300):
+            CharacterBasicHistory.objects.create(
+                character=self.character, date=self.now - timedelta(days=days_ago),
+                character_name='보존테스트', character_class='아크메이지(불,독)', character_class_level='6',
+                character_level=280, character_exp=0, character_exp_rate='0.000', character_image='',
+                access_flag=True, liberation_quest_clear_flag=True)
+
+        dry_run = compact_history(dry_run=True, policy=POLICY, now=self.now)
+        self.assertEqual(dry_run['tables']['characters.CharacterBasicHistory']['rows'], 2)
+        self.assertEqual(CharacterBasicHistory.objects.count(), 4)
+
+        report = compact_history(policy=POLICY, chunk_size=1, now=self.now)
+
+        self.assertEqual(report['total_rows'], 2)
+        self.assertEqual(CharacterBasicHistory.objects.count(), 2)
+
+    def test_dated_rows_partitioned_by_skill_grade(self):
+        """같은 날짜의 전직 차수별 스킬 행은 서로 지우지 않음"""
+        for days_ago in (20, 20.01):
+            for grade in ('0', '5', '6'):
+                CharacterSkill.objects.create(
+                    character=self.character, date=self.now - timedelta(days=days_ago), character_skill_grade=grade)
+
+        compact_history(policy=POLICY, now=self.now)
+
+        latest = self.now - timedelta(days=20)
+        self.assertEqual(
+            sorted(CharacterSkill.objects.values_list('character_skill_grade', 'date')),
+            [('0', latest), ('5', latest), ('6', latest)])
@@ -0,0 +1,125 @@
+"""
+util.single_flight 요청 병합 단위 테스트
+
+Redis 클라이언트는 mock으로 대체하고 락 획득/대기/장애 시 동작을 검증합니다.
+
+테스트 실행: uv run python manage.py test characters.tests.test_single_flight
+"""
+import redis
+from django.test import TestCase
+from unittest.mock import MagicMock, patch
+
+from util.single_flight import SingleFlight
+
+
+class SingleFlightTests(TestCase):
+    """SingleFlight.do() 테스트"""
+
+    def setUp(self):
+        patcher = patch('util.single_flight.RedisClient')
+        redis_client_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = MagicMock()
+        redis_client_cls.get_instance.return_value = self.client
+        self.flight = SingleFlight('test', lease=5, wait_timeout=0.3, poll_interval=0.01)
+        self.fetch = MagicMock(return_value={'fresh': True})
+
+    def test_leader_fetches_and_releases(self):
+        """락을 얻은 요청이 조회하고 락 해제 + 완료 알림"""
+        self.client.set.return_value = True
+
+        result, shared = self.flight.do(('ocid1', 'all_data', None), self.fetch, lambda: None)
+
+        self.assertEqual(result, {'fresh': True})
+        self.assertFalse(shared)
+        self.fetch.assert_called_once()
+        self.assertEqual(self.client.set.call_args.args[0], 'single_flight:test:ocid1:all_data:latest')
+        self.assertEqual(self.client.set.call_args.kwargs, {'nx': True, 'px': 5000})
+        self.client.eval.assert_called_once()
+        self.client.publish.assert_called_once_with(
+            'single_flight:test:ocid1:all_data:latest:done', 'done')
+
+    def test_leader_releases_on_error(self):
+        """조회 중 예외가 나도 락 해제"""
+        self.client.set.return_value = True
+        self.fetch.side_effect = RuntimeError('boom')
+
+        with self.assertRaises(RuntimeError):
+            self.flight.do(('ocid1', 'all_data', None), self.fetch, lambda: None)
+
+        self.client.eval.assert_called_once()
+
+    def test_follower_reads_shared_result(self):
+        """락을 얻지 못한 요청은 조회하지 않고 다른 요청의 결과를 읽음"""
+        self.client.set.return_value = False
+        self.client.exists.return_value = 1
+        read_result = MagicMock(side_effect=[None, None, {'cached': True}])
+
+        result, shared = self.flight.do(('ocid1', 'all_data', None), self.fetch, read_result)
+
+        self.assertEqual(result, {'cached': True})
+        self.assertTrue(shared)
+        self.fetch.assert_not_called()
+        self.client.pubsub.return_value.subscribe.assert_called_once_with(
+            'single_flight:test:ocid1:all_data:latest:done')
+        self.client.pubsub.return_value.close.assert_called_once()
+
+    def test_follower_takes_over_when_leader_failed(self):
+        """락이 해제됐는데 결과가 없으면(조회 실패) 다시 SET NX로 락을 얻은 뒤 조회"""
+        self.client.set.side_effect = [False, True]
+        self.client.exists.return_value = 0
+
+        result, shared = self.flight.do(('ocid1', 'all_data', None), self.fetch, lambda: None)
+
+        self.assertEqual(result, {'fresh': True})
+        self.assertFalse(shared)
+        self.fetch.assert_called_once()
+        self.assertEqual(self.client.set.call_count, 2)
+        self.client.eval.assert_called_once()
+
+    def test_follower_waits_for_new_leader(self):
+        """다른 요청이 새 락 소유자가 되면 조회하지 않고 그 결과를 기다림"""
+        self.client.set.return_value = False
+        self.client.exists.side_effect = [0, 1]
+        read_result = MagicMock(side_effect=[None, None, None, {'cached': True}])
+
+        result, shared = self.flight.do(('ocid1', 'all_data', None), self.fetch, read_result)
+
+        self.assertEqual(result, {'cached': True})
+        self.assertTrue(shared)
+        self.fetch.assert_not_called()
+        self.assertEqual(self.client.set.call_count, 2)
+
+    def test_follower_fetches_after_max_takeovers(self):
+        """락 재획득 시도 횟수를 넘기면 직접 조회"""
+        self.client.set.return_value = False
+        self.client.exists.return_value = 0
+        flight = SingleFlight('test', lease=5, wait_timeout=0.3, poll_interval=0.01, max_takeovers=2)
+
+        result, shared = flight.do(('ocid1', 'all_data', None), self.fetch, lambda: None)
+
+        self.assertEqual(result, {'fresh': True})
+        self.assertFalse(shared)
+        self.fetch.assert_called_once()
+        self.assertEqual(self.client.set.call_count, 3)
+
+    def test_follower_fetches_after_timeout(self):
+        """wait_timeout 안에 결과가 없으면 직접 조회"""
+        self.client.set.return_value = False
+        self.client.exists.return_value = 1
+
+        result, shared = self.flight.do(('ocid1', 'all_data', None), self.fetch, lambda: None)
+
+        self.assertEqual(result, {'fresh': True})
+        self.assertFalse(shared)
+        self.assertGreater(self.client.pubsub.return_value.get_message.call_count, 0)
+
+    def test_redis_down_fetches_directly(self):
+        """Redis에 연결할 수 없으면 병합 없이 조회"""
+        self.client.set.side_effect = redis.ConnectionError('connection refused')
+
+        result, shared = self.flight.do(('ocid1', 'all_data', '2025-01-01'), self.fetch, lambda: None)
+
+        self.assertEqual(result, {'fresh': True})
+        self.assertFalse(shared)
+        self.fetch.assert_called_once()
@@ -10,6 +10,7 @@ AC-2.11.6: skip 처리된 테스트들 활성화
 """
 import pytest
 import json
+from datetime import timedelta
 from pathlib import Path
 from django.urls import reverse
 from unittest.mock import patch, MagicMock
@@ -480,6 +481,9 @@ class TestErrorResponses(APITestCase):
             character_gender="남",
             character_class="팬텀",
         )
+        # 마지막 Nexon 데이터 공개 이전에 저장된 데이터로 설정 (force_refresh 허용 대상)
+        CharacterBasic.objects.filter(ocid=self.ocid).update(
+            last_updated=timezone.now() - timedelta(days=2))
 
         # API 오류 응답 mock
         responses.add(
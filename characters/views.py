@@ -12,8 +12,10 @@ import asyncio
 import aiohttp
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from util.rate_limiter import rate_limited
+from util.nexon_client import get_async_nexon_client
+from util.rate_limiter import get_nexon_all_data_limiter
 from util.redis_client import redis_client
+from util.single_flight import SingleFlight
 import time
 import pytz
 
@@ -27,6 +29,8 @@ from define.define import (
     CHARACTER_PET_EQUIPMENT_URL, CHARACTER_PROPENSITY_URL, CHARACTER_HYPER_STAT_URL,
     APIKEY
 )
+from .browser_pool import run_in_worker_loop
+from .freshness import get_freshness_policy
 from .mixins import MapleAPIClientMixin, APIViewMixin, CharacterDataMixin
 from .models import *
 from .schemas import (
@@ -51,6 +55,9 @@ from .serializers import (
 
 logger = logging.getLogger('maple_api')
 
+# 전체 데이터 조회 요청 병합 (fan-out 약 21회 + DB 저장, 최대 60초 소요 가정)
+all_data_single_flight = SingleFlight('character_all_data', lease=60, wait_timeout=30)
+
 
 class BaseCharacterView(MapleAPIClientMixin, APIViewMixin, CharacterDataMixin):
     """
@@ -171,7 +178,7 @@ class BaseCharacterView(MapleAPIClientMixin, APIViewMixin, CharacterDataMixin):
             openapi.Parameter(
                 'force_refresh',
                 openapi.IN_QUERY,
-                description='캐시 무시하고 새로운 데이터 조회',
+                description='캐시 무시하고 새로운 데이터 조회 (마지막 조회 이후 Nexon 데이터가 새로 공개된 경우에만 적용)',
                 type=openapi.TYPE_BOOLEAN,
                 default=False
             )
@@ -366,7 +373,7 @@ class CharacterSkillView(BaseCharacterView):
             openapi.Parameter(
                 'force_refresh',
                 openapi.IN_QUERY,
-                description='캐시 무시하고 새로운 데이터 조회',
+                description='캐시 무시하고 새로운 데이터 조회 (마지막 조회 이후 Nexon 데이터가 새로 공개된 경우에만 적용)',
                 type=openapi.TYPE_BOOLEAN,
                 default=False
             )
@@ -601,7 +608,7 @@ class CharacterAllDataView(BaseCharacterView):
             openapi.Parameter(
                 'force_refresh',
                 openapi.IN_QUERY,
-                description='캐시 무시하고 새로운 데이터 조회',
+                description='캐시 무시하고 새로운 데이터 조회 (마지막 조회 이후 Nexon 데이터가 새로 공개된 경우에만 적용)',
                 type=openapi.TYPE_BOOLEAN,
                 default=False
             )
@@ -645,72 +652,38 @@ class CharacterAllDataView(BaseCharacterView):
             # --- 캐시 확인 로직 수정 ---
             force_refresh = request.query_params.get(
                 'force_refresh', 'false').lower() == 'true'
-            if not force_refresh:
-                cache_key = f"character_data:{ocid}:all_data"
-                cached_data = redis_client.get(cache_key)
-                if cached_data:
-                    try:
-                        response_data = json.loads(cached_data)
-                        total_duration = time.time() - start_time  # 캐시 반환 전 시간 측정
-                        logger.info(
-                            f"캐시된 전체 데이터 반환 - OCID: {ocid}, 총 소요시간: {total_duration:.2f}초")
-                        return Response({'data': response_data})  # 캐시 데이터 반환
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            f"캐시된 데이터 JSON 파싱 오류 - Key: {cache_key}")
-                        # 파싱 오류 시 캐시 무시하고 새로 조회 (아래 로직으로 진행)
+            # 캐시는 다음 Nexon 공개 시각에 만료되므로, 캐시가 남아 있으면
+            # force_refresh여도 새로 받을 데이터가 없음
+            response_data = self._read_cached_all_data(ocid)
+            if response_data is not None:
+                total_duration = time.time() - start_time  # 캐시 반환 전 시간 측정
+                if force_refresh:
+                    logger.info(f"force_refresh 무시 - 마지막 공개 이후 캐시 존재: {ocid}")
+                logger.info(
+                    f"캐시된 전체 데이터 반환 - OCID: {ocid}, 총 소요시간: {total_duration:.2f}초")
+                return Response({'data': response_data})  # 캐시 데이터 반환
             # --- 캐시 확인 로직 끝 ---
 
-            # API 엔드포인트와 뷰 클래스 매핑 (변경 없음)
-            api_endpoints = {
-                CHARACTER_BASIC_URL: ('basic', CharacterBasicView),
-                CHARACTER_POPULARITY_URL: ('popularity', CharacterPopularityView),
-                CHARACTER_STAT_URL: ('stat', CharacterStatView),
-                CHARACTER_ABILITY_URL: ('ability', CharacterAbilityView),
-                CHARACTER_ITEM_EQUIPMENT_URL: ('item_equipment', CharacterItemEquipmentView),
-                CHARACTER_CASHITEM_EQUIPMENT_URL: ('cashitem_equipment', CharacterCashItemEquipmentView),
-                CHARACTER_SYMBOL_URL: ('symbol', CharacterSymbolView),
-                CHARACTER_LINK_SKILL_URL: ('link_skill', CharacterLinkSkillView),
-                CHARACTER_SKILL_URL: ('skill', CharacterSkillView),
-                CHARACTER_HEXAMATRIX_URL: ('hexamatrix', CharacterHexaMatrixView),
-                CHARACTER_HEXAMATRIX_STAT_URL: ('hexamatrix_stat', CharacterHexaMatrixStatView),
-                CHARACTER_VMATRIX_URL: ('vmatrix', CharacterVMatrixView),
-                CHARACTER_DOJANG_URL: ('dojang', CharacterDojangView),
-                CHARACTER_SET_EFFECT_URL: ('set_effect', CharacterSetEffectView),
-                CHARACTER_BEAUTY_EQUIPMENT_URL: ('beauty_equipment', CharacterBeautyEquipmentView),
-                CHARACTER_ANDROID_EQUIPMENT_URL: ('android_equipment', CharacterAndroidEquipmentView),
-                CHARACTER_PET_EQUIPMENT_URL: ('pet_equipment', CharacterPetEquipmentView),
-                CHARACTER_PROPENSITY_URL: ('propensity', CharacterPropensityView),
-                CHARACTER_HYPER_STAT_URL: ('hyper_stat', CharacterHyperStatView),
-            }
+            # --- 동시 요청 병합: 같은 캐릭터는 한 요청만 Nexon API 조회 (캐시 stampede 방지) ---
+            serialized_data, shared = all_data_single_flight.do(
+                (ocid, 'all_data', None),
+                fetch=lambda: self._fetch_and_cache_all_data(ocid, request),
+                read_result=lambda: self._read_cached_all_data(ocid),
+            )
 
-            # 비동기 호출 실행
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                results = loop.run_until_complete(
-                    self.fetch_all_data(ocid, api_endpoints, request))
-            finally:
-                loop.close()
-
-            # --- 데이터 조회 및 직렬화/캐싱 로직 수정 ---
-            try:
-                character = CharacterBasic.objects.get(ocid=ocid)
-            except CharacterBasic.DoesNotExist:
+            if shared:
+                total_duration = time.time() - start_time
+                logger.info(
+                    f"동시 요청이 조회한 전체 데이터 반환 - OCID: {ocid}, 총 소요시간: {total_duration:.2f}초")
+                return Response({'data': serialized_data})
+
+            if serialized_data is None:
                 total_duration = time.time() - start_time  # 실패 응답 전 시간 측정
                 logger.error(
                     f"모든 데이터 조회 후 CharacterBasic 조회 실패 - OCID: {ocid}, 총 소요시간: {total_duration:.2f}초")
                 return Response({'error': '캐릭터 정보를 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
 
-            serializer = self.serializer_class(
-                character, context={'request': request})
-            serialized_data = serializer.data
-
-            cache_key = f"character_data:{ocid}:all_data"
-            cache_ttl = 3600
-            redis_client.setex(cache_key, cache_ttl,
-                               json.dumps(serialized_data))
-            logger.info(f"전체 데이터 캐싱 완료 - Key: {cache_key}")
+            character = CharacterBasic.objects.get(ocid=ocid)
 
             # --- 자동 크롤링 시작 (인벤토리/창고/메소) ---
             crawl_task = self._trigger_auto_crawl(ocid, character)
@@ -738,6 +711,75 @@ class CharacterAllDataView(BaseCharacterView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @staticmethod
+    def all_data_cache_key(ocid: str) -> str:
+        return f"character_data:{ocid}:all_data"
+
+    def _read_cached_all_data(self, ocid: str):
+        """캐시된 전체 데이터 조회 (없거나 파싱 실패 시 None)"""
+        cache_key = self.all_data_cache_key(ocid)
+        cached_data = redis_client.get(cache_key)
+        if not cached_data:
+            return None
+        try:
+            return json.loads(cached_data)
+        except json.JSONDecodeError:
+            logger.warning(
+                f"캐시된 데이터 JSON 파싱 오류 - Key: {cache_key}")
+            # 파싱 오류 시 캐시 무시하고 새로 조회
+            return None
+
+    def _fetch_and_cache_all_data(self, ocid: str, request):
+        """
+        Nexon API 전체 조회 → DB 저장 → 직렬화 결과 캐싱
+
+        Returns:
+            dict: 직렬화된 전체 데이터 (CharacterBasic이 없으면 None)
+        """
+        # API 엔드포인트와 뷰 클래스 매핑 (변경 없음)
+        api_endpoints = {
+            CHARACTER_BASIC_URL: ('basic', CharacterBasicView),
+            CHARACTER_POPULARITY_URL: ('popularity', CharacterPopularityView),
+            CHARACTER_STAT_URL: ('stat', CharacterStatView),
+            CHARACTER_ABILITY_URL: ('ability', CharacterAbilityView),
+            CHARACTER_ITEM_EQUIPMENT_URL: ('item_equipment', CharacterItemEquipmentView),
+            CHARACTER_CASHITEM_EQUIPMENT_URL: ('cashitem_equipment', CharacterCashItemEquipmentView),
+            CHARACTER_SYMBOL_URL: ('symbol', CharacterSymbolView),
+            CHARACTER_LINK_SKILL_URL: ('link_skill', CharacterLinkSkillView),
+            CHARACTER_SKILL_URL: ('skill', CharacterSkillView),
+            CHARACTER_HEXAMATRIX_URL: ('hexamatrix', CharacterHexaMatrixView),
+            CHARACTER_HEXAMATRIX_STAT_URL: ('hexamatrix_stat', CharacterHexaMatrixStatView),
+            CHARACTER_VMATRIX_URL: ('vmatrix', CharacterVMatrixView),
+            CHARACTER_DOJANG_URL: ('dojang', CharacterDojangView),
+            CHARACTER_SET_EFFECT_URL: ('set_effect', CharacterSetEffectView),
+            CHARACTER_BEAUTY_EQUIPMENT_URL: ('beauty_equipment', CharacterBeautyEquipmentView),
+            CHARACTER_ANDROID_EQUIPMENT_URL: ('android_equipment', CharacterAndroidEquipmentView),
+            CHARACTER_PET_EQUIPMENT_URL: ('pet_equipment', CharacterPetEquipmentView),
+            CHARACTER_PROPENSITY_URL: ('propensity', CharacterPropensityView),
+            CHARACTER_HYPER_STAT_URL: ('hyper_stat', CharacterHyperStatView),
+        }
+
+        # 비동기 호출 실행 (요청마다 루프를 만들지 않고 스레드별로 유지되는 루프 사용)
+        results = run_in_worker_loop(
+            self.fetch_all_data(ocid, api_endpoints, request))
+
+        # --- 데이터 조회 및 직렬화/캐싱 로직 수정 ---
+        character = CharacterBasic.objects.filter(ocid=ocid).first()
+        if character is None:
+            return None
+
+        serializer = self.serializer_class(
+            character, context={'request': request})
+        serialized_data = serializer.data
+
+        cache_key = self.all_data_cache_key(ocid)
+        # 다음 Nexon 데이터 공개 시각(+여유)까지 캐싱
+        cache_ttl = get_freshness_policy().ttl_seconds()
+        redis_client.setex(cache_key, cache_ttl,
+                           json.dumps(serialized_data))
+        logger.info(f"전체 데이터 캐싱 완료 - Key: {cache_key}")
+        return serialized_data
+
     async def fetch_all_data(self, ocid, api_endpoints, request):
         """비동기로 모든 API 데이터 조회"""
         from asgiref.sync import sync_to_async
@@ -750,170 +792,170 @@ class CharacterAllDataView(BaseCharacterView):
         # force_refresh = request.query_params.get(
         #     'force_refresh', 'false').lower() == 'true'
 
-        async with aiohttp.ClientSession() as session:
-            # CharacterSkillView 처럼 파라미터가 필요한 경우 처리 필요
-            tasks = []
-            semaphore = asyncio.Semaphore(20)  # 동시 요청 제한
-
-            # @rate_limited 데코레이터는 async 함수에 직접 적용하기 어려울 수 있음
-            # 필요하다면 asyncio-limiter 같은 라이브러리 사용 고려
-            @rate_limited(500)
-            async def fetch_with_semaphore(url, params):
-                async with semaphore:
-                    try:
-                        request_start = time.time()
-                        headers = {'x-nxopen-api-key': APIKEY}
-
-                        # --- 개별 데이터 캐시 확인 (선택 사항) ---
-                        # 만약 force_refresh가 아니고, 개별 데이터 캐시도 확인하고 싶다면 여기서 확인
-                        # view_instance = api_endpoints[url][1]()
-                        # cached_item = view_instance.check_and_return_cached_data(...)
-                        # if cached_item and not force_refresh:
-                        #     logger.info(f"개별 캐시 사용 ({url})")
-                        #     return url, cached_item # 또는 DB 저장을 스킵할 플래그 반환
-                        # --- 개별 캐시 확인 끝 ---
-
-                        api_start = time.time()
-                        async with session.get(url, params=params, headers=headers) as response:
-                            api_time = time.time() - api_start
-                            if response.status == 200:
-                                data = await response.json()
-                                logger.info(
-                                    f"API 요청 성공 ({url}) - 상태: {response.status}, 소요시간: {api_time:.2f}초")
-
-                                process_start = time.time()
-                                endpoint_name, view_class = api_endpoints[url]
-
-                                # --- 날짜 처리 로직 수정 ---
-                                raw_date = data.get('date')
-                                if raw_date:
-                                    try:
-                                        if isinstance(raw_date, datetime.datetime):
-                                            # 이미 datetime 객체인 경우 timezone 확인
-                                            if timezone.is_naive(raw_date):
-                                                logger.warning(
-                                                    f"API 응답에 naive datetime 포함 ({url}): {raw_date}. UTC로 가정.")
-                                                # Django 설정의 TIME_ZONE을 사용하거나 UTC로 명시적 설정
-                                                # data['date'] = timezone.make_aware(raw_date, timezone.get_current_timezone())
-                                                data['date'] = timezone.make_aware(
-                                                    raw_date, timezone.utc)
-                                            else:
-                                                # 이미 aware datetime이면 그대로 사용 (UTC로 변환하는 것을 고려할 수 있음)
-                                                data['date'] = raw_date.astimezone(
-                                                    timezone.utc)
-                                        elif isinstance(raw_date, str):
-                                            # 문자열인 경우 파싱 시도
-                                            # ISO 8601 형식 (YYYY-MM-DDTHH:MM:SS+HH:MM 또는 YYYY-MM-DDTHH:MM:SSZ)
-                                            date_str = raw_date.replace(
-                                                'Z', '+00:00')
-                                            dt_obj = datetime.datetime.fromisoformat(
-                                                date_str)
-                                            # Aware datetime 객체를 UTC로 변환하여 저장 일관성 확보
-                                            data['date'] = dt_obj.astimezone(
-                                                timezone.utc)
-                                        else:
-                                            # 예상치 못한 타입
-                                            logger.warning(
-                                                f"알 수 없는 날짜 타입 ({url}): {type(raw_date)}. 현재 시간(UTC) 사용.")
-                                            # UTC 반환
-                                            data['date'] = timezone.now()
+        # 워커 루프의 공용 Nexon 클라이언트 (요청 간 keep-alive 연결 재사용, 시도마다 리미터 적용)
+        session = get_async_nexon_client()
+        # CharacterSkillView 처럼 파라미터가 필요한 경우 처리 필요
+        tasks = []
+        semaphore = asyncio.Semaphore(20)  # 동시 요청 제한
 
-                                    except (ValueError, TypeError) as dt_error:
+        async def fetch_with_semaphore(url, params):
+            async with semaphore:
+                try:
+                    request_start = time.time()
+                    headers = {'x-nxopen-api-key': APIKEY}
+
+                    # --- 개별 데이터 캐시 확인 (선택 사항) ---
+                    # 만약 force_refresh가 아니고, 개별 데이터 캐시도 확인하고 싶다면 여기서 확인
+                    # view_instance = api_endpoints[url][1]()
+                    # cached_item = view_instance.check_and_return_cached_data(...)
+                    # if cached_item and not force_refresh:
+                    #     logger.info(f"개별 캐시 사용 ({url})")
+                    #     return url, cached_item # 또는 DB 저장을 스킵할 플래그 반환
+                    # --- 개별 캐시 확인 끝 ---
+
+                    api_start = time.time()
+                    # fan-out 전용 버킷 (settings.NEXON_API_ALL_DATA_RATE_LIMIT)
+                    async with session.get(url, params=params, headers=headers,
+                                           limiter=get_nexon_all_data_limiter) as response:
+                        api_time = time.time() - api_start
+                        if response.status == 200:
+                            data = await response.json()
+                            logger.info(
+                                f"API 요청 성공 ({url}) - 상태: {response.status}, 소요시간: {api_time:.2f}초")
+
+                            process_start = time.time()
+                            endpoint_name, view_class = api_endpoints[url]
+
+                            # --- 날짜 처리 로직 수정 ---
+                            raw_date = data.get('date')
+                            if raw_date:
+                                try:
+                                    if isinstance(raw_date, datetime.datetime):
+                                        # 이미 datetime 객체인 경우 timezone 확인
+                                        if timezone.is_naive(raw_date):
+                                            logger.warning(
+                                                f"API 응답에 naive datetime 포함 ({url}): {raw_date}. UTC로 가정.")
+                                            # Django 설정의 TIME_ZONE을 사용하거나 UTC로 명시적 설정
+                                            # data['date'] = timezone.make_aware(raw_date, timezone.get_current_timezone())
+                                            data['date'] = timezone.make_aware(
+                                                raw_date, timezone.utc)
+                                        else:
+                                            # 이미 aware datetime이면 그대로 사용 (UTC로 변환하는 것을 고려할 수 있음)
+                                            data['date'] = raw_date.astimezone(
+                                                timezone.utc)
+                                    elif isinstance(raw_date, str):
+                                        # 문자열인 경우 파싱 시도
+                                        # ISO 8601 형식 (YYYY-MM-DDTHH:MM:SS+HH:MM 또는 YYYY-MM-DDTHH:MM:SSZ)
+                                        date_str = raw_date.replace(
+                                            'Z', '+00:00')
+                                        dt_obj = datetime.datetime.fromisoformat(
+                                            date_str)
+                                        # Aware datetime 객체를 UTC로 변환하여 저장 일관성 확보
+                                        data['date'] = dt_obj.astimezone(
+                                            timezone.utc)
+                                    else:
+                                        # 예상치 못한 타입
                                         logger.warning(
-                                            f"날짜 문자열 파싱 실패 ({url}): '{raw_date}'. 오류: {dt_error}. 현재 시간(UTC) 사용.")
-                                        data['date'] = timezone.now()  # UTC 반환
-                                else:
-                                    # date 필드가 없거나 None인 경우 (예: ocid 응답)
-                                    logger.info(
-                                        f"API 응답에 'date' 필드 없음 ({url}). 현재 시간(UTC) 사용.")
-                                    data['date'] = timezone.now()  # UTC 반환
-                                # --- 날짜 처리 로직 끝 ---
-
-                                db_start = time.time()
-                                # sync_to_async로 DB 저장 호출
-                                # save_to_database는 이제 timezone-aware UTC datetime 객체를 받음
-                                view_instance = view_class()
-                                await sync_to_async(view_instance.save_to_database)(data, ocid)
-                                db_time = time.time() - db_start
-                                logger.info(
-                                    f"DB 저장 완료 ({endpoint_name}) - 소요시간: {db_time:.2f}초")
+                                            f"알 수 없는 날짜 타입 ({url}): {type(raw_date)}. 현재 시간(UTC) 사용.")
+                                        # UTC 반환
+                                        data['date'] = timezone.now()
 
-                                process_time = time.time() - process_start - db_time
-                                logger.info(
-                                    f"데이터 처리 완료 ({endpoint_name}) - 소요시간: {process_time:.2f}초")
-
-                                total_request_time = time.time() - request_start
-                                logger.info(
-                                    f"요청 전체 처리 완료 ({url}) - 총 소요시간: {total_request_time:.2f}초")
-                                return url, data  # 성공 시 데이터 반환
-
-                            elif response.status == 400 and "INVALID_IDENTIFIER" in await response.text():
-                                logger.warning(
-                                    f"API 요청 실패 ({url}) - 잘못된 식별자(OCID): {ocid}, 상태: {response.status}, 소요시간: {api_time:.2f}초")
-                                # 특정 에러 구분
-                                return url, {'error': 'INVALID_IDENTIFIER'}
+                                except (ValueError, TypeError) as dt_error:
+                                    logger.warning(
+                                        f"날짜 문자열 파싱 실패 ({url}): '{raw_date}'. 오류: {dt_error}. 현재 시간(UTC) 사용.")
+                                    data['date'] = timezone.now()  # UTC 반환
                             else:
-                                error_text = await response.text()
-                                logger.error(
-                                    f"API 요청 실패 ({url}) - 상태: {response.status}, 내용: {error_text[:200]}, 소요시간: {api_time:.2f}초")
-                                # 실패 시 에러 정보 포함
-                                return url, {'error': f"API Error {response.status}"}
-
-                    except aiohttp.ClientError as e:
-                        logger.error(f"AIOHTTP ClientError ({url}): {str(e)}")
-                        return url, {'error': f'Client Connection Error: {str(e)}'}
-                    except asyncio.TimeoutError:
-                        logger.error(f"API 요청 시간 초과 ({url})")
-                        return url, {'error': 'Request Timeout'}
-                    except Exception as e:
-                        logger.error(f"API 호출/처리 중 예외 발생 ({url}): {str(e)}")
-                        import traceback
-                        logger.error(traceback.format_exc())
-                        return url, {'error': f'Unexpected Error: {str(e)}'}
-
-            # 각 엔드포인트에 맞는 파라미터 설정하여 tasks 생성
-            for url, (endpoint_name, view_class) in api_endpoints.items():
-                params = {'ocid': ocid}
-                # CharacterSkillView 처럼 추가 파라미터가 필요한 경우 처리
-                if view_class == CharacterSkillView:
-                    # 가져올 스킬 차수 목록 (0차, 5차, 6차)
-                    skill_grades_to_fetch = ['0', '5', '6']
-                    for grade in skill_grades_to_fetch:
-                        # 각 차수별 파라미터 설정
-                        skill_params = {'ocid': ocid,
-                                        'character_skill_grade': grade}
-                        # 각 차수별로 비동기 작업 추가
-                        tasks.append(fetch_with_semaphore(url, skill_params))
-                        logger.info(
-                            f"CharacterSkillView 작업 추가 - Grade: {grade}, URL: {url}")
-                    # CharacterSkillView에 대한 기본 task 추가 방지
-                    continue  # 다음 api_endpoint로 넘어감
-                    # --- 기존 로직 주석 처리 또는 삭제 ---
-                    # logger.warning(
-                    #     f"CharacterSkillView는 전체 조회 시 파라미터 필요. 현재는 제외됨. URL: {url}")
-                    # continue  # CharacterSkillView는 일단 제외
-
-                # 다른 뷰들은 기존 로직대로 추가
-                tasks.append(fetch_with_semaphore(url, params))
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            total_time = time.time() - total_start
-            successful_fetches = sum(1 for r in results if isinstance(
-                r, tuple) and r[1] and not r[1].get('error'))
-            failed_fetches = len(results) - successful_fetches
-            logger.info(
-                f"전체 데이터 fetch_all_data 완료 - 총 소요시간: {total_time:.2f}초, 성공: {successful_fetches}, 실패: {failed_fetches}")
-
-            # 예외 처리 또는 실패 로깅
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"비동기 작업 중 예외 발생: {result}")
-                elif isinstance(result, tuple) and result[1] and result[1].get('error'):
-                    logger.warning(
-                        f"데이터 조회 실패 - URL: {result[0]}, 오류: {result[1]['error']}")
-
-            return results  # 결과 반환 (성공/실패 정보 포함)
+                                # date 필드가 없거나 None인 경우 (예: ocid 응답)
+                                logger.info(
+                                    f"API 응답에 'date' 필드 없음 ({url}). 현재 시간(UTC) 사용.")
+                                data['date'] = timezone.now()  # UTC 반환
+                            # --- 날짜 처리 로직 끝 ---
+
+                            db_start = time.time()
+                            # sync_to_async로 DB 저장 호출
+                            # save_to_database는 이제 timezone-aware UTC datetime 객체를 받음
+                            view_instance = view_class()
+                            await sync_to_async(view_instance.save_to_database)(data, ocid)
+                            db_time = time.time() - db_start
+                            logger.info(
+                                f"DB 저장 완료 ({endpoint_name}) - 소요시간: {db_time:.2f}초")
+
+                            process_time = time.time() - process_start - db_time
+                            logger.info(
+                                f"데이터 처리 완료 ({endpoint_name}) - 소요시간: {process_time:.2f}초")
+
+                            total_request_time = time.time() - request_start
+                            logger.info(
+                                f"요청 전체 처리 완료 ({url}) - 총 소요시간: {total_request_time:.2f}초")
+                            return url, data  # 성공 시 데이터 반환
+
+                        elif response.status == 400 and "INVALID_IDENTIFIER" in await response.text():
+                            logger.warning(
+                                f"API 요청 실패 ({url}) - 잘못된 식별자(OCID): {ocid}, 상태: {response.status}, 소요시간: {api_time:.2f}초")
+                            # 특정 에러 구분
+                            return url, {'error': 'INVALID_IDENTIFIER'}
+                        else:
+                            error_text = await response.text()
+                            logger.error(
+                                f"API 요청 실패 ({url}) - 상태: {response.status}, 내용: {error_text[:200]}, 소요시간: {api_time:.2f}초")
+                            # 실패 시 에러 정보 포함
+                            return url, {'error': f"API Error {response.status}"}
+
+                except aiohttp.ClientError as e:
+                    logger.error(f"AIOHTTP ClientError ({url}): {str(e)}")
+                    return url, {'error': f'Client Connection Error: {str(e)}'}
+                except asyncio.TimeoutError:
+                    logger.error(f"API 요청 시간 초과 ({url})")
+                    return url, {'error': 'Request Timeout'}
+                except Exception as e:
+                    logger.error(f"API 호출/처리 중 예외 발생 ({url}): {str(e)}")
+                    import traceback
+                    logger.error(traceback.format_exc())
+                    return url, {'error': f'Unexpected Error: {str(e)}'}
+
+        # 각 엔드포인트에 맞는 파라미터 설정하여 tasks 생성
+        for url, (endpoint_name, view_class) in api_endpoints.items():
+            params = {'ocid': ocid}
+            # CharacterSkillView 처럼 추가 파라미터가 필요한 경우 처리
+            if view_class == CharacterSkillView:
+                # 가져올 스킬 차수 목록 (0차, 5차, 6차)
+                skill_grades_to_fetch = ['0', '5', '6']
+                for grade in skill_grades_to_fetch:
+                    # 각 차수별 파라미터 설정
+                    skill_params = {'ocid': ocid,
+                                    'character_skill_grade': grade}
+                    # 각 차수별로 비동기 작업 추가
+                    tasks.append(fetch_with_semaphore(url, skill_params))
+                    logger.info(
+                        f"CharacterSkillView 작업 추가 - Grade: {grade}, URL: {url}")
+                # CharacterSkillView에 대한 기본 task 추가 방지
+                continue  # 다음 api_endpoint로 넘어감
+                # --- 기존 로직 주석 처리 또는 삭제 ---
+                # logger.warning(
+                #     f"CharacterSkillView는 전체 조회 시 파라미터 필요. 현재는 제외됨. URL: {url}")
+                # continue  # CharacterSkillView는 일단 제외
+
+            # 다른 뷰들은 기존 로직대로 추가
+            tasks.append(fetch_with_semaphore(url, params))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        total_time = time.time() - total_start
+        successful_fetches = sum(1 for r in results if isinstance(
+            r, tuple) and r[1] and not r[1].get('error'))
+        failed_fetches = len(results) - successful_fetches
+        logger.info(
+            f"전체 데이터 fetch_all_data 완료 - 총 소요시간: {total_time:.2f}초, 성공: {successful_fetches}, 실패: {failed_fetches}")
+
+        # 예외 처리 또는 실패 로깅
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"비동기 작업 중 예외 발생: {result}")
+            elif isinstance(result, tuple) and result[1] and result[1].get('error'):
+                logger.warning(
+                    f"데이터 조회 실패 - URL: {result[0]}, 오류: {result[1]['error']}")
+
+        return results  # 결과 반환 (성공/실패 정보 포함)
 
 
 class RedisHealthCheckView(APIView):
@@ -1097,6 +1139,7 @@ class InventoryListView(APIView):
                         ),
                         'total_count': openapi.Schema(type=openapi.TYPE_INTEGER, description='총 아이템 수'),
                         'last_crawled_at': openapi.Schema(type=openapi.TYPE_STRING, nullable=True, description='마지막 크롤링 시간'),
+                        'last_confirmed_at': openapi.Schema(type=openapi.TYPE_STRING, nullable=True, description='페이지가 바뀌지 않았음을 마지막으로 확인한 시간'),
                         'category': openapi.Schema(type=openapi.TYPE_STRING, description='적용된 카테고리'),
                         'sort': openapi.Schema(type=openapi.TYPE_STRING, description='적용된 정렬 기준'),
                         'order': openapi.Schema(type=openapi.TYPE_STRING, description='적용된 정렬 순서')
@@ -1195,11 +1238,17 @@ class InventoryListView(APIView):
             if latest_item:
                 last_crawled_at = latest_item.crawled_at.isoformat()
 
+        # 내용이 같아 저장을 생략한 크롤링도 확인 시간으로 표시
+        crawl_state = CrawlContentState.objects.filter(
+            character_basic=character_basic, crawl_type='inventory').first()
+        last_confirmed_at = crawl_state.confirmed_at.isoformat() if crawl_state else last_crawled_at
+
         return Response({
             'character_name': character_basic.character_name,
             'items': serializer.data,
             'total_count': inventory_items.count(),
             'last_crawled_at': last_crawled_at,
+            'last_confirmed_at': last_confirmed_at,
             'category': category,  # 현재 적용된 카테고리 반환 (Story 3.5)
             'sort': sort_field,    # 현재 적용된 정렬 기준 반환 (Story 3.9: AC-3.9.5)
             'order': order         # 현재 적용된 정렬 순서 반환 (Story 3.9: AC-3.9.4)
@@ -1293,6 +1342,7 @@ class StorageListView(APIView):
                         ),
                         'total_count': openapi.Schema(type=openapi.TYPE_INTEGER, description='총 아이템 수'),
                         'last_crawled_at': openapi.Schema(type=openapi.TYPE_STRING, nullable=True, description='마지막 크롤링 시간'),
+                        'last_confirmed_at': openapi.Schema(type=openapi.TYPE_STRING, nullable=True, description='페이지가 바뀌지 않았음을 마지막으로 확인한 시간'),
                         'category': openapi.Schema(type=openapi.TYPE_STRING, description='적용된 카테고리'),
                         'sort': openapi.Schema(type=openapi.TYPE_STRING, description='적용된 정렬 기준'),
                         'order': openapi.Schema(type=openapi.TYPE_STRING, description='적용된 정렬 순서')
@@ -1319,7 +1369,7 @@ class StorageListView(APIView):
         AC-3.9.6: 만료일 정렬 시 null 값은 마지막에 표시
         """
         from accounts.models import Character
-        from .models import CharacterBasic, Storage
+        from .models import CharacterBasic, CrawlContentState, Storage
         from .serializers import StorageItemSerializer
 
         # 1. 소유권 검증: 사용자가 이 캐릭터를 소유하는지 확인
@@ -1400,10 +1450,17 @@ class StorageListView(APIView):
             if latest_item:
                 last_crawled_at = latest_item.crawled_at.isoformat()
 
+        # 내용이 같아 저장을 생략한 크롤링도 확인 시간으로 표시
+        crawl_state = CrawlContentState.objects.filter(
+            character_basic__ocid__in=user_character_ocids, crawl_type='storage'
+        ).order_by('-confirmed_at').first()
+        last_confirmed_at = crawl_state.confirmed_at.isoformat() if crawl_state else last_crawled_at
+
         return Response({
             'items': serializer.data,
             'total_count': storage_items.count(),
             'last_crawled_at': last_crawled_at,
+            'last_confirmed_at': last_confirmed_at,
             'category': category,
             'sort': sort_field,    # 현재 적용된 정렬 기준 반환 (Story 3.9: AC-3.9.5)
             'order': order         # 현재 적용된 정렬 순서 반환 (Story 3.9: AC-3.9.4)
@@ -1727,12 +1784,14 @@ class ItemSearchView(APIView):
                 'results': []
             })
 
-        # 4. 아이템 검색 결과 수집
+        # 4. 아이템 검색 결과 수집 (캐릭터 등록 순서대로 묶음)
         results = []
+        ocid_order = {ocid: index for index, ocid in enumerate(user_character_ocids)}
 
         # 4-1. 인벤토리 검색 (location이 'inventory' 또는 'all')
         if location in ['inventory', 'all']:
-            inventory_query = Inventory.objects.filter(
+            # 각 캐릭터의 현재 스냅샷만 조회 (CrawlSnapshot join, 쿼리 1회)
+            inventory_query = CrawlSnapshot.current_items('inventory').filter(
                 character_basic__ocid__in=user_character_ocids,
                 item_name__icontains=query
             ).select_related('character_basic')
@@ -1741,37 +1800,28 @@ class ItemSearchView(APIView):
             if item_type:
                 inventory_query = inventory_query.filter(item_type=item_type)
 
-            # 최근 크롤링 데이터만 조회 (각 캐릭터의 최신 crawled_at)
-            for ocid in user_character_ocids:
-                latest_crawled = Inventory.objects.filter(
-                    character_basic__ocid=ocid
-                ).order_by('-crawled_at').first()
-
-                if latest_crawled:
-                    items = inventory_query.filter(
-                        character_basic__ocid=ocid,
-                        crawled_at=latest_crawled.crawled_at
-                    )
-
-                    for item in items:
-                        results.append({
-                            'item_name': item.item_name,
-                            'item_type': item.item_type,
-                            'quantity': item.quantity,
-                            'item_icon': item.item_icon,
-                            'item_options': item.item_options,
-                            'location': 'inventory',
-                            'character_name': item.character_basic.character_name,
-                            'character_ocid': item.character_basic.ocid,
-                            'world_name': item.character_basic.world_name,
-                            'expiry_date': item.expiry_date,
-                            'days_until_expiry': item.days_until_expiry,
-                            'is_expirable': item.is_expirable,
-                        })
+            items = sorted(inventory_query, key=lambda item: ocid_order[item.character_basic.ocid])
+
+            for item in items:
+                results.append({
+                    'item_name': item.item_name,
+                    'item_type': item.item_type,
+                    'quantity': item.quantity,
+                    'item_icon': item.item_icon,
+                    'item_options': item.item_options,
+                    'location': 'inventory',
+                    'character_name': item.character_basic.character_name,
+                    'character_ocid': item.character_basic.ocid,
+                    'world_name': item.character_basic.world_name,
+                    'expiry_date': item.expiry_date,
+                    'days_until_expiry': item.days_until_expiry,
+                    'is_expirable': item.is_expirable,
+                })
 
         # 4-2. 창고 검색 (location이 'storage' 또는 'all')
         if location in ['storage', 'all']:
-            storage_query = Storage.objects.filter(
+            # 각 캐릭터의 현재 스냅샷만 조회 (CrawlSnapshot join, 쿼리 1회)
+            storage_query = CrawlSnapshot.current_items('storage').filter(
                 character_basic__ocid__in=user_character_ocids,
                 item_name__icontains=query
             ).select_related('character_basic')
@@ -1779,33 +1829,23 @@ class ItemSearchView(APIView):
             # 창고는 item_type 필드가 없으므로, 필터링하지 않음
             # (필요시 item_options 유무 등으로 유추 가능)
 
-            # 최근 크롤링 데이터만 조회
-            for ocid in user_character_ocids:
-                latest_crawled = Storage.objects.filter(
-                    character_basic__ocid=ocid
-                ).order_by('-crawled_at').first()
-
-                if latest_crawled:
-                    items = storage_query.filter(
-                        character_basic__ocid=ocid,
-                        crawled_at=latest_crawled.crawled_at
-                    )
-
-                    for item in items:
-                        results.append({
-                            'item_name': item.item_name,
-                            'item_type': None,  # Storage 모델에는 item_type 필드 없음
-                            'quantity': item.quantity,
-                            'item_icon': item.item_icon,
-                            'item_options': item.item_options,
-                            'location': 'storage',
-                            'character_name': item.character_basic.character_name,
-                            'character_ocid': item.character_basic.ocid,
-                            'world_name': item.character_basic.world_name,
-                            'expiry_date': item.expiry_date,
-                            'days_until_expiry': item.days_until_expiry,
-                            'is_expirable': item.is_expirable,
-                        })
+            items = sorted(storage_query, key=lambda item: ocid_order[item.character_basic.ocid])
+
+            for item in items:
+                results.append({
+                    'item_name': item.item_name,
+                    'item_type': None,  # Storage 모델에는 item_type 필드 없음
+                    'quantity': item.quantity,
+                    'item_icon': item.item_icon,
+                    'item_options': item.item_options,
+                    'location': 'storage',
+                    'character_name': item.character_basic.character_name,
+                    'character_ocid': item.character_basic.ocid,
+                    'world_name': item.character_basic.world_name,
+                    'expiry_date': item.expiry_date,
+                    'days_until_expiry': item.days_until_expiry,
+                    'is_expirable': item.is_expirable,
+                })
 
         # 5. 페이지네이션 처리
         page_number = request.query_params.get('page', 1)
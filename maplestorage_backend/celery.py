@@ -1,6 +1,7 @@
 import os
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_shutdown, worker_shutdown
 
 # Django 설정 모듈을 Celery의 기본 설정으로 지정
 os.environ.setdefault('DJANGO_SETTINGS_MODULE',
@@ -28,9 +29,33 @@ app.conf.beat_schedule = {
         'schedule': crontab(hour=0, minute=0),  # 매일 자정 (KST)
         'options': {'expires': 7200},  # 2시간 후 만료
     },
+    # 히스토리 보존 정책 적용 (인벤토리/창고 스냅샷, 날짜별 API 데이터)
+    'compact-history-daily': {
+        'task': 'characters.tasks.compact_history',
+        'schedule': crontab(hour=4, minute=30),  # 매일 04:30 (KST, 트래픽 적은 시간)
+        'options': {'expires': 7200},
+    },
 }
 
 
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def shutdown_crawler_browsers(**kwargs):
+    """워커 종료 시 크롤러 HTTP 세션, Nexon API 세션, 비동기 Redis 연결, 브라우저 풀 및 파싱 워커 정리"""
+    from characters.browser_pool import shutdown_browser_pools
+    from characters.page_fetchers import shutdown_http_fetchers
+    from characters.parse_executor import shutdown_parse_executor
+    from util.nexon_client import shutdown_async_nexon_clients
+    from util.redis_client import RedisClient
+
+    # 브라우저 풀 정리 시 워커 루프가 닫히므로 HTTP 세션을 먼저 종료
+    shutdown_http_fetchers()
+    shutdown_async_nexon_clients()
+    RedisClient.close_async_instances()
+    shutdown_browser_pools()
+    shutdown_parse_executor()
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
@@ -259,6 +259,12 @@ import sys
 if 'test' in sys.argv or 'pytest' in sys.argv[0] if sys.argv else False:
     CELERY_TASK_ALWAYS_EAGER = True
     CELERY_TASK_EAGER_PROPAGATES = True
+    # 테스트 환경에서는 외부 HTTP 요청 없이 Playwright(mock) 경로 사용
+    os.environ.setdefault('CRAWLER_FETCH_BACKEND', 'playwright')
+    # 테스트 환경에서는 파싱을 프로세스 풀 대신 호출한 루프에서 바로 실행 (파서 mock 적용)
+    os.environ.setdefault('CRAWLER_PARSE_MODE', 'inline')
+    # 테스트 간 파싱 결과가 캐시로 공유되지 않도록 비활성화 (locmem 캐시는 테스트 사이에 유지됨)
+    os.environ.setdefault('CRAWLER_PARSE_CACHE_ENABLED', 'False')
     # Story 3.1: 테스트 환경에서는 locmem 캐시 사용 (Redis 불필요)
     CACHES = {
         'default': {
@@ -278,6 +284,90 @@ else:
         }
     }
 
+# Nexon Open API Rate Limit (API 키별 토큰 버킷, util.rate_limiter)
+# 개발 단계: 초당 5건 / 서비스 단계: 초당 500건 (NEXON_API_RATE_LIMIT=500)
+NEXON_API_RATE_LIMIT = int(os.getenv('NEXON_API_RATE_LIMIT', '5'))
+NEXON_API_BURST = int(os.getenv('NEXON_API_BURST', str(NEXON_API_RATE_LIMIT)))
+# 엔드포인트별 추가 제한 (예: {'character/item-equipment': 50})
+NEXON_API_ENDPOINT_RATE_LIMITS = {}
+# 캐릭터 조회 뷰 버킷 (전체 조회 fan-out(약 21건 동시 호출)과 단일 엔드포인트 뷰)
+# NEXON_API_RATE_LIMIT(개발 기본 5/s)을 공유하면 요청마다 약 3초를 대기하므로 서비스 키 한도(초당 500건)를 기본값으로 사용
+NEXON_API_ALL_DATA_RATE_LIMIT = int(os.getenv('NEXON_API_ALL_DATA_RATE_LIMIT', '500'))
+NEXON_API_ALL_DATA_BURST = int(os.getenv('NEXON_API_ALL_DATA_BURST', str(NEXON_API_ALL_DATA_RATE_LIMIT)))
+
+# Nexon 데이터 공개 주기 기반 캐시 신선도 (characters/freshness.py)
+# 전일 데이터는 매일 오전 1시(KST) 이후 조회 가능 -> 공개 시각 + 여유 시간까지 캐싱
+NEXON_DEFAULT_PUBLISH_TIME = os.getenv('NEXON_DEFAULT_PUBLISH_TIME', '01:00')
+# 엔드포인트별 공개 시각 (예: {'character/basic': '01:00'})
+NEXON_PUBLISH_TIMES = {}
+NEXON_PUBLISH_SAFETY_MARGIN = int(os.getenv('NEXON_PUBLISH_SAFETY_MARGIN', '600'))
+
+# Nexon API HTTP 클라이언트 (util/nexon_client.py)
+# (connect, read) 타임아웃 초
+NEXON_HTTP_TIMEOUT = (
+    float(os.getenv('NEXON_HTTP_CONNECT_TIMEOUT', '3.05')),
+    float(os.getenv('NEXON_HTTP_READ_TIMEOUT', '10')),
+)
+# 호스트당 keep-alive 연결 수 (동시 요청 수보다 작으면 연결이 재사용되지 않고 버려짐)
+NEXON_HTTP_POOL_MAXSIZE = int(os.getenv('NEXON_HTTP_POOL_MAXSIZE', '20'))
+# 429/5xx/연결 오류 재시도 횟수
+NEXON_HTTP_MAX_RETRIES = int(os.getenv('NEXON_HTTP_MAX_RETRIES', '3'))
+
+# 크롤러 브라우저 풀 설정 (Celery 워커 프로세스별)
+# 동시에 유지할 Chromium 수, 브라우저 교체 전 최대 처리 페이지 수, Chromium RSS 합계 한도
+CRAWLER_BROWSER_POOL_SIZE = int(os.getenv('CRAWLER_BROWSER_POOL_SIZE', '1'))
+CRAWLER_BROWSER_MAX_PAGES = int(os.getenv('CRAWLER_BROWSER_MAX_PAGES', '100'))
+CRAWLER_BROWSER_MAX_MEMORY_MB = int(os.getenv('CRAWLER_BROWSER_MAX_MEMORY_MB', '1024'))
+
+# 크롤러 페이지 fetch 방식
+# 'http': 정적 HTTP 요청 우선 (필수 요소가 없으면 Playwright로 폴백), 'playwright': 항상 브라우저 사용
+CRAWLER_FETCH_BACKEND = os.getenv('CRAWLER_FETCH_BACKEND', 'http')
+
+# 크롤링 대상 사이트 주소 (오프라인 벤치마크 시 replay 서버 주소로 변경, characters/benchmarks/replay_server.py)
+CRAWLER_BASE_URL = os.getenv('CRAWLER_BASE_URL', 'https://maplestory.nexon.com')
+# 인벤토리 페이지 요청 전 대기 시간 (초, 실제 대기는 +0~3초 랜덤)
+CRAWLER_REQUEST_DELAY = float(os.getenv('CRAWLER_REQUEST_DELAY', '2'))
+
+# Playwright 페이지 리소스 차단 (이미지/미디어/폰트/트래커 요청 abort)
+# 차단 대상 타입/URL은 CRAWLER_BLOCKED_RESOURCE_TYPES, CRAWLER_BLOCKED_URL_KEYWORDS로 재정의 가능
+CRAWLER_BLOCK_RESOURCES = os.getenv('CRAWLER_BLOCK_RESOURCES', 'True') == 'True'
+
+# 크롤링 HTML 파싱 실행 방식 (characters/parse_executor.py)
+# 'process': 워커 프로세스 풀에서 파싱 (이벤트 루프가 파싱 중 멈추지 않음), 'inline': 루프에서 바로 파싱
+CRAWLER_PARSE_MODE = os.getenv('CRAWLER_PARSE_MODE', 'process')
+# Celery 워커 프로세스당 파싱 워커 수, 아이템 상세 묶음 파싱 시 작업당 페이지 수
+CRAWLER_PARSE_WORKERS = int(os.getenv('CRAWLER_PARSE_WORKERS', '2'))
+CRAWLER_PARSE_CHUNK_SIZE = int(os.getenv('CRAWLER_PARSE_CHUNK_SIZE', '16'))
+
+# 페이지 내용 해시 기반 파싱 결과 캐시 (characters/parse_cache.py)
+# 같은 HTML은 다시 파싱하지 않음. Redis 쪽 축출은 maxmemory-policy(allkeys-lru) + TTL
+CRAWLER_PARSE_CACHE_ENABLED = os.getenv('CRAWLER_PARSE_CACHE_ENABLED', 'True') == 'True'
+CRAWLER_PARSE_CACHE_TIMEOUT = int(os.getenv('CRAWLER_PARSE_CACHE_TIMEOUT', str(7 * 24 * 3600)))
+CRAWLER_PARSE_CACHE_LOCAL_SIZE = int(os.getenv('CRAWLER_PARSE_CACHE_LOCAL_SIZE', '256'))
+
+# 인벤토리/창고 아이템 저장 청크 크기 (characters/crawl_persistence.py)
+# 파싱 → 검증 → bulk_create를 청크 단위로 처리하므로 크롤링당 메모리가 청크 크기에 비례
+CRAWLER_PERSIST_CHUNK_SIZE = int(os.getenv('CRAWLER_PERSIST_CHUNK_SIZE', '200'))
+# PostgreSQL에서 인벤토리/창고 저장에 INSERT 대신 COPY 사용 (다른 DB는 무시)
+CRAWLER_PERSIST_USE_COPY = os.getenv('CRAWLER_PERSIST_USE_COPY', 'False') == 'True'
+# 인벤토리/창고 히스토리 저장 방식
+# full: 크롤링마다 전체 복사 / delta: 첫 스냅샷만 전체, 이후 추가/변경/제거된 슬롯만 저장
+CRAWLER_HISTORY_MODE = os.getenv('CRAWLER_HISTORY_MODE', 'full')
+
+# 히스토리 보존 정책 (characters/retention.py, 매일 compact_history 태스크)
+# 최근 KEEP_ALL_DAYS일은 모두, DAILY_DAYS일까지 하루 1개, WEEKLY_DAYS일까지 주 1개 (비우면 기한 없음)
+HISTORY_RETENTION_KEEP_ALL_DAYS = int(os.getenv('HISTORY_RETENTION_KEEP_ALL_DAYS', '7'))
+HISTORY_RETENTION_DAILY_DAYS = int(os.getenv('HISTORY_RETENTION_DAILY_DAYS', '90'))
+HISTORY_RETENTION_WEEKLY_DAYS = int(os.getenv('HISTORY_RETENTION_WEEKLY_DAYS')) if os.getenv('HISTORY_RETENTION_WEEKLY_DAYS') else None
+HISTORY_RETENTION_CHUNK_SIZE = int(os.getenv('HISTORY_RETENTION_CHUNK_SIZE', '1000'))
+
+# 아이템 상세 크롤링 동시성/요청률
+# RATE_PER_SEC/BURST는 대상 host별로 모든 워커가 공유하는 politeness budget (Redis 토큰 버킷)
+# CONCURRENCY는 크롤링 1건의 최대 동시 요청 수, 1이면 기존 순차 방식 (요청 간 2-3초, 50개마다 30초 휴식)
+CRAWLER_DETAIL_CONCURRENCY = int(os.getenv('CRAWLER_DETAIL_CONCURRENCY', '4'))
+CRAWLER_DETAIL_RATE_PER_SEC = float(os.getenv('CRAWLER_DETAIL_RATE_PER_SEC', '1.0'))
+CRAWLER_DETAIL_BURST = int(os.getenv('CRAWLER_DETAIL_BURST', '3'))
+
 # Story 2.10: Alert Settings
 # 알림 받을 관리자 이메일
 ALERT_EMAIL = os.getenv('ALERT_EMAIL', '')
@@ -0,0 +1,370 @@
+"""
+Nexon Open API HTTP 클라이언트 (커넥션 풀 + keep-alive)
+
+모든 Nexon API 호출은 이 모듈을 거칩니다. 호출마다 requests.get()으로 새
+TCP/TLS 연결을 여는 대신 풀링된 세션을 재사용하고, 기본 타임아웃과
+429/5xx 재시도(지터 포함 지수 백오프)를 한 곳에서 적용합니다.
+
+요청률 제한(util.rate_limiter)도 클라이언트가 적용합니다. 재시도를 포함한 모든 시도마다
+API 키(x-nxopen-api-key 헤더) + 엔드포인트 버킷에서 토큰을 얻으므로 429 재시도가 한도를 넘지 않습니다.
+
+- NexonAPIClient: requests.Session 기반 동기 클라이언트 (스레드별 세션)
+- AsyncNexonAPIClient: aiohttp 기반 비동기 클라이언트
+- get_async_nexon_client(): 이벤트 루프별 공용 비동기 클라이언트 (워커 루프 수명 동안 연결 재사용)
+
+settings:
+    NEXON_HTTP_TIMEOUT: (connect, read) 타임아웃 초 (기본 (3.05, 10))
+    NEXON_HTTP_POOL_MAXSIZE: 호스트당 최대 keep-alive 연결 수 (기본 20)
+    NEXON_HTTP_MAX_RETRIES: 429/5xx/연결 오류 재시도 횟수 (기본 3)
+"""
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import aiohttp
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from .rate_limiter import RateLimiter, api_key_scope, endpoint_from_url, get_nexon_api_limiter
+
+logger = logging.getLogger('maple_api')
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_HEADERS = {
+    'accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+
+# RateLimiter 또는 RateLimiter를 반환하는 함수 (지연 생성용)
+LimiterSource = Union[RateLimiter, Callable[[], RateLimiter]]
+
+
+def _limit_target(limiter: LimiterSource, url: str, headers: Optional[Dict[str, str]]):
+    """(리미터, 버킷 키, 엔드포인트)"""
+    resolved = limiter if isinstance(limiter, RateLimiter) else limiter()
+    api_key = (headers or {}).get('x-nxopen-api-key')
+    return resolved, api_key_scope(api_key), endpoint_from_url(url)
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[str], base: float, cap: float) -> float:
+    """
+    재시도 대기 시간 (full jitter 지수 백오프, Retry-After 헤더 우선)
+
+    Args:
+        attempt: 0부터 시작하는 재시도 번호
+        retry_after: 응답의 Retry-After 헤더 값 (초)
+    """
+    if retry_after:
+        try:
+            return min(cap, float(retry_after))
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class NexonAPIClient:
+    """
+    Nexon API 동기 클라이언트
+
+    requests.Session은 스레드 간 공유가 보장되지 않으므로 스레드별로 세션을
+    만들고, 세션 내부의 urllib3 커넥션 풀로 keep-alive 연결을 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[Tuple[float, float]] = None,
+        pool_maxsize: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        limiter: Optional[LimiterSource] = None,
+    ):
+        """
+        Args:
+            timeout: (connect, read) 기본 타임아웃 (초)
+            pool_maxsize: 호스트당 최대 keep-alive 연결 수
+            max_retries: 429/5xx/연결 오류 재시도 횟수
+            backoff_base: 백오프 기본 시간 (초)
+            backoff_max: 백오프 최대 시간 (초)
+            limiter: 시도마다 토큰을 얻을 리미터 (기본 get_nexon_api_limiter)
+        """
+        self.limiter = limiter or get_nexon_api_limiter
+        self.timeout = tuple(timeout or getattr(settings, 'NEXON_HTTP_TIMEOUT', (3.05, 10)))
+        self.pool_maxsize = pool_maxsize or getattr(settings, 'NEXON_HTTP_POOL_MAXSIZE', 20)
+        self.max_retries = max_retries if max_retries is not None else getattr(
+            settings, 'NEXON_HTTP_MAX_RETRIES', 3)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """현재 스레드의 세션 (없으면 생성)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            # 재시도는 get()에서 직접 처리 (지터/Retry-After 적용)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_maxsize, max_retries=0)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            self._local.session = session
+        return session
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout=None,
+        limiter: Optional[LimiterSource] = None,
+    ) -> requests.Response:
+        """
+        GET 요청 (시도마다 리미터 토큰 획득, 429/5xx/연결 오류 시 재시도)
+
+        재시도 후에도 실패한 응답은 그대로 반환하므로, 호출자는 기존처럼
+        status_code 확인이나 raise_for_status()를 사용합니다.
+
+        Args:
+            limiter: 이 요청에만 사용할 리미터 (없으면 클라이언트 리미터)
+
+        Raises:
+            requests.exceptions.ConnectionError / Timeout: 재시도 후에도 연결 실패 시
+        """
+        rate_limiter, key, endpoint = _limit_target(limiter or self.limiter, url, headers)
+
+        for attempt in range(self.max_retries + 1):
+            rate_limiter.acquire_sync(key, endpoint)
+            try:
+                response = self.session.get(
+                    url, params=params, headers=headers, timeout=timeout or self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = _backoff_delay(attempt, None, self.backoff_base, self.backoff_max)
+                logger.warning(f'Nexon API 연결 오류, {delay:.2f}초 후 재시도 ({url}): {e}')
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                return response
+
+            delay = _backoff_delay(
+                attempt, response.headers.get('Retry-After'), self.backoff_base, self.backoff_max)
+            logger.warning(
+                f'Nexon API {response.status_code}, {delay:.2f}초 후 재시도 ({url})')
+            response.close()
+            time.sleep(delay)
+
+        return response
+
+    def close(self):
+        """현재 스레드의 세션 종료"""
+        session = getattr(self._local, 'session', None)
+        if session is not None:
+            session.close()
+            self._local.session = None
+
+
+class NexonAsyncResponse:
+    """
+    AsyncNexonAPIClient 응답 (본문은 미리 읽어 둠)
+
+    aiohttp.ClientResponse와 같이 status, await text(), await json()을 제공하므로
+    기존 aiohttp 호출 코드를 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, status: int, body: str, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    async def text(self) -> str:
+        return self.body
+
+    async def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class _RequestContext:
+    """await client.get(...) 과 async with client.get(...) as response 를 모두 지원"""
+
+    def __init__(self, coro):
+        self._coro = coro
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    async def __aenter__(self) -> NexonAsyncResponse:
+        return await self._coro
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+class AsyncNexonAPIClient:
+    """
+    Nexon API 비동기 클라이언트 (NexonAPIClient의 aiohttp 버전)
+
+    aiohttp 세션은 이벤트 루프에 묶이므로 루프별 공용 클라이언트(get_async_nexon_client)를
+    쓰거나 async with 블록 단위로 사용합니다.
+
+    사용 예:
+        client = get_async_nexon_client()
+        async with client.get(url, params={'ocid': ocid}, headers=headers) as response:
+            if response.status == 200:
+                data = await response.json()
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[Tuple[float, float]] = None,
+        pool_maxsize: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        limiter: Optional[LimiterSource] = None,
+    ):
+        self.limiter = limiter or get_nexon_api_limiter
+        connect_timeout, read_timeout = timeout or getattr(settings, 'NEXON_HTTP_TIMEOUT', (3.05, 10))
+        self.timeout = aiohttp.ClientTimeout(
+            total=connect_timeout + read_timeout, connect=connect_timeout, sock_read=read_timeout)
+        self.pool_maxsize = pool_maxsize or getattr(settings, 'NEXON_HTTP_POOL_MAXSIZE', 20)
+        self.max_retries = max_retries if max_retries is not None else getattr(
+            settings, 'NEXON_HTTP_MAX_RETRIES', 3)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_maxsize,
+                    limit_per_host=self.pool_maxsize,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                ),
+                timeout=self.timeout,
+                headers=DEFAULT_HEADERS,
+            )
+        return self._session
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        limiter: Optional[LimiterSource] = None,
+    ) -> _RequestContext:
+        """
+        GET 요청 (시도마다 리미터 토큰 획득, 429/5xx/연결 오류 시 재시도)
+
+        Args:
+            limiter: 이 요청에만 사용할 리미터 (없으면 클라이언트 리미터)
+
+        Raises:
+            aiohttp.ClientError / asyncio.TimeoutError: 재시도 후에도 연결 실패 시
+        """
+        return _RequestContext(self._get(url, params, headers, limiter or self.limiter))
+
+    async def _get(self, url, params, headers, limiter) -> NexonAsyncResponse:
+        session = self._get_session()
+        rate_limiter, key, endpoint = _limit_target(limiter, url, headers)
+
+        for attempt in range(self.max_retries + 1):
+            await rate_limiter.acquire(key, endpoint)
+            try:
+                async with session.get(url, params=params, headers=headers) as response:
+                    result = NexonAsyncResponse(
+                        response.status, await response.text(), dict(response.headers))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = _backoff_delay(attempt, None, self.backoff_base, self.backoff_max)
+                logger.warning(f'Nexon API 연결 오류, {delay:.2f}초 후 재시도 ({url}): {e}')
+                await asyncio.sleep(delay)
+                continue
+
+            if result.status not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                return result
+
+            delay = _backoff_delay(
+                attempt, result.headers.get('Retry-After'), self.backoff_base, self.backoff_max)
+            logger.warning(f'Nexon API {result.status}, {delay:.2f}초 후 재시도 ({url})')
+            await asyncio.sleep(delay)
+
+        return result
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+_client: Optional[NexonAPIClient] = None
+_client_lock = threading.Lock()
+
+
+def get_nexon_client() -> NexonAPIClient:
+    """프로세스 공용 Nexon API 동기 클라이언트"""
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = NexonAPIClient()
+    return _client
+
+
+# 이벤트 루프별 공용 비동기 클라이언트 (aiohttp 세션은 생성된 루프에 묶임)
+_async_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncNexonAPIClient]' = weakref.WeakKeyDictionary()
+
+
+def get_async_nexon_client() -> AsyncNexonAPIClient:
+    """
+    현재 이벤트 루프의 공용 Nexon API 비동기 클라이언트 (없으면 생성)
+
+    run_in_worker_loop()처럼 계속 유지되는 루프에서 쓰면 요청 간에 keep-alive 연결을 재사용합니다.
+    반드시 코루틴 안에서 호출해야 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+
+    if client is None:
+        client = AsyncNexonAPIClient()
+        _async_clients[loop] = client
+
+    return client
+
+
+def shutdown_async_nexon_clients():
+    """모든 공용 비동기 클라이언트 세션 종료 (워커 종료 시 호출)"""
+    for loop, client in list(_async_clients.items()):
+        if loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(client.close())
+        except Exception as e:
+            logger.warning(f'Nexon API client shutdown failed: {e}')
+
+    _async_clients.clear()
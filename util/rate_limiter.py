@@ -1,51 +1,403 @@
+"""
+분산 토큰 버킷 레이트 리미터 (Redis Lua)
+
+여러 워커/프로세스가 같은 Nexon API 키를 공유하므로 버킷 상태는 Redis에 두고,
+토큰 계산과 차감은 Lua 스크립트 한 번으로 원자적으로 처리합니다.
+
+- 초당 rate개 토큰을 채우고 capacity만큼 burst 허용 (고정 1초 윈도우 X)
+- 버킷 단위: API 키별 + (설정된 경우) 엔드포인트별. 한 요청은 모든 버킷에서
+  동시에 토큰을 얻어야 통과하며, 부족하면 아무 버킷에서도 차감하지 않음
+- 동기 API(acquire_sync)는 time.sleep, 비동기 API(acquire)는 asyncio.sleep으로
+  대기하므로 이벤트 루프를 막지 않음
+- Redis에 연결할 수 없으면 잠시 프로세스 로컬 버킷으로 대체
+
+사용예시:
+    limiter = get_nexon_api_limiter()
+    await limiter.acquire(key=api_key_scope(APIKEY), endpoint='character/basic')
+
+    @rate_limited(get_nexon_api_limiter, key=api_key_scope(APIKEY))
+    def get_character():
+        return requests.get("https://open.api.nexon.com/...")
+"""
+import asyncio
+import hashlib
+import inspect
+import logging
+import threading
 import time
+import weakref
 from functools import wraps
-from .redis_client import redis_client
-import logging
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import redis
+from django.conf import settings
+
+from .redis_client import RedisClient
 
 logger = logging.getLogger('maple_api')
 
+# KEYS: 버킷 키 목록, ARGV[1]: 요청 토큰 수, ARGV[2i], ARGV[2i+1]: i번째 버킷의 rate, capacity
+# 반환: {허용 여부(1/0), 대기 시간(초, 문자열)}
+TOKEN_BUCKET_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local requested = tonumber(ARGV[1])
+local wait = 0
+local levels = {}
+
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2])
+    local capacity = tonumber(ARGV[i * 2 + 1])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    levels[i] = tokens
+    if tokens < requested then
+        wait = math.max(wait, (requested - tokens) / rate)
+    end
+end
+
+local allowed = wait == 0
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2])
+    local capacity = tonumber(ARGV[i * 2 + 1])
+    local tokens = levels[i]
+    if allowed then
+        tokens = tokens - requested
+    end
+    redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+    redis.call('PEXPIRE', key, math.ceil(capacity / rate * 1000) + 1000)
+end
+
+if allowed then
+    return {1, '0'}
+end
+return {0, tostring(wait)}
+"""
+
+# KEYS/ARGV는 TOKEN_BUCKET_SCRIPT와 같음 (ARGV[1]은 사용하지 않음), 모든 버킷의 토큰을 0으로
+DRAIN_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2])
+    local capacity = tonumber(ARGV[i * 2 + 1])
+    redis.call('HSET', key, 'tokens', '0', 'ts', tostring(now))
+    redis.call('PEXPIRE', key, math.ceil(capacity / rate * 1000) + 1000)
+end
+return 1
+"""
+
+# Redis 장애 시 재연결을 시도하지 않는 시간 (초)
+REDIS_RETRY_INTERVAL = 5
+
+
+class _LocalBucket:
+    """Redis 장애 시 사용하는 프로세스 로컬 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def level(self, now: float) -> float:
+        return min(self.capacity, self.tokens + max(0.0, now - self.updated_at) * self.rate)
+
 
-def check_rate_limit(max_calls: int = 500):
+class RateLimiter:
     """
-    레이트 리밋을 체크하는 함수
-    1초당 max_calls를 넘으면, 다음 초까지 대기했다가 다시 시도.
+    Redis Lua 토큰 버킷 레이트 리미터
+
+    Args:
+        name: 리미터 이름 (Redis 키 prefix)
+        rate: 키별 초당 허용 요청 수
+        capacity: 키별 burst 허용량 (기본: rate)
+        endpoint_rates: 엔드포인트별 추가 제한 {endpoint: rate} (capacity는 rate와 동일)
     """
-    current_second = int(time.time())
-    key = f"rate_limit:{current_second}"
 
-    # transaction=False로 성능 향상
-    with redis_client.pipeline(transaction=False) as pipe:
-        current_count = pipe.incr(key).expire(key, 2).execute()[0]
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: Optional[float] = None,
+        endpoint_rates: Optional[Dict[str, float]] = None,
+    ):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+
+        self.name = name
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity else rate)
+        self.endpoint_rates = dict(endpoint_rates or {})
+
+        self._local_buckets: Dict[str, _LocalBucket] = {}
+        self._local_lock = threading.Lock()
+        self._redis_down_until = 0.0
+        self._sync_script = None
+        self._async_scripts: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+    def _buckets(self, key: str, endpoint: Optional[str]) -> List[Tuple[str, float, float]]:
+        """(Redis 키, rate, capacity) 목록"""
+        buckets = [(f'rate_limit:{self.name}:{key}', self.rate, self.capacity)]
+
+        endpoint_rate = self.endpoint_rates.get(endpoint) if endpoint else None
+        if endpoint_rate:
+            buckets.append(
+                (f'rate_limit:{self.name}:{key}:{endpoint}', float(endpoint_rate), float(endpoint_rate)))
+
+        return buckets
+
+    @staticmethod
+    def _script_args(buckets, tokens: float):
+        keys = [bucket_key for bucket_key, _, _ in buckets]
+        args = [tokens]
+        for _, rate, capacity in buckets:
+            args.extend([rate, capacity])
+        return keys, args
+
+    def _redis_available(self) -> bool:
+        return time.monotonic() >= self._redis_down_until
+
+    def _mark_redis_down(self, error: Exception):
+        if self._redis_available():
+            logger.warning(
+                f'Rate limiter {self.name}: Redis unavailable, using local buckets for '
+                f'{REDIS_RETRY_INTERVAL}s ({error})')
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_INTERVAL
 
-        if current_count % 10 == 0:  # 10개 요청마다 한번만 로깅
-            logger.info(
-                f"Rate limit check - Current count: {current_count}/{max_calls} at {current_second}"
+    def _take_local(self, buckets, tokens: float) -> float:
+        """로컬 버킷에서 토큰 차감 시도 (반환: 대기 시간, 0이면 통과)"""
+        with self._local_lock:
+            now = time.monotonic()
+            levels = []
+            for bucket_key, rate, capacity in buckets:
+                bucket = self._local_buckets.get(bucket_key)
+                if bucket is None:
+                    bucket = self._local_buckets[bucket_key] = _LocalBucket(rate, capacity)
+                levels.append((bucket, bucket.level(now)))
+
+            wait = max(
+                ((tokens - level) / bucket.rate for bucket, level in levels if level < tokens),
+                default=0.0
             )
 
-        if current_count <= max_calls:
-            return True
+            for bucket, level in levels:
+                bucket.tokens = level - tokens if wait == 0 else level
+                bucket.updated_at = now
+
+            return wait
+
+    def _drain_local(self, buckets):
+        with self._local_lock:
+            now = time.monotonic()
+            for bucket_key, rate, capacity in buckets:
+                bucket = self._local_buckets.get(bucket_key)
+                if bucket is None:
+                    bucket = self._local_buckets[bucket_key] = _LocalBucket(rate, capacity)
+                bucket.tokens = 0.0
+                bucket.updated_at = now
+
+    def try_acquire(self, key: str = 'default', endpoint: Optional[str] = None, tokens: float = 1) -> float:
+        """
+        토큰 1회 획득 시도 (동기, 대기하지 않음)
+
+        Returns:
+            0이면 통과, 아니면 다시 시도하기까지 기다려야 하는 시간 (초)
+        """
+        buckets = self._buckets(key, endpoint)
+
+        if self._redis_available():
+            try:
+                if self._sync_script is None:
+                    self._sync_script = RedisClient.get_instance().register_script(TOKEN_BUCKET_SCRIPT)
+                keys, args = self._script_args(buckets, tokens)
+                allowed, wait = self._sync_script(keys=keys, args=args)
+                return 0.0 if int(allowed) else float(wait)
+            except redis.RedisError as e:
+                self._mark_redis_down(e)
+
+        return self._take_local(buckets, tokens)
+
+    async def try_acquire_async(self, key: str = 'default', endpoint: Optional[str] = None, tokens: float = 1) -> float:
+        """try_acquire()의 비동기 버전 (redis.asyncio 사용)"""
+        buckets = self._buckets(key, endpoint)
+
+        if self._redis_available():
+            try:
+                loop = asyncio.get_running_loop()
+                script = self._async_scripts.get(loop)
+                if script is None:
+                    script = RedisClient.get_async_instance().register_script(TOKEN_BUCKET_SCRIPT)
+                    self._async_scripts[loop] = script
+                keys, args = self._script_args(buckets, tokens)
+                allowed, wait = await script(keys=keys, args=args)
+                return 0.0 if int(allowed) else float(wait)
+            except redis.RedisError as e:
+                self._mark_redis_down(e)
+
+        return self._take_local(buckets, tokens)
 
-        time.sleep(1)
-        return check_rate_limit(max_calls)
+    def drain(self, key: str = 'default', endpoint: Optional[str] = None):
+        """버킷 토큰 비우기 (throttle 응답 직후 모든 워커의 burst 방지)"""
+        buckets = self._buckets(key, endpoint)
 
+        if self._redis_available():
+            try:
+                script = RedisClient.get_instance().register_script(DRAIN_SCRIPT)
+                keys, args = self._script_args(buckets, 0)
+                script(keys=keys, args=args)
+                return
+            except redis.RedisError as e:
+                self._mark_redis_down(e)
 
-def rate_limited(max_calls: int = 500):
+        self._drain_local(buckets)
+
+    async def drain_async(self, key: str = 'default', endpoint: Optional[str] = None):
+        """drain()의 비동기 버전"""
+        buckets = self._buckets(key, endpoint)
+
+        if self._redis_available():
+            try:
+                script = RedisClient.get_async_instance().register_script(DRAIN_SCRIPT)
+                keys, args = self._script_args(buckets, 0)
+                await script(keys=keys, args=args)
+                return
+            except redis.RedisError as e:
+                self._mark_redis_down(e)
+
+        self._drain_local(buckets)
+
+    def acquire_sync(self, key: str = 'default', endpoint: Optional[str] = None, tokens: float = 1):
+        """토큰을 얻을 때까지 대기 (동기, 스레드를 블로킹)"""
+        while True:
+            wait = self.try_acquire(key, endpoint, tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire(self, key: str = 'default', endpoint: Optional[str] = None, tokens: float = 1):
+        """토큰을 얻을 때까지 대기 (비동기, 이벤트 루프를 막지 않음)"""
+        while True:
+            wait = await self.try_acquire_async(key, endpoint, tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+
+def endpoint_from_url(url: str) -> str:
     """
-    API 호출에 레이트 리밋을 적용하는 데코레이터
+    Nexon API URL에서 엔드포인트 이름 추출 (NEXON_API_ENDPOINT_RATE_LIMITS 키)
 
-    Args:
-        max_calls (int): 초당 최대 허용 호출 수
+    예: https://open.api.nexon.com/maplestory/v1/character/basic -> 'character/basic'
+    """
+    path = url.split('?', 1)[0]
+    marker = '/maplestory/v1/'
+    if marker in path:
+        return path.split(marker, 1)[1].strip('/')
+    return path.rstrip('/').rsplit('/', 1)[-1]
 
-    사용예시:
-    @rate_limited(max_calls=100)
-    def get_character():
-        return requests.get("https://api.maplestory.nexon.com/...")
+
+def api_key_scope(api_key: Optional[str]) -> str:
+    """API 키별 버킷 키 (원본 키는 Redis에 남기지 않도록 해시)"""
+    if not api_key:
+        return 'anonymous'
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+_nexon_api_limiter: Optional[RateLimiter] = None
+
+
+def get_nexon_api_limiter() -> RateLimiter:
     """
+    Nexon Open API 리미터 (settings.NEXON_API_RATE_LIMIT 기반, 프로세스당 1개)
+
+    settings:
+        NEXON_API_RATE_LIMIT: API 키별 초당 허용 요청 수
+        NEXON_API_BURST: burst 허용량 (기본: NEXON_API_RATE_LIMIT)
+        NEXON_API_ENDPOINT_RATE_LIMITS: 엔드포인트별 추가 제한 {'character/basic': 10, ...}
+    """
+    global _nexon_api_limiter
+
+    if _nexon_api_limiter is None:
+        rate = getattr(settings, 'NEXON_API_RATE_LIMIT', 5)
+        _nexon_api_limiter = RateLimiter(
+            'nexon_api',
+            rate=rate,
+            capacity=getattr(settings, 'NEXON_API_BURST', None) or rate,
+            endpoint_rates=getattr(settings, 'NEXON_API_ENDPOINT_RATE_LIMITS', None),
+        )
+
+    return _nexon_api_limiter
+
+
+_nexon_all_data_limiter: Optional[RateLimiter] = None
+
+
+def get_nexon_all_data_limiter() -> RateLimiter:
+    """
+    캐릭터 조회 뷰 리미터 (settings.NEXON_API_ALL_DATA_RATE_LIMIT 기반, 프로세스당 1개)
+
+    전체 조회는 한 번에 약 21개 엔드포인트를 호출하므로 NEXON_API_RATE_LIMIT(개발 키 기본 5/s)를
+    함께 쓰면 요청마다 수 초를 대기합니다. 서비스 키 한도에 맞춘 별도 버킷을 사용하며,
+    단일 엔드포인트 뷰(MapleAPIClientMixin.get_api_data)도 같은 버킷을 씁니다.
+
+    settings:
+        NEXON_API_ALL_DATA_RATE_LIMIT: API 키별 초당 허용 요청 수
+        NEXON_API_ALL_DATA_BURST: burst 허용량 (기본: NEXON_API_ALL_DATA_RATE_LIMIT)
+        NEXON_API_ENDPOINT_RATE_LIMITS: 엔드포인트별 추가 제한 (공통)
+    """
+    global _nexon_all_data_limiter
+
+    if _nexon_all_data_limiter is None:
+        rate = getattr(settings, 'NEXON_API_ALL_DATA_RATE_LIMIT', 500)
+        _nexon_all_data_limiter = RateLimiter(
+            'nexon_api_all_data',
+            rate=rate,
+            capacity=getattr(settings, 'NEXON_API_ALL_DATA_BURST', None) or rate,
+            endpoint_rates=getattr(settings, 'NEXON_API_ENDPOINT_RATE_LIMITS', None),
+        )
+
+    return _nexon_all_data_limiter
+
+
+def rate_limited(
+    limiter: Union[RateLimiter, Callable[[], RateLimiter]],
+    key: str = 'default',
+    endpoint: Union[str, Callable[..., Optional[str]], None] = None,
+):
+    """
+    함수 호출마다 리미터 토큰을 얻는 데코레이터
+
+    코루틴 함수에 적용하면 호출(코루틴 생성) 시점이 아니라 실행 시점에
+    await limiter.acquire()로 대기합니다.
+
+    Args:
+        limiter: RateLimiter 또는 RateLimiter를 반환하는 함수 (지연 생성용)
+        key: 버킷 키 (예: api_key_scope(APIKEY))
+        endpoint: 엔드포인트 이름 또는 (*args, **kwargs)를 받아 이름을 반환하는 함수
+    """
+    def resolve(args, kwargs):
+        resolved_limiter = limiter if isinstance(limiter, RateLimiter) else limiter()
+        resolved_endpoint = endpoint(*args, **kwargs) if callable(endpoint) else endpoint
+        return resolved_limiter, resolved_endpoint
+
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                resolved_limiter, resolved_endpoint = resolve(args, kwargs)
+                await resolved_limiter.acquire(key, resolved_endpoint)
+                return await func(*args, **kwargs)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            check_rate_limit(max_calls)
+            resolved_limiter, resolved_endpoint = resolve(args, kwargs)
+            resolved_limiter.acquire_sync(key, resolved_endpoint)
             return func(*args, **kwargs)
         return wrapper
+
     return decorator
@@ -1,4 +1,8 @@
+import asyncio
+import weakref
+
 import redis
+import redis.asyncio
 from django.conf import settings
 
 # 싱글톤 패턴으로 Redis 클라이언트 관리
@@ -6,6 +10,8 @@ from django.conf import settings
 
 class RedisClient:
     _instance = None
+    # redis.asyncio 연결은 생성된 이벤트 루프에 묶이므로 루프별로 관리
+    _async_instances = weakref.WeakKeyDictionary()
 
     @classmethod
     def get_instance(cls):
@@ -18,6 +24,33 @@ class RedisClient:
             )
         return cls._instance
 
+    @classmethod
+    def get_async_instance(cls):
+        """현재 이벤트 루프의 비동기 Redis 클라이언트 (코루틴 안에서 호출)"""
+        loop = asyncio.get_running_loop()
+        instance = cls._async_instances.get(loop)
+        if instance is None:
+            instance = redis.asyncio.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=0,
+                decode_responses=True
+            )
+            cls._async_instances[loop] = instance
+        return instance
+
+    @classmethod
+    def close_async_instances(cls):
+        """루프별 비동기 Redis 클라이언트 연결 종료 (워커 종료 시, 루프를 닫기 전에 호출)"""
+        for loop, instance in list(cls._async_instances.items()):
+            if loop.is_closed() or loop.is_running():
+                continue
+            try:
+                loop.run_until_complete(instance.aclose())
+            except Exception:
+                pass
+        cls._async_instances.clear()
+
 
 # 편의를 위한 전역 인스턴스
 redis_client = RedisClient.get_instance()
@@ -0,0 +1,172 @@
+"""
+요청 병합 (single-flight, Redis 락)
+
+같은 캐릭터를 여러 요청이 동시에 조회할 때 캐시가 비어 있으면 요청마다
+Nexon API fan-out과 DB 저장이 중복 실행됩니다 (캐시 stampede).
+(ocid, endpoint, date) 단위로 Redis 락을 잡은 요청 하나만 실제로 조회하고,
+나머지는 pub/sub 알림(또는 폴링)으로 결과가 캐시에 들어오기를 기다립니다.
+
+- 락: SET NX PX (lease 만료 시 자동 해제), 해제는 토큰 비교 Lua 스크립트
+- 대기: 완료 채널 구독 + poll_interval마다 캐시 확인, wait_timeout 초과 시 직접 조회
+- 락을 가진 요청이 결과 없이 끝나면(조회 실패) 대기 중인 요청들이 다시 SET NX를 시도해
+  하나만 새 락 소유자가 됨 (max_takeovers회까지, 이후에는 직접 조회)
+- Redis에 연결할 수 없으면 병합 없이 바로 조회
+
+사용예시:
+    flight = SingleFlight('character_all_data', lease=60, wait_timeout=30)
+    data, shared = flight.do(
+        (ocid, 'all_data', None),
+        fetch=lambda: fetch_and_cache(ocid),
+        read_result=lambda: read_cache(ocid),
+    )
+"""
+import logging
+import time
+import uuid
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+import redis
+
+from .redis_client import RedisClient
+
+logger = logging.getLogger('maple_api')
+
+T = TypeVar('T')
+
+# 락 소유자(토큰)가 같을 때만 삭제
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+DONE_MESSAGE = 'done'
+
+
+class SingleFlight:
+    """
+    Redis 락 기반 single-flight
+
+    Args:
+        name: 이름 (Redis 키 prefix)
+        lease: 락 유지 시간 (초). 조회 도중 프로세스가 죽어도 이 시간 후 해제됨
+        wait_timeout: 다른 요청의 결과를 기다리는 최대 시간 (초)
+        poll_interval: 캐시 확인 주기 (초, pub/sub 메시지 대기 시간)
+        max_takeovers: 락 소유자가 결과 없이 끝났을 때 락 재획득을 시도하는 최대 횟수
+    """
+
+    def __init__(
+        self,
+        name: str,
+        lease: float = 30,
+        wait_timeout: float = 20,
+        poll_interval: float = 0.2,
+        max_takeovers: int = 3,
+    ):
+        self.name = name
+        self.lease = lease
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.max_takeovers = max_takeovers
+
+    def _key(self, key_parts: Tuple[Any, ...]) -> str:
+        return f"single_flight:{self.name}:" + ':'.join(
+            'latest' if part is None else str(part) for part in key_parts)
+
+    def do(
+        self,
+        key_parts: Tuple[Any, ...],
+        fetch: Callable[[], T],
+        read_result: Callable[[], Optional[T]],
+    ) -> Tuple[T, bool]:
+        """
+        key_parts 단위로 fetch()를 한 번만 실행
+
+        Args:
+            key_parts: 병합 단위 (예: (ocid, endpoint, date))
+            fetch: 실제 조회 함수. 결과를 read_result()가 읽을 수 있는 곳(캐시)에 저장해야 함
+            read_result: 다른 요청이 저장한 결과 조회 (없으면 None)
+
+        Returns:
+            (결과, shared): shared가 True면 다른 요청이 조회한 결과를 읽은 것
+        """
+        lock_key = self._key(key_parts)
+        channel = f"{lock_key}:done"
+        token = uuid.uuid4().hex
+
+        for attempt in range(self.max_takeovers + 1):
+            try:
+                client = RedisClient.get_instance()
+                acquired = client.set(lock_key, token, nx=True, px=int(self.lease * 1000))
+            except redis.RedisError as e:
+                logger.warning(f"SingleFlight {self.name}: Redis 사용 불가, 병합 없이 조회 ({e})")
+                return fetch(), False
+
+            if acquired:
+                try:
+                    return fetch(), False
+                finally:
+                    self._release(client, lock_key, channel, token)
+
+            result, leader_failed = self._wait(client, lock_key, channel, read_result)
+            if result is not None:
+                return result, True
+            if not leader_failed:
+                # 대기 시간 초과 또는 Redis 오류
+                break
+            # 락 소유자가 결과 없이 끝남: 다시 SET NX를 시도해 대기 요청 중 하나만 새로 조회
+            logger.info(f"SingleFlight {self.name}: 락 소유자 조회 실패, 락 재획득 시도 "
+                        f"({attempt + 1}/{self.max_takeovers}, {lock_key})")
+
+        logger.warning(f"SingleFlight {self.name}: 대기 중 결과 없음, 직접 조회 ({lock_key})")
+        return fetch(), False
+
+    def _release(self, client, lock_key: str, channel: str, token: str):
+        """락 해제 후 대기 중인 요청에 완료 알림"""
+        try:
+            client.eval(RELEASE_SCRIPT, 1, lock_key, token)
+            client.publish(channel, DONE_MESSAGE)
+        except redis.RedisError as e:
+            logger.warning(f"SingleFlight {self.name}: 락 해제 실패 ({lock_key}): {e}")
+
+    def _wait(
+        self, client, lock_key: str, channel: str, read_result: Callable[[], Optional[T]]
+    ) -> Tuple[Optional[T], bool]:
+        """
+        락을 가진 요청의 결과를 기다림
+
+        구독 직전에 조회가 끝났을 수 있으므로 알림과 관계없이 매 주기마다 결과를 확인합니다.
+
+        Returns:
+            (결과, leader_failed): 락이 사라졌는데 결과가 없으면(조회 실패) (None, True),
+            대기 시간 초과 또는 Redis 오류면 (None, False)
+        """
+        deadline = time.monotonic() + self.wait_timeout
+        pubsub = None
+
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(channel)
+
+            while True:
+                result = read_result()
+                if result is not None:
+                    return result, False
+                if not client.exists(lock_key):
+                    result = read_result()
+                    return result, result is None
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None, False
+                pubsub.get_message(timeout=min(self.poll_interval, remaining))
+        except redis.RedisError as e:
+            logger.warning(f"SingleFlight {self.name}: 대기 중 Redis 오류 ({lock_key}): {e}")
+            return read_result(), False
+        finally:
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except redis.RedisError:
+                    pass